@@ -16,7 +16,13 @@ Imports model logic from swarm_model and MC engine from swarm_mc, then produces
 
 Usage:
     source publications/scripts/.venv/bin/activate
-    python publications/scripts/generate_swarm_figures.py
+    python publications/scripts/generate_swarm_figures.py [--workers 0] [--no-cache]
+
+Every DES run the figures need is declared up front (FIGURE_JOBS) and run
+in one deduplicated parallel sweep; the figure functions then plot from
+the shared results table.  Runs are also cached on disk ($SWARM_RUN_CACHE,
+default ~/.cache/swarm_des_runs) keyed by config and swarm_model.py source,
+so a re-plot with an unchanged model reruns nothing.
 """
 
 from __future__ import annotations
@@ -27,9 +33,10 @@ import argparse
 import functools
 import math
 import time
+from dataclasses import replace
 from os import environ, makedirs
-from os.path import abspath, dirname, join
-from typing import Any
+from os.path import abspath, dirname, expanduser, join
+from typing import Any, Callable
 
 import numpy as np
 from numpy.random import default_rng
@@ -47,16 +54,20 @@ from scipy.optimize import curve_fit  # noqa: E402
 from swarm_model import (  # noqa: E402
     CoordinationTopology,
     SwarmCoordinationConfig,
-    SwarmCoordinationSimulator,
+    SwarmCoordinationRunResult,
     TierMessageBreakdown,
     calculate_bandwidth_requirement,
     calculate_communication_overhead,
     calculate_propagation_delay,
 )
 from swarm_mc import (  # noqa: E402
+    ResultCache,
+    SwarmCoordinationResult,
+    SweepTable,
     calculate_stats,
     confidence_interval,
-    run_swarm_coordination_mc,
+    run_sweep,
+    sweep_grid,
 )
 
 # ---------------------------------------------------------------------------
@@ -127,6 +138,12 @@ SCALE_FULL = {
     "sim_days_cap": 90,
 }
 SCALE = SCALE_FULL  # default; overridden by --fast
+EXECUTION_MODE = "event"  # overridden by --cycle-batched (hierarchical runs only)
+FIDELITY = "des"  # overridden by --analytic (MC sweeps that only need means)
+RANDOM_STREAMS = "shared"  # overridden by --crn (common random numbers across configs)
+WORKERS: int | None = None  # overridden by --workers (None = $SWARM_MC_WORKERS)
+SWEEP = SweepTable()  # every DES run, shared by all figures (see _runs)
+CACHE: ResultCache | None = None  # on-disk run cache; enabled in __main__ unless --no-cache
 TOPO_COLORS = {
     "centralized": c_centralized,
     "hierarchical": c_hierarchical,
@@ -180,13 +197,56 @@ def _make_config(
         simulation_days=kwargs.pop("simulation_days", _sim_days(node_count)),
         seed=seed,
         max_events=kwargs.pop("max_events", _max_events(node_count)),
+        execution_mode=kwargs.pop("execution_mode", EXECUTION_MODE),
+        random_streams=kwargs.pop("random_streams", RANDOM_STREAMS),
         **kwargs,
     )
 
 
+# ---------------------------------------------------------------------------
+# Helper: run sweep jobs through the shared results table
+# ---------------------------------------------------------------------------
+def _seeded(cfg: SwarmCoordinationConfig, n_runs: int) -> list[SwarmCoordinationConfig]:
+    """Return the *n_runs* MC replica configs of *cfg* (seeds cfg.seed + i)."""
+    return sweep_grid(cfg, seeds=range(cfg.seed, cfg.seed + n_runs))
+
+
+def _runs(
+    configs: list[SwarmCoordinationConfig], encoding: str = "histogram"
+) -> list[SwarmCoordinationRunResult]:
+    """Return the result of each config, running any not yet in SWEEP."""
+    run_sweep(configs, WORKERS, table=SWEEP, encoding=encoding, cache=CACHE)
+    return [SWEEP.run_result(c) for c in configs]
+
+
+def _ensemble(cfg: SwarmCoordinationConfig, n_runs: int) -> SwarmCoordinationResult:
+    """Return the *n_runs* MC aggregate of *cfg* (as run_swarm_coordination_mc)."""
+    run_sweep(_seeded(cfg, n_runs), WORKERS, table=SWEEP, cache=CACHE)
+    return SWEEP.ensemble(cfg, n_runs)
+
+
 # ---------------------------------------------------------------------------
 # Figure 1: Communication Overhead vs Node Count
 # ---------------------------------------------------------------------------
+def _overhead_vs_nodes_configs() -> dict[tuple[str, int], SwarmCoordinationConfig]:
+    return {
+        (topo, nc): _make_config(
+            nc, topology=topo,
+            cluster_size=min(200, max(50, int(math.floor(math.sqrt(nc))))),
+            fidelity=FIDELITY,
+        )
+        for topo in TOPOLOGIES
+        for nc in SCALE["node_counts"]
+    }
+
+
+def _overhead_vs_nodes_jobs() -> list[SwarmCoordinationConfig]:
+    return [
+        c for cfg in _overhead_vs_nodes_configs().values()
+        for c in _seeded(cfg, SCALE["n_runs"])
+    ]
+
+
 def fig_overhead_vs_nodes() -> None:
     """Generate Figure 1: overhead (%) vs node count for all 3 topologies.
 
@@ -195,6 +255,7 @@ def fig_overhead_vs_nodes() -> None:
     """
     node_counts = SCALE["node_counts"]
     n_runs = SCALE["n_runs"]
+    configs = _overhead_vs_nodes_configs()
 
     fig, ax = subplots()
 
@@ -204,11 +265,9 @@ def fig_overhead_vs_nodes() -> None:
         ci_hi = []
 
         for nc in node_counts:
-            cluster_size = min(200, max(50, int(math.floor(math.sqrt(nc)))))
-            cfg = _make_config(nc, topology=topo, cluster_size=cluster_size)
-            output = run_swarm_coordination_mc(cfg, runs=n_runs)
-            means.append(output.result.communication_overhead_percent)
-            lo, hi = output.result.confidence_interval_95
+            result = _ensemble(configs[topo, nc], n_runs)
+            means.append(result.communication_overhead_percent)
+            lo, hi = result.confidence_interval_95
             ci_lo.append(lo)
             ci_hi.append(hi)
 
@@ -243,20 +302,42 @@ def fig_overhead_vs_nodes() -> None:
 # ---------------------------------------------------------------------------
 # Figure 2: Latency Distribution
 # ---------------------------------------------------------------------------
+def _latency_scales() -> list[int]:
+    """Pick 3 representative scales from available node counts."""
+    nc_list = SCALE["node_counts"]
+    if len(nc_list) >= 3:
+        return [nc_list[0], nc_list[len(nc_list) // 2], nc_list[-1]]
+    return nc_list[:3]
+
+
+def _latency_distribution_configs() -> dict[tuple[str, int], list[SwarmCoordinationConfig]]:
+    n_runs = min(10, SCALE["n_runs"])
+    return {
+        (topo, nc): _seeded(
+            _make_config(
+                nc, topology=topo,
+                cluster_size=min(200, max(50, int(math.floor(math.sqrt(nc))))),
+            ),
+            n_runs,
+        )
+        for topo in TOPOLOGIES
+        for nc in _latency_scales()
+    }
+
+
+def _latency_distribution_jobs() -> list[SwarmCoordinationConfig]:
+    return [c for runs in _latency_distribution_configs().values() for c in runs]
+
+
 def fig_latency_distribution() -> None:
     """Generate Figure 2: box/violin plot of propagation latency at 3 scales.
 
     Three subplots (one per topology). At each of 3 scales (10K, 100K, 1M),
     run 10 simulations and collect propagation times. Log scale for y-axis.
     """
-    nc_list = SCALE["node_counts"]
-    # Pick 3 representative scales from available node counts
-    if len(nc_list) >= 3:
-        scales = [nc_list[0], nc_list[len(nc_list) // 2], nc_list[-1]]
-    else:
-        scales = nc_list[:3]
+    scales = _latency_scales()
     scale_labels = [f"{s // 1000}K" if s >= 1000 else str(s) for s in scales]
-    n_runs = min(10, SCALE["n_runs"])
+    configs = _latency_distribution_configs()
 
     n_topos = len(TOPOLOGIES)
     fig, axes = subplots(1, n_topos, figsize=(3.5 * n_topos, 4), sharey=True)
@@ -270,17 +351,10 @@ def fig_latency_distribution() -> None:
         labels = []
 
         for s_idx, nc in enumerate(scales):
-            cluster_size = min(200, max(50, int(math.floor(math.sqrt(nc)))))
-            latencies = []
-
-            for run_i in range(n_runs):
-                cfg = _make_config(
-                    nc, topology=topo, cluster_size=cluster_size,
-                    seed=SEED + run_i,
-                )
-                sim = SwarmCoordinationSimulator(cfg)
-                result = sim.run()
-                latencies.append(result.avg_update_propagation_ms)
+            latencies = [
+                result.avg_update_propagation_ms
+                for result in _runs(configs[topo, nc])
+            ]
 
             data.append(latencies)
             positions.append(s_idx + 1)
@@ -314,6 +388,18 @@ def fig_latency_distribution() -> None:
 # ---------------------------------------------------------------------------
 # Figure 3: Cluster Size Optimization
 # ---------------------------------------------------------------------------
+def _cluster_size_configs() -> dict[int, SwarmCoordinationConfig]:
+    nc = SCALE["node_counts"][-2] if len(SCALE["node_counts"]) >= 2 else SCALE["node_counts"][-1]
+    return {cs: _make_config(nc, cluster_size=cs) for cs in SCALE["cluster_sizes"]}
+
+
+def _cluster_size_jobs() -> list[SwarmCoordinationConfig]:
+    return [
+        c for cfg in _cluster_size_configs().values()
+        for c in _seeded(cfg, SCALE["n_runs"])
+    ]
+
+
 def fig_cluster_size_optimization() -> None:
     """Generate Figure 3: overhead vs cluster size for hierarchical at 100K nodes.
 
@@ -321,9 +407,8 @@ def fig_cluster_size_optimization() -> None:
     Shows optimal cluster size. Secondary y-axis for latency.
     """
     cluster_sizes = SCALE["cluster_sizes"]
-    nc = SCALE["node_counts"][-2] if len(SCALE["node_counts"]) >= 2 else SCALE["node_counts"][-1]
     n_runs = SCALE["n_runs"]
-    sim_days = _sim_days(nc)
+    configs = _cluster_size_configs()
 
     overheads_mean = []
     overheads_ci_lo = []
@@ -333,20 +418,16 @@ def fig_cluster_size_optimization() -> None:
     latencies_ci_hi = []
 
     for cs in cluster_sizes:
-        cfg = _make_config(nc, cluster_size=cs)
-        output = run_swarm_coordination_mc(cfg, runs=n_runs)
-        overheads_mean.append(output.result.communication_overhead_percent)
-        lo, hi = output.result.confidence_interval_95
+        result = _ensemble(configs[cs], n_runs)
+        overheads_mean.append(result.communication_overhead_percent)
+        lo, hi = result.confidence_interval_95
         overheads_ci_lo.append(lo)
         overheads_ci_hi.append(hi)
 
-        # Collect latency data from individual runs
-        lat_values = []
-        for run_i in range(n_runs):
-            run_cfg = _make_config(nc, cluster_size=cs, seed=SEED + run_i)
-            sim = SwarmCoordinationSimulator(run_cfg)
-            result = sim.run()
-            lat_values.append(result.avg_update_propagation_ms)
+        # Latency from the same individual runs
+        lat_values = [
+            r.avg_update_propagation_ms for r in _runs(_seeded(configs[cs], n_runs))
+        ]
 
         lat_stats = calculate_stats(lat_values)
         lat_ci = confidence_interval(lat_values)
@@ -433,16 +514,29 @@ def fig_cluster_size_optimization() -> None:
 # ---------------------------------------------------------------------------
 # Figure 4: Duty Cycle Pareto
 # ---------------------------------------------------------------------------
+DUTY_CYCLES_H = [1, 4, 8, 12, 24, 48, 168]
+
+
+def _duty_cycle_configs() -> dict[int, list[SwarmCoordinationConfig]]:
+    nc = SCALE["node_counts"][min(2, len(SCALE["node_counts"]) - 1)]  # ~10K or smaller
+    return {
+        dc: _seeded(_make_config(nc, coordinator_duty_cycle_hours=float(dc)), SCALE["n_runs"])
+        for dc in DUTY_CYCLES_H
+    }
+
+
+def _duty_cycle_jobs() -> list[SwarmCoordinationConfig]:
+    return [c for runs in _duty_cycle_configs().values() for c in runs]
+
+
 def fig_duty_cycle_pareto() -> None:
     """Generate Figure 4: power variance vs coordinator availability for duty cycles.
 
     Scatter plot for duty cycles [1h, 4h, 8h, 12h, 24h, 48h, 168h].
     Hierarchical topology, 10K nodes, 20 runs each. Pareto frontier highlighted.
     """
-    duty_cycles_h = [1, 4, 8, 12, 24, 48, 168]
-    nc = SCALE["node_counts"][min(2, len(SCALE["node_counts"]) - 1)]  # ~10K or smaller
-    n_runs = SCALE["n_runs"]
-    sim_days = _sim_days(nc)
+    duty_cycles_h = DUTY_CYCLES_H
+    configs = _duty_cycle_configs()
 
     avail_means = []
     pvar_means = []
@@ -453,13 +547,7 @@ def fig_duty_cycle_pareto() -> None:
         a_vals = []
         p_vals = []
 
-        for run_i in range(n_runs):
-            cfg = _make_config(
-                nc, seed=SEED + run_i,
-                coordinator_duty_cycle_hours=float(dc),
-            )
-            sim = SwarmCoordinationSimulator(cfg)
-            result = sim.run()
+        for result in _runs(configs[dc]):
             a_vals.append(result.coordinator_availability_percent)
             p_vals.append(result.power_variance_percent)
 
@@ -679,6 +767,22 @@ def fit_scaling_models(
 # ---------------------------------------------------------------------------
 # Figure 5: Scaling Trajectory
 # ---------------------------------------------------------------------------
+def _scaling_trajectory_configs() -> dict[tuple[str, int], SwarmCoordinationConfig]:
+    configs = {}
+    for nc in SCALE["node_counts"]:
+        configs["fixed", nc] = _make_config(nc, cluster_size=100)
+        opt_cs = min(200, max(50, int(math.floor(math.sqrt(nc)))))
+        configs["optimized", nc] = _make_config(nc, cluster_size=opt_cs)
+    return configs
+
+
+def _scaling_trajectory_jobs() -> list[SwarmCoordinationConfig]:
+    return [
+        c for cfg in _scaling_trajectory_configs().values()
+        for c in _seeded(cfg, SCALE["n_runs"])
+    ]
+
+
 def fig_scaling_trajectory() -> None:
     """Generate Figure 5: overhead trajectory at increasing node counts.
 
@@ -688,7 +792,8 @@ def fig_scaling_trajectory() -> None:
     """
     node_counts = SCALE["node_counts"]
     n_runs = SCALE["n_runs"]
-    fixed_cluster_size = 100
+    configs = _scaling_trajectory_configs()
+    fixed_cluster_size = configs["fixed", node_counts[0]].cluster_size
 
     means_fixed = []
     ci_lo_fixed = []
@@ -699,19 +804,16 @@ def fig_scaling_trajectory() -> None:
 
     for nc in node_counts:
         # Fixed cluster size
-        cfg_fixed = _make_config(nc, cluster_size=fixed_cluster_size)
-        out_fixed = run_swarm_coordination_mc(cfg_fixed, runs=n_runs)
-        means_fixed.append(out_fixed.result.communication_overhead_percent)
-        lo, hi = out_fixed.result.confidence_interval_95
+        out_fixed = _ensemble(configs["fixed", nc], n_runs)
+        means_fixed.append(out_fixed.communication_overhead_percent)
+        lo, hi = out_fixed.confidence_interval_95
         ci_lo_fixed.append(lo)
         ci_hi_fixed.append(hi)
 
         # Optimized cluster size
-        opt_cs = min(200, max(50, int(math.floor(math.sqrt(nc)))))
-        cfg_opt = _make_config(nc, cluster_size=opt_cs)
-        out_opt = run_swarm_coordination_mc(cfg_opt, runs=n_runs)
-        means_opt.append(out_opt.result.communication_overhead_percent)
-        lo, hi = out_opt.result.confidence_interval_95
+        out_opt = _ensemble(configs["optimized", nc], n_runs)
+        means_opt.append(out_opt.communication_overhead_percent)
+        lo, hi = out_opt.confidence_interval_95
         ci_lo_opt.append(lo)
         ci_hi_opt.append(hi)
 
@@ -935,6 +1037,22 @@ def fig_architecture_diagram() -> None:
 # ---------------------------------------------------------------------------
 # Figure 7: Failure Resilience
 # ---------------------------------------------------------------------------
+def _failure_resilience_configs() -> dict[tuple[str, float], list[SwarmCoordinationConfig]]:
+    nc = SCALE["node_counts"][min(2, len(SCALE["node_counts"]) - 1)]
+    return {
+        (topo, fr): _seeded(
+            _make_config(nc, topology=topo, node_failure_rate_per_year=fr),
+            SCALE["n_runs"],
+        )
+        for topo in TOPOLOGIES
+        for fr in SCALE["failure_rates"]
+    }
+
+
+def _failure_resilience_jobs() -> list[SwarmCoordinationConfig]:
+    return [c for runs in _failure_resilience_configs().values() for c in runs]
+
+
 def fig_failure_resilience() -> None:
     """Generate Figure 7: coordinator availability vs node failure rate.
 
@@ -942,9 +1060,7 @@ def fig_failure_resilience() -> None:
     Failure rates from 0.01 to 0.10 per year.
     """
     failure_rates = SCALE["failure_rates"]
-    nc = SCALE["node_counts"][min(2, len(SCALE["node_counts"]) - 1)]
-    n_runs = SCALE["n_runs"]
-    sim_days = _sim_days(nc)
+    configs = _failure_resilience_configs()
 
     fig, ax = subplots()
 
@@ -954,15 +1070,10 @@ def fig_failure_resilience() -> None:
         ci_hi = []
 
         for fr in failure_rates:
-            avail_values = []
-            for run_i in range(n_runs):
-                cfg = _make_config(
-                    nc, topology=topo, seed=SEED + run_i,
-                    node_failure_rate_per_year=fr,
-                )
-                sim = SwarmCoordinationSimulator(cfg)
-                result = sim.run()
-                avail_values.append(result.coordinator_availability_percent)
+            avail_values = [
+                result.coordinator_availability_percent
+                for result in _runs(configs[topo, fr])
+            ]
 
             stats = calculate_stats(avail_values)
             ci = confidence_interval(avail_values)
@@ -999,15 +1110,25 @@ def fig_failure_resilience() -> None:
 # ---------------------------------------------------------------------------
 # Figure 8: Topology Summary
 # ---------------------------------------------------------------------------
+def _topology_summary_configs() -> dict[str, list[SwarmCoordinationConfig]]:
+    nc = SCALE["summary_nodes"]
+    return {
+        topo: _seeded(_make_config(nc, topology=topo), SCALE["summary_runs"])
+        for topo in TOPOLOGIES
+    }
+
+
+def _topology_summary_jobs() -> list[SwarmCoordinationConfig]:
+    return [c for runs in _topology_summary_configs().values() for c in runs]
+
+
 def fig_topology_summary() -> None:
     """Generate Figure 8: grouped bar chart comparing 3 topologies on 4 metrics.
 
     Metrics: overhead (%), availability (%), latency (ms, normalized), drop rate (%).
     10K nodes, 50 runs each. Error bars for 95% CI.
     """
-    nc = SCALE["summary_nodes"]
-    n_runs = SCALE["summary_runs"]
-    sim_days = _sim_days(nc)
+    configs = _topology_summary_configs()
 
     baseline_telemetry_pct = 20.48
     metrics = {
@@ -1026,10 +1147,7 @@ def fig_topology_summary() -> None:
         latency_vals = []
         drop_vals = []
 
-        for run_i in range(n_runs):
-            cfg = _make_config(nc, topology=topo, seed=SEED + run_i)
-            sim = SwarmCoordinationSimulator(cfg)
-            result = sim.run()
+        for result in _runs(configs[topo]):
             overhead_vals.append(result.communication_overhead_percent - baseline_telemetry_pct)
             avail_vals.append(result.coordinator_availability_percent)
             latency_vals.append(result.avg_update_propagation_ms)
@@ -1100,6 +1218,20 @@ def fig_topology_summary() -> None:
 # ---------------------------------------------------------------------------
 # Figure 9: Message Decomposition
 # ---------------------------------------------------------------------------
+def _message_decomposition_configs() -> dict[int, list[SwarmCoordinationConfig]]:
+    return {
+        nc: _seeded(
+            _make_config(nc, cluster_size=min(200, max(50, int(math.floor(math.sqrt(nc)))))),
+            min(5, SCALE["n_runs"]),
+        )
+        for nc in SCALE["node_counts"]
+    }
+
+
+def _message_decomposition_jobs() -> list[SwarmCoordinationConfig]:
+    return [c for runs in _message_decomposition_configs().values() for c in runs]
+
+
 def fig_message_decomposition() -> None:
     """Generate Figure 9: stacked area chart of per-tier message breakdown vs node count.
 
@@ -1108,25 +1240,18 @@ def fig_message_decomposition() -> None:
     message counts as stacked areas.
     """
     node_counts = SCALE["node_counts"]
-    n_runs = min(5, SCALE["n_runs"])
+    configs = _message_decomposition_configs()
 
     intra_means: list[float] = []
     inter_means: list[float] = []
     central_means: list[float] = []
 
     for nc in node_counts:
-        cluster_size = min(200, max(50, int(math.floor(math.sqrt(nc)))))
-
         intra_vals: list[float] = []
         inter_vals: list[float] = []
         central_vals: list[float] = []
 
-        for run_i in range(n_runs):
-            cfg = _make_config(
-                nc, cluster_size=cluster_size, seed=SEED + run_i,
-            )
-            sim = SwarmCoordinationSimulator(cfg)
-            result = sim.run()
+        for result in _runs(configs[nc]):
             tb = result.tier_breakdown
             if tb is not None:
                 intra_vals.append(tb.intra_cluster_msgs)
@@ -1168,50 +1293,58 @@ def fig_message_decomposition() -> None:
 # ---------------------------------------------------------------------------
 # Figure 10: Age-of-Information (AoI) Quality Metric
 # ---------------------------------------------------------------------------
-def fig_aoi_quality() -> None:
-    """Generate Figure 10: AoI at coordinators as a function of p_exc and p_link.
+AOI_P_EXC_VALUES = [0.0, 0.1, 0.2, 0.3, 0.5, 0.7, 1.0]
+AOI_P_LINK_VALUES = [1.0, 0.9, 0.8, 0.7, 0.6, 0.5, 0.4]
 
-    Two panels:
-    (a) AoI vs exception probability p_exc (full links)
-    (b) AoI vs link availability p_link (full reporting)
-    """
+
+def _aoi_quality_configs() -> dict[tuple[str, float], SwarmCoordinationConfig]:
     N = SCALE["node_counts"][2] if len(SCALE["node_counts"]) > 2 else 1000
     sim_days = 1.0 if "--fast" not in __import__("sys").argv else 0.1
-
-    # Panel (a): AoI vs p_exc
-    p_exc_values = [0.0, 0.1, 0.2, 0.3, 0.5, 0.7, 1.0]
-    aoi_mean_exc = []
-    aoi_p99_exc = []
-    for p in p_exc_values:
+    configs = {}
+    for p in AOI_P_EXC_VALUES:
         if p == 0.0:
             # No exception telemetry = full reporting (p_exc disabled)
-            cfg = _make_config(
+            configs["p_exc", p] = _make_config(
                 N, seed=42, simulation_days=sim_days,
                 enable_exception_telemetry=False,
             )
         else:
-            cfg = _make_config(
+            configs["p_exc", p] = _make_config(
                 N, seed=42, simulation_days=sim_days,
                 enable_exception_telemetry=True, exception_threshold=p,
             )
-        sim = SwarmCoordinationSimulator(cfg)
-        result = sim.run()
-        aoi_mean_exc.append(result.aoi_mean_seconds)
-        aoi_p99_exc.append(result.aoi_p99_seconds)
-
-    # Panel (b): AoI vs p_link
-    p_link_values = [1.0, 0.9, 0.8, 0.7, 0.6, 0.5, 0.4]
-    aoi_mean_link = []
-    aoi_p99_link = []
-    for p in p_link_values:
-        cfg = _make_config(
+    for p in AOI_P_LINK_VALUES:
+        configs["p_link", p] = _make_config(
             N, seed=42, simulation_days=sim_days,
             link_availability=p,
         )
-        sim = SwarmCoordinationSimulator(cfg)
-        result = sim.run()
-        aoi_mean_link.append(result.aoi_mean_seconds)
-        aoi_p99_link.append(result.aoi_p99_seconds)
+    return configs
+
+
+def _aoi_quality_jobs() -> list[SwarmCoordinationConfig]:
+    return list(_aoi_quality_configs().values())
+
+
+def fig_aoi_quality() -> None:
+    """Generate Figure 10: AoI at coordinators as a function of p_exc and p_link.
+
+    Two panels:
+    (a) AoI vs exception probability p_exc (full links)
+    (b) AoI vs link availability p_link (full reporting)
+    """
+    configs = _aoi_quality_configs()
+
+    # Panel (a): AoI vs p_exc
+    p_exc_values = AOI_P_EXC_VALUES
+    results = _runs([configs["p_exc", p] for p in p_exc_values])
+    aoi_mean_exc = [r.aoi_mean_seconds for r in results]
+    aoi_p99_exc = [r.aoi_p99_seconds for r in results]
+
+    # Panel (b): AoI vs p_link
+    p_link_values = AOI_P_LINK_VALUES
+    results = _runs([configs["p_link", p] for p in p_link_values])
+    aoi_mean_link = [r.aoi_mean_seconds for r in results]
+    aoi_p99_link = [r.aoi_p99_seconds for r in results]
 
     fig, (ax1, ax2) = subplots(1, 2, figsize=(7, 3.5))
 
@@ -1411,6 +1544,28 @@ c_stress = "#dc2626"    # red
 c_nominal = "#2563eb"   # blue
 c_event = "#d97706"     # amber
 
+def _workload_runs() -> int:
+    return max(3, SCALE["n_runs"] // 4)  # fewer runs needed (near-deterministic)
+
+
+def _workload_configs() -> dict[tuple[str, int], SwarmCoordinationConfig]:
+    return {
+        (profile, nc): _make_config(
+            nc, cluster_size=min(200, max(50, int(math.floor(math.sqrt(nc))))),
+            workload_profile=profile,
+        )
+        for profile in ("stress", "event_driven", "nominal")
+        for nc in SCALE["node_counts"]
+    }
+
+
+def _workload_jobs() -> list[SwarmCoordinationConfig]:
+    return [
+        c for cfg in _workload_configs().values()
+        for c in _seeded(cfg, _workload_runs())
+    ]
+
+
 def fig_workload_comparison() -> None:
     """Generate Figure 13: η vs N for stress/nominal/event-driven workloads.
 
@@ -1419,7 +1574,8 @@ def fig_workload_comparison() -> None:
     Includes sectorized mesh under all 3 profiles for comparison.
     """
     node_counts = SCALE["node_counts"]
-    n_runs = max(3, SCALE["n_runs"] // 4)  # fewer runs needed (near-deterministic)
+    n_runs = _workload_runs()
+    configs = _workload_configs()
 
     profiles = [
         ("stress", "Stress-case", "-", "o"),
@@ -1435,14 +1591,9 @@ def fig_workload_comparison() -> None:
         ci_hi = []
 
         for nc in node_counts:
-            cluster_size = min(200, max(50, int(math.floor(math.sqrt(nc)))))
-            cfg = _make_config(
-                nc, cluster_size=cluster_size,
-                workload_profile=profile,
-            )
-            output = run_swarm_coordination_mc(cfg, runs=n_runs)
-            means.append(output.result.communication_overhead_percent)
-            lo, hi = output.result.confidence_interval_95
+            result = _ensemble(configs[profile, nc], n_runs)
+            means.append(result.communication_overhead_percent)
+            lo, hi = result.confidence_interval_95
             ci_lo.append(lo)
             ci_hi.append(hi)
 
@@ -1473,32 +1624,23 @@ def fig_workload_comparison() -> None:
 # ---------------------------------------------------------------------------
 # Figure 14: Gilbert-Elliott vs Bernoulli Link Model Comparison
 # ---------------------------------------------------------------------------
-def fig_link_model_comparison() -> None:
-    """Generate Figure 14: retransmission effectiveness under correlated vs i.i.d. losses.
+LINK_P_LINKS = [0.5, 0.6, 0.7, 0.8, 0.9, 0.95, 1.0]
+LINK_MAX_RETRIES = [0, 1, 2]
 
-    Compares message loss rates across link availability levels for both
-    Bernoulli (i.i.d.) and Gilbert-Elliott (correlated burst) models.
-    """
+
+def _link_model_runs() -> int:
+    return max(3, SCALE["n_runs"] // 4)
+
+
+def _link_model_configs() -> dict[tuple[str, int, float], SwarmCoordinationConfig]:
     # Use a fixed moderate fleet size
     nc = SCALE.get("summary_nodes", 5_000)
     sim_days = min(_sim_days(nc), 30)
-    n_runs = max(3, SCALE["n_runs"] // 4)
     cluster_size = 100
-
-    # Bernoulli p_link values to test
-    p_links = [0.5, 0.6, 0.7, 0.8, 0.9, 0.95, 1.0]
-    max_retries = [0, 1, 2]
-
-    fig, axes = subplots(1, 2, figsize=(10, 4))
-
-    for ax_idx, (link_model, ax_title) in enumerate([
-        ("bernoulli", "(a) Bernoulli (i.i.d.)"),
-        ("gilbert_elliott", "(b) Gilbert-Elliott (correlated)"),
-    ]):
-        ax = axes[ax_idx]
-        for mr, ls, marker in zip(max_retries, ["-", "--", "-."], ["o", "s", "^"]):
-            loss_rates = []
-            for p_link in p_links:
+    configs = {}
+    for link_model in ("bernoulli", "gilbert_elliott"):
+        for mr in LINK_MAX_RETRIES:
+            for p_link in LINK_P_LINKS:
                 if link_model == "bernoulli":
                     cfg = _make_config(
                         nc, cluster_size=cluster_size,
@@ -1537,8 +1679,40 @@ def fig_link_model_comparison() -> None:
                         ge_p_loss_good=p_loss_good,
                         ge_p_loss_bad=p_loss_bad,
                     )
-                output = run_swarm_coordination_mc(cfg, runs=n_runs)
-                loss_rates.append(output.result.message_drop_rate * 100)
+                configs[link_model, mr, p_link] = cfg
+    return configs
+
+
+def _link_model_jobs() -> list[SwarmCoordinationConfig]:
+    return [
+        c for cfg in _link_model_configs().values()
+        for c in _seeded(cfg, _link_model_runs())
+    ]
+
+
+def fig_link_model_comparison() -> None:
+    """Generate Figure 14: retransmission effectiveness under correlated vs i.i.d. losses.
+
+    Compares message loss rates across link availability levels for both
+    Bernoulli (i.i.d.) and Gilbert-Elliott (correlated burst) models.
+    """
+    n_runs = _link_model_runs()
+    p_links = LINK_P_LINKS
+    max_retries = LINK_MAX_RETRIES
+    configs = _link_model_configs()
+
+    fig, axes = subplots(1, 2, figsize=(10, 4))
+
+    for ax_idx, (link_model, ax_title) in enumerate([
+        ("bernoulli", "(a) Bernoulli (i.i.d.)"),
+        ("gilbert_elliott", "(b) Gilbert-Elliott (correlated)"),
+    ]):
+        ax = axes[ax_idx]
+        for mr, ls, marker in zip(max_retries, ["-", "--", "-."], ["o", "s", "^"]):
+            loss_rates = [
+                _ensemble(configs[link_model, mr, p_link], n_runs).message_drop_rate * 100
+                for p_link in p_links
+            ]
 
             ax.plot(
                 [p * 100 for p in p_links],
@@ -1565,6 +1739,23 @@ def fig_link_model_comparison() -> None:
 # ---------------------------------------------------------------------------
 # Figure 15: Overhead Decomposition by Message Class
 # ---------------------------------------------------------------------------
+def _overhead_decomposition_configs() -> dict[str, SwarmCoordinationConfig]:
+    N = 10_000
+    return {
+        profile: _make_config(
+            N,
+            cluster_size=min(200, max(50, int(math.floor(math.sqrt(N))))),
+            simulation_days=_sim_days(N),
+            workload_profile=profile,
+        )
+        for profile in ("stress", "event_driven", "nominal")
+    }
+
+
+def _overhead_decomposition_jobs() -> list[SwarmCoordinationConfig]:
+    return list(_overhead_decomposition_configs().values())
+
+
 def fig_overhead_decomposition() -> None:
     """Generate Figure 15: stacked bar chart of overhead by message class.
 
@@ -1573,8 +1764,6 @@ def fig_overhead_decomposition() -> None:
     ephemeris, heartbeat, command, summary, alert.
     """
     N = 10_000
-    sim_days = _sim_days(N)
-    cluster_size = min(200, max(50, int(math.floor(math.sqrt(N)))))
 
     profiles = ["stress", "event_driven", "nominal"]
     profile_labels = ["Stress", "Event-driven", "Nominal"]
@@ -1591,21 +1780,18 @@ def fig_overhead_decomposition() -> None:
     # Collect data: for each profile, run DES (hierarchical only) and extract per-class bytes
     bar_data: list[dict[str, float]] = []
     x_labels: list[str] = []
+    configs = _overhead_decomposition_configs()
 
     for pi, profile in enumerate(profiles):
-        cfg = _make_config(
-            N,
-            cluster_size=cluster_size,
-            simulation_days=sim_days,
-            workload_profile=profile,
+        r, = _runs([configs[profile]])
+        # Convert to fraction of fleet bandwidth for η decomposition, with
+        # the scaling the DES applies to protocol bytes (1/sample rate,
+        # simulated seconds, fleet capacity)
+        per_byte = (
+            r.communication_overhead_percent / r.protocol_bytes_sent
+            if r.protocol_bytes_sent > 0 else 0.0
         )
-        sim = SwarmCoordinationSimulator(cfg)
-        r = sim.run()
-        # Convert to fraction of fleet bandwidth for η decomposition
-        scale = 1.0 / max(cfg.sync_sample_rate if cfg.sync_sample_rate > 0 else min(1.0, 1_000 / N), 1e-9)
-        sim_s = max(1.0, sim.current_time)
-        fleet_cap_bps = N * cfg.bandwidth_per_node_kbps * 1_000
-        to_pct = lambda b: (b / sim_s * scale * 8 / fleet_cap_bps * 100) if fleet_cap_bps > 0 else 0
+        to_pct = lambda b: b * per_byte
 
         bar_data.append({
             "ephemeris": to_pct(r.ephemeris_bytes_sent),
@@ -1642,16 +1828,36 @@ def fig_overhead_decomposition() -> None:
 # ---------------------------------------------------------------------------
 # Figure 16: Phase-Stagger Coordinator Drop Comparison
 # ---------------------------------------------------------------------------
+STAGGER_CAPACITIES = [10, 15, 20, 25, 30, 40, 50, 75, 100]
+
+
+def _phase_stagger_configs() -> dict[tuple[bool, int], SwarmCoordinationConfig]:
+    N = 10_000
+    return {
+        (stagger, cap): _make_config(
+            N,
+            cluster_size=100,
+            simulation_days=_sim_days(N),
+            coordinator_link_capacity_kbps=float(cap),
+            enable_phase_stagger=stagger,
+        )
+        for stagger in (False, True)
+        for cap in STAGGER_CAPACITIES
+    }
+
+
+def _phase_stagger_jobs() -> list[SwarmCoordinationConfig]:
+    return list(_phase_stagger_configs().values())
+
+
 def fig_phase_stagger() -> None:
     """Generate Figure 16: coordinator drops vs link capacity with/without phase stagger.
 
     Sweeps coordinator_link_capacity_kbps and compares random-phase vs
     phase-staggered scheduling at N=10,000.
     """
-    N = 10_000
-    sim_days = _sim_days(N)
-    cluster_size = 100
-    capacities = [10, 15, 20, 25, 30, 40, 50, 75, 100]
+    capacities = STAGGER_CAPACITIES
+    runs = _phase_stagger_configs()
 
     configs = [
         ("Random phase", False, c_centralized, "-", "o"),
@@ -1663,16 +1869,7 @@ def fig_phase_stagger() -> None:
     for label, stagger, color, ls, marker in configs:
         drops: list[int] = []
         overheads: list[float] = []
-        for cap in capacities:
-            cfg = _make_config(
-                N,
-                cluster_size=cluster_size,
-                simulation_days=sim_days,
-                coordinator_link_capacity_kbps=float(cap),
-                enable_phase_stagger=stagger,
-            )
-            sim = SwarmCoordinationSimulator(cfg)
-            r = sim.run()
+        for r in _runs([runs[stagger, cap] for cap in capacities]):
             drops.append(r.coordinator_drops)
             overheads.append(r.communication_overhead_percent)
 
@@ -1759,6 +1956,30 @@ def fig_command_rate_sweep() -> None:
 # ---------------------------------------------------------------------------
 # Figure 18: Cross-Cycle Recovery Distribution
 # ---------------------------------------------------------------------------
+CROSS_CYCLE_P_BG = [0.10, 0.20, 0.50]  # DES validation dots in panel (b)
+
+
+def _cross_cycle_configs() -> dict[float | None, list[SwarmCoordinationConfig]]:
+    """Return panel (a) runs under key None and panel (b) runs by p_BG."""
+    nc = SCALE.get("summary_nodes", 5_000)
+    n_runs = SCALE.get("summary_runs", 30)  # 30 for publication, 3 for --fast
+    base = _make_config(
+        nc,
+        cluster_size=100,
+        simulation_days=min(_sim_days(nc), 30),
+        link_model="gilbert_elliott",
+        max_retransmissions=2,
+    )
+    configs: dict[float | None, list[SwarmCoordinationConfig]] = {None: _seeded(base, n_runs)}
+    for p_bg_val in CROSS_CYCLE_P_BG:
+        configs[p_bg_val] = _seeded(replace(base, ge_p_bad_to_good=p_bg_val), n_runs)
+    return configs
+
+
+def _cross_cycle_jobs() -> list[SwarmCoordinationConfig]:
+    return [c for runs in _cross_cycle_configs().values() for c in runs]
+
+
 def fig_cross_cycle_recovery() -> None:
     """Generate Figure 18: DES-validated inter-cycle recovery under GE losses.
 
@@ -1766,27 +1987,14 @@ def fig_cross_cycle_recovery() -> None:
     Panel (b): GE parameter sensitivity — P95 recovery cycles vs p_BG for
     three p_loss_bad values, providing a family of design curves.
     """
-    nc = SCALE.get("summary_nodes", 5_000)
-    sim_days = min(_sim_days(nc), 30)
-    cluster_size = 100
-    n_runs = SCALE.get("summary_runs", 30)  # 30 for publication, 3 for --fast
+    configs = _cross_cycle_configs()
 
     # --- Panel (a): DES CDF vs analytical at default parameters ---
     all_cdfs: list[list[float]] = []
     all_means: list[float] = []
     all_p95s: list[float] = []
 
-    for run_idx in range(n_runs):
-        cfg = _make_config(
-            nc,
-            cluster_size=cluster_size,
-            simulation_days=sim_days,
-            seed=SEED + run_idx,
-            link_model="gilbert_elliott",
-            max_retransmissions=2,
-        )
-        sim = SwarmCoordinationSimulator(cfg)
-        r = sim.run()
+    for r in _runs(configs[None]):
         if r.cross_cycle_recovery_rate_by_cycle:
             all_cdfs.append(r.cross_cycle_recovery_rate_by_cycle)
             all_means.append(r.cross_cycle_recovery_mean)
@@ -1828,19 +2036,9 @@ def fig_cross_cycle_recovery() -> None:
 
     # Also run DES at selected p_BG values for validation dots
     des_p95_by_pbg: dict[float, list[float]] = {}
-    for p_bg_val in [0.10, 0.20, 0.50]:
+    for p_bg_val in CROSS_CYCLE_P_BG:
         p95_runs = []
-        for run_idx in range(n_runs):
-            cfg_sens = _make_config(
-                nc,
-                cluster_size=cluster_size,
-                simulation_days=sim_days,
-                seed=SEED + run_idx,
-                link_model="gilbert_elliott",
-                max_retransmissions=2,
-                ge_p_bad_to_good=p_bg_val,
-            )
-            r_s = SwarmCoordinationSimulator(cfg_sens).run()
+        for r_s in _runs(configs[p_bg_val]):
             if r_s.cross_cycle_recovery_count > 0:
                 p95_runs.append(r_s.cross_cycle_recovery_p95)
         if p95_runs:
@@ -1986,6 +2184,28 @@ def fig_fleet_reuse() -> None:
 # ---------------------------------------------------------------------------
 # Figure 20: Coordinator Buffer Occupancy CDF
 # ---------------------------------------------------------------------------
+BUFFER_CAMPAIGNS = [(0.10, "bernoulli", 1), (0.10, "on_off", 100), (1.0, "bernoulli", 1)]
+"""(duty factor d, campaign mode, L_on) of the three curves."""
+
+
+def _coordinator_buffer_jobs() -> list[SwarmCoordinationConfig]:
+    return [
+        _make_config(
+            10_000,
+            cluster_size=100,
+            simulation_days=max(1, min(5, SCALE.get("sim_days_cap", 90))),
+            workload_profile="stress",
+            campaign_duty_factor=d,
+            campaign_mode=mode,
+            campaign_on_length=l_on,
+            link_model="gilbert_elliott",
+            ge_p_bad_to_good=0.50,
+            max_retransmissions=2,
+        )
+        for d, mode, l_on in BUFFER_CAMPAIGNS
+    ]
+
+
 def fig_coordinator_buffer_cdf() -> None:
     """Generate Figure 20: CDF of per-cycle coordinator ingress bytes.
 
@@ -1993,37 +2213,19 @@ def fig_coordinator_buffer_cdf() -> None:
     GE losses.  ON/OFF produces heavier tails than Bernoulli at the same
     marginal d due to temporally correlated campaign bursts.
     """
-    nc = 10_000
-    cluster_size = 100
-    sim_days = max(1, min(5, SCALE.get("sim_days_cap", 90)))
-
-    # Three configurations: Bernoulli d=0.10, ON/OFF d=0.10 L_on=100, continuous d=1.0
+    # Three configurations (BUFFER_CAMPAIGNS order): Bernoulli d=0.10,
+    # ON/OFF d=0.10 L_on=100, continuous d=1.0
     configs = [
-        {"d": 0.10, "mode": "bernoulli", "L_on": 1,
-         "label": "Bernoulli $d\\!=\\!0.10$", "color": c_hierarchical, "ls": "-"},
-        {"d": 0.10, "mode": "on_off", "L_on": 100,
-         "label": "ON/OFF $d\\!=\\!0.10$, $L_{\\mathrm{on}}\\!=\\!100$", "color": "#e67e22", "ls": "-."},
-        {"d": 1.0, "mode": "bernoulli", "L_on": 1,
-         "label": "$d\\!=\\!1.0$ (continuous)", "color": c_stress, "ls": "--"},
+        {"label": "Bernoulli $d\\!=\\!0.10$", "color": c_hierarchical, "ls": "-"},
+        {"label": "ON/OFF $d\\!=\\!0.10$, $L_{\\mathrm{on}}\\!=\\!100$", "color": "#e67e22", "ls": "-."},
+        {"label": "$d\\!=\\!1.0$ (continuous)", "color": c_stress, "ls": "--"},
     ]
 
     fig, ax = subplots(figsize=(5.5, 4))
 
-    for c in configs:
-        cfg = _make_config(
-            nc,
-            cluster_size=cluster_size,
-            simulation_days=sim_days,
-            workload_profile="stress",
-            campaign_duty_factor=c["d"],
-            campaign_mode=c["mode"],
-            campaign_on_length=c["L_on"],
-            link_model="gilbert_elliott",
-            ge_p_bad_to_good=0.50,
-            max_retransmissions=2,
-        )
-        sim = SwarmCoordinationSimulator(cfg)
-        r = sim.run()
+    # Raw per-cycle ingress series, so these runs are kept lossless
+    results = _runs(_coordinator_buffer_jobs(), encoding="lossless")
+    for c, r in zip(configs, results):
         ingress = np.array(r.coordinator_ingress_bytes_per_cycle)
         if len(ingress) == 0:
             continue
@@ -2045,11 +2247,63 @@ def fig_coordinator_buffer_cdf() -> None:
     close(fig)
 
 
+# ---------------------------------------------------------------------------
+# Sweep jobs
+# ---------------------------------------------------------------------------
+FIGURE_JOBS: dict[Callable[[], None], Callable[[], list[SwarmCoordinationConfig]]] = {
+    fig_overhead_vs_nodes: _overhead_vs_nodes_jobs,
+    fig_latency_distribution: _latency_distribution_jobs,
+    fig_cluster_size_optimization: _cluster_size_jobs,
+    fig_duty_cycle_pareto: _duty_cycle_jobs,
+    fig_scaling_trajectory: _scaling_trajectory_jobs,
+    fig_failure_resilience: _failure_resilience_jobs,
+    fig_topology_summary: _topology_summary_jobs,
+    fig_message_decomposition: _message_decomposition_jobs,
+    fig_aoi_quality: _aoi_quality_jobs,
+    fig_workload_comparison: _workload_jobs,
+    fig_link_model_comparison: _link_model_jobs,
+    fig_overhead_decomposition: _overhead_decomposition_jobs,
+    fig_phase_stagger: _phase_stagger_jobs,
+    fig_cross_cycle_recovery: _cross_cycle_jobs,
+    fig_coordinator_buffer_cdf: _coordinator_buffer_jobs,
+}
+"""DES runs each figure reads from SWEEP (figures not listed are analytical)."""
+
+LOSSLESS_FIGURES = {fig_coordinator_buffer_cdf}
+"""Figures that need raw per-cycle series rather than histogram-packed runs."""
+
+
+def run_figure_jobs(figures: list[Callable[[], None]]) -> None:
+    """Run the DES jobs of *figures* into SWEEP in one parallel pass.
+
+    Jobs shared between figures run once and the pool takes the longest
+    runs first; the figure functions then only read SWEEP and plot.
+    """
+    jobs = [c for f in figures if f in FIGURE_JOBS and f not in LOSSLESS_FIGURES
+            for c in FIGURE_JOBS[f]()]
+    lossless = [c for f in figures if f in LOSSLESS_FIGURES for c in FIGURE_JOBS[f]()]
+
+    def _progress(cur: int, total: int, pct: float) -> None:
+        if cur % 50 == 0 or cur == total:
+            print(f"  {cur}/{total} runs ({pct:.0f}%)")
+
+    t0 = time.perf_counter()
+    n_before = len(SWEEP)
+    print(f"Running sweep ({len(jobs) + len(lossless)} jobs requested)...")
+    run_sweep(jobs, WORKERS, on_progress=_progress, table=SWEEP, cache=CACHE)
+    run_sweep(lossless, WORKERS, on_progress=_progress, table=SWEEP,
+              encoding="lossless", cache=CACHE)
+    print(f"  {len(SWEEP) - n_before} distinct runs in {time.perf_counter() - t0:.1f}s")
+    if CACHE is not None:
+        print(f"  cache: {CACHE.hits} hits, {CACHE.misses} misses, "
+              f"{CACHE.size_bytes() / 1e6:.1f} MB in {CACHE.directory}")
+
+
 # ---------------------------------------------------------------------------
 # Main entry point
 # ---------------------------------------------------------------------------
 def main() -> None:
-    """Generate all 19 figures sequentially with timing for each."""
+    """Run every figure's DES jobs in one sweep, then plot all 20 figures."""
     figures = [
         ("Fig 1: overhead vs nodes", fig_overhead_vs_nodes),
         ("Fig 2: latency distribution", fig_latency_distribution),
@@ -2074,6 +2328,7 @@ def main() -> None:
     ]
 
     total_t0 = time.perf_counter()
+    run_figure_jobs([func for _, func in figures])
 
     for i, (label, func) in enumerate(figures, 1):
         print(f"Generating {label}...")
@@ -2094,7 +2349,54 @@ if __name__ == "__main__":
         action="store_true",
         help="Use reduced node counts and MC runs for faster generation (~2 min vs ~30 min)",
     )
+    parser.add_argument(
+        "--cycle-batched",
+        action="store_true",
+        help="Run hierarchical simulations in the vectorised cycle-batched mode",
+    )
+    parser.add_argument(
+        "--analytic",
+        action="store_true",
+        help="Use the closed-form surrogate for the overhead-vs-nodes MC sweep",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for the DES sweep (0 = one per CPU; default $SWARM_MC_WORKERS)",
+    )
+    parser.add_argument(
+        "--crn",
+        action="store_true",
+        help="Give each stochastic process its own RNG stream so swept configs share failure and loss draws",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Rerun every DES run instead of reading/writing the on-disk run cache",
+    )
+    parser.add_argument(
+        "--cache-size-gb",
+        type=float,
+        default=5.0,
+        help="Size bound of the run cache; least recently used runs are evicted beyond it",
+    )
     args = parser.parse_args()
     if args.fast:
         SCALE = SCALE_FAST
+    if args.cycle_batched:
+        EXECUTION_MODE = "cycle_batched"
+    if args.analytic:
+        FIDELITY = "analytic"
+    if args.crn:
+        RANDOM_STREAMS = "per_process"
+    WORKERS = args.workers
+    if not args.no_cache:
+        cache_dir = environ.get(
+            "SWARM_RUN_CACHE",
+            join(environ.get("XDG_CACHE_HOME", join(expanduser("~"), ".cache")),
+                 "swarm_des_runs"),
+        )
+        CACHE = ResultCache(cache_dir, max_bytes=int(args.cache_size_gb * 1e9))
+        CACHE.prune()
     main()
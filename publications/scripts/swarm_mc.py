@@ -11,22 +11,43 @@ from __future__ import annotations
 
 __version__ = "1.0.0"
 
+import functools
+import hashlib
+import inspect
+import itertools
+import json
 import math
+import multiprocessing
+import os
+import re
 import time
-from dataclasses import dataclass, field, replace
-from typing import Any, Callable, NamedTuple, Optional, TypedDict
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field, fields, replace
+from typing import Any, Callable, Literal, NamedTuple, Optional, Sequence, TypedDict
 
 import numpy as np
 from numpy.random import Generator
 from numpy.typing import NDArray
-from scipy.stats import spearmanr, rankdata
+from scipy.stats import qmc, spearmanr, rankdata
 from numpy.linalg import lstsq
 
 from swarm_model import (
+    SECONDS_PER_DAY,
+    SKETCH_RESOLUTION,
     CoordinationTopology,
+    ExactSamples,
+    FluidSwarmSimulator,
+    LogHistogram,
+    NetworkStructure,
+    QuantileSketch,
     SwarmCoordinationConfig,
     SwarmCoordinationRunResult,
     SwarmCoordinationSimulator,
+    TierMessageBreakdown,
+    analytic_run_result,
+    initialize_network,
+    to_log_histogram,
 )
 
 NDFloat = NDArray[np.floating[Any]]
@@ -131,6 +152,16 @@ class SwarmCoordinationResult:
     message_drop_rate: float = 0.0
     message_drop_rate_std_dev: float = 0.0
     confidence_interval_95: tuple[float, float] = (0.0, 0.0)
+    # Pooled quantiles over every sample of every run (merged sketches)
+    aoi_mean_seconds: float = 0.0
+    aoi_p99_seconds: float = 0.0
+    update_propagation_p95_ms: float = 0.0
+    coordinator_ingress_p99_bytes: float = 0.0
+    cross_cycle_recovery_p95: float = 0.0
+    distributions: dict[str, QuantileSketch] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+    """Ensemble-merged sketches keyed as in ``swarm_model.SKETCH_RESOLUTION``."""
 
 
 @dataclass
@@ -141,6 +172,24 @@ class SwarmCoordinationOutput:
     result: SwarmCoordinationResult
     runs: int
     execution_time_ms: float
+    achieved_precision: dict[str, float] = field(default_factory=dict)
+    """Relative 95 % CI half-width per targeted metric (sequential mode only)."""
+    converged: bool = True
+    """False if the run budget ran out before every precision target was met."""
+
+
+@dataclass
+class PairedDifference:
+    """Paired difference ``other - baseline`` in one metric over common seeds."""
+
+    baseline: str
+    other: str
+    metric: str
+    mean: float
+    std_dev: float
+    ci_lower: float
+    ci_upper: float
+    runs: int
 
 
 @dataclass
@@ -151,6 +200,12 @@ class TopologyComparisonResult:
     results: list[SwarmCoordinationResult]
     optimal_config_index: int
     analysis: TopologyAnalysis
+    runs: list[int] = field(default_factory=list)
+    """Runs used per topology."""
+    achieved_precision: list[dict[str, float]] = field(default_factory=list)
+    """Relative CI half-width per targeted metric and topology (sequential mode only)."""
+    paired_differences: list[PairedDifference] = field(default_factory=list)
+    """Each other topology against the optimal one, per ``PAIRED_METRICS``."""
 
 
 @dataclass
@@ -172,6 +227,508 @@ class PRCCResult:
     p_val: float
 
 
+# ---------------------------------------------------------------------------
+# Compact run-result encoding
+# ---------------------------------------------------------------------------
+ResultEncoding = Literal["lossless", "histogram"]
+
+_SERIES_DTYPES: dict[str, Any] = {
+    "cross_cycle_recovery_rate_by_cycle": np.float64,
+    "coordinator_ingress_bytes_per_cycle": np.int64,
+}
+"""Per-run sample series of :class:`SwarmCoordinationRunResult` and their dtypes."""
+
+_HISTOGRAM_EDGES: dict[str, NDArray[np.float64]] = {
+    # 20 log bins per decade from 1 B to 10 GB, plus [0, 1) and overflow.
+    "coordinator_ingress_bytes_per_cycle": np.concatenate(
+        ([0.0], np.logspace(0, 10, 201), [np.inf])
+    ),
+}
+"""Fixed bin edges for series pre-binned by the ``"histogram"`` encoding.
+
+Edges are shared by every run, so histograms merge by adding counts.
+Series not listed here (e.g. the short recovery CDF) stay lossless.
+"""
+
+_SCALAR_FIELDS: tuple[str, ...] = tuple(
+    f.name for f in fields(SwarmCoordinationRunResult)
+    if f.name not in _SERIES_DTYPES
+    and f.name not in ("config", "tier_breakdown", "distributions", "profile")
+)
+_TIER_FIELDS: tuple[str, ...] = tuple(f.name for f in fields(TierMessageBreakdown))
+_PACKED_SCALAR_NAMES: tuple[str, ...] = _SCALAR_FIELDS + tuple(
+    f"tier_breakdown.{name}" for name in _TIER_FIELDS
+)
+_INT_SCALAR_FIELDS: frozenset[str] = frozenset(
+    f.name for f in fields(SwarmCoordinationRunResult)
+    if f.name in _SCALAR_FIELDS and type(f.default) is int
+)
+
+
+@dataclass
+class PackedRunResult:
+    """Array-backed encoding of one :class:`SwarmCoordinationRunResult`.
+
+    Used as the inter-process payload of pooled ensembles and as the
+    on-disk format of :func:`save_packed_results`.  The run's config is not
+    carried; :func:`unpack_run_result` takes it from the caller.
+    """
+
+    scalars: NDArray[np.float64]
+    """Scalar fields in ``_PACKED_SCALAR_NAMES`` order (ints are exact below 2**53)."""
+    series: dict[str, NDArray[Any]] = field(default_factory=dict)
+    """Sample series kept verbatim, keyed by result field name."""
+    histograms: dict[str, NDArray[np.int64]] = field(default_factory=dict)
+    """Counts over ``_HISTOGRAM_EDGES[name]`` for series packed as histograms."""
+    encoding: ResultEncoding = "lossless"
+    """Encoding the series were packed with."""
+    sketches: dict[str, QuantileSketch] = field(default_factory=dict)
+    """Distribution sketches (exact samples are re-binned by ``"histogram"``)."""
+
+    def scalar(self, name: str) -> float:
+        """Return the packed value of scalar field *name*."""
+        return float(self.scalars[_PACKED_SCALAR_NAMES.index(name)])
+
+
+def pack_run_result(
+    result: SwarmCoordinationRunResult,
+    encoding: ResultEncoding = "lossless",
+) -> PackedRunResult:
+    """Encode *result* as arrays.
+
+    ``"lossless"`` keeps every sample series as a typed array;
+    ``"histogram"`` pre-bins the unbounded per-cycle series on the fixed
+    ``_HISTOGRAM_EDGES`` so the payload size is independent of run length.
+    """
+    tiers = result.tier_breakdown
+    scalars = np.array(
+        [getattr(result, name) for name in _SCALAR_FIELDS]
+        + [getattr(tiers, name) if tiers is not None else np.nan for name in _TIER_FIELDS],
+        dtype=np.float64,
+    )
+    packed = PackedRunResult(scalars=scalars, encoding=encoding)
+    for name, dtype in _SERIES_DTYPES.items():
+        values = np.asarray(getattr(result, name), dtype=dtype)
+        if encoding == "histogram" and name in _HISTOGRAM_EDGES:
+            counts, _ = np.histogram(values, bins=_HISTOGRAM_EDGES[name])
+            packed.histograms[name] = counts.astype(np.int64)
+        else:
+            packed.series[name] = values
+    for name, sketch in result.distributions.items():
+        if encoding == "histogram":
+            sketch = to_log_histogram(sketch, SKETCH_RESOLUTION.get(name, 1.0))
+        packed.sketches[name] = sketch
+    return packed
+
+
+def unpack_run_result(
+    packed: PackedRunResult,
+    config: Optional[SwarmCoordinationConfig] = None,
+) -> SwarmCoordinationRunResult:
+    """Decode *packed* back into a :class:`SwarmCoordinationRunResult`.
+
+    Lossless packs round-trip exactly.  Series that were packed as
+    histograms come back empty; read them from ``packed.histograms``.
+    """
+    values = dict(zip(_PACKED_SCALAR_NAMES, packed.scalars.tolist()))
+    kwargs: dict[str, Any] = {
+        name: int(values[name]) if name in _INT_SCALAR_FIELDS else values[name]
+        for name in _SCALAR_FIELDS
+    }
+    tier_values = [values[f"tier_breakdown.{name}"] for name in _TIER_FIELDS]
+    if not any(math.isnan(v) for v in tier_values):
+        kwargs["tier_breakdown"] = TierMessageBreakdown(*(int(v) for v in tier_values))
+    for name in _SERIES_DTYPES:
+        kwargs[name] = packed.series[name].tolist() if name in packed.series else []
+    kwargs["distributions"] = dict(packed.sketches)
+    return SwarmCoordinationRunResult(config=config, **kwargs)
+
+
+_SKETCH_KINDS: tuple[str, ...] = ("exact", "log_histogram")
+
+
+def _sketch_to_arrays(
+    sketch: Optional[QuantileSketch],
+) -> tuple[NDArray[np.float64], NDArray[np.int64], NDArray[np.float64]]:
+    """Flatten *sketch* to ``(header, keys, data)`` for :func:`save_packed_results`.
+
+    The header is ``[kind, count, total, min, max, resolution, ratio]``
+    (kind -1 = absent); exact sketches store their samples in *data*, log
+    histograms their bin indices in *keys* and counts in *data*.
+    """
+    if sketch is None:
+        header = np.full(7, np.nan)
+        header[0] = -1
+        return header, np.empty(0, dtype=np.int64), np.empty(0)
+    resolution, ratio = (
+        (sketch.resolution, sketch.ratio) if isinstance(sketch, LogHistogram)
+        else (np.nan, np.nan)
+    )
+    header = np.array([
+        _SKETCH_KINDS.index(sketch.kind), sketch.count, sketch.total,
+        sketch.min, sketch.max, resolution, ratio,
+    ])
+    if isinstance(sketch, LogHistogram):
+        keys = np.array(sorted(sketch.bins), dtype=np.int64)
+        return header, keys, np.array([sketch.bins[k] for k in keys.tolist()], dtype=np.float64)
+    assert isinstance(sketch, ExactSamples)
+    return header, np.empty(0, dtype=np.int64), sketch.samples()
+
+
+def _sketch_from_arrays(
+    header: NDArray[np.float64], keys: NDArray[np.int64], data: NDArray[np.float64],
+) -> Optional[QuantileSketch]:
+    """Inverse of :func:`_sketch_to_arrays`."""
+    kind = int(header[0])
+    if kind < 0:
+        return None
+    sketch: QuantileSketch
+    if _SKETCH_KINDS[kind] == "log_histogram":
+        sketch = LogHistogram(resolution=float(header[5]), ratio=float(header[6]))
+        sketch.bins = dict(zip(keys.tolist(), (int(n) for n in data.tolist())))
+    else:
+        sketch = ExactSamples()
+        sketch.add_many_samples(np.asarray(data, dtype=np.float64))
+    sketch.count = int(header[1])
+    sketch.total = float(header[2])
+    sketch.min, sketch.max = float(header[3]), float(header[4])
+    return sketch
+
+
+def save_packed_results(path: str, packed: Sequence[PackedRunResult]) -> None:
+    """Write an ensemble of packed results to a compressed ``.npz`` file.
+
+    Scalars are stored as one ``(runs, fields)`` matrix; each series is
+    concatenated with a CSR-style offsets array and each histogram as a
+    ``(runs, bins)`` count matrix alongside its bin edges.
+    """
+    arrays: dict[str, NDArray[Any]] = {
+        "scalar_names": np.array(_PACKED_SCALAR_NAMES),
+        "encoding": np.array([p.encoding for p in packed]),
+        "scalars": np.array([p.scalars for p in packed]).reshape(
+            len(packed), len(_PACKED_SCALAR_NAMES)
+        ),
+    }
+    for name, dtype in _SERIES_DTYPES.items():
+        runs = [p.series.get(name, np.empty(0, dtype=dtype)) for p in packed]
+        offsets = np.zeros(len(runs) + 1, dtype=np.int64)
+        np.cumsum([len(r) for r in runs], out=offsets[1:])
+        arrays[f"{name}.values"] = np.concatenate(runs) if runs else np.empty(0, dtype=dtype)
+        arrays[f"{name}.offsets"] = offsets
+    for name, edges in _HISTOGRAM_EDGES.items():
+        counts = np.zeros((len(packed), len(edges) - 1), dtype=np.int64)
+        for i, p in enumerate(packed):
+            if name in p.histograms:
+                counts[i] = p.histograms[name]
+        arrays[f"{name}.counts"] = counts
+        arrays[f"{name}.edges"] = edges
+    for name in SKETCH_RESOLUTION:
+        flat = [_sketch_to_arrays(p.sketches.get(name)) for p in packed]
+        arrays[f"{name}.sketch_header"] = np.array([f[0] for f in flat]).reshape(len(flat), 7)
+        for part, column in (("keys", 1), ("data", 2)):
+            runs = [f[column] for f in flat]
+            offsets = np.zeros(len(runs) + 1, dtype=np.int64)
+            np.cumsum([len(r) for r in runs], out=offsets[1:])
+            arrays[f"{name}.sketch_{part}"] = np.concatenate(runs) if runs else np.empty(0)
+            arrays[f"{name}.sketch_{part}_offsets"] = offsets
+    np.savez_compressed(path, **arrays)
+
+
+def load_packed_results(path: str) -> list[PackedRunResult]:
+    """Read an ensemble written by :func:`save_packed_results`.
+
+    Scalar columns are matched by name, so files written before a result
+    field was added still load (the missing field reads as its default).
+    """
+    with np.load(path) as data:
+        stored = {str(n): j for j, n in enumerate(data["scalar_names"])}
+        matrix = data["scalars"]
+        defaults = {
+            f.name: f.default for f in fields(SwarmCoordinationRunResult)
+            if f.name in _SCALAR_FIELDS
+        }
+        columns = [
+            matrix[:, stored[name]] if name in stored
+            else np.full(len(matrix), float(defaults.get(name, np.nan)))
+            for name in _PACKED_SCALAR_NAMES
+        ]
+        scalars = np.stack(columns, axis=1) if columns else matrix
+        packed = [
+            PackedRunResult(scalars=scalars[i], encoding=str(enc))
+            for i, enc in enumerate(data["encoding"])
+        ]
+        for name in _SERIES_DTYPES:
+            values, offsets = data[f"{name}.values"], data[f"{name}.offsets"]
+            for i, p in enumerate(packed):
+                if not (p.encoding == "histogram" and name in _HISTOGRAM_EDGES):
+                    p.series[name] = values[offsets[i]:offsets[i + 1]]
+        for name in _HISTOGRAM_EDGES:
+            counts = data[f"{name}.counts"]
+            for i, p in enumerate(packed):
+                if p.encoding == "histogram":
+                    p.histograms[name] = counts[i]
+        for name in SKETCH_RESOLUTION:
+            if f"{name}.sketch_header" not in data:
+                continue
+            header = data[f"{name}.sketch_header"]
+            keys, key_off = data[f"{name}.sketch_keys"], data[f"{name}.sketch_keys_offsets"]
+            vals, val_off = data[f"{name}.sketch_data"], data[f"{name}.sketch_data_offsets"]
+            for i, p in enumerate(packed):
+                sketch = _sketch_from_arrays(
+                    header[i],
+                    keys[key_off[i]:key_off[i + 1]].astype(np.int64),
+                    vals[val_off[i]:val_off[i + 1]],
+                )
+                if sketch is not None:
+                    p.sketches[name] = sketch
+    return packed
+
+
+# ---------------------------------------------------------------------------
+# Parallel execution
+# ---------------------------------------------------------------------------
+WORKERS_ENV_VAR = "SWARM_MC_WORKERS"
+"""Environment variable supplying the default ``workers`` count."""
+
+
+def default_workers() -> int:
+    """Return the default worker count from ``$SWARM_MC_WORKERS``.
+
+    Unset or empty means 1 (serial, in-process); ``0`` or a negative value
+    means one worker per CPU.
+    """
+    value = os.environ.get(WORKERS_ENV_VAR, "").strip()
+    return _resolve_workers(int(value) if value else 1)
+
+
+def _resolve_workers(workers: Optional[int]) -> int:
+    """Map a ``workers`` argument to a concrete process count (>= 1)."""
+    if workers is None:
+        return default_workers()
+    if workers <= 0:
+        return os.cpu_count() or 1
+    return workers
+
+
+def _run_single(
+    config: SwarmCoordinationConfig,
+    encoding: ResultEncoding,
+    network: Optional[NetworkStructure] = None,
+) -> PackedRunResult:
+    """Run one simulation (module level so pool workers can unpickle it)."""
+    if config.fidelity == "analytic":
+        return pack_run_result(analytic_run_result(config), encoding)
+    if config.fidelity == "fluid":
+        return pack_run_result(FluidSwarmSimulator(config).run(), encoding)
+    return pack_run_result(SwarmCoordinationSimulator(config, network).run(), encoding)
+
+
+_shared_network: Optional[NetworkStructure] = None
+"""Topology snapshot read by pool workers (see :func:`_run_configs`)."""
+
+
+def _share_network(network: Optional[NetworkStructure]) -> None:
+    """Install *network* as this process's topology snapshot."""
+    global _shared_network
+    _shared_network = network
+
+
+def _run_shared(
+    config: SwarmCoordinationConfig, encoding: ResultEncoding
+) -> PackedRunResult:
+    """Run one simulation on a fork of the process's topology snapshot."""
+    return _run_single(config, encoding, _shared_network)
+
+
+def _run_configs(
+    run_configs: list[SwarmCoordinationConfig],
+    workers: Optional[int] = None,
+    on_result: Optional[Callable[[int, PackedRunResult], None]] = None,
+    encoding: ResultEncoding = "lossless",
+    network: Optional[NetworkStructure] = None,
+) -> list[PackedRunResult]:
+    """Run every config and return the packed results in input order.
+
+    With more than one worker the runs fan out over a single process pool;
+    ``on_result(index, packed)`` fires as each run finishes (completion
+    order), while the returned list always follows *run_configs*.  Every
+    run is fully determined by its own config, so the results are
+    identical to the serial path.  Runs come back as
+    :class:`PackedRunResult` in both paths, which keeps the pickled
+    payload small and lets callers aggregate without the raw series.
+
+    A *network* snapshot is forked by every run instead of being rebuilt.
+    Pool workers inherit it through ``fork`` where the platform supports
+    it, otherwise it is pickled once per worker (never once per run).
+    """
+    n_workers = min(_resolve_workers(workers), len(run_configs))
+    results: list[Optional[PackedRunResult]] = [None] * len(run_configs)
+    if n_workers <= 1:
+        for i, cfg in enumerate(run_configs):
+            results[i] = _run_single(cfg, encoding, network)
+            if on_result is not None:
+                on_result(i, results[i])
+        return results  # type: ignore[return-value]
+
+    task: Callable[[SwarmCoordinationConfig, ResultEncoding], PackedRunResult] = _run_single
+    pool_kwargs: dict[str, Any] = {}
+    if network is not None:
+        task = _run_shared
+        if "fork" in multiprocessing.get_all_start_methods():
+            _share_network(network)
+            pool_kwargs["mp_context"] = multiprocessing.get_context("fork")
+        else:
+            pool_kwargs["initializer"] = _share_network
+            pool_kwargs["initargs"] = (network,)
+    try:
+        with ProcessPoolExecutor(max_workers=n_workers, **pool_kwargs) as pool:
+            futures = {
+                pool.submit(task, cfg, encoding): i
+                for i, cfg in enumerate(run_configs)
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                results[i] = future.result()
+                if on_result is not None:
+                    on_result(i, results[i])
+    finally:
+        _share_network(None)
+    return results  # type: ignore[return-value]
+
+
+_RANDOM_TOPOLOGIES: tuple[CoordinationTopology, ...] = ("mesh",)
+"""Topologies whose ``initialize_network`` layout depends on the seed."""
+
+
+def _seeded_configs(
+    config: SwarmCoordinationConfig, runs: int
+) -> list[SwarmCoordinationConfig]:
+    """Return the per-run configs of an ensemble (``seed = config.seed + i``)."""
+    return [replace(config, seed=config.seed + i) for i in range(runs)]
+
+
+def relative_half_width(
+    values: NDFloat | list[float],
+    confidence: float = 0.95,
+) -> float:
+    """Return the CI half-width of the mean of *values* relative to the mean.
+
+    Uses :func:`confidence_interval`.  Fewer than two values, or a
+    non-zero width around a zero mean, give ``inf``; a zero-width
+    interval is 0.
+    """
+    if len(values) < 2:
+        return math.inf
+    lo, hi = confidence_interval(values, confidence)
+    half = (hi - lo) / 2
+    if half == 0.0:
+        return 0.0
+    mean = float(np.mean(values))
+    return half / abs(mean) if mean else math.inf
+
+
+PAIRED_METRICS: tuple[str, ...] = (
+    "communication_overhead_percent",
+    "avg_update_propagation_ms",
+    "power_variance_percent",
+    "coordinator_availability_percent",
+    "message_drop_rate",
+)
+"""Run-result fields compared pairwise by :func:`run_topology_comparison`."""
+
+
+def paired_difference(
+    baseline: Sequence[PackedRunResult],
+    other: Sequence[PackedRunResult],
+    metric: str,
+    baseline_label: str = "baseline",
+    other_label: str = "other",
+    confidence: float = 0.95,
+) -> PairedDifference:
+    """Return the paired difference ``other - baseline`` in *metric*.
+
+    Run ``i`` of each ensemble must share a seed (as :func:`_seeded_configs`
+    arranges), so the CI is taken over per-seed differences; with
+    ``random_streams="per_process"`` both runs see the same failure and
+    loss draws and the interval is much narrower than an unpaired one.
+    Unequal ensembles are paired over their common prefix.
+    """
+    n = min(len(baseline), len(other))
+    diffs = np.array([other[i].scalar(metric) - baseline[i].scalar(metric) for i in range(n)])
+    lo, hi = confidence_interval(diffs, confidence)
+    return PairedDifference(
+        baseline=baseline_label,
+        other=other_label,
+        metric=metric,
+        mean=float(np.mean(diffs)) if n else 0.0,
+        std_dev=float(np.std(diffs, ddof=1)) if n > 1 else 0.0,
+        ci_lower=lo,
+        ci_upper=hi,
+        runs=n,
+    )
+
+
+def _run_until_precise(
+    configs: list[SwarmCoordinationConfig],
+    precision: dict[str, float],
+    max_runs: int,
+    batch_size: Optional[int],
+    workers: Optional[int],
+    on_result: Optional[Callable[[int, PackedRunResult], None]] = None,
+    network: Optional[NetworkStructure] = None,
+) -> tuple[list[list[PackedRunResult]], list[dict[str, float]]]:
+    """Run ensembles of *configs* in batches until each meets *precision*.
+
+    *precision* maps run-result scalar fields to target relative 95 % CI
+    half-widths (see :func:`relative_half_width`).  Every round runs one
+    batch of *batch_size* replicas (default: the worker count, at least
+    10) for each config still short of a target, all on one pool, and
+    stops a config once every target is met or *max_runs* is reached.
+    Replica ``i`` of a config uses ``seed + i``, so a sequential ensemble
+    of n runs equals the fixed-size ensemble of n runs.  ``on_result``
+    receives the config index.  Returns the packed runs and the achieved
+    precision per config.
+    """
+    unknown = sorted(set(precision) - set(_PACKED_SCALAR_NAMES))
+    if unknown:
+        raise ValueError(f"unknown precision metrics: {', '.join(unknown)}")
+    if batch_size is None:
+        batch_size = max(10, _resolve_workers(workers))
+    columns = {m: _PACKED_SCALAR_NAMES.index(m) for m in precision}
+    runs: list[list[PackedRunResult]] = [[] for _ in configs]
+    achieved: list[dict[str, float]] = [{m: math.inf for m in precision} for _ in configs]
+    pending = list(range(len(configs)))
+    while pending:
+        owners: list[int] = []
+        batch: list[SwarmCoordinationConfig] = []
+        for k in pending:
+            done = len(runs[k])
+            for i in range(done, min(done + batch_size, max_runs)):
+                owners.append(k)
+                batch.append(replace(configs[k], seed=configs[k].seed + i))
+
+        def _on_batch_result(j: int, packed: PackedRunResult) -> None:
+            if on_result is not None:
+                on_result(owners[j], packed)
+
+        packed = _run_configs(
+            batch, workers, _on_batch_result, encoding="histogram", network=network
+        )
+        for k, p in zip(owners, packed):
+            runs[k].append(p)
+        still: list[int] = []
+        for k in pending:
+            achieved[k] = {
+                m: relative_half_width([float(p.scalars[col]) for p in runs[k]])
+                for m, col in columns.items()
+            }
+            short = any(achieved[k][m] > target for m, target in precision.items())
+            if short and len(runs[k]) < max_runs:
+                still.append(k)
+        pending = still
+    return runs, achieved
+
+
 # ---------------------------------------------------------------------------
 # Core MC runner
 # ---------------------------------------------------------------------------
@@ -179,6 +736,11 @@ def run_swarm_coordination_mc(
     config: SwarmCoordinationConfig,
     runs: int = 100,
     on_progress: Optional[Callable[[int, int, float], None]] = None,
+    workers: Optional[int] = None,
+    warm_start: bool = False,
+    fixed_topology: bool = False,
+    precision: Optional[dict[str, float]] = None,
+    batch_size: Optional[int] = None,
 ) -> SwarmCoordinationOutput:
     """Run *runs* Monte Carlo simulations and aggregate results.
 
@@ -189,52 +751,98 @@ def run_swarm_coordination_mc(
     runs : int
         Number of simulation runs.
     on_progress : callable, optional
-        ``on_progress(current_run, total_runs, percent_complete)``
+        ``on_progress(completed_runs, total_runs, percent_complete)``, called
+        as each run finishes.
+    workers : int, optional
+        Number of worker processes (default ``$SWARM_MC_WORKERS``, else 1;
+        ``<= 0`` = one per CPU).  Results are identical to the serial run.
+    warm_start : bool
+        Build the network once and give every run its own fork of it
+        instead of rebuilding it per run.  Topologies with a random layout
+        (``"mesh"``) are still built per run unless *fixed_topology* is
+        set, so results are identical to a cold start.
+    fixed_topology : bool
+        Hold the topology fixed across runs: every run forks the network
+        drawn from ``config.seed`` (implies *warm_start*).  Only ``"mesh"``
+        results change, as its gossip graph no longer varies by run.
+    precision : dict, optional
+        Sequential mode: target relative 95 % CI half-width per run-result
+        field, e.g. ``{"communication_overhead_percent": 0.01}``.  Runs
+        are added in batches until every target is met, with *runs* as the
+        budget; the output records the runs used and the precision reached.
+    batch_size : int, optional
+        Runs per batch in sequential mode (default: the worker count, at
+        least 10).
 
     Returns
     -------
     SwarmCoordinationOutput
     """
     t_start = time.perf_counter()
-    results: list[SwarmCoordinationRunResult] = []
-
-    for i in range(runs):
-        seed = config.seed + i
-        run_cfg = replace(config, seed=seed)
-        sim = SwarmCoordinationSimulator(run_cfg)
-        result = sim.run()
-        results.append(result)
+    completed = 0
 
+    def _on_result(_i: int, _packed: PackedRunResult) -> None:
+        nonlocal completed
+        completed += 1
         if on_progress is not None:
-            on_progress(i + 1, runs, (i + 1) / runs * 100)
+            on_progress(completed, runs, completed / runs * 100)
+
+    network: Optional[NetworkStructure] = None
+    if config.fidelity == "des" and (
+        fixed_topology
+        or (warm_start and config.coordination_topology not in _RANDOM_TOPOLOGIES)
+    ):
+        network = initialize_network(config, np.random.default_rng(config.seed))
+    achieved: dict[str, float] = {}
+    if precision is None:
+        results = _run_configs(
+            _seeded_configs(config, runs), workers, _on_result,
+            encoding="histogram", network=network,
+        )
+    else:
+        ensembles, reached = _run_until_precise(
+            [config], precision, runs, batch_size, workers, _on_result, network
+        )
+        results, achieved = ensembles[0], reached[0]
 
     elapsed_ms = (time.perf_counter() - t_start) * 1_000
     return SwarmCoordinationOutput(
         config=config,
         result=aggregate_results(results),
-        runs=runs,
+        runs=len(results),
         execution_time_ms=elapsed_ms,
+        achieved_precision=achieved,
+        converged=all(achieved[m] <= t for m, t in (precision or {}).items()),
     )
 
 
 # ---------------------------------------------------------------------------
 # Aggregation
 # ---------------------------------------------------------------------------
+_AGGREGATED_FIELDS: tuple[str, ...] = (
+    "communication_overhead_percent",
+    "bottleneck_threshold_nodes",
+    "coordinator_availability_percent",
+    "power_variance_percent",
+    "avg_update_propagation_ms",
+    "max_update_propagation_ms",
+    "failed_handoffs",
+    "message_drop_rate",
+)
+_AGGREGATED_COLUMNS: list[int] = [_PACKED_SCALAR_NAMES.index(n) for n in _AGGREGATED_FIELDS]
+
+
 def aggregate_results(
-    results: list[SwarmCoordinationRunResult],
+    results: Sequence[SwarmCoordinationRunResult | PackedRunResult],
 ) -> SwarmCoordinationResult:
-    """Compute statistics across an ensemble of run results."""
+    """Compute statistics across an ensemble of run results.
+
+    Accepts full or packed run results (or a mix); only scalar fields are
+    read, so packed ensembles never need their series decoded.
+    """
     arrays = np.array([
-        (
-            r.communication_overhead_percent,
-            r.bottleneck_threshold_nodes,
-            r.coordinator_availability_percent,
-            r.power_variance_percent,
-            r.avg_update_propagation_ms,
-            r.max_update_propagation_ms,
-            float(r.failed_handoffs),
-            r.message_drop_rate,
-        )
+        r.scalars[_AGGREGATED_COLUMNS] if isinstance(r, PackedRunResult)
+        else [float(getattr(r, name)) for name in _AGGREGATED_FIELDS]
         for r in results
     ])
     (
@@ -256,6 +864,10 @@ def aggregate_results(
     drop_stats = calculate_stats(drop_rates)
 
     ci = confidence_interval(overheads)
+    merged = merge_distributions(results)
+
+    def _pooled(name: str, q: float) -> float:
+        return merged[name].percentile(q) if name in merged else 0.0
 
     return SwarmCoordinationResult(
         communication_overhead_percent=overhead_stats.mean,
@@ -273,9 +885,49 @@ def aggregate_results(
         message_drop_rate=drop_stats.mean,
         message_drop_rate_std_dev=drop_stats.stddev,
         confidence_interval_95=ci,
+        aoi_mean_seconds=merged["aoi_seconds"].mean if "aoi_seconds" in merged else 0.0,
+        aoi_p99_seconds=_pooled("aoi_seconds", 99),
+        update_propagation_p95_ms=_pooled("update_propagation_ms", 95),
+        coordinator_ingress_p99_bytes=_pooled("coordinator_ingress_bytes", 99),
+        cross_cycle_recovery_p95=_pooled("recovery_streak_cycles", 95),
+        distributions=merged,
     )
 
 
+def merge_distributions(
+    results: Sequence[SwarmCoordinationRunResult | PackedRunResult],
+) -> dict[str, QuantileSketch]:
+    """Merge each run's distribution sketches into ensemble-wide sketches.
+
+    Exact sketches stay exact when every run is exact; otherwise all runs are
+    re-binned to log histograms first.  The runs' own sketches are not
+    modified.
+    """
+    merged: dict[str, QuantileSketch] = {}
+    for name, resolution in SKETCH_RESOLUTION.items():
+        sketches = [
+            s for s in (
+                (r.sketches if isinstance(r, PackedRunResult) else r.distributions).get(name)
+                for r in results
+            )
+            if s is not None
+        ]
+        if not sketches:
+            continue
+        target: QuantileSketch
+        if all(isinstance(s, ExactSamples) for s in sketches):
+            target = ExactSamples()
+        else:
+            sketches = [to_log_histogram(s, resolution) for s in sketches]
+            first = sketches[0]
+            assert isinstance(first, LogHistogram)
+            target = LogHistogram(resolution=first.resolution, ratio=first.ratio)
+        for sketch in sketches:
+            target.merge(sketch)
+        merged[name] = target
+    return merged
+
+
 # ---------------------------------------------------------------------------
 # Topology comparison
 # ---------------------------------------------------------------------------
@@ -355,11 +1007,58 @@ def _analyze_comparison(
     }
 
 
+def _run_ensembles(
+    configs: list[SwarmCoordinationConfig],
+    runs_per: int,
+    workers: Optional[int],
+    on_progress: Optional[Callable[[int, int, float, int], None]],
+    precision: Optional[dict[str, float]] = None,
+    batch_size: Optional[int] = None,
+) -> tuple[list[list[PackedRunResult]], list[dict[str, float]]]:
+    """Run a *runs_per* ensemble for each config on one shared pool.
+
+    All ``len(configs) * runs_per`` runs are submitted together, so the
+    pool stays busy across config boundaries.  ``on_progress(completed,
+    total, pct, config_index)`` fires as each run finishes (*total* is the
+    run budget).  With *precision*, ensembles grow in batches up to
+    *runs_per* runs (see :func:`_run_until_precise`).  Returns the packed
+    runs and the precision reached per config.
+    """
+    total_runs = len(configs) * runs_per
+    completed = 0
+
+    def _on_result(k: int, _packed: PackedRunResult) -> None:
+        nonlocal completed
+        completed += 1
+        if on_progress is not None:
+            on_progress(completed, total_runs, completed / total_runs * 100, k)
+
+    if precision is not None:
+        ensembles, achieved = _run_until_precise(
+            configs, precision, runs_per, batch_size, workers, _on_result
+        )
+    else:
+        run_configs = [cfg for base in configs for cfg in _seeded_configs(base, runs_per)]
+        results = _run_configs(
+            run_configs, workers,
+            lambda i, packed: _on_result(i // runs_per, packed),
+            encoding="histogram",
+        )
+        ensembles = [
+            results[k * runs_per:(k + 1) * runs_per] for k in range(len(configs))
+        ]
+        achieved = [{} for _ in configs]
+    return ensembles, achieved
+
+
 def run_topology_comparison(
     base_config: SwarmCoordinationConfig,
     topologies: Optional[list[CoordinationTopology]] = None,
     runs_per: int = 50,
     on_progress: Optional[Callable[[int, int, float, str], None]] = None,
+    workers: Optional[int] = None,
+    precision: Optional[dict[str, float]] = None,
+    batch_size: Optional[int] = None,
 ) -> TopologyComparisonResult:
     """Run MC for each topology and compare.
 
@@ -373,33 +1072,48 @@ def run_topology_comparison(
         Runs per topology.
     on_progress : callable, optional
         ``on_progress(current_run, total_runs, pct, current_topology)``
+    workers : int, optional
+        Worker processes shared by all topologies (see
+        :func:`run_swarm_coordination_mc`).
+    precision, batch_size : optional
+        Sequential mode with *runs_per* as the per-topology budget (see
+        :func:`run_swarm_coordination_mc`); each topology stops on its own.
+
+    Every topology runs the same seeds, so the result also carries paired
+    differences against the optimal topology; set
+    ``base_config.random_streams = "per_process"`` for common random
+    numbers across topologies.
     """
     if topologies is None:
         topologies = ["centralized", "hierarchical", "mesh"]
 
-    configs: list[SwarmCoordinationConfig] = []
-    results: list[SwarmCoordinationResult] = []
-    total_runs = len(topologies) * runs_per
-    completed = 0
+    configs = [replace(base_config, coordination_topology=topo) for topo in topologies]
 
-    for topo in topologies:
-        cfg = replace(base_config, coordination_topology=topo)
-        configs.append(cfg)
-
-        def _progress(cur: int, tot: int, pct: float, _topo: str = topo) -> None:
-            if on_progress is not None:
-                overall_pct = (completed + cur) / total_runs * 100
-                on_progress(completed + cur, total_runs, overall_pct, _topo)
+    def _progress(cur: int, tot: int, pct: float, k: int) -> None:
+        if on_progress is not None:
+            on_progress(cur, tot, pct, topologies[k])
 
-        output = run_swarm_coordination_mc(cfg, runs_per, _progress)
-        results.append(output.result)
-        completed += runs_per
+    ensembles, achieved = _run_ensembles(
+        configs, runs_per, workers, _progress, precision, batch_size
+    )
+    results = [aggregate_results(e) for e in ensembles]
+    optimal = find_optimal_config(results, topologies)
 
     return TopologyComparisonResult(
         configs=configs,
         results=results,
-        optimal_config_index=find_optimal_config(results, topologies),
+        optimal_config_index=optimal,
         analysis=_analyze_comparison(topologies, results),
+        runs=[len(e) for e in ensembles],
+        achieved_precision=achieved if precision is not None else [],
+        paired_differences=[
+            paired_difference(
+                ensembles[optimal], ensembles[k], metric,
+                topologies[optimal], topologies[k],
+            )
+            for k in range(len(topologies)) if k != optimal
+            for metric in PAIRED_METRICS
+        ],
     )
 
 
@@ -426,26 +1140,41 @@ def run_scaling_analysis(
     target_latency_ms: float = 1_000.0,
     runs_per_size: int = 30,
     on_progress: Optional[Callable[[int, int, float], None]] = None,
+    workers: Optional[int] = None,
+    fluid_from_nodes: Optional[int] = None,
 ) -> ScalingAnalysisResult:
     """Run MC at multiple node counts and find the maximum viable size.
 
     *Viable* means ``avg_update_propagation_ms <= target_latency_ms``.
+    All sizes share one pool of *workers* processes (see
+    :func:`run_swarm_coordination_mc`).  Sizes of at least
+    *fluid_from_nodes* run on the fluid engine (``fidelity="fluid"``),
+    which covers the whole fleet in time independent of the node count;
+    it models the hierarchical topology only, so any other topology
+    raises ``ValueError`` before anything runs.
     """
+    if (
+        fluid_from_nodes is not None
+        and base_config.coordination_topology != "hierarchical"
+    ):
+        raise ValueError(
+            "fluid_from_nodes needs the hierarchical topology, "
+            f"not {base_config.coordination_topology!r}"
+        )
     node_counts = [1_000, 5_000, 10_000, 50_000, 100_000, 500_000, 1_000_000]
     configs = generate_scaling_configs(base_config, node_counts)
-    results: list[SwarmCoordinationResult] = []
-
-    completed = 0
-    total_runs = len(configs) * runs_per_size
+    if fluid_from_nodes is not None:
+        configs = [
+            replace(cfg, fidelity="fluid") if cfg.node_count >= fluid_from_nodes else cfg
+            for cfg in configs
+        ]
 
-    for cfg in configs:
-        def _progress(cur: int, tot: int, pct: float) -> None:
-            if on_progress is not None:
-                on_progress(completed + cur, total_runs, (completed + cur) / total_runs * 100)
+    def _progress(cur: int, tot: int, pct: float, _k: int) -> None:
+        if on_progress is not None:
+            on_progress(cur, tot, pct)
 
-        output = run_swarm_coordination_mc(cfg, runs_per_size, _progress)
-        results.append(output.result)
-        completed += runs_per_size
+    ensembles, _ = _run_ensembles(configs, runs_per_size, workers, _progress)
+    results = [aggregate_results(e) for e in ensembles]
 
     # Find maximum viable
     max_viable_idx = 0
@@ -461,90 +1190,574 @@ def run_scaling_analysis(
     )
 
 
+# ---------------------------------------------------------------------------
+# Run-result cache
+# ---------------------------------------------------------------------------
+_CACHE_IGNORED_FIELDS: frozenset[str] = frozenset({
+    "checkpoint_interval_days",
+    "checkpoint_path",
+    "event_queue",
+    "profile",
+})
+"""Config fields that do not change a run's result (left out of cache keys)."""
+
+
+@functools.lru_cache(maxsize=None)
+def model_fingerprint() -> str:
+    """Return the SHA-256 of the ``swarm_model`` source, the version of cached runs."""
+    with open(inspect.getfile(SwarmCoordinationSimulator), "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def config_digest(
+    config: SwarmCoordinationConfig, encoding: ResultEncoding = "histogram"
+) -> str:
+    """Return a stable SHA-256 of *config*'s fields and the result *encoding*.
+
+    Fields are serialised by name, so the digest survives field reordering
+    and does not depend on the process (unlike ``hash``).
+    """
+    values = {
+        f.name: getattr(config, f.name)
+        for f in fields(config) if f.name not in _CACHE_IGNORED_FIELDS
+    }
+    payload = json.dumps({"config": values, "encoding": encoding}, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+_CACHE_VERSION_NAME = re.compile(r"[0-9a-f]{16}")
+"""Name of a :class:`ResultCache` model-version directory."""
+
+_CACHE_ENTRY_NAME = re.compile(r"[0-9a-f]{64}\.npz")
+"""Name of a :class:`ResultCache` entry file."""
+
+
+class ResultCache:
+    """Content-addressed on-disk cache of packed run results.
+
+    Each run is one :func:`save_packed_results` file named by
+    :func:`config_digest`, in a subdirectory per :func:`model_fingerprint`:
+    editing ``swarm_model.py`` leaves exactly the runs of the old code
+    unreachable (:meth:`prune` deletes them).  A hit refreshes the file's
+    mtime, and :meth:`evict` deletes the least recently used files until
+    the cache fits in *max_bytes* (no bound if None).  Only files in that
+    layout (``<16-hex version>/<64-hex digest>.npz``) count as cache
+    entries; anything else under *directory* is left alone.
+    """
+
+    def __init__(self, directory: str, max_bytes: Optional[int] = None) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.version = model_fingerprint()[:16]
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, config: SwarmCoordinationConfig, encoding: ResultEncoding) -> str:
+        return os.path.join(
+            self.directory, self.version, f"{config_digest(config, encoding)}.npz"
+        )
+
+    def get(
+        self, config: SwarmCoordinationConfig, encoding: ResultEncoding = "histogram"
+    ) -> Optional[PackedRunResult]:
+        """Return the cached result of *config*, or None."""
+        path = self._path(config, encoding)
+        try:
+            packed = load_packed_results(path)[0]
+            os.utime(path)
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return packed
+
+    def put(
+        self,
+        config: SwarmCoordinationConfig,
+        packed: PackedRunResult,
+        encoding: ResultEncoding = "histogram",
+    ) -> None:
+        """Store *packed* as the result of *config* (atomic replace)."""
+        path = self._path(config, encoding)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path[:-4]}.{os.getpid()}.tmp.npz"
+        save_packed_results(tmp, [packed])
+        os.replace(tmp, path)
+
+    def _entries(self) -> list[tuple[float, int, str]]:
+        """Return ``(mtime, size, path)`` of every cached file."""
+        entries = []
+        try:
+            versions = [
+                d.path for d in os.scandir(self.directory)
+                if _CACHE_VERSION_NAME.fullmatch(d.name) and d.is_dir(follow_symlinks=False)
+            ]
+        except FileNotFoundError:
+            return entries
+        for version_dir in versions:
+            for f in os.scandir(version_dir):
+                if not _CACHE_ENTRY_NAME.fullmatch(f.name):
+                    continue
+                try:
+                    st = f.stat(follow_symlinks=False)
+                except FileNotFoundError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, f.path))
+        return entries
+
+    def size_bytes(self) -> int:
+        """Return the total size of the cached files."""
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self) -> int:
+        """Delete least recently used files beyond ``max_bytes``; return the count."""
+        if self.max_bytes is None:
+            return 0
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+        return removed
+
+    def prune(self) -> int:
+        """Delete the runs of other model versions; return the count."""
+        removed = 0
+        stale_dirs = set()
+        for _, _, path in self._entries():
+            version_dir = os.path.dirname(path)
+            if os.path.basename(version_dir) != self.version:
+                os.remove(path)
+                stale_dirs.add(version_dir)
+                removed += 1
+        for version_dir in stale_dirs:
+            try:
+                os.rmdir(version_dir)
+            except OSError:
+                pass  # holds files that are not ours
+        return removed
+
+
+# ---------------------------------------------------------------------------
+# Parameter sweeps
+# ---------------------------------------------------------------------------
+def _config_key(config: SwarmCoordinationConfig) -> tuple[Any, ...]:
+    """Return a hashable key identifying *config* (configs are unhashable)."""
+    return tuple(getattr(config, f.name) for f in fields(config))
+
+
+_SYNC_INTERVAL_SECONDS = 10.0
+"""State-sync interval T_c of the DES and the fluid engine."""
+
+_SYNC_CYCLES_PER_DAY = SECONDS_PER_DAY / _SYNC_INTERVAL_SECONDS
+"""Sync cycles simulated per day (8,640)."""
+
+_FLUID_CYCLE_COST_SYNCS = 5.0
+"""Run time of one fluid-engine cycle, in sampled DES state syncs."""
+
+
+def _sweep_cost(config: SwarmCoordinationConfig) -> float:
+    """Estimate the relative run time of *config* for longest-first scheduling.
+
+    Proportional to the sampled state syncs simulated (sampled nodes x
+    days), capped by ``max_events``; the analytic surrogate costs nothing
+    and a fluid-engine cycle about as much as a handful of syncs,
+    whatever the node count.
+    """
+    if config.fidelity == "analytic":
+        return 0.0
+    if config.fidelity == "fluid":
+        return config.simulation_days * _SYNC_CYCLES_PER_DAY * _FLUID_CYCLE_COST_SYNCS
+    rate = config.sync_sample_rate or min(1.0, 1_000 / config.node_count)
+    syncs = config.node_count * rate * config.simulation_days * _SYNC_CYCLES_PER_DAY
+    if config.max_events is not None:
+        syncs = min(syncs, config.max_events)
+    return syncs
+
+
+def sweep_grid(
+    base_config: SwarmCoordinationConfig,
+    grid: Optional[dict[str, Sequence[Any]]] = None,
+    seeds: Optional[Sequence[int]] = None,
+) -> list[SwarmCoordinationConfig]:
+    """Return the configs of a declarative sweep.
+
+    Every combination of the *grid* overrides (config field name to
+    values, varied last-field-fastest) is applied to *base_config* and run
+    at each of *seeds* (default: ``base_config.seed`` only).
+    """
+    grid = grid or {}
+    unknown = sorted(set(grid) - {f.name for f in fields(base_config)})
+    if unknown:
+        raise ValueError(f"unknown config fields: {', '.join(unknown)}")
+    if seeds is None:
+        seeds = (base_config.seed,)
+    names = list(grid)
+    return [
+        replace(base_config, **dict(zip(names, values)), seed=seed)
+        for values in itertools.product(*(grid[n] for n in names))
+        for seed in seeds
+    ]
+
+
+@dataclass
+class SweepTable:
+    """Results of a parameter sweep, one row per distinct run config.
+
+    Rows are looked up by config (see :meth:`get`), so figures and
+    analyses that need the same (config, seed) share one run.
+    """
+
+    configs: list[SwarmCoordinationConfig] = field(default_factory=list)
+    results: list[PackedRunResult] = field(default_factory=list)
+    _index: dict[tuple[Any, ...], int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self._index = {_config_key(cfg): i for i, cfg in enumerate(self.configs)}
+
+    def __len__(self) -> int:
+        return len(self.configs)
+
+    def __contains__(self, config: object) -> bool:
+        return (
+            isinstance(config, SwarmCoordinationConfig)
+            and _config_key(config) in self._index
+        )
+
+    def has(self, config: SwarmCoordinationConfig, encoding: ResultEncoding) -> bool:
+        """Return whether *config* has a row at least as detailed as *encoding*.
+
+        A ``"lossless"`` row serves both encodings; a ``"histogram"`` row
+        lacks the raw series, so it does not serve ``"lossless"``.
+        """
+        i = self._index.get(_config_key(config))
+        if i is None:
+            return False
+        return encoding == "histogram" or self.results[i].encoding == "lossless"
+
+    def add(self, config: SwarmCoordinationConfig, packed: PackedRunResult) -> None:
+        """Record the result of *config*, replacing any earlier row."""
+        key = _config_key(config)
+        if key in self._index:
+            self.results[self._index[key]] = packed
+            return
+        self._index[key] = len(self.configs)
+        self.configs.append(config)
+        self.results.append(packed)
+
+    def get(self, config: SwarmCoordinationConfig) -> PackedRunResult:
+        """Return the packed result of *config* (``KeyError`` if not run)."""
+        try:
+            return self.results[self._index[_config_key(config)]]
+        except KeyError:
+            raise KeyError(f"config not in sweep table: {config}") from None
+
+    def run_result(self, config: SwarmCoordinationConfig) -> SwarmCoordinationRunResult:
+        """Return the decoded result of *config*."""
+        return unpack_run_result(self.get(config), config)
+
+    def ensemble(
+        self, config: SwarmCoordinationConfig, runs: int
+    ) -> SwarmCoordinationResult:
+        """Aggregate the *runs* seeds of *config*, as :func:`run_swarm_coordination_mc` does."""
+        return aggregate_results([self.get(c) for c in _seeded_configs(config, runs)])
+
+    def rows(self, columns: Optional[Sequence[str]] = None) -> list[dict[str, Any]]:
+        """Return the table as records of config columns and scalar metrics.
+
+        *columns* defaults to the config fields that vary across rows
+        (always including ``seed``).
+        """
+        if columns is None:
+            names = [f.name for f in fields(SwarmCoordinationConfig)]
+            columns = [
+                n for n in names
+                if n == "seed" or len({getattr(c, n) for c in self.configs}) > 1
+            ]
+        return [
+            {
+                **{n: getattr(cfg, n) for n in columns},
+                **dict(zip(_PACKED_SCALAR_NAMES, packed.scalars.tolist())),
+            }
+            for cfg, packed in zip(self.configs, self.results)
+        ]
+
+
+def run_sweep(
+    configs: Sequence[SwarmCoordinationConfig],
+    workers: Optional[int] = None,
+    on_progress: Optional[Callable[[int, int, float], None]] = None,
+    table: Optional[SweepTable] = None,
+    encoding: ResultEncoding = "histogram",
+    cache: Optional[ResultCache] = None,
+) -> SweepTable:
+    """Run every distinct config of *configs* and return the results table.
+
+    Duplicate configs, and configs already in *table* at *encoding* or
+    better (see :meth:`SweepTable.has`) or in the on-disk *cache*, run
+    once.  The remaining runs share one pool of *workers* processes (see
+    :func:`run_swarm_coordination_mc`) and are submitted longest first so
+    the slowest runs do not trail at the end; each is written to *cache*
+    as it finishes, and the cache is trimmed to its size bound at the end.
+    New rows are added to *table* if given.  ``on_progress(completed,
+    total, pct)`` fires as each run finishes.
+    """
+    if table is None:
+        table = SweepTable()
+    pending: dict[tuple[Any, ...], SwarmCoordinationConfig] = {}
+    for cfg in configs:
+        if not table.has(cfg, encoding):
+            pending.setdefault(_config_key(cfg), cfg)
+    jobs: list[SwarmCoordinationConfig] = []
+    for cfg in sorted(pending.values(), key=_sweep_cost, reverse=True):
+        hit = cache.get(cfg, encoding) if cache is not None else None
+        if hit is not None:
+            table.add(cfg, hit)
+        else:
+            jobs.append(cfg)
+    total = len(jobs)
+    completed = 0
+
+    def _on_result(i: int, packed: PackedRunResult) -> None:
+        nonlocal completed
+        completed += 1
+        if cache is not None:
+            cache.put(jobs[i], packed, encoding)
+        if on_progress is not None:
+            on_progress(completed, total, completed / total * 100)
+
+    for cfg, packed in zip(jobs, _run_configs(jobs, workers, _on_result, encoding)):
+        table.add(cfg, packed)
+    if cache is not None and jobs:
+        cache.evict()
+    return table
+
+
+# ---------------------------------------------------------------------------
+# Analytic surrogate validation
+# ---------------------------------------------------------------------------
+SURROGATE_METRICS: tuple[str, ...] = (
+    "communication_overhead_percent",
+    "coordinator_availability_percent",
+    "message_drop_rate",
+    "message_loss_rate",
+    "power_variance_percent",
+    "total_energy_kwh",
+)
+"""Run-result fields compared by :func:`validate_analytic_surrogate`."""
+
+
+def surrogate_validation_grid(
+    base_config: Optional[SwarmCoordinationConfig] = None,
+    node_counts: Sequence[int] = (1_000, 10_000),
+    topologies: Sequence[CoordinationTopology] = (
+        "centralized", "hierarchical", "mesh", "sectorized_mesh",
+    ),
+) -> list[SwarmCoordinationConfig]:
+    """Return the standard topology x node-count grid for surrogate checks.
+
+    Cluster sizes scale as in :func:`generate_scaling_configs`; the default
+    base is :data:`DEFAULT_SWARM_COORDINATION_CONFIG` shortened to one day.
+    """
+    if base_config is None:
+        base_config = replace(DEFAULT_SWARM_COORDINATION_CONFIG, simulation_days=1)
+    return [
+        cfg
+        for topo in topologies
+        for cfg in generate_scaling_configs(
+            replace(base_config, coordination_topology=topo), list(node_counts)
+        )
+    ]
+
+
+@dataclass
+class SurrogateValidationResult:
+    """Analytic surrogate against a DES ensemble for one config."""
+
+    config: SwarmCoordinationConfig
+    des: dict[str, float]
+    """DES ensemble mean per metric in :data:`SURROGATE_METRICS`."""
+    analytic: dict[str, float]
+    """Surrogate value per metric."""
+    relative_error: dict[str, float]
+    """``|analytic - des| / |des|`` per metric (absolute error when des is 0)."""
+
+
+def validate_analytic_surrogate(
+    configs: Optional[list[SwarmCoordinationConfig]] = None,
+    runs: int = 3,
+    workers: Optional[int] = None,
+) -> list[SurrogateValidationResult]:
+    """Compare :func:`swarm_model.analytic_run_result` with the DES.
+
+    Each config (default :func:`surrogate_validation_grid`) runs a *runs*
+    replica DES ensemble; all ensembles share one pool of *workers*
+    processes (see :func:`run_swarm_coordination_mc`).
+    """
+    if configs is None:
+        configs = surrogate_validation_grid()
+    des_configs = [replace(cfg, fidelity="des") for cfg in configs]
+    run_configs = [c for base in des_configs for c in _seeded_configs(base, runs)]
+    packed = _run_configs(run_configs, workers)
+
+    report: list[SurrogateValidationResult] = []
+    for k, cfg in enumerate(des_configs):
+        ensemble = packed[k * runs:(k + 1) * runs]
+        surrogate = analytic_run_result(cfg)
+        des = {m: float(np.mean([p.scalar(m) for p in ensemble])) for m in SURROGATE_METRICS}
+        analytic = {m: float(getattr(surrogate, m)) for m in SURROGATE_METRICS}
+        report.append(SurrogateValidationResult(
+            config=cfg,
+            des=des,
+            analytic=analytic,
+            relative_error={
+                m: abs(analytic[m] - des[m]) / abs(des[m]) if des[m] else abs(analytic[m])
+                for m in SURROGATE_METRICS
+            },
+        ))
+    return report
+
+
 # ---------------------------------------------------------------------------
 # PRCC sensitivity analysis
 # ---------------------------------------------------------------------------
+SampleDesign = Literal["lhs", "sobol", "halton"]
+
+PRCC_RANGES: dict[str, tuple[float, float]] = {
+    "node_count": (1_000, 50_000),
+    "cluster_size": (50, 200),
+    "coordinator_duty_cycle_hours": (1.0, 168.0),
+}
+"""Default sampled config fields and their (inclusive) ranges."""
+
+PRCC_OUTPUTS: dict[str, str] = {
+    "communication_overhead_percent": "overhead",
+    "power_variance_percent": "power_variance",
+    "aoi_p99_seconds": "aoi_p99",
+    "message_drop_rate": "drop_rate",
+}
+"""Default PRCC responses (run-result field to short label)."""
+
+
+def sample_configs(
+    base_config: SwarmCoordinationConfig,
+    ranges: dict[str, tuple[float, float]],
+    samples: int,
+    design: SampleDesign = "lhs",
+    rng: Optional[Generator] = None,
+) -> tuple[list[SwarmCoordinationConfig], dict[str, NDFloat]]:
+    """Return *samples* space-filling configs over the config fields in *ranges*.
+
+    ``"lhs"`` is a Latin hypercube (one point per stratum of every field);
+    ``"sobol"`` and ``"halton"`` are scrambled low-discrepancy sequences
+    (Sobol is balanced at powers of two).  Integer fields take ``lo..hi``
+    in equal-width strata.  Sample *i* runs at ``seed = base_config.seed +
+    i``.  Returns the configs and the sampled value arrays per field.
+    """
+    known = {f.name for f in fields(base_config)}
+    unknown = sorted(set(ranges) - known)
+    if unknown:
+        raise ValueError(f"unknown config fields: {', '.join(unknown)}")
+    for name in ranges:
+        if type(getattr(base_config, name)) not in (int, float):
+            raise ValueError(f"config field {name!r} is not numeric")
+    if rng is None:
+        rng = np.random.default_rng(base_config.seed)
+    samplers = {"lhs": qmc.LatinHypercube, "sobol": qmc.Sobol, "halton": qmc.Halton}
+    unit = samplers[design](d=len(ranges), rng=rng).random(samples)
+
+    values: dict[str, NDFloat] = {}
+    for j, (name, (lo, hi)) in enumerate(ranges.items()):
+        if type(getattr(base_config, name)) is int:
+            values[name] = np.minimum(lo + np.floor(unit[:, j] * (hi - lo + 1)), hi)
+        else:
+            values[name] = lo + unit[:, j] * (hi - lo)
+    configs = [
+        replace(
+            base_config,
+            **{
+                name: type(getattr(base_config, name))(v[i])
+                for name, v in values.items()
+            },
+            seed=base_config.seed + i,
+        )
+        for i in range(samples)
+    ]
+    return configs, values
+
+
 def compute_prcc_sensitivity(
     base_config: SwarmCoordinationConfig,
     runs: int = 200,
     rng: Optional[Generator] = None,
+    ranges: Optional[dict[str, tuple[float, float]]] = None,
+    outputs: Optional[dict[str, str]] = None,
+    design: SampleDesign = "lhs",
+    workers: Optional[int] = None,
+    on_progress: Optional[Callable[[int, int, float], None]] = None,
 ) -> list[PRCCResult]:
-    """Run PRCC sensitivity analysis for key parameters vs. overhead.
+    """Run PRCC sensitivity analysis of config fields against run outputs.
 
-    Varies ``node_count``, ``cluster_size``, and ``coordinator_duty_cycle_hours``
-    across their plausible ranges, runs one simulation per sample, then
-    computes Partial Rank Correlation Coefficients.
+    Draws *runs* configs over *ranges* (default :data:`PRCC_RANGES`) with
+    :func:`sample_configs`, runs one simulation per sample (at most 30
+    days) on a pool of *workers* processes (see :func:`run_sweep`), then
+    computes Partial Rank Correlation Coefficients of every field against
+    every output.
 
     Parameters
     ----------
     base_config : SwarmCoordinationConfig
         Baseline configuration.
     runs : int
-        Number of Latin-hypercube-like samples.
+        Number of samples.
     rng : Generator, optional
-        Random number generator.
+        Random number generator for the design.
+    ranges : dict, optional
+        Config field to ``(lo, hi)`` sampling range.
+    outputs : dict, optional
+        Run-result field to label (default :data:`PRCC_OUTPUTS`).
+    design : {"lhs", "sobol", "halton"}
+        Sampling design.
+    workers : int, optional
+        Pool size (see :func:`default_workers`).
+    on_progress : callable, optional
+        ``on_progress(completed, total, pct)`` after each run.
 
     Returns
     -------
     list[PRCCResult]
-        PRCC for each sampled parameter against communication overhead,
-        power variance, and propagation delay.
+        PRCC for each sampled field against each output, named
+        ``"<field> vs <label>"``, grouped by output.
     """
-    if rng is None:
-        rng = np.random.default_rng(base_config.seed)
-
-    # Sample parameter space
-    node_counts = rng.integers(1_000, 50_001, size=runs).astype(float)
-    cluster_sizes = rng.integers(50, 201, size=runs).astype(float)
-    duty_cycles = rng.uniform(1.0, 168.0, size=runs)
-
-    overheads = np.empty(runs, dtype=float)
-    power_vars = np.empty(runs, dtype=float)
-
-    print(f"PRCC sensitivity: running {runs} samples ...")
-
-    for i in range(runs):
-        cfg = replace(
-            base_config,
-            node_count=int(node_counts[i]),
-            cluster_size=int(cluster_sizes[i]),
-            coordinator_duty_cycle_hours=float(duty_cycles[i]),
-            simulation_days=min(30, base_config.simulation_days),
-            seed=base_config.seed + i,
-        )
-        sim = SwarmCoordinationSimulator(cfg)
-        result = sim.run()
-        overheads[i] = result.communication_overhead_percent
-        power_vars[i] = result.power_variance_percent
-
-        if (i + 1) % 50 == 0 or i == runs - 1:
-            print(f"  [{i + 1}/{runs}]")
-
-    # Build param arrays
-    param_arrays: dict[str, NDFloat] = {
-        "node_count": node_counts,
-        "cluster_size": cluster_sizes,
-        "duty_cycle": duty_cycles,
-    }
-
-    # PRCC against overhead
-    prcc_overhead = _compute_prcc(param_arrays, overheads)
-    # PRCC against power variance
-    prcc_power = _compute_prcc(param_arrays, power_vars)
+    if ranges is None:
+        ranges = PRCC_RANGES
+    if outputs is None:
+        outputs = PRCC_OUTPUTS
+    configs, param_arrays = sample_configs(
+        replace(base_config, simulation_days=min(30, base_config.simulation_days)),
+        ranges, runs, design, rng,
+    )
+    table = run_sweep(configs, workers, on_progress)
+    packed = [table.get(cfg) for cfg in configs]
 
     results: list[PRCCResult] = []
-    for pr in prcc_overhead:
-        results.append(PRCCResult(
-            name=f"{pr.name} vs overhead",
-            prcc=pr.prcc,
-            p_val=pr.p_val,
-        ))
-    for pr in prcc_power:
-        results.append(PRCCResult(
-            name=f"{pr.name} vs power_variance",
-            prcc=pr.prcc,
-            p_val=pr.p_val,
-        ))
+    for metric, label in outputs.items():
+        response = np.array([p.scalar(metric) for p in packed], dtype=float)
+        for pr in _compute_prcc(param_arrays, response):
+            results.append(PRCCResult(
+                name=f"{pr.name} vs {label}",
+                prcc=pr.prcc,
+                p_val=pr.p_val,
+            ))
     return results
 
 
@@ -559,6 +1772,8 @@ def _compute_prcc(
       2. Regresses rank(X_i) on ranks of all other parameters -> residuals.
       3. Regresses rank(Y) on ranks of all other parameters -> residuals.
       4. PRCC = Spearman(residual_X_i, residual_Y).
+
+    A constant response has no rank correlation: every PRCC is NaN.
     """
     names = list(param_arrays.keys())
     n_params = len(names)
@@ -571,6 +1786,8 @@ def _compute_prcc(
     for j, name in enumerate(names):
         rank_matrix[:, j] = rankdata(param_arrays[name])
     rank_y = rankdata(response)
+    if np.ptp(rank_y) == 0:
+        return [PRCCResult(name=name, prcc=math.nan, p_val=math.nan) for name in names]
 
     results: list[PRCCResult] = []
     for i, name in enumerate(names):
@@ -665,14 +1882,26 @@ if __name__ == "__main__":
     print(f"  Best power       : {analysis['bestPower']}")
     print(f"  Optimal topology : {topos[comparison.optimal_config_index]}")
     print(f"  Recommendation   : {analysis['recommendation']}")
+    print(f"\nPaired differences vs {topos[comparison.optimal_config_index]} (95% CI):")
+    for d in comparison.paired_differences:
+        print(
+            f"  {d.other:<14s} {d.metric:<34s} {d.mean:+12.4g}"
+            f"  [{d.ci_lower:+.4g}, {d.ci_upper:+.4g}]"
+        )
 
     # ----- PRCC sensitivity -----
     print("\n" + "=" * 72)
     print("PRCC Sensitivity Analysis")
     print("=" * 72)
-    prcc_results = compute_prcc_sensitivity(base, runs=100)
+    print("PRCC sensitivity: running 100 samples ...")
+
+    def prcc_progress(cur: int, total: int, pct: float) -> None:
+        if cur % 50 == 0 or cur == total:
+            print(f"  [{cur}/{total}]")
+
+    prcc_results = compute_prcc_sensitivity(base, runs=100, on_progress=prcc_progress)
     for pr in prcc_results:
         sig = "***" if pr.p_val < 0.001 else ("**" if pr.p_val < 0.01 else ("*" if pr.p_val < 0.05 else ""))
-        print(f"  {pr.name:<35s}  PRCC={pr.prcc:+.4f}  p={pr.p_val:.4f}  {sig}")
+        print(f"  {pr.name:<50s}  PRCC={pr.prcc:+.4f}  p={pr.p_val:.4f}  {sig}")
 
     print("\nDone.")
@@ -14,14 +14,21 @@ from __future__ import annotations
 
 __version__ = "1.0.0"
 
+import copy
 import heapq
 import math
+import os
+import pickle
 import random as _stdlib_random
-from dataclasses import dataclass, field
-from typing import Any, Literal, Optional
+import sys
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field, replace
+from time import perf_counter
+from typing import Any, Callable, Iterator, Literal, Optional
 
 import numpy as np
 from numpy.random import Generator
+from numpy.typing import NDArray
 
 # ---------------------------------------------------------------------------
 # Literal types
@@ -37,8 +44,25 @@ EventType = Literal[
     "collision_warning",
     "gossip_round",
     "state_sync",
+    "sync_cycle",
 ]
 
+EVENT_TYPES: tuple[EventType, ...] = (
+    "message_send",
+    "message_receive",
+    "coordinator_handoff",
+    "node_failure",
+    "node_recovery",
+    "collision_warning",
+    "gossip_round",
+    "state_sync",
+    "sync_cycle",
+)
+"""Event types in event-code order."""
+
+EVENT_CODES: dict[str, int] = {t: i for i, t in enumerate(EVENT_TYPES)}
+"""Integer code of each event type (index into the simulator's dispatch table)."""
+
 # ---------------------------------------------------------------------------
 # Physical / protocol constants
 # ---------------------------------------------------------------------------
@@ -68,6 +92,12 @@ MESSAGE_SIZES: dict[str, int] = {
 }
 """Message sizes in bytes by type."""
 
+MESSAGE_CLASSES: tuple[str, ...] = tuple(MESSAGE_SIZES)
+"""Message types indexed by the class codes held in cached route tables."""
+
+MESSAGE_CLASS_CODES: dict[str, int] = {t: i for i, t in enumerate(MESSAGE_CLASSES)}
+"""Class code of each message type (its index in :data:`MESSAGE_CLASSES`)."""
+
 HANDOFF_STATE_SIZE_BYTES: int = 8192
 """Cluster ephemeris data transferred during coordinator handoff."""
 
@@ -321,6 +351,85 @@ class SwarmCoordinationConfig:
     Each node gossips with its sector_size nearest neighbors.
     """
 
+    execution_mode: Literal["event", "cycle_batched"] = "event"
+    """How sampled state-sync traffic is executed.
+
+    "event" = one ``state_sync`` event per sampled node per cycle (reference).
+    "cycle_batched" = one ``sync_cycle`` event per T_c that processes every
+        sampled node's report with NumPy array operations (loss and
+        retransmission draws, coordinator byte caps, airtime, per-class
+        byte counters).  Node sampling and phases are identical to "event";
+        the per-message draws come from a separate RNG stream, so results
+        are statistically equivalent rather than bit-identical.
+    Only the hierarchical topology is batched; other topologies ignore it.
+    """
+
+    stats_backend: Literal["exact", "log_histogram"] = "exact"
+    """Streaming-statistics backend for AoI, ingress and recovery distributions.
+
+    "exact" = retain every sample (percentiles match ``numpy.percentile``;
+        memory grows with fleet size x duration).
+    "log_histogram" = fixed geometric bins (~0.5 % quantile error, memory
+        bounded by dynamic range); the raw
+        ``coordinator_ingress_bytes_per_cycle`` series is not retained.
+    Update-propagation delay always uses a log histogram.
+    """
+
+    event_queue: Literal["heap", "calendar"] = "heap"
+    """Future-event list implementation.
+
+    "heap" = binary heap (:class:`EventQueue`).
+    "calendar" = calendar queue with T_c / 64 slots
+        (:class:`CalendarEventQueue`).
+    Both deliver events in the same ``(time, insertion order)`` sequence, so
+    results are identical; only the speed differs.
+    """
+
+    checkpoint_interval_days: Optional[float] = None
+    """Simulated days between checkpoints written by :meth:`SwarmCoordinationSimulator.run`.
+
+    None = no checkpoints.  Requires ``checkpoint_path``; the file is
+    overwritten at every interval and can be resumed with
+    :meth:`SwarmCoordinationSimulator.load_checkpoint`.
+    """
+
+    checkpoint_path: Optional[str] = None
+    """File the periodic checkpoint is written to (see ``checkpoint_interval_days``)."""
+
+    fidelity: Literal["des", "analytic", "fluid"] = "des"
+    """Model used by the ``swarm_mc`` runners.
+
+    "des" = discrete-event simulation (:class:`SwarmCoordinationSimulator`).
+    "analytic" = closed-form surrogate (:func:`analytic_run_result`):
+        expected overhead, availability, drop and loss rates, energy and
+        power variance in milliseconds, without per-run randomness.
+    "fluid" = time-stepped cluster-level model (:class:`FluidSwarmSimulator`,
+        hierarchical only): the whole fleet advances one T_c at a time with
+        binomial draws, so run time depends on the number of cycles rather
+        than on ``node_count``; ``sync_sample_rate`` does not apply.
+    """
+
+    random_streams: Literal["shared", "per_process"] = "shared"
+    """How random draws are split across stochastic processes.
+
+    "shared" = node failures, link loss, Gilbert-Elliott transitions,
+        exception telemetry and gossip sampling share the streams used for
+        sync sampling and handoffs (reference draw order).
+    "per_process" = each process in :data:`RANDOM_PROCESSES` has its own
+        stream derived from ``seed``, and failure and repair times are drawn
+        per node up front.  Configs with the same seed then see the same
+        failure and loss realisations (common random numbers), so the
+        variance of differences between them shrinks.
+    """
+
+    profile: bool = False
+    """Record a :class:`RunProfile` on the run result.
+
+    Per-event-type counts and wall time, event-queue size over time,
+    events/s and peak RSS.  Off by default; the event loop then runs
+    untimed.  Does not change the simulated result.
+    """
+
 
 @dataclass
 class SwarmNode:
@@ -363,6 +472,7 @@ class Message:
     receive_time: Optional[float] = None
     delivered: bool = False
     message_type: str = "ephemeris"
+    receiver_idx: int = -1
 
 
 @dataclass
@@ -374,10 +484,10 @@ class SimEvent:
     node_id: str
     cluster_id: Optional[str] = None
     data: Optional[dict[str, Any]] = None
-
-    def __lt__(self, other: SimEvent) -> bool:
-        """Comparison for heapq ordering (min-heap on *time*)."""
-        return self.time < other.time
+    node_idx: int = -1
+    """Integer index of *node_id* in the :class:`NodeStore` (-1 = not a node)."""
+    cluster_idx: int = -1
+    """Integer index of *cluster_id* in ``NetworkStructure.clusters``."""
 
 
 @dataclass
@@ -400,6 +510,67 @@ class TierMessageBreakdown:
     gossip_msgs: int = 0
 
 
+PROFILE_PHASES: tuple[str, ...] = ("power_update", "aoi_sample", "ge_transition")
+"""Periodic run-loop work timed by :class:`RunProfile` besides the event handlers."""
+
+
+@dataclass
+class RunProfile:
+    """Where a :meth:`SwarmCoordinationSimulator.run` spent its time.
+
+    Recorded when ``config.profile`` is set.  ``counts`` and ``seconds``
+    are keyed by event type and by the periodic phases in
+    :data:`PROFILE_PHASES`; ``seconds`` is cumulative wall time.
+    """
+
+    counts: dict[str, int] = field(default_factory=dict)
+    seconds: dict[str, float] = field(default_factory=dict)
+    queue_times: list[float] = field(default_factory=list)
+    """Simulated times (s) at which ``queue_sizes`` were sampled."""
+    queue_sizes: list[int] = field(default_factory=list)
+    """Event-queue length at each of ``queue_times``."""
+    wall_seconds: float = 0.0
+    """Wall time spent in :meth:`SwarmCoordinationSimulator.advance`."""
+    events: int = 0
+    peak_rss_mb: float = 0.0
+    """Peak resident set size of the process (0 where unavailable)."""
+
+    @property
+    def events_per_second(self) -> float:
+        return self.events / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    def format_table(self) -> str:
+        """Return the profile as a text table, slowest entries first."""
+        total = sum(self.seconds.values())
+        lines = [f"  {'handler':<20} {'count':>12} {'time (s)':>10} {'share':>7} {'us/call':>9}"]
+        for name in sorted(self.seconds, key=self.seconds.__getitem__, reverse=True):
+            n, t = self.counts.get(name, 0), self.seconds[name]
+            if n == 0:
+                continue
+            lines.append(
+                f"  {name:<20} {n:>12,} {t:>10.3f} {t / max(total, 1e-12):>7.1%} "
+                f"{t / max(n, 1) * 1e6:>9.1f}"
+            )
+        lines.append(
+            f"  {self.events:,} events in {self.wall_seconds:.2f} s "
+            f"({self.events_per_second:,.0f} events/s), "
+            f"peak queue {max(self.queue_sizes, default=0):,}, "
+            f"peak RSS {self.peak_rss_mb:.0f} MB"
+        )
+        return "\n".join(lines)
+
+
+def _peak_rss_mb() -> float:
+    """Return the peak resident set size of this process in MB (0 if unknown)."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kB on Linux, bytes on macOS
+    return peak / 1e6 if sys.platform == "darwin" else peak / 1e3
+
+
 @dataclass
 class SwarmCoordinationRunResult:
     """Result of a single simulation run."""
@@ -486,34 +657,362 @@ class SwarmCoordinationRunResult:
     cross_cycle_recovery_rate_by_cycle: list[float] = field(default_factory=list)
     """Cumulative recovery fraction at each cycle count [1, 2, ..., 10]."""
     coordinator_ingress_bytes_per_cycle: list[int] = field(default_factory=list)
-    """Per-cycle coordinator ingress bytes (summed across all coordinators)."""
+    """Per-cycle coordinator ingress bytes (summed across all coordinators).
+
+    Empty when ``stats_backend="log_histogram"``; use
+    ``distributions["coordinator_ingress_bytes"]`` instead.
+    """
+    distributions: dict[str, QuantileSketch] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+    """Mergeable sketches keyed as in :data:`SKETCH_RESOLUTION`."""
+    profile: Optional[RunProfile] = field(default=None, repr=False, compare=False)
+    """Timing profile of the run (only with ``config.profile``)."""
+
+
+# ---------------------------------------------------------------------------
+# Columnar node store
+# ---------------------------------------------------------------------------
+NODE_STATUSES: tuple[NodeStatus, ...] = (
+    "operational", "coordinator", "failed", "recovering",
+)
+"""Status names indexed by the integer codes held in :attr:`NodeStore.status`."""
+
+STATUS_OPERATIONAL: int = 0
+STATUS_COORDINATOR: int = 1
+STATUS_FAILED: int = 2
+STATUS_RECOVERING: int = 3
+
+ROLE_MEMBER: int = 0
+ROLE_CLUSTER_COORDINATOR: int = 1
+ROLE_REGIONAL_COORDINATOR: int = 2
+"""Role tiers held in :attr:`NetworkStructure.role_tier`.
+
+A regional coordinator (the ``cluster_regional`` node of its own cluster)
+keeps its tier for the whole run; other nodes are cluster coordinators
+while ``is_coordinator`` is set and members otherwise.
+"""
+
+
+class NodeStore:
+    """Struct-of-arrays node state addressed by integer node index.
+
+    The simulator keeps one NumPy array per :class:`SwarmNode` field instead
+    of one Python object per node, so a million-node fleet costs tens of
+    megabytes rather than gigabytes and fleet-wide updates vectorise.
+    :class:`SwarmNode` objects are only materialised as snapshot views for
+    the public API (see :meth:`view`).
+    """
+
+    def __init__(
+        self,
+        ids: list[str],
+        cluster_idx: NDArray[np.integer[Any]] | list[int],
+        cluster_names: list[str],
+    ) -> None:
+        n = len(ids)
+        self.ids: list[str] = ids
+        self.cluster_names: list[str] = cluster_names
+        self.cluster_idx: NDArray[np.int32] = np.asarray(cluster_idx, dtype=np.int32)
+        self.status: NDArray[np.int8] = np.full(n, STATUS_OPERATIONAL, dtype=np.int8)
+        self.is_coordinator: NDArray[np.bool_] = np.zeros(n, dtype=bool)
+        self.coordinator_time_seconds: NDArray[np.float64] = np.zeros(n)
+        self.power_consumed_wh: NDArray[np.float64] = np.zeros(n)
+        self.messages_sent: NDArray[np.int64] = np.zeros(n, dtype=np.int64)
+        self.messages_received: NDArray[np.int64] = np.zeros(n, dtype=np.int64)
+        self.last_update_time: NDArray[np.float64] = np.zeros(n)
+        self.failure_time: NDArray[np.float64] = np.full(n, np.nan)
+        self.live_per_cluster: NDArray[np.int64] = np.bincount(
+            self.cluster_idx, minlength=len(cluster_names)
+        ).astype(np.int64)
+        """Non-failed node count per cluster, kept current by the mutators."""
+        self._index: Optional[dict[str, int]] = None
+        # Lazy energy accounting (see start_energy_accounting)
+        self._power_rates_w: Optional[tuple[float, float]] = None
+        self.accounted_seconds: float = 0.0
+        """Total time credited through :meth:`accrue` so far."""
+        self._settled_seconds: NDArray[np.float64] = np.zeros(n)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def index_of(self, node_id: str) -> int:
+        """Return the index of *node_id*, or -1 if unknown.
+
+        The ID -> index map is only built on first use; the simulator itself
+        never resolves string IDs.
+        """
+        if self._index is None:
+            self._index = {nid: i for i, nid in enumerate(self.ids)}
+        return self._index.get(node_id, -1)
+
+    # -- mutators ----------------------------------------------------------
+    def _set_status(self, idx: int, status: int) -> None:
+        self._settle(idx)
+        was_failed = self.status[idx] == STATUS_FAILED
+        if was_failed != (status == STATUS_FAILED):
+            self.live_per_cluster[self.cluster_idx[idx]] += 1 if was_failed else -1
+        self.status[idx] = status
+
+    def set_coordinator(self, idx: int) -> None:
+        """Promote node *idx* to coordinator."""
+        self._set_status(idx, STATUS_COORDINATOR)
+        self.is_coordinator[idx] = True
+
+    def set_operational(self, idx: int) -> None:
+        """Return node *idx* to regular operational duty."""
+        self._set_status(idx, STATUS_OPERATIONAL)
+        self.is_coordinator[idx] = False
+
+    def fail(self, idx: int, failure_time: float) -> None:
+        """Mark node *idx* as failed at *failure_time* (cf. :func:`fail_node`)."""
+        self._set_status(idx, STATUS_FAILED)
+        self.is_coordinator[idx] = False
+        self.failure_time[idx] = failure_time
+
+    def recover(self, idx: int) -> None:
+        """Bring failed node *idx* back as an operational non-coordinator."""
+        self.set_operational(idx)
+        self.failure_time[idx] = np.nan
+
+    # -- energy accounting -------------------------------------------------
+    def start_energy_accounting(self, base_power_w: float, coordinator_power_w: float) -> None:
+        """Credit energy and coordinator time lazily from now on.
+
+        :meth:`accrue` only advances :attr:`accounted_seconds`.  Each node
+        settles the time credited since its last settlement when its role
+        changes (every mutator goes through :meth:`_set_status`) and in
+        :meth:`settle_all`, so a node pays for an interval at the rate of
+        the role it held when the interval was credited.
+        """
+        self._power_rates_w = (base_power_w, coordinator_power_w)
+
+    def accrue(self, elapsed_seconds: float) -> None:
+        """Credit *elapsed_seconds* of operation to every node, in O(1)."""
+        self.accounted_seconds += elapsed_seconds
+
+    def _settle(self, idx: int) -> None:
+        if self._power_rates_w is None:
+            return
+        dt = self.accounted_seconds - self._settled_seconds[idx]
+        if dt > 0.0:
+            base_w, coord_w = self._power_rates_w
+            if self.is_coordinator[idx]:
+                self.power_consumed_wh[idx] += coord_w * dt / 3600.0
+                self.coordinator_time_seconds[idx] += dt
+            else:
+                self.power_consumed_wh[idx] += base_w * dt / 3600.0
+            self._settled_seconds[idx] = self.accounted_seconds
+
+    def settle_all(self) -> None:
+        """Bring every node's energy and coordinator time up to date."""
+        if self._power_rates_w is None:
+            return
+        base_w, coord_w = self._power_rates_w
+        dt = self.accounted_seconds - self._settled_seconds
+        self.power_consumed_wh += np.where(self.is_coordinator, coord_w, base_w) * dt / 3600.0
+        self.coordinator_time_seconds += np.where(self.is_coordinator, dt, 0.0)
+        self._settled_seconds.fill(self.accounted_seconds)
+
+    # -- views -------------------------------------------------------------
+    def view(self, idx: int) -> SwarmNode:
+        """Return a :class:`SwarmNode` snapshot of node *idx*."""
+        self._settle(idx)
+        failure_time = float(self.failure_time[idx])
+        return SwarmNode(
+            id=self.ids[idx],
+            status=NODE_STATUSES[int(self.status[idx])],
+            cluster_id=self.cluster_names[int(self.cluster_idx[idx])],
+            is_coordinator=bool(self.is_coordinator[idx]),
+            coordinator_time_seconds=float(self.coordinator_time_seconds[idx]),
+            power_consumed_wh=float(self.power_consumed_wh[idx]),
+            messages_sent=int(self.messages_sent[idx]),
+            messages_received=int(self.messages_received[idx]),
+            last_update_time=float(self.last_update_time[idx]),
+            failure_time=None if math.isnan(failure_time) else failure_time,
+        )
+
+    def views(self) -> list[SwarmNode]:
+        """Return :class:`SwarmNode` snapshots of every node, in index order."""
+        return [self.view(i) for i in range(len(self.ids))]
 
 
 @dataclass
 class NetworkStructure:
-    """Network structure produced by topology initialization."""
+    """Network structure produced by topology initialization.
 
-    nodes: list[SwarmNode]
+    Node state lives in the columnar :attr:`store`; every topology lays out
+    the members of cluster ``c`` as the contiguous index range
+    ``cluster_offsets[c]:cluster_offsets[c + 1]``.  Coordinator roles are
+    tracked as integer arrays so the simulator never resolves string IDs.
+    """
+
+    store: NodeStore
     clusters: list[Cluster]
     central_coordinator_id: str
-    mesh_neighbors: Optional[dict[str, list[str]]] = None
+    cluster_offsets: NDArray[np.int64]
+    """CSR-style offsets of each cluster's member index range (len = clusters + 1)."""
+    cluster_coordinator: NDArray[np.int32]
+    """Current coordinator node index per cluster."""
+    cluster_regional: NDArray[np.int32]
+    """Regional coordinator node index per cluster (-1 = none)."""
+    central_idx: int = 0
+    """Node index of the central coordinator."""
+    mesh_indptr: Optional[NDArray[np.int64]] = None
+    """CSR row offsets into :attr:`mesh_indices` (mesh topologies only)."""
+    mesh_indices: Optional[NDArray[np.int32]] = None
+    """CSR gossip neighbour indices; node ``i``'s neighbours are
+    ``mesh_indices[mesh_indptr[i]:mesh_indptr[i + 1]]``."""
+    sector_adjacency: bool = False
+    """Implicit sectorized-mesh adjacency (no CSR): each cluster is a sector
+    and a node's neighbours are the rest of its sector plus the boundary
+    node of each adjacent sector (see :meth:`neighbors`)."""
 
     def __post_init__(self) -> None:
         self.rebuild_indices()
 
     def rebuild_indices(self) -> None:
-        """Build O(1) lookup dicts for nodes and clusters."""
-        self._node_map: dict[str, int] = {
-            n.id: i for i, n in enumerate(self.nodes)
-        }
+        """Build the O(1) cluster lookup dict and the integer reverse indexes.
+
+        :attr:`coordinator_cluster` maps a node to the cluster it is
+        assigned to coordinate (-1 = none) and :attr:`role_tier` holds each
+        node's ``ROLE_*`` tier.  Both are kept current by :meth:`fail`,
+        :meth:`recover` and :meth:`hand_over`, which also bump the
+        cluster's :attr:`cluster_epoch` so cached routes can be invalidated.
+        """
         self._cluster_map: dict[str, int] = {
             c.id: i for i, c in enumerate(self.clusters)
         }
+        store = self.store
+        n = len(store)
+        self.coordinator_cluster: NDArray[np.int32] = np.full(n, -1, dtype=np.int32)
+        self.coordinator_cluster[self.cluster_coordinator] = np.arange(
+            len(self.cluster_coordinator), dtype=np.int32
+        )
+        self._is_regional: NDArray[np.bool_] = (
+            self.cluster_regional[store.cluster_idx] == np.arange(n)
+        )
+        self.role_tier: NDArray[np.int8] = np.where(
+            self._is_regional,
+            ROLE_REGIONAL_COORDINATOR,
+            np.where(store.is_coordinator, ROLE_CLUSTER_COORDINATOR, ROLE_MEMBER),
+        ).astype(np.int8)
+        self.cluster_epoch: NDArray[np.int64] = np.zeros(len(self.clusters), dtype=np.int64)
+        """Per-cluster change counter, bumped by every mutator touching the cluster."""
+
+    def _refresh_role(self, idx: int) -> None:
+        if not self._is_regional[idx]:
+            self.role_tier[idx] = (
+                ROLE_CLUSTER_COORDINATOR if self.store.is_coordinator[idx] else ROLE_MEMBER
+            )
+
+    def fail(self, idx: int, failure_time: float) -> None:
+        """Fail node *idx* (see :meth:`NodeStore.fail`), keeping roles current.
+
+        The node stays assigned to its cluster until :meth:`hand_over`.
+        """
+        self.store.fail(idx, failure_time)
+        self._refresh_role(idx)
+        self.cluster_epoch[self.store.cluster_idx[idx]] += 1
+
+    def recover(self, idx: int) -> None:
+        """Recover node *idx* (see :meth:`NodeStore.recover`), keeping roles current."""
+        self.store.recover(idx)
+        self._refresh_role(idx)
+        self.cluster_epoch[self.store.cluster_idx[idx]] += 1
+
+    def hand_over(self, cluster_idx: int, new: int) -> None:
+        """Make node *new* the coordinator of cluster *cluster_idx*."""
+        store = self.store
+        old = int(self.cluster_coordinator[cluster_idx])
+        store.set_operational(old)
+        store.set_coordinator(new)
+        self.clusters[cluster_idx].coordinator_id = store.ids[new]
+        self.cluster_coordinator[cluster_idx] = new
+        self.coordinator_cluster[old] = -1
+        self.coordinator_cluster[new] = cluster_idx
+        self._refresh_role(old)
+        self._refresh_role(new)
+        self.cluster_epoch[cluster_idx] += 1
+
+    @property
+    def nodes(self) -> list[SwarmNode]:
+        """Snapshot :class:`SwarmNode` views of all nodes (public API only)."""
+        return self.store.views()
+
+    @property
+    def mesh_neighbors(self) -> Optional[dict[str, list[str]]]:
+        """Gossip neighbour IDs keyed by node ID (mesh topologies only)."""
+        if not self.sector_adjacency and (
+            self.mesh_indptr is None or self.mesh_indices is None
+        ):
+            return None
+        ids = self.store.ids
+        return {
+            ids[i]: [ids[j] for j in self.neighbors(i).tolist()]
+            for i in range(len(ids))
+        }
+
+    def neighbors(self, idx: int) -> NDArray[np.int32]:
+        """Return the gossip neighbour indices of node *idx* (empty if none).
+
+        With :attr:`sector_adjacency` the row is derived from the sector's
+        index range: the other sector members in index order, then the last
+        node of the previous sector and the first node of the next one.
+        """
+        if self.sector_adjacency:
+            return np.fromiter(self.sector_neighbors(idx), dtype=np.int32)
+        if self.mesh_indptr is None or self.mesh_indices is None:
+            return np.empty(0, dtype=np.int32)
+        return self.mesh_indices[self.mesh_indptr[idx]:self.mesh_indptr[idx + 1]]
+
+    def sector_neighbors(self, idx: int) -> Iterator[int]:
+        """Yield the implicit sectorized-mesh neighbours of node *idx* in order."""
+        c = int(self.store.cluster_idx[idx])
+        offsets = self.cluster_offsets
+        start, stop = int(offsets[c]), int(offsets[c + 1])
+        yield from range(start, idx)
+        yield from range(idx + 1, stop)
+        if c > 0:
+            yield start - 1
+        if c + 2 < len(offsets):
+            yield stop
+
+    def index_of(self, node_id: str) -> int:
+        """Return the integer index of *node_id*, or -1 if unknown."""
+        return self.store.index_of(node_id)
+
+    def cluster_index_of(self, cluster_id: str) -> int:
+        """Return the integer index of *cluster_id*, or -1 if unknown."""
+        return self._cluster_map.get(cluster_id, -1)
+
+    def fork(self) -> "NetworkStructure":
+        """Return a copy whose mutable state is independent of this network.
+
+        The read-only layout (node IDs, cluster membership, CSR offsets and
+        mesh neighbour lists) is shared with the original rather than
+        copied; node state arrays and coordinator assignments are copied.
+        """
+        store = self.store
+        shared: list[Any] = [
+            store.ids, store.cluster_names, store.cluster_idx,
+            self.cluster_offsets, self.mesh_indptr, self.mesh_indices,
+        ]
+        shared.extend(c.node_ids for c in self.clusters)
+        memo: dict[int, Any] = {id(obj): obj for obj in shared if obj is not None}
+        return copy.deepcopy(self, memo)
+
+    def cluster_members(self, cluster_idx: int) -> range:
+        """Return the node index range of cluster *cluster_idx*."""
+        return range(
+            int(self.cluster_offsets[cluster_idx]),
+            int(self.cluster_offsets[cluster_idx + 1]),
+        )
 
     def get_node(self, node_id: str) -> Optional["SwarmNode"]:
-        """O(1) node lookup by ID."""
-        idx = self._node_map.get(node_id)
-        return self.nodes[idx] if idx is not None else None
+        """O(1) node lookup by ID (returns a snapshot view)."""
+        idx = self.store.index_of(node_id)
+        return self.store.view(idx) if idx >= 0 else None
 
     def get_cluster(self, cluster_id: str) -> Optional["Cluster"]:
         """O(1) cluster lookup by ID."""
@@ -666,6 +1165,7 @@ def create_message(
     receiver_id: str,
     message_type: str,
     send_time: float,
+    receiver_idx: int = -1,
 ) -> Message:
     """Create a new network message."""
     return Message(
@@ -676,6 +1176,7 @@ def create_message(
         send_time=send_time,
         delivered=False,
         message_type=message_type,
+        receiver_idx=receiver_idx,
     )
 
 
@@ -707,43 +1208,336 @@ def estimate_message_count(
     return node_count * gossip_fanout * gossip_rounds * updates
 
 
+# ---------------------------------------------------------------------------
+# Streaming statistics
+# ---------------------------------------------------------------------------
+class QuantileSketch(ABC):
+    """Mergeable streaming summary of a sample stream.
+
+    Count, sum, minimum and maximum are exact for every backend; subclasses
+    decide how much of the distribution is kept for :meth:`percentile` and
+    :meth:`cdf`.  Sketches of the same kind and parameters merge in place,
+    so per-run summaries can be pooled across a Monte Carlo ensemble.
+    """
+
+    kind: str = ""
+    """Backend name, as accepted by :func:`make_sketch`."""
+
+    def __init__(self) -> None:
+        self.count: int = 0
+        self.total: float = 0.0
+        self.min: float = math.inf
+        self.max: float = -math.inf
+
+    def add(self, value: float) -> None:
+        """Fold one sample into the summary."""
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def add_many(self, values: NDArray[Any] | list[float]) -> None:
+        """Fold an array of samples into the summary."""
+        arr = np.asarray(values, dtype=np.float64)
+        if arr.size == 0:
+            return
+        self.count += int(arr.size)
+        self.total += float(arr.sum())
+        self.min = min(self.min, float(arr.min()))
+        self.max = max(self.max, float(arr.max()))
+
+    def add_counts(
+        self, values: NDArray[Any] | list[float], counts: NDArray[Any] | list[int]
+    ) -> None:
+        """Fold ``counts[i]`` copies of ``values[i]`` into the summary."""
+        arr = np.asarray(values, dtype=np.float64)
+        n = np.asarray(counts, dtype=np.int64)
+        arr = arr[n > 0]
+        n = n[n > 0]
+        if arr.size == 0:
+            return
+        self.count += int(n.sum())
+        self.total += float(arr @ n)
+        self.min = min(self.min, float(arr.min()))
+        self.max = max(self.max, float(arr.max()))
+
+    def merge(self, other: QuantileSketch) -> None:
+        """Merge *other* (same kind and parameters) into this sketch."""
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def mean(self) -> float:
+        """Mean of the samples (0.0 when empty)."""
+        return self.total / self.count if self.count else 0.0
+
+    @abstractmethod
+    def percentile(self, q: float) -> float:
+        """Return the *q*-th percentile (0-100); 0.0 when empty."""
+
+    @abstractmethod
+    def cdf(self, x: float) -> float:
+        """Return the fraction of samples ``<= x``; 0.0 when empty."""
+
+
+class ExactSamples(QuantileSketch):
+    """Reference backend that retains every sample.
+
+    Percentiles match :func:`numpy.percentile` exactly; memory grows with the
+    sample count.
+    """
+
+    kind = "exact"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._values: list[float] = []
+        self._chunks: list[NDArray[np.float64]] = []
+
+    def add(self, value: float) -> None:
+        super().add(value)
+        self._values.append(value)
+
+    def add_many(self, values: NDArray[Any] | list[float]) -> None:
+        arr = np.asarray(values, dtype=np.float64)
+        super().add_many(arr)
+        if arr.size:
+            self._flush()
+            self._chunks.append(arr)
+
+    def add_counts(
+        self, values: NDArray[Any] | list[float], counts: NDArray[Any] | list[int]
+    ) -> None:
+        self.add_many(np.repeat(np.asarray(values, dtype=np.float64), counts))
+
+    def merge(self, other: QuantileSketch) -> None:
+        if not isinstance(other, ExactSamples):
+            raise TypeError(f"cannot merge {other.kind!r} sketch into 'exact'")
+        super().merge(other)
+        self.add_many_samples(other.samples())
+
+    def add_many_samples(self, samples: NDArray[np.float64]) -> None:
+        """Append *samples* without touching the summary scalars."""
+        if samples.size:
+            self._flush()
+            self._chunks.append(samples)
+
+    def _flush(self) -> None:
+        """Move scalar-appended values into the chunk list (keeps order)."""
+        if self._values:
+            self._chunks.append(np.array(self._values))
+            self._values = []
+
+    def samples(self) -> NDArray[np.float64]:
+        """Return every sample, in insertion order."""
+        self._flush()
+        if len(self._chunks) > 1:
+            self._chunks = [np.concatenate(self._chunks)]
+        return self._chunks[0] if self._chunks else np.empty(0)
+
+    @property
+    def mean(self) -> float:
+        return float(np.mean(self.samples())) if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        return float(np.percentile(self.samples(), q)) if self.count else 0.0
+
+    def cdf(self, x: float) -> float:
+        return float(np.mean(self.samples() <= x)) if self.count else 0.0
+
+
+class LogHistogram(QuantileSketch):
+    """Fixed geometric-bin histogram with bounded memory.
+
+    Bin 0 collects non-positive samples; bin ``b >= 1`` covers
+    ``[resolution * ratio**(b-1), resolution * ratio**b)`` (samples in
+    ``(0, resolution)`` fall in bin 1).  Quantiles are nearest-rank: the
+    geometric midpoint of the bin holding the rank, clamped to the exact
+    ``[min, max]``, so the relative error is
+    about ``(ratio - 1) / 2``; memory is bounded by the dynamic range, not
+    the count.
+    """
+
+    kind = "log_histogram"
+
+    def __init__(self, resolution: float = 1.0, ratio: float = 1.01) -> None:
+        super().__init__()
+        self.resolution: float = resolution
+        self.ratio: float = ratio
+        self.bins: dict[int, int] = {}
+        self._scale: float = 1.0 / resolution
+        self._log_ratio: float = math.log(ratio)
+
+    def add(self, value: float) -> None:
+        super().add(value)
+        b = 0
+        if value > 0.0:
+            b = max(1, 1 + math.floor(math.log(value * self._scale) / self._log_ratio))
+        self.bins[b] = self.bins.get(b, 0) + 1
+
+    def add_many(self, values: NDArray[Any] | list[float]) -> None:
+        arr = np.asarray(values, dtype=np.float64)
+        super().add_many(arr)
+        if arr.size == 0:
+            return
+        b = np.zeros(arr.size, dtype=np.int64)
+        pos = arr > 0.0
+        b[pos] = np.maximum(
+            1, 1 + np.floor(np.log(arr[pos] * self._scale) / self._log_ratio)
+        ).astype(np.int64)
+        keys, counts = np.unique(b, return_counts=True)
+        for key, n in zip(keys.tolist(), counts.tolist()):
+            self.bins[key] = self.bins.get(key, 0) + n
+
+    def add_counts(
+        self, values: NDArray[Any] | list[float], counts: NDArray[Any] | list[int]
+    ) -> None:
+        arr = np.asarray(values, dtype=np.float64)
+        n = np.asarray(counts, dtype=np.int64)
+        super().add_counts(arr, n)
+        for value, k in zip(arr[n > 0].tolist(), n[n > 0].tolist()):
+            b = 0
+            if value > 0.0:
+                b = max(1, 1 + math.floor(math.log(value * self._scale) / self._log_ratio))
+            self.bins[b] = self.bins.get(b, 0) + k
+
+    def merge(self, other: QuantileSketch) -> None:
+        if not (
+            isinstance(other, LogHistogram)
+            and other.resolution == self.resolution
+            and other.ratio == self.ratio
+        ):
+            raise TypeError("can only merge log histograms with identical bins")
+        super().merge(other)
+        for key, n in other.bins.items():
+            self.bins[key] = self.bins.get(key, 0) + n
+
+    def _bin_value(self, b: int) -> float:
+        """Representative (geometric midpoint) value of bin *b*."""
+        if b == 0:
+            return 0.0
+        return self.resolution * self.ratio ** (b - 0.5)
+
+    def percentile(self, q: float) -> float:
+        if self.count == 0:
+            return 0.0
+        rank = min(self.count - 1, int(self.count * (q / 100.0)))
+        seen = 0
+        for b in sorted(self.bins):
+            seen += self.bins[b]
+            if seen > rank:
+                return min(self.max, max(self.min, self._bin_value(b)))
+        return self.max
+
+    def cdf(self, x: float) -> float:
+        if self.count == 0:
+            return 0.0
+        edge = 0 if x <= 0.0 else max(1, 1 + math.floor(math.log(x * self._scale) / self._log_ratio))
+        return sum(n for b, n in self.bins.items() if b <= edge) / self.count
+
+
+def make_sketch(backend: str, resolution: float = 1.0) -> QuantileSketch:
+    """Return an empty sketch for *backend* (``"exact"`` or ``"log_histogram"``).
+
+    *resolution* is the smallest non-zero value the log histogram resolves;
+    the exact backend ignores it.
+    """
+    if backend == "exact":
+        return ExactSamples()
+    if backend == "log_histogram":
+        return LogHistogram(resolution=resolution)
+    raise ValueError(f"unknown statistics backend {backend!r}")
+
+
+def to_log_histogram(sketch: QuantileSketch, resolution: float = 1.0) -> LogHistogram:
+    """Return *sketch* as a :class:`LogHistogram` (re-binning exact samples)."""
+    if isinstance(sketch, LogHistogram):
+        return sketch
+    hist = LogHistogram(resolution=resolution)
+    if isinstance(sketch, ExactSamples):
+        hist.add_many(sketch.samples())
+    return hist
+
+
+SKETCH_RESOLUTION: dict[str, float] = {
+    "aoi_seconds": 1e-3,
+    "update_propagation_ms": 1e-3,
+    "coordinator_ingress_bytes": 1.0,
+    "recovery_streak_cycles": 1.0,
+}
+"""Distributions reported by a run and the resolution of their log histograms."""
+
+
 # ---------------------------------------------------------------------------
 # MessageQueue
 # ---------------------------------------------------------------------------
+_PROPAGATION_BIN_RATIO: float = 1.01
+"""Geometric bin width of the streaming propagation-time histogram.
+
+Quantiles read from the histogram are accurate to within ~0.5 % relative
+error while memory stays bounded by the dynamic range, not the count.
+"""
+
+
 class MessageQueue:
-    """FIFO message queue with congestion modelling and drop tracking."""
+    """FIFO message queue with congestion modelling and drop tracking.
+
+    Messages are held in a binary heap keyed on ``(send_time, seq)``, so
+    dequeues are O(log n) and equal send times keep arrival order.
+    Propagation statistics are accumulated as they stream past (count, sum,
+    max and a log-binned histogram for the P95) rather than by retaining
+    every sample.
+    """
 
     def __init__(self, max_queue_size: int = 10_000) -> None:
-        self._queue: list[Message] = []
+        self._heap: list[tuple[float, int, Message]] = []
+        self._seq: int = 0
         self._total_processed: int = 0
         self._total_dropped: int = 0
-        self._propagation_times: list[float] = []
         self._max_queue_size: int = max_queue_size
+        # Streaming propagation-time statistics (ms, 1 µs resolution)
+        self.propagation: LogHistogram = LogHistogram(
+            resolution=1e-3, ratio=_PROPAGATION_BIN_RATIO
+        )
 
     # -- mutators ----------------------------------------------------------
     def is_full(self) -> bool:
         """Return ``True`` if the queue has reached its capacity."""
-        return len(self._queue) >= self._max_queue_size
+        return len(self._heap) >= self._max_queue_size
 
     def enqueue(self, message: Message) -> bool:
         """Add *message* to the queue.  Returns ``False`` if dropped."""
-        if len(self._queue) >= self._max_queue_size:
+        if len(self._heap) >= self._max_queue_size:
             self._total_dropped += 1
             return False
-        self._queue.append(message)
+        heapq.heappush(self._heap, (message.send_time, self._seq, message))
+        self._seq += 1
         return True
 
+    def admit(self, count: int) -> int:
+        """Reserve room for up to *count* messages about to be enqueued.
+
+        Messages beyond the free capacity are counted as dropped, exactly as
+        if :meth:`enqueue` had rejected them one by one.  Returns how many
+        the caller may enqueue.
+        """
+        accepted = min(count, max(0, self._max_queue_size - len(self._heap)))
+        self._total_dropped += count - accepted
+        return accepted
+
     def dequeue(self, current_time: float) -> Optional[Message]:
         """Dequeue the oldest message, mark it delivered at *current_time*."""
-        if not self._queue:
+        if not self._heap:
             return None
-        self._queue.sort(key=lambda m: m.send_time)
-        message = self._queue.pop(0)
+        message = heapq.heappop(self._heap)[2]
         message.receive_time = current_time
         message.delivered = True
         self._total_processed += 1
-        propagation_ms = (current_time - message.send_time) * 1_000
-        self._propagation_times.append(propagation_ms)
+        self.propagation.add((current_time - message.send_time) * 1_000)
         return message
 
     def process_messages(
@@ -752,13 +1546,19 @@ class MessageQueue:
         bandwidth_bps: float,
         duration_seconds: float,
     ) -> list[Message]:
-        """Process messages up to the bandwidth limit over *duration_seconds*."""
+        """Process messages up to the bandwidth limit over *duration_seconds*.
+
+        Messages whose send time is still in the future (queued ahead by a
+        batched sync cycle) are left in the queue.
+        """
         processed: list[Message] = []
         bytes_processed = 0.0
         max_bytes = (bandwidth_bps * duration_seconds) / 8.0
 
-        while self._queue and bytes_processed < max_bytes:
-            front = self._queue[0]
+        while self._heap and bytes_processed < max_bytes:
+            front = self._heap[0][2]
+            if front.send_time > current_time:
+                break
             if bytes_processed + front.size_bytes > max_bytes:
                 break
             msg = self.dequeue(current_time)
@@ -770,7 +1570,7 @@ class MessageQueue:
     # -- queries -----------------------------------------------------------
     def size(self) -> int:
         """Return the current queue depth."""
-        return len(self._queue)
+        return len(self._heap)
 
     def get_stats(self) -> dict[str, float]:
         """Return processed / dropped / dropRate statistics."""
@@ -782,22 +1582,24 @@ class MessageQueue:
         }
 
     def get_propagation_stats(self) -> PropagationStats:
-        """Return propagation-time statistics across delivered messages."""
-        if not self._propagation_times:
+        """Return propagation-time statistics across delivered messages.
+
+        The mean and maximum are exact; the P95 is read from the streaming
+        histogram (geometric bin midpoint, clamped to the observed range).
+        """
+        prop = self.propagation
+        if prop.count == 0:
             return PropagationStats()
-        sorted_times = sorted(self._propagation_times)
-        total = sum(sorted_times)
-        p95_idx = int(len(sorted_times) * 0.95)
         return PropagationStats(
-            avg_propagation_ms=total / len(sorted_times),
-            max_propagation_ms=sorted_times[-1],
-            p95_propagation_ms=sorted_times[p95_idx],
-            message_count=len(sorted_times),
+            avg_propagation_ms=prop.mean,
+            max_propagation_ms=prop.max,
+            p95_propagation_ms=prop.percentile(95),
+            message_count=prop.count,
         )
 
     def clear(self) -> None:
         """Remove all messages from the queue (stats are kept)."""
-        self._queue.clear()
+        self._heap.clear()
 
 
 # ---------------------------------------------------------------------------
@@ -901,8 +1703,19 @@ def calculate_coordinator_availability(
         for n in nodes
         if n.cluster_id == cluster.id
     )
+    return _coordinator_availability_percent(
+        total_coord_time, cluster.failed_handoffs, simulation_duration_seconds
+    )
+
+
+def _coordinator_availability_percent(
+    total_coord_time: float,
+    failed_handoffs: int,
+    simulation_duration_seconds: float,
+) -> float:
+    """Availability from a cluster's summed coordinator time (see above)."""
     expected_time = simulation_duration_seconds
-    handoff_gap_seconds = cluster.failed_handoffs * HANDOFF_TIMEOUT_SECONDS
+    handoff_gap_seconds = failed_handoffs * HANDOFF_TIMEOUT_SECONDS
     effective = min(total_coord_time - handoff_gap_seconds, expected_time)
     return (effective / expected_time) * 100.0
 
@@ -1012,7 +1825,15 @@ def calculate_power_variance(nodes: list[SwarmNode]) -> float:
     """Return the coefficient of variation of power consumption (percent)."""
     if not nodes:
         return 0.0
-    powers = np.array([n.power_consumed_wh for n in nodes])
+    return _power_variance_percent(
+        np.fromiter((n.power_consumed_wh for n in nodes), dtype=np.float64, count=len(nodes))
+    )
+
+
+def _power_variance_percent(powers: NDArray[np.float64]) -> float:
+    """Coefficient of variation (percent) of a per-node energy array."""
+    if powers.size == 0:
+        return 0.0
     mean_p = powers.mean()
     return 0.0 if mean_p == 0.0 else 100.0 * (powers.std() / mean_p)
 
@@ -1063,95 +1884,156 @@ def calculate_handoff_time(bandwidth_kbps: float) -> float:
 
 def calculate_total_energy(nodes: list[SwarmNode]) -> float:
     """Return total energy consumed by all nodes in kWh."""
-    return sum(n.power_consumed_wh for n in nodes) / 1_000.0
+    return _total_energy_kwh(
+        np.fromiter((n.power_consumed_wh for n in nodes), dtype=np.float64, count=len(nodes))
+    )
+
+
+def _total_energy_kwh(power_wh: NDArray[np.float64]) -> float:
+    """Total energy (kWh) of a per-node energy array, summed in node order."""
+    return sum(power_wh.tolist()) / 1_000.0
 
 
 # ---------------------------------------------------------------------------
 # Topology initialization and routing
 # ---------------------------------------------------------------------------
+def _build_network(
+    ids: list[str],
+    clusters: list[Cluster],
+    cluster_sizes: list[int],
+    coordinator_idx: list[int],
+    regional_idx: Optional[list[int]] = None,
+    central_idx: int = 0,
+    mesh_csr: Optional[tuple[NDArray[np.int64], NDArray[np.int32]]] = None,
+    mark_coordinators: bool = True,
+    sector_adjacency: bool = False,
+) -> NetworkStructure:
+    """Assemble a :class:`NetworkStructure` from contiguous cluster ranges.
+
+    Cluster ``c`` owns the next ``cluster_sizes[c]`` node indices and is
+    coordinated by node ``coordinator_idx[c]``, which starts out in
+    coordinator status unless *mark_coordinators* is ``False``.
+    """
+    cluster_names = [c.id for c in clusters]
+    offsets = np.zeros(len(clusters) + 1, dtype=np.int64)
+    np.cumsum(cluster_sizes, out=offsets[1:])
+    cluster_idx = np.repeat(
+        np.arange(len(clusters), dtype=np.int32), cluster_sizes
+    )
+    store = NodeStore(ids, cluster_idx, cluster_names)
+    if mark_coordinators:
+        for idx in coordinator_idx:
+            store.set_coordinator(idx)
+    if regional_idx is None:
+        regional_idx = [-1] * len(clusters)
+    return NetworkStructure(
+        store=store,
+        clusters=clusters,
+        central_coordinator_id=ids[central_idx] if ids else "",
+        cluster_offsets=offsets,
+        cluster_coordinator=np.asarray(coordinator_idx, dtype=np.int32),
+        cluster_regional=np.asarray(regional_idx, dtype=np.int32),
+        central_idx=central_idx,
+        mesh_indptr=mesh_csr[0] if mesh_csr is not None else None,
+        mesh_indices=mesh_csr[1] if mesh_csr is not None else None,
+        sector_adjacency=sector_adjacency,
+    )
+
+
 def _initialize_centralized(node_count: int) -> NetworkStructure:
     """Build a centralized network where all nodes talk to one coordinator."""
-    nodes: list[SwarmNode] = []
     cluster_id = "central"
     central_id = "central-coordinator"
-    nodes.append(create_node(central_id, cluster_id, True))
-    for i in range(node_count - 1):
-        nodes.append(create_node(f"node-{i}", cluster_id, False))
-    cluster = Cluster(
-        id=cluster_id,
-        node_ids=[n.id for n in nodes],
-        coordinator_id=central_id,
-    )
-    return NetworkStructure(
-        nodes=nodes, clusters=[cluster], central_coordinator_id=central_id
-    )
+    ids = [central_id] + [f"node-{i}" for i in range(node_count - 1)]
+    cluster = Cluster(id=cluster_id, node_ids=list(ids), coordinator_id=central_id)
+    return _build_network(ids, [cluster], [len(ids)], [0])
 
 
 def _initialize_hierarchical(
     node_count: int, cluster_size: int, rng: Generator
 ) -> NetworkStructure:
     """Build a hierarchical network with cluster and regional coordinators."""
-    nodes: list[SwarmNode] = []
+    ids: list[str] = []
     clusters: list[Cluster] = []
+    sizes: list[int] = []
+    coordinators: list[int] = []
+    regionals: list[int] = []
     num_clusters = math.ceil(node_count / cluster_size)
-    regional_coordinators: list[str] = []
+    regional_coordinators: list[int] = []
 
     node_index = 0
     for c in range(num_clusters):
         region_id = c // 10
         cid = f"cluster-{c}"
         n_in_cluster = min(cluster_size, node_count - node_index)
-        coord_id = f"{cid}-node-0"
-        cluster, cluster_nodes = create_cluster(cid, n_in_cluster, coord_id)
+        node_ids = [f"{cid}-node-{i}" for i in range(n_in_cluster)]
+        cluster = Cluster(id=cid, node_ids=node_ids, coordinator_id=node_ids[0])
 
+        regional = -1
         if c % 10 == 0:
-            regional_coordinators.append(coord_id)
-            cluster.regional_coordinator_id = coord_id
-        else:
-            if region_id < len(regional_coordinators):
-                cluster.regional_coordinator_id = regional_coordinators[region_id]
-
-        nodes.extend(cluster_nodes)
+            regional_coordinators.append(node_index)
+            regional = node_index
+            cluster.regional_coordinator_id = node_ids[0]
+        elif region_id < len(regional_coordinators):
+            regional = regional_coordinators[region_id]
+            cluster.regional_coordinator_id = ids[regional]
+
+        ids.extend(node_ids)
         clusters.append(cluster)
+        sizes.append(n_in_cluster)
+        coordinators.append(node_index)
+        regionals.append(regional)
         node_index += n_in_cluster
 
-    central_id = regional_coordinators[0] if regional_coordinators else (
-        nodes[0].id if nodes else "central-0"
-    )
-    return NetworkStructure(
-        nodes=nodes, clusters=clusters, central_coordinator_id=central_id
+    central_idx = regional_coordinators[0] if regional_coordinators else 0
+    return _build_network(
+        ids, clusters, sizes, coordinators,
+        regional_idx=regionals, central_idx=central_idx,
     )
 
 
+def _sample_mesh_neighbors(
+    node_count: int, k: int, rng: Generator
+) -> NDArray[np.int32]:
+    """Draw *k* distinct gossip peers per node, uniformly among the other N-1.
+
+    Rows are drawn in bulk with ``rng.integers`` and any row containing a
+    repeated peer is redrawn whole.  Rejecting whole rows keeps every
+    ordered k-tuple of distinct peers equally likely, i.e. the same
+    distribution as ``rng.choice(N - 1, k, replace=False)`` per node, at
+    O(N * k) cost.  Returns an ``(N, k)`` int32 array.
+    """
+    peers = np.empty((node_count, k), dtype=np.int64)
+    if k == 0:
+        return peers.astype(np.int32)
+    pending = np.arange(node_count)
+    while pending.size:
+        draw = rng.integers(0, node_count - 1, size=(pending.size, k))
+        # Position p among the other N-1 nodes maps to node p, skipping self
+        draw += draw >= pending[:, None]
+        peers[pending] = draw
+        ordered = np.sort(draw, axis=1)
+        pending = pending[(ordered[:, 1:] == ordered[:, :-1]).any(axis=1)]
+    return peers.astype(np.int32)
+
+
 def _initialize_mesh(
     node_count: int, rng: Generator
 ) -> NetworkStructure:
     """Build a mesh network with random gossip neighbours."""
-    nodes: list[SwarmNode] = []
-    for i in range(node_count):
-        nid = f"mesh-node-{i}"
-        nodes.append(create_node(nid, "mesh", False))
-
+    ids = [f"mesh-node-{i}" for i in range(node_count)]
     gossip_fanout = min(5, math.ceil(math.log2(node_count)))
-    mesh_neighbors: dict[str, list[str]] = {}
+    k = min(gossip_fanout, node_count - 1)
 
-    for node in nodes:
-        candidates = [n.id for n in nodes if n.id != node.id]
-        k = min(gossip_fanout, len(candidates))
-        chosen_indices = rng.choice(len(candidates), size=k, replace=False)
-        mesh_neighbors[node.id] = [candidates[idx] for idx in chosen_indices]
+    # Fixed fan-out, so the CSR row offsets are simply multiples of k
+    indices = _sample_mesh_neighbors(node_count, k, rng).ravel()
+    indptr = np.arange(node_count + 1, dtype=np.int64) * k
 
-    central_id = nodes[0].id if nodes else "mesh-node-0"
-    cluster = Cluster(
-        id="mesh",
-        node_ids=[n.id for n in nodes],
-        coordinator_id=central_id,
-    )
-    return NetworkStructure(
-        nodes=nodes,
-        clusters=[cluster],
-        central_coordinator_id=central_id,
-        mesh_neighbors=mesh_neighbors,
+    cluster = Cluster(id="mesh", node_ids=list(ids), coordinator_id=ids[0])
+    # Mesh nodes are all peers: node 0 is nominal, not a coordinator.
+    return _build_network(
+        ids, [cluster], [node_count], [0],
+        mesh_csr=(indptr, indices), mark_coordinators=False,
     )
 
 
@@ -1166,63 +2048,33 @@ def _initialize_sectorized_mesh(
 
     This models a spatially-partitioned gossip protocol where each node
     communicates with O(sqrt(N)) orbital neighbors, yielding O(N * sqrt(N))
-    = O(N^{3/2}) total messages per cycle.
+    = O(N^{3/2}) total messages per cycle.  The adjacency itself is implicit
+    in the sector index ranges (see :meth:`NetworkStructure.neighbors`), so
+    the network takes O(N) memory.
     """
-    nodes: list[SwarmNode] = []
-    for i in range(node_count):
-        nid = f"sector-node-{i}"
-        nodes.append(create_node(nid, "sector-0", False))
+    ids = [f"sector-node-{i}" for i in range(node_count)]
 
     # Assign nodes to sectors based on index (modeling orbital proximity)
-    n_sectors = math.ceil(node_count / max(1, sector_size))
-    sectors: list[list[int]] = [[] for _ in range(n_sectors)]
-    for i in range(node_count):
-        sector_idx = i // max(1, sector_size)
-        if sector_idx >= n_sectors:
-            sector_idx = n_sectors - 1
-        sectors[sector_idx].append(i)
-        nodes[i] = create_node(f"sector-node-{i}", f"sector-{sector_idx}", False)
-
-    # Build neighbor map: intra-sector + adjacent sector boundary nodes
-    mesh_neighbors: dict[str, list[str]] = {}
-    for s_idx, sector_members in enumerate(sectors):
-        for node_idx in sector_members:
-            nid = nodes[node_idx].id
-            neighbors: list[str] = []
-            # Intra-sector: all other nodes in same sector
-            for other_idx in sector_members:
-                if other_idx != node_idx:
-                    neighbors.append(nodes[other_idx].id)
-            # Inter-sector: boundary nodes of adjacent sectors
-            for adj_s in [s_idx - 1, s_idx + 1]:
-                if 0 <= adj_s < n_sectors and adj_s != s_idx:
-                    adj_members = sectors[adj_s]
-                    if adj_members:
-                        # Connect to the nearest boundary node
-                        boundary_idx = adj_members[-1] if adj_s < s_idx else adj_members[0]
-                        neighbors.append(nodes[boundary_idx].id)
-            mesh_neighbors[nid] = neighbors
-
-    central_id = nodes[0].id if nodes else "sector-node-0"
+    k = max(1, sector_size)
+    n_sectors = math.ceil(node_count / k)
+    sectors: list[range] = [
+        range(s * k, min((s + 1) * k, node_count)) for s in range(n_sectors)
+    ]
+
     # Create one cluster per sector for tracking; mark sector coordinators
-    clusters: list[Cluster] = []
-    for s_idx, sector_members in enumerate(sectors):
-        cid = f"sector-{s_idx}"
-        coord_idx = sector_members[0] if sector_members else 0
-        nodes[coord_idx].is_coordinator = True
-        nodes[coord_idx].status = "coordinator"
-        cluster = Cluster(
-            id=cid,
-            node_ids=[nodes[i].id for i in sector_members],
-            coordinator_id=nodes[coord_idx].id,
+    clusters = [
+        Cluster(
+            id=f"sector-{s_idx}",
+            node_ids=ids[members.start:members.stop],
+            coordinator_id=ids[members.start],
         )
-        clusters.append(cluster)
-
-    return NetworkStructure(
-        nodes=nodes,
-        clusters=clusters,
-        central_coordinator_id=central_id,
-        mesh_neighbors=mesh_neighbors,
+        for s_idx, members in enumerate(sectors)
+    ]
+    return _build_network(
+        ids, clusters,
+        [len(m) for m in sectors],
+        [m.start for m in sectors],
+        sector_adjacency=True,
     )
 
 
@@ -1243,24 +2095,23 @@ def initialize_network(
 
 
 # -- routing ---------------------------------------------------------------
+# Routing works on node indices; :func:`get_message_routing` translates to
+# and from string IDs for callers outside the simulator.
 def _centralized_routing(
     network: NetworkStructure,
-    source_node_id: str,
-) -> list[tuple[str, str]]:
+    source: int,
+) -> list[tuple[int, int]]:
     """Centralized: all messages go to / from the central coordinator."""
-    if source_node_id == network.central_coordinator_id:
-        return [
-            (source_node_id, n.id)
-            for n in network.nodes
-            if n.id != source_node_id and n.status != "failed"
-        ]
-    return [(source_node_id, network.central_coordinator_id)]
+    if source == network.central_idx:
+        alive = np.flatnonzero(network.store.status != STATUS_FAILED)
+        return [(source, j) for j in alive.tolist() if j != source]
+    return [(source, network.central_idx)]
 
 
 def _hierarchical_routing(
     network: NetworkStructure,
-    source_node_id: str,
-) -> list[tuple[str, str]]:
+    source: int,
+) -> list[tuple[int, int]]:
     """Hierarchical: upward aggregation routes.
 
     - Regular node → cluster coordinator (ephemeris, 256 B)
@@ -1271,42 +2122,30 @@ def _hierarchical_routing(
     handled via batch accounting in ``_handle_state_sync`` to avoid
     generating O(k_c) individual events per coordinator per cycle.
     """
-    routes: list[tuple[str, str]] = []
-    source = network.get_node(source_node_id)
-    if source is None:
-        return routes
-    cluster = network.get_cluster(source.cluster_id) if source.cluster_id else None
-    if cluster is None:
-        return routes
-
-    if source_node_id == cluster.coordinator_id:
+    c = int(network.store.cluster_idx[source])
+    coordinator = int(network.cluster_coordinator[c])
+    if source == coordinator:
         # --- Upward: coordinator sends summary ---
-        if (
-            cluster.regional_coordinator_id
-            and cluster.regional_coordinator_id != source_node_id
-        ):
+        regional = int(network.cluster_regional[c])
+        if regional >= 0 and regional != source:
             # Cluster coordinator → regional coordinator (cluster_summary)
-            routes.append((source_node_id, cluster.regional_coordinator_id))
-        elif source_node_id != network.central_coordinator_id:
+            return [(source, regional)]
+        if source != network.central_idx:
             # Regional coordinator (not central) → central (region_summary)
-            routes.append((source_node_id, network.central_coordinator_id))
-    else:
-        # Regular node sends ephemeris to coordinator
-        routes.append((source_node_id, cluster.coordinator_id))
-    return routes
+            return [(source, network.central_idx)]
+        return []
+    # Regular node sends ephemeris to coordinator
+    return [(source, coordinator)]
 
 
 def _mesh_routing(
     network: NetworkStructure,
-    source_node_id: str,
-) -> list[tuple[str, str]]:
+    source: int,
+) -> list[tuple[int, int]]:
     """Mesh: gossip to neighbours."""
-    neighbors = (network.mesh_neighbors or {}).get(source_node_id, [])
-    return [
-        (source_node_id, nid)
-        for nid in neighbors
-        if (lambda n: n is not None and n.status != "failed")(network.get_node(nid))
-    ]
+    neighbors = network.neighbors(source)
+    live = neighbors[network.store.status[neighbors] != STATUS_FAILED]
+    return [(source, j) for j in live.tolist()]
 
 
 _SECTORIZED_MESH_MAX_GOSSIP: int = 10
@@ -1320,13 +2159,15 @@ routing to keep the DES tractable while matching the analytical model.
 
 def _sectorized_mesh_routing(
     network: NetworkStructure,
-    source_node_id: str,
-) -> list[tuple[str, str]]:
+    source: int,
+) -> list[tuple[int, int]]:
     """Sectorized mesh: status to sector coordinator + heartbeats to neighbors.
 
     Returns routes for:
     1. Status report (ephemeris, 256 B) to the sector coordinator
-    2. Heartbeats (32 B) to up to _SECTORIZED_MESH_MAX_GOSSIP other neighbors
+    2. Heartbeats (32 B) to up to _SECTORIZED_MESH_MAX_GOSSIP other neighbors,
+       the first live ones in :meth:`NetworkStructure.neighbors` order,
+       walked lazily so the O(sector_size) row is never built
 
     Coordination commands from sector coordinator to members are handled
     via batch accounting in ``_handle_state_sync``.
@@ -1335,45 +2176,58 @@ def _sectorized_mesh_routing(
     ``_classify_message_type`` can distinguish it (ephemeris) from peer
     heartbeats.
     """
-    source = network.get_node(source_node_id)
-    if source is None:
-        return []
-    cluster = network.get_cluster(source.cluster_id) if source.cluster_id else None
+    status = network.store.status
+    coordinator = int(network.cluster_coordinator[network.store.cluster_idx[source]])
 
-    routes: list[tuple[str, str]] = []
+    routes: list[tuple[int, int]] = []
     # 1. Status report to sector coordinator (unless we ARE the coordinator)
-    if cluster and cluster.coordinator_id != source_node_id:
-        coord_node = network.get_node(cluster.coordinator_id)
-        if coord_node and coord_node.status != "failed":
-            routes.append((source_node_id, cluster.coordinator_id))
+    if coordinator != source and status[coordinator] != STATUS_FAILED:
+        routes.append((source, coordinator))
 
     # 2. Heartbeats to mesh neighbors (excluding coordinator, already added)
-    neighbors = (network.mesh_neighbors or {}).get(source_node_id, [])
-    coord_id = cluster.coordinator_id if cluster else None
-    live = [
-        nid for nid in neighbors
-        if nid != coord_id
-        and (lambda n: n is not None and n.status != "failed")(network.get_node(nid))
-    ]
-    routes.extend(
-        (source_node_id, nid) for nid in live[:_SECTORIZED_MESH_MAX_GOSSIP]
+    neighbors = (
+        network.sector_neighbors(source) if network.sector_adjacency
+        else network.neighbors(source).tolist()
     )
+    budget = _SECTORIZED_MESH_MAX_GOSSIP
+    for j in neighbors:
+        if budget == 0:
+            break
+        if j != coordinator and status[j] != STATUS_FAILED:
+            routes.append((source, j))
+            budget -= 1
     return routes
 
 
+def get_message_routing_indices(
+    topology: CoordinationTopology,
+    network: NetworkStructure,
+    source: int,
+) -> list[tuple[int, int]]:
+    """Return ``(sender, receiver)`` node-index pairs for an update from *source*."""
+    if topology == "centralized":
+        return _centralized_routing(network, source)
+    if topology == "hierarchical":
+        return _hierarchical_routing(network, source)
+    if topology == "sectorized_mesh":
+        return _sectorized_mesh_routing(network, source)
+    return _mesh_routing(network, source)
+
+
 def get_message_routing(
     topology: CoordinationTopology,
     network: NetworkStructure,
     source_node_id: str,
 ) -> list[tuple[str, str]]:
     """Return ``(sender, receiver)`` pairs for an update from *source_node_id*."""
-    if topology == "centralized":
-        return _centralized_routing(network, source_node_id)
-    if topology == "hierarchical":
-        return _hierarchical_routing(network, source_node_id)
-    if topology == "sectorized_mesh":
-        return _sectorized_mesh_routing(network, source_node_id)
-    return _mesh_routing(network, source_node_id)
+    source = network.index_of(source_node_id)
+    if source < 0:
+        return []
+    ids = network.store.ids
+    return [
+        (ids[s], ids[r])
+        for s, r in get_message_routing_indices(topology, network, source)
+    ]
 
 
 def get_hop_count(
@@ -1431,62 +2285,1347 @@ def estimate_bottleneck_threshold(
 
 
 # ---------------------------------------------------------------------------
-# EventQueue (min-heap on event.time)
+# Analytic surrogate
 # ---------------------------------------------------------------------------
-class EventQueue:
-    """Priority queue of :class:`SimEvent` objects backed by a binary heap."""
-
-    def __init__(self) -> None:
-        self._heap: list[SimEvent] = []
-
-    def push(self, event: SimEvent) -> None:
-        """Add an event to the queue."""
-        heapq.heappush(self._heap, event)
+def _delivery_probability(config: SwarmCoordinationConfig) -> tuple[float, float]:
+    """Return ``(P(delivered), loss rate per attempt)`` under the link model.
 
-    def pop(self) -> Optional[SimEvent]:
-        """Remove and return the earliest event, or ``None`` if empty."""
-        if not self._heap:
-            return None
-        return heapq.heappop(self._heap)
+    A message is delivered if any of its ``1 + max_retransmissions``
+    attempts gets through.  Under Gilbert-Elliott every attempt within a
+    cycle sees the same (stationary) link state.  The second value is the
+    DES ``message_loss_rate``: messages lost over attempts made.
+    """
+    attempts = 1 + config.max_retransmissions
+    if config.link_model == "gilbert_elliott":
+        p_gb, p_bg = config.ge_p_good_to_bad, config.ge_p_bad_to_good
+        pi_good = p_bg / (p_gb + p_bg) if p_gb + p_bg > 0 else 1.0
+        states = ((pi_good, config.ge_p_loss_good), (1.0 - pi_good, config.ge_p_loss_bad))
+    else:
+        states = ((1.0, 1.0 - min(1.0, config.link_availability)),)
+    lost = sum(w * q ** attempts for w, q in states)
+    tries = sum(w * sum(q ** i for i in range(attempts)) for w, q in states)
+    return 1.0 - lost, lost / tries
 
-    def peek(self) -> Optional[SimEvent]:
-        """Return the earliest event without removing it."""
-        return self._heap[0] if self._heap else None
 
-    def is_empty(self) -> bool:
-        return len(self._heap) == 0
+def _rotation_power_variance(config: SwarmCoordinationConfig, sizes: list[int]) -> float:
+    """Power variance (percent) of round-robin coordinator rotation.
 
-    def size(self) -> int:
-        return len(self._heap)
+    Each cluster of *sizes* hands off every duty cycle to the member with
+    the least coordinator time, so tenure ``i`` goes to member ``i mod k``
+    and the last tenure is cut short by the end of the run.
+    """
+    duration = config.simulation_days * SECONDS_PER_DAY
+    duty = config.coordinator_duty_cycle_hours * 3600.0
+    n_tenures = max(1, math.ceil(duration / duty)) if duty > 0 else 1
+    tenures = np.full(n_tenures, duty if duty > 0 else duration)
+    tenures[-1] = duration - (n_tenures - 1) * tenures[0]
+    extra_w = config.coordinator_power_w - config.base_power_w
+    energies = []
+    for k in sizes:
+        coord_time = np.bincount(np.arange(n_tenures) % k, weights=tenures, minlength=k)
+        energies.append((config.base_power_w * duration + extra_w * coord_time) / 3600.0)
+    return _power_variance_percent(np.concatenate(energies)) if energies else 0.0
+
+
+def analytic_run_result(config: SwarmCoordinationConfig) -> SwarmCoordinationRunResult:
+    """Return a closed-form estimate of a DES run of *config*.
+
+    Expected per-cycle protocol bytes follow the DES traffic accounting
+    (summaries, heartbeats, commands under the workload profile and
+    campaign duty factor, collision alerts, gossip), thinned by exception
+    telemetry and the link model.  Availability, energy and power variance
+    follow from the coordinator rotation schedule; propagation delay and
+    the bottleneck threshold come from :func:`calculate_propagation_delay`
+    and :func:`estimate_bottleneck_threshold`.  Node failures, coordinator
+    bandwidth caps and airtime limits are not modelled, and the per-run
+    DES counters (message and byte totals, AoI, recovery streaks) are left
+    at their defaults.
+    """
+    topo = config.coordination_topology
+    n = config.node_count
+    k = config.cluster_size
+    T_c = 10.0  # sync interval used by the DES
+    duration = config.simulation_days * SECONDS_PER_DAY
+    sample_rate = (
+        config.sync_sample_rate if config.sync_sample_rate > 0.0
+        else min(1.0, 1_000 / n)
+    )
+    p_delivered, loss_rate = _delivery_probability(config)
+    needs_loss = config.link_model == "gilbert_elliott" or config.link_availability < 1.0
+    if not needs_loss:
+        p_delivered, loss_rate = 1.0, 0.0
+
+    # Cluster layout as built by initialize_network
+    if topo == "hierarchical":
+        sizes = [min(k, n - i) for i in range(0, n, k)]
+    elif topo == "sectorized_mesh":
+        sector_k = config.sector_size if config.sector_size > 0 else math.ceil(math.sqrt(n))
+        sizes = [min(sector_k, n - i) for i in range(0, n, sector_k)]
+    else:
+        sizes = [n]
+    n_clusters = len(sizes)
+    members = n - n_clusters  # non-coordinator nodes
+
+    # Command volume per member per cycle (hierarchical and sectorized)
+    duty = min(1.0, max(0.0, config.campaign_duty_factor))
+    profile = config.workload_profile
+    exception = config.enable_exception_telemetry and topo == "hierarchical"
+    report_p = config.exception_threshold if exception else 1.0
+    cmd_p = 0.0 if profile == "nominal" else duty
+    if profile == "event_driven":
+        cmd_p *= config.event_command_probability
+    consensus_bytes = 0.0
+    if profile == "distributed":
+        consensus_bytes = (
+            cmd_p * members * config.distributed_consensus_rounds
+            * config.distributed_vote_msg_bytes
+        )
+    cmd_bytes = cmd_p * report_p * members * MESSAGE_SIZES["coordination_command"] * p_delivered
+
+    # Fleet-wide protocol bytes per cycle and messages entering the latency queue
+    protocol_bytes = 0.0
+    queued_msgs = 0.0
+    smallest_queued = MESSAGE_SIZES["ephemeris"]
+    if topo == "centralized":
+        queued_msgs = 2.0 * (n - 1) * p_delivered
+    elif topo == "hierarchical":
+        n_regions = math.ceil(n_clusters / 10)
+        # Region summaries flow until the regional coordinators first hand
+        # off; afterwards every cluster coordinator sends a cluster summary
+        window = min(1.0, config.coordinator_duty_cycle_hours * 3600.0 / duration)
+        summaries = (
+            (n_clusters - n_regions) * MESSAGE_SIZES["cluster_summary"]
+            + window * (n_regions - 1) * MESSAGE_SIZES["region_summary"]
+            + (1.0 - window) * n_regions * MESSAGE_SIZES["cluster_summary"]
+        )
+        reporters = members * report_p
+        protocol_bytes = (
+            summaries * p_delivered
+            + reporters * p_delivered * MESSAGE_SIZES["coordination_heartbeat"]
+            + (n_clusters + reporters) * 1e-4 * T_c * MESSAGE_SIZES["collision_alert"]
+            + cmd_bytes + consensus_bytes
+        )
+        queued_msgs = (reporters + n_clusters) * p_delivered
+    elif topo == "sectorized_mesh":
+        heartbeats = 0.0
+        for s_idx, m in enumerate(sizes):
+            adjacent = (s_idx > 0) + (s_idx + 1 < n_clusters)
+            heartbeats += (m - 1) * min(_SECTORIZED_MESH_MAX_GOSSIP, m - 2 + adjacent)
+            heartbeats += min(_SECTORIZED_MESH_MAX_GOSSIP, m - 1 + adjacent)
+        protocol_bytes = (
+            heartbeats * p_delivered * MESSAGE_SIZES["heartbeat"]
+            + cmd_bytes + consensus_bytes
+        )
+        queued_msgs = (members + heartbeats) * p_delivered
+        smallest_queued = MESSAGE_SIZES["heartbeat"]
+    else:
+        fanout = min(min(5, math.ceil(math.log2(n))), n - 1)
+        queued_msgs = n * fanout * p_delivered
+        smallest_queued = MESSAGE_SIZES["gossip"]
+        protocol_bytes = queued_msgs * MESSAGE_SIZES["gossip"]
+
+    # The latency queue (capacity 10 N) drains only when a receive event's
+    # 100 ms bandwidth budget fits a message; otherwise it fills and every
+    # later message is dropped
+    n_cycles = duration / T_c
+    drains = config.bandwidth_per_node_kbps * 1_000 * 0.1 / 8 >= smallest_queued
+    per_cycle = sample_rate * queued_msgs
+    if topo == "mesh":
+        # Gossip rounds are not sampled but are scaled like sampled traffic,
+        # and only count while the queue has room
+        round_msgs = min(1_000, min(1_000, n) * fanout) * p_delivered
+        per_cycle += round_msgs
+        active = 1.0
+        if not drains and per_cycle > 0:
+            active = min(1.0, n * 10 / per_cycle / n_cycles)
+        protocol_bytes += active * round_msgs / sample_rate * MESSAGE_SIZES["gossip"]
+    drop_rate = 0.0 if drains or per_cycle * n_cycles <= n * 10 else 1.0
+
+    fleet_capacity_bps = n * config.bandwidth_per_node_kbps * 1_000
+    overhead = (
+        protocol_bytes * 8 / T_c / fleet_capacity_bps * 100.0
+        if fleet_capacity_bps > 0 else 0.0
+    )
+
+    # Hierarchical handoffs at every duty cycle; 1 % fail (30 s gap each)
+    availability = 100.0
+    failed_handoffs = 0.0
+    if topo == "hierarchical" and config.coordinator_duty_cycle_hours > 0:
+        handoffs = max(0, math.ceil(duration / (config.coordinator_duty_cycle_hours * 3600.0)) - 1)
+        failed_handoffs = 0.01 * handoffs * n_clusters
+        availability -= 0.01 * handoffs * HANDOFF_TIMEOUT_SECONDS / duration * 100.0
+
+    coordinators = 0 if topo == "mesh" else n_clusters
+    energy_wh = (
+        (n - coordinators) * config.base_power_w + coordinators * config.coordinator_power_w
+    ) * duration / 3600.0
+    if topo in ("hierarchical", "sectorized_mesh"):
+        power_var = _rotation_power_variance(config, sizes)
+    elif topo == "centralized":
+        powers = np.full(n, config.base_power_w)
+        powers[0] = config.coordinator_power_w
+        power_var = _power_variance_percent(powers)
+    else:
+        power_var = 0.0
+
+    avg_prop = calculate_propagation_delay(topo, n, k)
+    return SwarmCoordinationRunResult(
+        config=config,
+        communication_overhead_percent=overhead,
+        bottleneck_threshold_nodes=estimate_bottleneck_threshold(
+            topo, k, config.bandwidth_per_node_kbps
+        ),
+        coordinator_availability_percent=availability,
+        power_variance_percent=power_var,
+        avg_update_propagation_ms=avg_prop,
+        max_update_propagation_ms=avg_prop * 2.0,
+        failed_handoffs=round(failed_handoffs),
+        message_drop_rate=drop_rate,
+        total_energy_kwh=energy_wh / 1_000.0,
+        coordinator_bandwidth_kbps=per_coordinator_bandwidth_kbps(k, T_c),
+        exception_telemetry_reduction=report_p,
+        message_loss_rate=loss_rate,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Fluid (time-stepped) engine
+# ---------------------------------------------------------------------------
+_AGE_TAIL_NODES: float = 1e-9
+"""Expected node count below which trailing age columns are dropped."""
+
+_AGE_SUBSAMPLES: int = 10
+"""Sample points per T_c when AoI samples are read from the age histogram."""
+
+
+class _AgeDistribution:
+    """Expected node counts by ``(link state, age in cycles)``.
+
+    Row 0 holds nodes whose link is good, row 1 nodes whose link is bad.
+    Counts are expected values (floats) evolved by the fluid recursion of
+    :class:`FluidSwarmSimulator`; trailing columns whose mass falls below
+    :data:`_AGE_TAIL_NODES` are dropped, so the width follows the decay of
+    the distribution rather than the length of the run.
+    """
+
+    def __init__(self, count: float) -> None:
+        self.counts: NDArray[np.float64] = np.zeros((2, 64))
+        self.counts[0, 0] = count
+        self.width: int = 1
+
+    def live(self) -> NDArray[np.float64]:
+        """Return the columns in use (a view)."""
+        return self.counts[:, :self.width]
+
+    def ages(self) -> NDArray[np.int64]:
+        """Return the age of each column in use."""
+        return np.arange(self.width)
+
+    def ge_step(self, transition: NDArray[np.float64]) -> None:
+        """Apply the Gilbert-Elliott *transition* matrix to every age column."""
+        live = self.live()
+        live[:] = transition.T @ live
+
+    def remove(self, n: float) -> None:
+        """Remove *n* nodes drawn uniformly from every state and age."""
+        live = self.live()
+        total = live.sum()
+        if total > 0:
+            live *= max(0.0, 1.0 - n / total)
+
+    def add(self, n: float, bad_fraction: float) -> None:
+        """Add *n* nodes at age 0, a *bad_fraction* of them with a bad link."""
+        self.counts[0, 0] += n * (1.0 - bad_fraction)
+        self.counts[1, 0] += n * bad_fraction
+
+    def advance(
+        self,
+        stay: Optional[NDArray[np.float64]],
+        up: NDArray[np.float64],
+        reset: NDArray[np.float64],
+    ) -> None:
+        """Replace the counts: *stay* keep their age, *up* age by one cycle.
+
+        *stay* and *up* have the shape of :meth:`live` (``None`` = no node
+        stays); *reset* gives, per state, the nodes that restart at age 0.
+        """
+        w = self.width
+        if w + 1 > self.counts.shape[1]:
+            self.counts = np.concatenate([self.counts, np.zeros_like(self.counts)], axis=1)
+        counts = self.counts
+        if stay is None:
+            counts[:, :w] = 0.0
+        else:
+            counts[:, :w] = stay
+        counts[:, w] = 0.0
+        counts[:, 1:w + 1] += up
+        counts[:, 0] += reset
+        w += 1
+        while w > 1 and counts[0, w - 1] + counts[1, w - 1] < _AGE_TAIL_NODES:
+            w -= 1
+        counts[:, w:w + 2] = 0.0
+        self.width = w
+
+
+class FluidSwarmSimulator:
+    """Time-stepped cluster-level model of a hierarchical swarm.
+
+    Every T_c the whole fleet advances at once: member reports, exception
+    telemetry, coordinator byte caps, link loss with retransmissions,
+    airtime limits, summaries, commands and collision alerts are binomial
+    draws over message counts instead of per-message events, so a cycle
+    costs the same for a thousand nodes as for a million and no node is
+    sampled out.  Per-cluster state (live members, current coordinator,
+    tenure, failed handoffs) is kept in arrays of length ``n_clusters``;
+    node failures and repairs follow the DES failure model and every
+    cluster hands off each duty cycle to its least-used live member, with
+    1 % of handoffs failing.
+
+    The model is mean-field in three places.  The fleet's split into good
+    and bad Gilbert-Elliott links follows the expected (fluid) recursion.
+    Byte caps and airtime limits act on each cluster's expected offered
+    load, not on its per-cycle fluctuation, and thin reports at random
+    instead of always starving the same members, so AoI under a binding cap
+    is optimistic.  Age of information and loss streaks are expected
+    histograms over (link state, cycles since the last delivered report),
+    so AoI is measured at the current coordinator only (the DES also
+    samples what demoted coordinators last heard); they become Poisson
+    counts when folded into the sketches.  The DES latency queue is reduced
+    to its capacity (10 N) and drain rule: ``message_drop_rate`` is the
+    overflow share of delivered routed messages, and while the queue
+    drains a message's propagation delay is
+    :func:`calculate_propagation_delay` plus serialization and one base
+    delay per retransmission.  Distributions are always log histograms.
+    """
+
+    def __init__(self, config: SwarmCoordinationConfig) -> None:
+        if config.coordination_topology != "hierarchical":
+            raise ValueError(
+                "the fluid engine models the hierarchical topology only, "
+                f"not {config.coordination_topology!r}"
+            )
+        self.config = config
+        self.rng: Generator = np.random.default_rng(config.seed)
+        self.simulation_duration_seconds: float = config.simulation_days * SECONDS_PER_DAY
+        self.duty_cycle_seconds: float = config.coordinator_duty_cycle_hours * 3600.0
+        self._sync_interval: float = 10.0
+        self._aoi_sample_interval: float = max(100.0, self.simulation_duration_seconds / 1000)
+
+        # Cluster layout as built by _initialize_hierarchical
+        n, k = config.node_count, config.cluster_size
+        n_clusters = math.ceil(n / k)
+        self.cluster_offsets: NDArray[np.int64] = np.minimum(
+            np.arange(n_clusters + 1, dtype=np.int64) * k, n
+        )
+        starts = self.cluster_offsets[:-1]
+        self._regional_cluster: NDArray[np.int64] = (np.arange(n_clusters) // 10) * 10
+        self.cluster_regional: NDArray[np.int64] = starts[self._regional_cluster]
+        self.cluster_coordinator: NDArray[np.int64] = starts.copy()
+        self.headed: NDArray[np.bool_] = np.ones(n_clusters, dtype=bool)
+        """Whether the cluster's coordinator is live and acting."""
+        self.tenure_start: NDArray[np.float64] = np.zeros(n_clusters)
+        self.failed_handoffs: NDArray[np.int64] = np.zeros(n_clusters, dtype=np.int64)
+        self.live_per_cluster: NDArray[np.int64] = np.diff(self.cluster_offsets)
+        self.alive: NDArray[np.bool_] = np.ones(n, dtype=bool)
+        self.coordinator_time_seconds: NDArray[np.float64] = np.zeros(n)
+        members = np.arange(n_clusters * k, dtype=np.int64).reshape(n_clusters, k)
+        self._members: NDArray[np.int64] = np.where(members < n, members, -1)
+
+        # Failures hit non-coordinators once, as in the DES
+        rate_per_second = config.node_failure_rate_per_year / (365.0 * 24.0 * 3600.0)
+        is_member = np.ones(n, dtype=bool)
+        is_member[starts] = False
+        candidates = np.flatnonzero(is_member)
+        failure_times = self.rng.exponential(1.0 / rate_per_second, size=candidates.size)
+        due = failure_times < self.simulation_duration_seconds
+        order = np.argsort(failure_times[due], kind="stable")
+        self._failure_times: list[float] = failure_times[due][order].tolist()
+        self._failure_nodes: list[int] = candidates[due][order].tolist()
+        self._next_failure: int = 0
+        self._recoveries: list[tuple[float, int]] = []
+        self._next_handoff: float = (
+            self.duty_cycle_seconds
+            if 0 < self.duty_cycle_seconds < self.simulation_duration_seconds
+            else math.inf
+        )
+
+        # Link model: per-attempt loss in the good and bad state
+        self._ge = config.link_model == "gilbert_elliott"
+        if self._ge:
+            p_gb, p_bg = config.ge_p_good_to_bad, config.ge_p_bad_to_good
+            self._ge_transition = np.array([[1.0 - p_gb, p_gb], [p_bg, 1.0 - p_bg]])
+            self._loss = (config.ge_p_loss_good, config.ge_p_loss_bad)
+        else:
+            q = 1.0 - min(1.0, config.link_availability)
+            self._loss = (q, q)
+        self._needs_loss = self._ge or config.link_availability < 1.0
+        self._attempts = 1 + config.max_retransmissions
+
+        # Live members' AoI and loss streaks; failed members' last update
+        self._aoi = _AgeDistribution(n - n_clusters)
+        self._streaks = _AgeDistribution(n - n_clusters)
+        self._recovered_by_streak: NDArray[np.float64] = np.zeros(64)
+        self._failed_last_update: dict[int, float] = {}
+        self._dirty = True
+
+        d = config.campaign_duty_factor
+        L_on = max(1, config.campaign_on_length)
+        self._campaign_p_on_to_off = 1.0 / L_on
+        if 0 < d < 1:
+            self._campaign_p_off_to_on = 1.0 / max(1.0, L_on * (1.0 - d) / d)
+        else:
+            self._campaign_p_off_to_on = 1.0 if d >= 1 else 0.0
+        self._campaign_on_clusters: int = n_clusters if d >= 1 else 0
+
+        self._base_delay_ms = calculate_propagation_delay("hierarchical", n, k)
+        self._report_p = (
+            config.exception_threshold if config.enable_exception_telemetry else 1.0
+        )
+        self._byte_cap = 0.0
+        if config.coordinator_link_capacity_kbps > 0:
+            self._byte_cap = (
+                config.coordinator_link_capacity_kbps * 1_000 / 8 * self._sync_interval
+            )
+            if config.coordinator_scheduling == "tdma":
+                self._byte_cap *= 1.0 - config.guard_time_fraction
+
+        # Counters, named as in SwarmCoordinationSimulator
+        self.total_messages_sent = 0
+        self.total_messages_delivered = 0
+        self._tier_breakdown = TierMessageBreakdown()
+        self._total_bytes_sent = 0
+        self._protocol_bytes_sent = 0
+        self._total_bytes_attempted = 0
+        self._protocol_bytes_attempted = 0
+        self._ephemeris_bytes_sent = 0
+        self._heartbeat_bytes_sent = 0
+        self._command_bytes_sent = 0
+        self._summary_bytes_sent = 0
+        self._alert_bytes_sent = 0
+        self._distributed_consensus_bytes = 0
+        self._exception_expected_msgs = 0
+        self._exception_actual_msgs = 0
+        self._link_attempted_msgs = 0
+        self._link_lost_msgs = 0
+        self._retransmission_count = 0
+        self._coordinator_drops = 0
+        self._coordinator_unavailability_events = 0
+        self._queued_msgs = 0
+        self._airtime_attempted = 0
+        self._airtime_delivered = 0
+        self._airtime_deadline_misses = 0
+        self._airtime_utilization_sum = 0.0
+        self._airtime_utilization_count = 0
+        self._delay_counts: dict[str, list[int]] = {
+            msg_type: [0] * self._attempts
+            for msg_type in ("ephemeris", "cluster_summary", "region_summary")
+        }
+        self._coordinator_ingress_per_cycle: list[int] = []
+        self._coordinator_ingress_stats = make_sketch(
+            config.stats_backend, SKETCH_RESOLUTION["coordinator_ingress_bytes"]
+        )
+        self._aoi_stats = LogHistogram(resolution=SKETCH_RESOLUTION["aoi_seconds"])
+
+    # -- run -----------------------------------------------------------------
+    def run(self) -> SwarmCoordinationRunResult:
+        """Simulate every T_c cycle of the run and return the result."""
+        duration = self.simulation_duration_seconds
+        T_c = self._sync_interval
+        last_aoi_sample_time = 0.0
+        for cycle in range(math.ceil(duration / T_c)):
+            t = cycle * T_c
+            self._apply_events(t)
+            if t - last_aoi_sample_time >= self._aoi_sample_interval:
+                self._sample_aoi(t)
+                last_aoi_sample_time = t
+            self._step()
+        headed = self.headed
+        self.coordinator_time_seconds[self.cluster_coordinator[headed]] += (
+            duration - self.tenure_start[headed]
+        )
+        return self._generate_result()
+
+    # -- failures and handoffs -------------------------------------------------
+    def _apply_events(self, t: float) -> None:
+        """Apply the failures, repairs and handoffs due at or before *t*, in time order."""
+        while True:
+            t_fail = (
+                self._failure_times[self._next_failure]
+                if self._next_failure < len(self._failure_times) else math.inf
+            )
+            t_repair = self._recoveries[0][0] if self._recoveries else math.inf
+            t_next = min(t_fail, t_repair, self._next_handoff)
+            if t_next > t:
+                return
+            if t_next == self._next_handoff:
+                self._hand_over(t_next)
+                self._next_handoff += self.duty_cycle_seconds
+                if self._next_handoff >= self.simulation_duration_seconds:
+                    self._next_handoff = math.inf
+            elif t_next == t_fail:
+                self._fail(self._failure_nodes[self._next_failure], t_fail)
+                self._next_failure += 1
+            else:
+                self._recover(heapq.heappop(self._recoveries)[1])
+            self._dirty = True
+
+    def _bad_fraction(self) -> float:
+        """Fraction of live member links in the bad state."""
+        mass = self._aoi.live().sum(axis=1)
+        total = float(mass[0] + mass[1])
+        return float(mass[1]) / total if total > 0 else 0.0
+
+    def _fail(self, idx: int, time: float) -> None:
+        c = idx // self.config.cluster_size
+        self.alive[idx] = False
+        self.live_per_cluster[c] -= 1
+        if self.cluster_coordinator[c] == idx:
+            # The cluster stays headless until its next regular handoff
+            if self.headed[c]:
+                self.coordinator_time_seconds[idx] += time - self.tenure_start[c]
+                self.headed[c] = False
+        else:
+            # The member keeps the age it had at its coordinator
+            by_age = self._aoi.live().sum(axis=0)
+            age = int(self.rng.choice(by_age.size, p=by_age / by_age.sum()))
+            self._failed_last_update[idx] = time - (age + 0.5) * self._sync_interval
+            self._aoi.remove(1)
+            self._streaks.remove(1)
+        mttr_seconds = int(self.rng.integers(1, 8)) * SECONDS_PER_DAY
+        if time + mttr_seconds < self.simulation_duration_seconds:
+            heapq.heappush(self._recoveries, (time + mttr_seconds, idx))
+
+    def _recover(self, idx: int) -> None:
+        c = idx // self.config.cluster_size
+        self.alive[idx] = True
+        self.live_per_cluster[c] += 1
+        if self._failed_last_update.pop(idx, None) is not None:
+            bad = self._bad_fraction()
+            self._aoi.add(1, bad)
+            self._streaks.add(1, bad)
+
+    def _hand_over(self, t: float) -> None:
+        """Hand off every cluster to its least-used live member at time *t*."""
+        headed = self.headed
+        coord = self.cluster_coordinator
+        coord_time = self.coordinator_time_seconds
+        coord_time[coord[headed]] += t - self.tenure_start[headed]
+
+        # Least accumulated coordinator time wins (first index on ties)
+        members = self._members
+        idx = np.maximum(members, 0)
+        eligible = (members >= 0) & self.alive[idx] & (members != coord[:, None])
+        key = np.where(eligible, coord_time[idx], math.inf)
+        best = key.argmin(axis=1)
+        has = eligible[np.arange(best.size), best]
+        ok = has & (self.rng.random(best.size) >= 0.01)
+        self.failed_handoffs += ~ok
+
+        # New coordinators leave the members; old ones rejoin them
+        old = coord[ok]
+        old_alive = self.alive[old]
+        bad = self._bad_fraction()
+        for dist in (self._aoi, self._streaks):
+            dist.remove(int(np.count_nonzero(ok)))
+            dist.add(int(np.count_nonzero(old_alive)), bad)
+        for i in old[~old_alive].tolist():
+            self._failed_last_update[i] = t
+
+        coord[ok] = members[ok, best[ok]]
+        headed[ok] = True
+        self.tenure_start[headed] = t
+
+    def _refresh_clusters(self) -> None:
+        """Recompute the fleet aggregates that depend on cluster state."""
+        coord = self.cluster_coordinator
+        headed = self.headed
+        members = self.live_per_cluster - self.alive[coord]
+        self._n_members = int(members.sum())
+        self._n_headed = int(np.count_nonzero(headed))
+
+        # Summaries: cluster coordinator -> regional -> central (node 0)
+        reg = self.cluster_regional
+        reg_cluster = self._regional_cluster
+        to_regional = headed & (coord != reg)
+        to_central = headed & (coord == reg) & (coord != 0)
+        regional_acting = headed[reg_cluster] & (coord[reg_cluster] == reg)
+        cluster_in = to_regional & regional_acting
+        region_in = to_central & bool(headed[0] and coord[0] == 0)
+        self._cluster_summaries = int(np.count_nonzero(to_regional))
+        self._region_summaries = int(np.count_nonzero(to_central))
+        self._cluster_summaries_in = int(np.count_nonzero(cluster_in))
+        self._region_summaries_in = int(np.count_nonzero(region_in))
+
+        # Coordinator byte caps on the expected offered load (fluid limit)
+        headed_members = np.where(headed, members, 0)
+        offered = (
+            self._report_p * MESSAGE_SIZES["ephemeris"] * headed_members
+            + MESSAGE_SIZES["cluster_summary"]
+            * np.bincount(reg_cluster[cluster_in], minlength=coord.size)
+        )
+        offered[0] += MESSAGE_SIZES["region_summary"] * self._region_summaries_in
+        admit = np.ones(coord.size)
+        if self._byte_cap > 0:
+            np.divide(self._byte_cap, offered, out=admit, where=offered > self._byte_cap)
+        n_headed_members = int(headed_members.sum())
+        self._headed_fraction = (
+            n_headed_members / self._n_members if self._n_members else 0.0
+        )
+        self._ephemeris_admit = (
+            float(headed_members @ admit) / n_headed_members if n_headed_members else 1.0
+        )
+        self._cluster_summary_admit = (
+            float(admit[reg_cluster[cluster_in]].mean()) if self._cluster_summaries_in else 1.0
+        )
+        self._region_summary_admit = float(admit[0])
+        self._admitted_members = (headed_members * admit)[headed_members > 0]
+        self._command_members = int((self.live_per_cluster - 1)[headed].sum())
+        self._dirty = False
+
+    # -- one cycle -------------------------------------------------------------
+    def _split(self, n: int, p_bad: float) -> tuple[int, int]:
+        """Split *n* senders into ``(good, bad)`` link-state counts."""
+        bad = int(self.rng.binomial(n, p_bad)) if n and p_bad > 0.0 else 0
+        return n - bad, bad
+
+    def _thin(self, counts: tuple[int, int], p: float) -> tuple[int, int]:
+        """Keep each of *counts* with probability *p*."""
+        if p >= 1.0:
+            return counts
+        binomial = self.rng.binomial
+        return int(binomial(counts[0], p)), int(binomial(counts[1], p))
+
+    def _transmit(
+        self, offered: tuple[int, int]
+    ) -> tuple[list[int], tuple[int, int], tuple[int, int]]:
+        """Send *offered* ``(good, bad)`` messages through the link model.
+
+        Returns the messages delivered at each attempt, and the delivered
+        and lost (after every attempt) counts per link state.
+        """
+        per_attempt = [0] * self._attempts
+        if not self._needs_loss:
+            per_attempt[0] = offered[0] + offered[1]
+            return per_attempt, offered, (0, 0)
+        binomial = self.rng.binomial
+        delivered = [0, 0]
+        lost = [0, 0]
+        for s in (0, 1):
+            remaining = offered[s]
+            p_ok = 1.0 - self._loss[s]
+            for attempt in range(self._attempts):
+                if remaining == 0:
+                    break
+                got = int(binomial(remaining, p_ok))
+                per_attempt[attempt] += got
+                remaining -= got
+            delivered[s] = offered[s] - remaining
+            lost[s] = remaining
+        return per_attempt, (delivered[0], delivered[1]), (lost[0], lost[1])
+
+    def _count_attempts(
+        self, msg_type: str, offered: int, per_attempt: list[int], lost: int
+    ) -> int:
+        """Account the link attempts of *offered* routed messages; return them."""
+        size = MESSAGE_SIZES[msg_type]
+        attempts = lost * self._attempts
+        for i, n in enumerate(per_attempt):
+            attempts += (i + 1) * n
+        self._link_attempted_msgs += attempts
+        self._link_lost_msgs += lost
+        self._retransmission_count += attempts - offered
+        self._total_bytes_attempted += attempts * size
+        if msg_type != "ephemeris":
+            self._protocol_bytes_attempted += attempts * size
+        return attempts
+
+    def _count_sent(self, msg_type: str, per_attempt: list[int]) -> int:
+        """Account routed messages delivered at each attempt; return their number."""
+        sent = sum(per_attempt)
+        size = MESSAGE_SIZES[msg_type]
+        self._total_bytes_sent += sent * size
+        if msg_type != "ephemeris":
+            self._protocol_bytes_sent += sent * size
+        self.total_messages_sent += sent
+        self._queued_msgs += sent
+        delays = self._delay_counts[msg_type]
+        for i, n in enumerate(per_attempt):
+            delays[i] += n
+        return sent
+
+    def _add_protocol_bytes(self, n_bytes: int, n_messages: int) -> None:
+        """Count *n_bytes* of unrouted protocol traffic as attempted and sent."""
+        self._total_bytes_sent += n_bytes
+        self._protocol_bytes_sent += n_bytes
+        self._total_bytes_attempted += n_bytes
+        self._protocol_bytes_attempted += n_bytes
+        self.total_messages_sent += n_messages
+        self._tier_breakdown.intra_cluster_msgs += n_messages
+
+    def _step(self) -> None:
+        """Advance the fleet by one T_c cycle."""
+        config = self.config
+        rng = self.rng
+        if self._dirty:
+            self._refresh_clusters()
+        if self._ge:
+            self._aoi.ge_step(self._ge_transition)
+            self._streaks.ge_step(self._ge_transition)
+        p_bad = self._bad_fraction() if self._ge else 0.0
+        live = self._split(self._n_members, p_bad)
+
+        # --- Member ephemeris: exception filter, byte cap, link, airtime ---
+        reporters = live
+        if config.enable_exception_telemetry:
+            reporters = self._thin(live, config.exception_threshold)
+            self._exception_expected_msgs += self._n_members
+            self._exception_actual_msgs += reporters[0] + reporters[1]
+        to_headed = self._thin(reporters, self._headed_fraction)
+        headless = (reporters[0] - to_headed[0], reporters[1] - to_headed[1])
+        admitted = to_headed
+        if self._byte_cap > 0:
+            admitted = self._thin(to_headed, self._ephemeris_admit)
+            self._coordinator_drops += sum(to_headed) - sum(admitted)
+        per_attempt, delivered, lost = self._transmit(admitted)
+        self._count_attempts("ephemeris", sum(admitted), per_attempt, sum(lost))
+        self._coordinator_unavailability_events += sum(lost)
+        if config.enforce_airtime:
+            per_attempt, delivered = self._enforce_airtime(per_attempt, delivered)
+        eph = self._count_sent("ephemeris", per_attempt)
+        hl_per_attempt, hl_delivered, hl_lost = self._transmit(headless)
+        self._count_attempts("ephemeris", sum(headless), hl_per_attempt, sum(hl_lost))
+        eph += self._count_sent("ephemeris", hl_per_attempt)
+        self._ephemeris_bytes_sent += eph * MESSAGE_SIZES["ephemeris"]
+        self._tier_breakdown.intra_cluster_msgs += eph
+
+        # Heartbeat/ACK (64 B) after each delivered ephemeris
+        hb_bytes = eph * MESSAGE_SIZES["coordination_heartbeat"]
+        self._add_protocol_bytes(hb_bytes, eph)
+        self._heartbeat_bytes_sent += hb_bytes
+
+        # --- Summaries over the coordinators' links ---
+        for msg_type, n_sent, n_in, admit in (
+            ("cluster_summary", self._cluster_summaries,
+             self._cluster_summaries_in, self._cluster_summary_admit),
+            ("region_summary", self._region_summaries,
+             self._region_summaries_in, self._region_summary_admit),
+        ):
+            if n_sent == 0:
+                continue
+            offered = n_sent
+            if self._byte_cap > 0 and n_in and admit < 1.0:
+                dropped = n_in - int(rng.binomial(n_in, admit))
+                self._coordinator_drops += dropped
+                offered -= dropped
+            s_per_attempt, _, s_lost = self._transmit(self._split(offered, p_bad))
+            self._count_attempts(msg_type, offered, s_per_attempt, sum(s_lost))
+            self._coordinator_unavailability_events += sum(s_lost)
+            sent = self._count_sent(msg_type, s_per_attempt)
+            self._summary_bytes_sent += sent * MESSAGE_SIZES[msg_type]
+            if msg_type == "region_summary":
+                self._tier_breakdown.central_msgs += sent
+            else:
+                self._tier_breakdown.inter_cluster_msgs += sent
+
+        self._send_commands(p_bad)
+
+        # Collision alert (128 B): Bernoulli per sync, p = 10^-4/s * T_c
+        syncs = reporters[0] + reporters[1] + self._n_headed
+        alerts = int(rng.binomial(syncs, 1e-4 * self._sync_interval))
+        alert_bytes = alerts * MESSAGE_SIZES["collision_alert"]
+        self._add_protocol_bytes(alert_bytes, alerts)
+        self._alert_bytes_sent += alert_bytes
+
+        ingress = (
+            MESSAGE_SIZES["ephemeris"] * (to_headed[0] + to_headed[1])
+            + MESSAGE_SIZES["cluster_summary"] * self._cluster_summaries_in
+            + MESSAGE_SIZES["region_summary"] * self._region_summaries_in
+        )
+        self._coordinator_ingress_stats.add(ingress)
+        if config.stats_backend == "exact":
+            self._coordinator_ingress_per_cycle.append(ingress)
+
+        # --- AoI: reports delivered to acting coordinators restart the age ---
+        aoi = self._aoi.live()
+        updated = np.array([
+            delivered[s] / live[s] if live[s] else 0.0 for s in (0, 1)
+        ])
+        resets = aoi * updated[:, None]
+        self._aoi.advance(None, aoi - resets, resets.sum(axis=1))
+
+        # --- Loss streaks: lost reports extend them, delivered ones end them ---
+        streaks = self._streaks.live()
+        p_lost = np.zeros(2)
+        p_ended = np.zeros(2)
+        for s in (0, 1):
+            n_lost = lost[s] + hl_lost[s]
+            if live[s] > n_lost:
+                p_ended[s] = (delivered[s] + hl_delivered[s]) / (live[s] - n_lost)
+            if live[s]:
+                p_lost[s] = n_lost / live[s]
+        extended = streaks * p_lost[:, None]
+        rest = streaks - extended
+        ended = rest * p_ended[:, None]
+        recovered = ended.sum(axis=0)
+        if recovered.size > self._recovered_by_streak.size:
+            self._recovered_by_streak = _grow(self._recovered_by_streak, recovered.size)
+        self._recovered_by_streak[:recovered.size] += recovered
+        self._streaks.advance(rest - ended, extended, ended.sum(axis=1))
+
+    def _enforce_airtime(
+        self, per_attempt: list[int], delivered: tuple[int, int]
+    ) -> tuple[list[int], tuple[int, int]]:
+        """Drop delivered ephemeris beyond each coordinator's T_c airtime.
+
+        Each acting coordinator receives its expected share of the cycle's
+        deliveries and keeps the ``floor(T_c / slot)`` that fit in T_c.
+        """
+        n_delivered = delivered[0] + delivered[1]
+        if n_delivered == 0:
+            return per_attempt, delivered
+        slot_ms = self.config.airtime_slot_duration_ms
+        T_c_ms = self._sync_interval * 1000
+        shares = self._admitted_members * (n_delivered / self._admitted_members.sum())
+        kept = np.minimum(shares, math.floor(T_c_ms / slot_ms))
+        self._airtime_utilization_sum += float(kept.sum()) * slot_ms / T_c_ms
+        self._airtime_utilization_count += shares.size
+        p_kept = float(kept.sum()) / n_delivered
+        per_attempt = [int(self.rng.binomial(n, p_kept)) for n in per_attempt]
+        kept_delivered = sum(per_attempt)
+        self._airtime_attempted += n_delivered
+        self._airtime_delivered += kept_delivered
+        self._airtime_deadline_misses += n_delivered - kept_delivered
+        bad = int(self.rng.hypergeometric(delivered[1], delivered[0], kept_delivered))
+        return per_attempt, (kept_delivered - bad, bad)
+
+    def _send_commands(self, p_bad: float) -> None:
+        """Account the cycle's coordinator-to-member commands (see the DES)."""
+        config = self.config
+        if config.workload_profile == "nominal" or self._n_headed == 0:
+            return
+        rng = self.rng
+        if config.campaign_mode == "on_off":
+            # One ON/OFF chain per acting coordinator
+            on = min(self._campaign_on_clusters, self._n_headed)
+            active = (
+                on - int(rng.binomial(on, self._campaign_p_on_to_off))
+                + int(rng.binomial(self._n_headed - on, self._campaign_p_off_to_on))
+            )
+            self._campaign_on_clusters = active
+        else:
+            active = int(rng.binomial(self._n_headed, min(1.0, config.campaign_duty_factor)))
+        n_cmd = round(active * self._command_members / self._n_headed)
+        if config.workload_profile == "event_driven":
+            n_cmd = int(rng.binomial(n_cmd, config.event_command_probability))
+        if config.workload_profile == "distributed":
+            consensus_bytes = (
+                config.distributed_consensus_rounds * n_cmd * config.distributed_vote_msg_bytes
+            )
+            self._distributed_consensus_bytes += consensus_bytes
+            self._add_protocol_bytes(consensus_bytes, 0)
+        if config.enable_exception_telemetry:
+            n_cmd = int(rng.binomial(n_cmd, config.exception_threshold))
+        # Commands are not routed: no loss counters, only retransmissions
+        per_attempt, _, lost = self._transmit(self._split(n_cmd, p_bad))
+        attempts = (lost[0] + lost[1]) * self._attempts
+        for i, n in enumerate(per_attempt):
+            attempts += (i + 1) * n
+        cmd_size = MESSAGE_SIZES["coordination_command"]
+        cmd_bytes = sum(per_attempt) * cmd_size
+        self._retransmission_count += attempts - n_cmd
+        self._total_bytes_attempted += attempts * cmd_size
+        self._protocol_bytes_attempted += attempts * cmd_size
+        self._total_bytes_sent += cmd_bytes
+        self._protocol_bytes_sent += cmd_bytes
+        self._command_bytes_sent += cmd_bytes
+        self.total_messages_sent += n_cmd
+        self._tier_breakdown.intra_cluster_msgs += n_cmd
+
+    def _sample_aoi(self, t: float) -> None:
+        """Sample the AoI of every member of an acting coordinator at time *t*."""
+        # Samples fall anywhere within a cycle, so each age column is spread
+        # evenly over the T_c it spans
+        expected = self._aoi.live().sum(axis=0) * (self._headed_fraction / _AGE_SUBSAMPLES)
+        counts = self.rng.poisson(np.repeat(expected, _AGE_SUBSAMPLES))
+        offsets = (np.arange(_AGE_SUBSAMPLES) + 0.5) / _AGE_SUBSAMPLES
+        ages = (self._aoi.ages()[:, None] + offsets).ravel() * self._sync_interval
+        self._aoi_stats.add_counts(ages, counts)
+        if self._failed_last_update:
+            self._aoi_stats.add_many(t - np.fromiter(
+                self._failed_last_update.values(), dtype=np.float64
+            ))
+
+    # -- result ----------------------------------------------------------------
+    def _generate_result(self) -> SwarmCoordinationRunResult:
+        config = self.config
+        duration = self.simulation_duration_seconds
+        fleet_capacity_bps = config.node_count * config.bandwidth_per_node_kbps * 1_000
+        overhead = (
+            self._protocol_bytes_sent * 8 / duration / fleet_capacity_bps * 100.0
+            if fleet_capacity_bps > 0 else 0.0
+        )
+
+        coord_time = np.add.reduceat(self.coordinator_time_seconds, self.cluster_offsets[:-1])
+        avails = [
+            _coordinator_availability_percent(float(ct), int(fh), duration)
+            for ct, fh in zip(coord_time, self.failed_handoffs)
+        ]
+        power_wh = (
+            config.base_power_w * duration
+            + (config.coordinator_power_w - config.base_power_w)
+            * self.coordinator_time_seconds
+        ) / 3600.0
+
+        # Latency queue: holds 10 N messages and drains only when a receive
+        # event's 100 ms bandwidth budget fits an ephemeris
+        queued = self._queued_msgs
+        drains = config.bandwidth_per_node_kbps * 1_000 * 0.1 / 8 >= MESSAGE_SIZES["ephemeris"]
+        queue_drops = 0 if drains else max(0, queued - config.node_count * 10)
+        self.total_messages_delivered = queued if drains else 0
+
+        # Propagation: base delay + serialization + one base delay per retry
+        prop = LogHistogram(
+            resolution=SKETCH_RESOLUTION["update_propagation_ms"],
+            ratio=_PROPAGATION_BIN_RATIO,
+        )
+        base = self._base_delay_ms
+        for msg_type, counts in self._delay_counts.items():
+            if not drains:
+                break
+            size = MESSAGE_SIZES[msg_type]
+            serialization_ms = 0.0
+            if size > MESSAGE_SIZES["ephemeris"]:
+                serialization_ms = (size * 8) / (config.bandwidth_per_node_kbps * 1_000) * 1_000
+            prop.add_counts(base + serialization_ms + np.arange(self._attempts) * base, counts)
+        avg_prop, max_prop = prop.mean, prop.max
+        if prop.count == 0:
+            avg_prop = base
+            max_prop = avg_prop * 2.0
+
+        aoi = self._aoi_stats
+        aoi_mean = aoi.mean
+        aoi_p99 = aoi.percentile(99)
+        streaks = LogHistogram(resolution=SKETCH_RESOLUTION["recovery_streak_cycles"])
+        recovered = self.rng.poisson(self._recovered_by_streak[1:])
+        streaks.add_counts(np.arange(1, recovered.size + 1), recovered)
+        cc_count = streaks.count
+        return SwarmCoordinationRunResult(
+            run_id=0,
+            config=config,
+            communication_overhead_percent=overhead,
+            bottleneck_threshold_nodes=estimate_bottleneck_threshold(
+                "hierarchical", config.cluster_size, config.bandwidth_per_node_kbps
+            ),
+            coordinator_availability_percent=(
+                sum(avails) / len(avails) if avails else 100.0
+            ),
+            power_variance_percent=_power_variance_percent(power_wh),
+            avg_update_propagation_ms=avg_prop,
+            max_update_propagation_ms=max_prop,
+            failed_handoffs=int(self.failed_handoffs.sum()),
+            message_drop_rate=queue_drops / queued if queued else 0.0,
+            total_messages_sent=self.total_messages_sent,
+            total_messages_delivered=self.total_messages_delivered,
+            avg_messages_per_node_per_day=(
+                self.total_messages_sent
+                / max(1, config.node_count)
+                / max(1, config.simulation_days)
+            ),
+            total_energy_kwh=_total_energy_kwh(power_wh),
+            coordinator_bandwidth_kbps=per_coordinator_bandwidth_kbps(
+                config.cluster_size, 10.0
+            ),
+            tier_breakdown=self._tier_breakdown,
+            exception_telemetry_reduction=(
+                self._exception_actual_msgs / self._exception_expected_msgs
+                if self._exception_expected_msgs else 1.0
+            ),
+            message_loss_rate=(
+                self._link_lost_msgs / self._link_attempted_msgs
+                if self._link_attempted_msgs else 0.0
+            ),
+            coordinator_unavailability_events=self._coordinator_unavailability_events,
+            total_bytes_sent=self._total_bytes_sent,
+            protocol_bytes_sent=self._protocol_bytes_sent,
+            coordinator_drops=self._coordinator_drops,
+            retransmission_count=self._retransmission_count,
+            total_bytes_attempted=self._total_bytes_attempted,
+            protocol_bytes_attempted=self._protocol_bytes_attempted,
+            aoi_mean_seconds=aoi_mean,
+            aoi_p99_seconds=aoi_p99,
+            aoi_max_seconds=aoi.max if aoi.count else 0.0,
+            aoi_samples=aoi.count,
+            ephemeris_bytes_sent=self._ephemeris_bytes_sent,
+            heartbeat_bytes_sent=self._heartbeat_bytes_sent,
+            command_bytes_sent=self._command_bytes_sent,
+            summary_bytes_sent=self._summary_bytes_sent,
+            alert_bytes_sent=self._alert_bytes_sent,
+            aoi_mean_position_error_m=(
+                config.aoi_sigma_0_m + config.aoi_sigma_dot_m_per_s * aoi_mean
+            ),
+            aoi_p99_position_error_m=(
+                config.aoi_sigma_0_m + config.aoi_sigma_dot_m_per_s * aoi_p99
+            ),
+            cross_cycle_recovery_mean=streaks.mean,
+            cross_cycle_recovery_p95=streaks.percentile(95),
+            cross_cycle_recovery_count=cc_count,
+            cross_cycle_max_streak=int(streaks.max) if cc_count else 0,
+            cross_cycle_recovery_rate_by_cycle=(
+                [streaks.cdf(k) for k in range(1, 11)] if cc_count else []
+            ),
+            airtime_utilization_mean=(
+                self._airtime_utilization_sum / self._airtime_utilization_count
+                if self._airtime_utilization_count else 0.0
+            ),
+            airtime_deadline_misses=self._airtime_deadline_misses,
+            airtime_limited_delivery=(
+                self._airtime_delivered / max(1, self._airtime_attempted)
+                if config.enforce_airtime else 0.0
+            ),
+            distributed_consensus_bytes=self._distributed_consensus_bytes,
+            coordinator_ingress_bytes_per_cycle=self._coordinator_ingress_per_cycle,
+            distributions={
+                "aoi_seconds": aoi,
+                "update_propagation_ms": prop,
+                "coordinator_ingress_bytes": self._coordinator_ingress_stats,
+                "recovery_streak_cycles": streaks,
+            },
+        )
+
+
+# ---------------------------------------------------------------------------
+# Event queues
+# ---------------------------------------------------------------------------
+# Queue entries are ``(time, seq, code, node_idx, event)`` tuples.  The
+# insertion counter *seq* is unique, so ordering is decided on the first two
+# fields by C-level tuple comparison (never reaching the SimEvent), and
+# events due at the same time are delivered in the order they were pushed.
+EventEntry = tuple[float, int, int, int, SimEvent]
+
+Routes = tuple[tuple[int, int], ...]
+"""``(receiver, message class code)`` pairs of one update (see ``_routes``)."""
+
+
+class EventQueue:
+    """Priority queue of :class:`SimEvent` objects backed by a binary heap."""
+
+    def __init__(self) -> None:
+        self._heap: list[EventEntry] = []
+        self._seq: int = 0
+
+    def push(self, event: SimEvent) -> None:
+        """Add an event to the queue."""
+        heapq.heappush(
+            self._heap,
+            (event.time, self._seq, EVENT_CODES[event.type], event.node_idx, event),
+        )
+        self._seq += 1
+
+    def push_entry(self, entry: EventEntry) -> None:
+        """Put back an entry returned by :meth:`pop_entry`, keeping its order."""
+        heapq.heappush(self._heap, entry)
+
+    def discard(self, event_type: EventType) -> None:
+        """Remove every queued event of *event_type*."""
+        code = EVENT_CODES[event_type]
+        self._heap = [entry for entry in self._heap if entry[2] != code]
+        heapq.heapify(self._heap)
+
+    def pop_entry(self) -> Optional[EventEntry]:
+        """Remove and return the earliest entry, or ``None`` if empty."""
+        if not self._heap:
+            return None
+        return heapq.heappop(self._heap)
+
+    def pop(self) -> Optional[SimEvent]:
+        """Remove and return the earliest event, or ``None`` if empty."""
+        entry = self.pop_entry()
+        return entry[4] if entry is not None else None
+
+    def peek(self) -> Optional[SimEvent]:
+        """Return the earliest event without removing it."""
+        return self._heap[0][4] if self._heap else None
+
+    def is_empty(self) -> bool:
+        return len(self._heap) == 0
+
+    def size(self) -> int:
+        return len(self._heap)
+
+
+class CalendarEventQueue:
+    """Calendar queue (Brown, 1988) with the :class:`EventQueue` interface.
+
+    Time is cut into slots of *bucket_width* seconds; slot ``k`` lives in
+    bucket ``k % n_buckets``, a small heap.  Dequeueing walks the slots in
+    order, so for the periodic T_c-driven workload, where nearly every event
+    lands within the next cycle, each push and pop touches a short heap.
+    Entries are the same ``(time, seq, ...)`` tuples as :class:`EventQueue`
+    and come out in exactly the same order.
+    """
+
+    def __init__(self, bucket_width: float, n_buckets: int = 1024) -> None:
+        self._width: float = bucket_width
+        self._n: int = n_buckets
+        self._buckets: list[list[EventEntry]] = [[] for _ in range(n_buckets)]
+        self._size: int = 0
+        self._seq: int = 0
+        self._slot: int = 0  # no queued event lies in an earlier slot
+
+    def push(self, event: SimEvent) -> None:
+        """Add an event to the queue."""
+        slot = int(event.time / self._width)
+        heapq.heappush(
+            self._buckets[slot % self._n],
+            (event.time, self._seq, EVENT_CODES[event.type], event.node_idx, event),
+        )
+        self._seq += 1
+        self._size += 1
+        if slot < self._slot:
+            self._slot = slot
+
+    def push_entry(self, entry: EventEntry) -> None:
+        """Put back an entry returned by :meth:`pop_entry`, keeping its order."""
+        slot = int(entry[0] / self._width)
+        heapq.heappush(self._buckets[slot % self._n], entry)
+        self._size += 1
+        if slot < self._slot:
+            self._slot = slot
+
+    def discard(self, event_type: EventType) -> None:
+        """Remove every queued event of *event_type*."""
+        code = EVENT_CODES[event_type]
+        for i, bucket in enumerate(self._buckets):
+            kept = [entry for entry in bucket if entry[2] != code]
+            if len(kept) != len(bucket):
+                heapq.heapify(kept)
+                self._size -= len(bucket) - len(kept)
+                self._buckets[i] = kept
+
+    def _advance(self) -> Optional[list[EventEntry]]:
+        """Move to the slot holding the earliest entry and return its bucket."""
+        if self._size == 0:
+            return None
+        width, n = self._width, self._n
+        for _ in range(n):
+            bucket = self._buckets[self._slot % n]
+            if bucket and int(bucket[0][0] / width) <= self._slot:
+                return bucket
+            self._slot += 1
+        # Nothing due within a full year of slots: jump to the minimum
+        first = min(b[0] for b in self._buckets if b)
+        self._slot = int(first[0] / width)
+        return self._buckets[self._slot % n]
+
+    def pop_entry(self) -> Optional[EventEntry]:
+        """Remove and return the earliest entry, or ``None`` if empty."""
+        bucket = self._advance()
+        if bucket is None:
+            return None
+        self._size -= 1
+        return heapq.heappop(bucket)
+
+    def pop(self) -> Optional[SimEvent]:
+        """Remove and return the earliest event, or ``None`` if empty."""
+        entry = self.pop_entry()
+        return entry[4] if entry is not None else None
+
+    def peek(self) -> Optional[SimEvent]:
+        """Return the earliest event without removing it."""
+        bucket = self._advance()
+        return bucket[0][4] if bucket is not None else None
+
+    def is_empty(self) -> bool:
+        return self._size == 0
+
+    def size(self) -> int:
+        return self._size
+
+
+def _running_total_by_key(
+    keys: NDArray[np.integer[Any]],
+    values: NDArray[np.integer[Any]],
+) -> NDArray[np.integer[Any]]:
+    """Return the inclusive running total of *values* within runs of equal *keys*.
+
+    *keys* must already be grouped (e.g. stably sorted), so that each
+    receiver's messages form one contiguous run in arrival order.
+    """
+    if keys.size == 0:
+        return values.copy()
+    totals = np.cumsum(values)
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    run_lengths = np.diff(np.r_[starts, keys.size])
+    return totals - np.repeat(totals[starts] - values[starts], run_lengths)
+
+
+def _first_come_admission(
+    keys: NDArray[np.integer[Any]],
+    sizes: NDArray[np.integer[Any]],
+    budget: float,
+) -> NDArray[np.bool_]:
+    """Return which messages a per-key byte *budget* admits, first come first served.
+
+    Message *i* is admitted iff the bytes already admitted for its key plus
+    its own size fit the budget, so a smaller message may still squeeze in
+    after a larger one was refused.  *keys* must be grouped as for
+    :func:`_running_total_by_key`.  Each pass admits every group's fitting
+    prefix; the largest size still in play shrinks every pass, so the loop
+    runs at most once per distinct message size.
+    """
+    admitted = np.zeros(keys.size, dtype=bool)
+    remaining = np.full(keys.size, float(budget))
+    pending = np.arange(keys.size)
+    while pending.size:
+        k = keys[pending]
+        s = sizes[pending]
+        fits = _running_total_by_key(k, s) <= remaining[pending]
+        admitted[pending[fits]] = True
+        new_group = np.r_[True, k[1:] != k[:-1]]
+        group = np.cumsum(new_group) - 1
+        used = np.bincount(group, weights=np.where(fits, s, 0))
+        left = (remaining[pending][new_group] - used)[group]
+        remaining[pending] = left
+        pending = pending[~fits & (s <= left)]
+    return admitted
+
+
+def _stdlib_uniforms(
+    rng: _stdlib_random.Random, n: int, mt: np.random.MT19937
+) -> NDArray[np.float64]:
+    """Return the next *n* ``rng.random()`` values as one array.
+
+    Both generators are MT19937: *rng*'s state is loaded into the NumPy bit
+    generator *mt*, ``2 n`` raw 32-bit words are drawn and combined with
+    CPython's 53-bit recipe, and *rng* is advanced to the state after the
+    draws.  The values and the stream position are bit-identical to calling
+    ``rng.random()`` *n* times.
+    """
+    version, internal, gauss = rng.getstate()
+    mt.state = {
+        "bit_generator": "MT19937",
+        "state": {"key": np.array(internal[:-1], dtype=np.uint32), "pos": internal[-1]},
+    }
+    raw = mt.random_raw(2 * n)
+    a = raw[0::2] >> np.uint64(5)
+    b = raw[1::2] >> np.uint64(6)
+    state = mt.state["state"]
+    rng.setstate((version, tuple(state["key"].tolist()) + (int(state["pos"]),), gauss))
+    return (a * 67108864.0 + b) * (1.0 / 9007199254740992.0)
+
+
+def _grow(arr: NDArray[Any], needed: int) -> NDArray[Any]:
+    """Return *arr* with capacity for at least *needed* items (amortised doubling)."""
+    if needed <= len(arr):
+        return arr
+    grown = np.empty(max(needed, 2 * len(arr), 16), dtype=arr.dtype)
+    grown[:len(arr)] = arr
+    return grown
 
 
 # ---------------------------------------------------------------------------
 # Discrete-event simulator
 # ---------------------------------------------------------------------------
+_CHECKPOINT_VERSION = 3
+"""Format version stored in simulator checkpoints."""
+
+_FORK_FIXED_FIELDS: tuple[str, ...] = (
+    "node_count",
+    "coordination_topology",
+    "cluster_size",
+    "sector_size",
+    "seed",
+    "sync_sample_rate",
+    "coordinator_scheduling",
+    "enable_phase_stagger",
+    "execution_mode",
+    "stats_backend",
+    "event_queue",
+    "random_streams",
+)
+"""Config fields baked into the network or event schedule at construction."""
+
+RANDOM_PROCESSES: tuple[str, ...] = (
+    "failures",
+    "link_loss",
+    "ge_transitions",
+    "exception_telemetry",
+    "gossip_sampling",
+)
+"""Stochastic processes with their own stream under ``random_streams="per_process"``."""
+
+
+def _process_seed(seed: int, process: str) -> np.random.SeedSequence:
+    """Return the seed sequence of *process*'s stream (see :data:`RANDOM_PROCESSES`)."""
+    return np.random.SeedSequence(seed, spawn_key=(RANDOM_PROCESSES.index(process),))
+
+
+def _process_generator(seed: int, process: str) -> Generator:
+    """Return a NumPy generator on *process*'s stream."""
+    return np.random.default_rng(_process_seed(seed, process))
+
+
+def _process_random(seed: int, process: str) -> _stdlib_random.Random:
+    """Return a stdlib generator on *process*'s stream."""
+    return _stdlib_random.Random(int(_process_seed(seed, process).generate_state(1, np.uint64)[0]))
+
+
 class SwarmCoordinationSimulator:
     """Discrete-event simulator for swarm coordination.
 
     Instantiate with a :class:`SwarmCoordinationConfig` and call
     :meth:`run` to execute the simulation, which returns a
-    :class:`SwarmCoordinationRunResult`.
+    :class:`SwarmCoordinationRunResult`.  Passing a prebuilt *network*
+    reuses one topology across runs (each simulator works on its own
+    :meth:`NetworkStructure.fork`).  Long runs can be checkpointed
+    (:meth:`save_checkpoint` / :meth:`load_checkpoint`) and warm-started
+    branches split off a partially advanced run with :meth:`fork`.
     """
 
-    def __init__(self, config: SwarmCoordinationConfig) -> None:
+    def __init__(
+        self,
+        config: SwarmCoordinationConfig,
+        network: Optional[NetworkStructure] = None,
+    ) -> None:
         self.config = config
+        # ON/OFF Markov campaign state (start OFF); transition probabilities
+        # are set by _derive_config_parameters
+        self._campaign_on: bool = False
+        self._derive_config_parameters()
         self.rng: Generator = np.random.default_rng(config.seed)
-        self.event_queue = EventQueue()
-        self.simulation_duration_seconds: float = (
-            config.simulation_days * SECONDS_PER_DAY
+        self.event_queue: EventQueue | CalendarEventQueue
+        if config.event_queue == "calendar":
+            # 64 slots per T_c (10 s, see _schedule_state_sync_events)
+            self.event_queue = CalendarEventQueue(bucket_width=10.0 / 64)
+        else:
+            self.event_queue = EventQueue()
+        self.events_processed: int = 0
+        # Run-loop progress, kept on the instance so a checkpoint taken
+        # between events resumes exactly (see advance)
+        self._advanced_to: float = 0.0
+        self._finished: bool = False
+        self._last_power_time: float = 0.0
+        self._last_aoi_sample_time: float = 0.0
+        self._last_ge_transition_time: float = 0.0
+
+        # Initialize network, or fork a prebuilt one (an unused network from
+        # initialize_network for this config); its topology draws are then
+        # not taken from self.rng
+        self.network: NetworkStructure = (
+            initialize_network(config, self.rng) if network is None else network.fork()
+        )
+        self.network.store.start_energy_accounting(
+            config.base_power_w, config.coordinator_power_w
         )
-        self.duty_cycle_seconds: float = config.coordinator_duty_cycle_hours * 3600.0
-
-        # Initialize network
-        self.network: NetworkStructure = initialize_network(config, self.rng)
         self.message_queue = MessageQueue(config.node_count * 10)
+        # Per-cluster handoff candidate heaps of (coordinator_time, node_idx),
+        # built on a cluster's first handoff (see _handoff_candidate)
+        self._handoff_heaps: list[Optional[list[tuple[float, int]]]] = [
+            None
+        ] * len(self.network.clusters)
         self.current_time: float = 0.0
         self.total_messages_sent: int = 0
         self.total_messages_delivered: int = 0
-        self.propagation_times: list[float] = []
         self._tier_breakdown = TierMessageBreakdown()
 
         # Exception telemetry tracking
@@ -1505,7 +3644,7 @@ class SwarmCoordinationSimulator:
         # Coordinator bandwidth tracking
         self._coordinator_drops: int = 0
         # Per-coordinator byte counters reset each sync interval
-        self._coordinator_bytes_this_interval: dict[str, float] = {}
+        self._coordinator_bytes_this_interval: dict[int, float] = {}
         self._coordinator_interval_start: float = 0.0
 
         # Retransmission tracking
@@ -1523,28 +3662,49 @@ class SwarmCoordinationSimulator:
         self._gossip_bytes_sent: int = 0    # mesh/sectorized gossip
 
         # Age-of-Information (AoI) tracking at coordinators
-        # Maps coordinator_id -> {member_node_id -> last_update_time}
-        self._coordinator_last_update: dict[str, dict[str, float]] = {}
+        # Every coordinator that has heard from a member gets an AoI *entry*
+        # (in first-heard order) covering its cluster's members.  A live
+        # entry reads the dense per-node _aoi_last_update, so member updates
+        # are a single store by node index; a demoted coordinator's entry is
+        # frozen into _aoi_frozen (see _hand_over_aoi).  _aoi_sample_nodes /
+        # _aoi_sample_frozen / _aoi_sample_entry list every sampled
+        # (entry, member) pair so _sample_aoi is one masked gather.
+        n_nodes = len(self.network.store)
+        self._aoi_last_update: NDArray[np.float64] = np.zeros(n_nodes)
+        self._aoi_tracked: NDArray[np.bool_] = np.zeros(n_nodes, dtype=bool)
+        self._aoi_entry_of: NDArray[np.int64] = np.full(n_nodes, -1, dtype=np.int64)
+        self._aoi_entries: int = 0
+        self._aoi_entry_coord: NDArray[np.int64] = np.empty(0, dtype=np.int64)
+        self._aoi_entry_live: NDArray[np.bool_] = np.empty(0, dtype=bool)
+        self._aoi_entry_offset: NDArray[np.int64] = np.empty(0, dtype=np.int64)
+        self._aoi_frozen: NDArray[np.float64] = np.empty(0)
+        self._aoi_frozen_used: int = 0
+        self._aoi_samples_used: int = 0
+        self._aoi_sample_nodes: NDArray[np.int64] = np.empty(0, dtype=np.int64)
+        self._aoi_sample_frozen: NDArray[np.int64] = np.empty(0, dtype=np.int64)
+        self._aoi_sample_entry: NDArray[np.int64] = np.empty(0, dtype=np.int64)
         # Collected AoI samples (sampled periodically, not every cycle)
-        self._aoi_samples: list[float] = []
-        self._aoi_sample_interval: float = max(100.0, self.simulation_duration_seconds / 1000)
+        backend = config.stats_backend
+        self._aoi_stats: QuantileSketch = make_sketch(
+            backend, SKETCH_RESOLUTION["aoi_seconds"]
+        )
 
         # Stdlib RNG seeded from config for exception/link Bernoulli draws
         self._stdlib_rng = _stdlib_random.Random(config.seed)
 
-        # Gilbert-Elliott link state: per-node (True=good, False=bad)
-        self._ge_link_states: dict[str, bool] = {}
-        if config.link_model == "gilbert_elliott":
-            for node in self.network.nodes:
-                self._ge_link_states[node.id] = True  # start in good state
-        self._ge_last_transition_time: float = 0.0
+        # Gilbert-Elliott link state per node (True=good, False=bad); every
+        # link starts in the good state
+        self._ge_good: NDArray[np.bool_] = np.ones(n_nodes, dtype=bool)
+        self._ge_mt: Optional[np.random.MT19937] = None
 
         # Cross-cycle recovery tracking: per-member consecutive loss streaks
         # Tracks how many consecutive cycles each member's ephemeris failed
         # to reach its coordinator.  Upon successful delivery after >=1 failures,
         # the streak length is recorded for distribution analysis.
-        self._member_loss_streak: dict[str, int] = {}
-        self._recovery_streaks: list[int] = []
+        self._member_loss_streak: NDArray[np.int64] = np.zeros(n_nodes, dtype=np.int64)
+        self._recovery_streaks: QuantileSketch = make_sketch(
+            backend, SKETCH_RESOLUTION["recovery_streak_cycles"]
+        )
 
         # Airtime enforcement tracking
         self._airtime_per_cycle: list[float] = []  # ms consumed per cycle
@@ -1552,7 +3712,7 @@ class SwarmCoordinationSimulator:
         self._airtime_delivered: int = 0
         self._airtime_attempted: int = 0
         # Per-coordinator airtime within current cycle
-        self._coordinator_airtime_this_cycle: dict[str, float] = {}
+        self._coordinator_airtime_this_cycle: dict[int, float] = {}
 
         # Distributed consensus traffic tracking
         self._distributed_consensus_bytes: int = 0
@@ -1560,11 +3720,115 @@ class SwarmCoordinationSimulator:
         # Per-cycle coordinator ingress tracking (for distributional analysis)
         self._coordinator_ingress_this_cycle: int = 0
         self._coordinator_ingress_per_cycle: list[int] = []
+        self._coordinator_ingress_stats: QuantileSketch = make_sketch(
+            backend, SKETCH_RESOLUTION["coordinator_ingress_bytes"]
+        )
+
+        # Cycle-batched execution (hierarchical only): one sync_cycle event
+        # per T_c replaces the per-node state_sync events.  Per-message
+        # draws use their own stream so failure and handoff draws on
+        # self.rng stay aligned with the per-event path.
+        self._cycle_batched: bool = (
+            config.execution_mode == "cycle_batched"
+            and config.coordination_topology == "hierarchical"
+        )
+        self._batch_rng: Generator = np.random.default_rng([config.seed, 1])
+        # Per-process streams (see random_streams); "shared" aliases the
+        # streams above so every draw keeps its reference position
+        self._failure_rng: Generator = self.rng
+        self._gossip_rng: Generator = self.rng
+        self._link_random: _stdlib_random.Random = self._stdlib_rng
+        self._ge_random: _stdlib_random.Random = self._stdlib_rng
+        self._exception_random: _stdlib_random.Random = self._stdlib_rng
+        self._batch_link_rng: Generator = self._batch_rng
+        self._batch_ge_rng: Generator = self._batch_rng
+        self._batch_exception_rng: Generator = self._batch_rng
+        if config.random_streams == "per_process":
+            seed = config.seed
+            self._failure_rng = _process_generator(seed, "failures")
+            self._gossip_rng = _process_generator(seed, "gossip_sampling")
+            self._link_random = _process_random(seed, "link_loss")
+            self._ge_random = _process_random(seed, "ge_transitions")
+            self._exception_random = _process_random(seed, "exception_telemetry")
+            self._batch_link_rng = _process_generator(seed, "link_loss")
+            self._batch_ge_rng = _process_generator(seed, "ge_transitions")
+            self._batch_exception_rng = _process_generator(seed, "exception_telemetry")
+        # Per-node repair times in days, drawn with the failure times when
+        # random_streams == "per_process"
+        self._repair_days: Optional[NDArray[np.int64]] = None
+        # Nodes whose one failure has not happened yet (see fork)
+        self._failure_pending: NDArray[np.bool_] = np.zeros(0, dtype=bool)
+        self._batch_nodes: NDArray[np.int64] = np.zeros(0, dtype=np.int64)
+        self._batch_phase: NDArray[np.float64] = np.zeros(0)
+        # state_sync events folded into sync_cycle events (count toward max_events)
+        self._batched_events: int = 0
+        # Lazily stepped Gilbert-Elliott chain: _ge_good holds each node's
+        # state as of the cycle recorded here
+        self._ge_cycle: NDArray[np.int64] = np.zeros(n_nodes, dtype=np.int64)
+
+        # Timing profile (config.profile); handlers are wrapped with timers
+        # by _build_dispatch only when it is set
+        self._profile: Optional[RunProfile] = RunProfile() if config.profile else None
+        self._last_queue_sample_time: float = -math.inf
+
+        # Per-node route tables (hierarchical / centralized): (cluster epoch,
+        # ((receiver, class code), ...)), rebuilt when the epoch moves on
+        self._route_table: Optional[list[Optional[tuple[int, Routes]]]] = (
+            [None] * n_nodes
+            if config.coordination_topology in ("hierarchical", "centralized")
+            else None
+        )
+
+        self._dispatch: list[Callable[[SimEvent], None]] = self._build_dispatch()
+
+        self._initialize_simulation()
 
-        # ON/OFF Markov campaign state
-        self._campaign_on: bool = False  # start OFF
-        d = self.config.campaign_duty_factor
-        L_on = max(1, self.config.campaign_on_length)
+    def _build_dispatch(self) -> list[Callable[[SimEvent], None]]:
+        """Return the event handlers indexed by event code (see EVENT_CODES)."""
+        handlers: dict[str, Callable[[SimEvent], None]] = {
+            "state_sync": self._handle_state_sync,
+            "sync_cycle": self._handle_sync_cycle,
+            "message_send": self._handle_message_send,
+            "message_receive": self._handle_message_receive,
+            "coordinator_handoff": self._handle_coordinator_handoff,
+            "node_failure": self._handle_node_failure,
+            "node_recovery": self._handle_node_recovery,
+            "gossip_round": self._handle_gossip_round,
+            "collision_warning": self._handle_collision_warning,
+        }
+        if self._profile is None:
+            return [handlers[t] for t in EVENT_TYPES]
+        return [self._timed(t, handlers[t]) for t in EVENT_TYPES]
+
+    def _timed(
+        self, name: str, handler: Callable[..., None]
+    ) -> Callable[..., None]:
+        """Return *handler* wrapped to add its calls and wall time to the profile."""
+        profile = self._profile
+        assert profile is not None
+        counts, seconds = profile.counts, profile.seconds
+        counts.setdefault(name, 0)
+        seconds.setdefault(name, 0.0)
+
+        def timed(*args: Any) -> None:
+            t0 = perf_counter()
+            handler(*args)
+            seconds[name] += perf_counter() - t0
+            counts[name] += 1
+
+        return timed
+
+    def _derive_config_parameters(self) -> None:
+        """Set the attributes derived from ``self.config`` (see :meth:`fork`)."""
+        config = self.config
+        self.simulation_duration_seconds: float = (
+            config.simulation_days * SECONDS_PER_DAY
+        )
+        self.duty_cycle_seconds: float = config.coordinator_duty_cycle_hours * 3600.0
+        self._aoi_sample_interval: float = max(100.0, self.simulation_duration_seconds / 1000)
+
+        d = config.campaign_duty_factor
+        L_on = max(1, config.campaign_on_length)
         # Transition probabilities: P(ON→OFF) = 1/L_on, P(OFF→ON) derived from steady-state d
         self._campaign_p_on_to_off = 1.0 / L_on
         if d > 0 and d < 1:
@@ -1575,8 +3839,7 @@ class SwarmCoordinationSimulator:
             self._campaign_on = True
         else:
             self._campaign_p_off_to_on = 0.0  # always OFF
-
-        self._initialize_simulation()
+            self._campaign_on = False
 
     # -- initialization helpers --------------------------------------------
     def _initialize_simulation(self) -> None:
@@ -1614,7 +3877,7 @@ class SwarmCoordinationSimulator:
 
         # Build per-cluster node lists for TDMA slot assignment
         is_tdma = self.config.coordinator_scheduling == "tdma"
-        cluster_node_idx: dict[str, int] = {}  # per-cluster slot counter
+        cluster_slot_count: dict[int, int] = {}  # per-cluster slot counter
 
         # Phase-stagger: build cluster-index map for deterministic coordinator offsets
         is_stagger = (
@@ -1622,51 +3885,90 @@ class SwarmCoordinationSimulator:
             and self.config.coordination_topology == "hierarchical"
             and not is_tdma
         )
-        cluster_phase_offset: dict[str, float] = {}
+        cluster_phase_offset: dict[int, float] = {}
         if is_stagger:
             n_clusters = len(self.network.clusters)
-            for ci, cluster in enumerate(self.network.clusters):
-                cluster_phase_offset[cluster.id] = (
+            for ci in range(n_clusters):
+                cluster_phase_offset[ci] = (
                     (ci / max(1, n_clusters)) * self._sync_interval
                 )
 
-        for node in self.network.nodes:
-            if node.status == "failed":
+        store = self.network.store
+        batch_nodes: list[int] = []
+        batch_offsets: list[float] = []
+        for idx in range(len(store)):
+            if store.status[idx] == STATUS_FAILED:
                 continue
             if self.rng.random() >= self._sync_sample_rate:
                 continue
 
             if is_tdma and self.config.coordination_topology == "hierarchical":
                 # TDMA: deterministic slot within [0, T_c)
-                cid = node.cluster_id or "default"
-                slot_idx = cluster_node_idx.get(cid, 0)
-                cluster_node_idx[cid] = slot_idx + 1
+                cid = int(store.cluster_idx[idx])
+                slot_idx = cluster_slot_count.get(cid, 0)
+                cluster_slot_count[cid] = slot_idx + 1
                 gamma = 1.0 - self.config.guard_time_fraction
                 slot_duration = self._sync_interval * gamma / max(1, self.config.cluster_size)
                 offset = slot_idx * (self._sync_interval / max(1, self.config.cluster_size))
                 t = start_time + min(offset, self._sync_interval * 0.99)
-            elif is_stagger and node.is_coordinator:
+            elif is_stagger and store.is_coordinator[idx]:
                 # Phase-stagger: coordinator fires at deterministic offset
                 # based on cluster index to spread regional coordinator inbound
-                cid = node.cluster_id or "default"
-                offset = cluster_phase_offset.get(cid, 0.0)
+                offset = cluster_phase_offset.get(int(store.cluster_idx[idx]), 0.0)
                 t = start_time + offset
             else:
                 # Random phase: uniform random offset within [0, T_c)
                 offset = float(self.rng.uniform(0, self._sync_interval))
                 t = start_time + offset
 
+            if self._cycle_batched:
+                batch_nodes.append(idx)
+                batch_offsets.append(t - start_time)
+            else:
+                self.event_queue.push(self._node_event("state_sync", t, idx))
+
+        if self._cycle_batched and batch_nodes:
+            # Phase order within the cycle = per-event firing order
+            phase = np.asarray(batch_offsets)
+            order = np.argsort(phase, kind="stable")
+            self._batch_nodes = np.asarray(batch_nodes, dtype=np.int64)[order]
+            self._batch_phase = phase[order]
             self.event_queue.push(
                 SimEvent(
-                    type="state_sync",
-                    time=t,
-                    node_id=node.id,
-                    cluster_id=node.cluster_id,
+                    type="sync_cycle",
+                    time=start_time,
+                    node_id="sync-cycle",
+                    data={"cycle": 0},
                 )
             )
 
-    def _reschedule_state_sync(self, node: "SwarmNode", current_time: float) -> None:
-        """Schedule the next state_sync for *node* after the sync interval.
+    def _node_event(self, event_type: EventType, time: float, idx: int) -> SimEvent:
+        """Build an event addressed to node *idx* (IDs filled in for tracing)."""
+        store = self.network.store
+        cidx = int(store.cluster_idx[idx])
+        return SimEvent(
+            type=event_type,
+            time=time,
+            node_id=store.ids[idx],
+            cluster_id=store.cluster_names[cidx],
+            node_idx=idx,
+            cluster_idx=cidx,
+        )
+
+    def _cluster_event(self, event_type: EventType, time: float, cidx: int) -> SimEvent:
+        """Build an event addressed to cluster *cidx* and its current coordinator."""
+        idx = int(self.network.cluster_coordinator[cidx])
+        return SimEvent(
+            type=event_type,
+            time=time,
+            node_id=self.network.store.ids[idx],
+            cluster_id=self.network.clusters[cidx].id,
+            node_idx=idx,
+            cluster_idx=cidx,
+        )
+
+    def _reschedule_state_sync(self, idx: int, current_time: float) -> None:
+        """Schedule the next state_sync for node *idx* after the sync interval.
 
         Once a node is selected during initialisation (with probability
         ``_sync_sample_rate``), it fires every interval for the remainder of
@@ -1681,43 +3983,24 @@ class SwarmCoordinationSimulator:
         # This preserves TDMA slot assignment or random phase offset
         next_time = current_time + self._sync_interval
         if next_time < self.simulation_duration_seconds:
-            self.event_queue.push(
-                SimEvent(
-                    type="state_sync",
-                    time=next_time,
-                    node_id=node.id,
-                    cluster_id=node.cluster_id,
-                )
-            )
+            self.event_queue.push(self._node_event("state_sync", next_time, idx))
 
     def _schedule_handoff_events(self, start_time: float) -> None:
         """Schedule only the first coordinator handoff per cluster (lazy)."""
         t = start_time + self.duty_cycle_seconds
         if t < self.simulation_duration_seconds:
-            for cluster in self.network.clusters:
+            for cidx in range(len(self.network.clusters)):
                 self.event_queue.push(
-                    SimEvent(
-                        type="coordinator_handoff",
-                        time=t,
-                        node_id=cluster.coordinator_id,
-                        cluster_id=cluster.id,
-                    )
+                    self._cluster_event("coordinator_handoff", t, cidx)
                 )
 
-    def _reschedule_handoff(self, cluster_id: str, current_time: float) -> None:
-        """Schedule the next coordinator handoff for *cluster_id*."""
+    def _reschedule_handoff(self, cidx: int, current_time: float) -> None:
+        """Schedule the next coordinator handoff for cluster *cidx*."""
         next_time = current_time + self.duty_cycle_seconds
         if next_time < self.simulation_duration_seconds:
-            cluster = self.network.get_cluster(cluster_id)
-            if cluster is not None:
-                self.event_queue.push(
-                    SimEvent(
-                        type="coordinator_handoff",
-                        time=next_time,
-                        node_id=cluster.coordinator_id,
-                        cluster_id=cluster.id,
-                    )
-                )
+            self.event_queue.push(
+                self._cluster_event("coordinator_handoff", next_time, cidx)
+            )
 
     def _schedule_gossip_rounds(self, start_time: float) -> None:
         """Schedule only the first gossip round (lazy)."""
@@ -1751,139 +4034,327 @@ class SwarmCoordinationSimulator:
         seconds_per_year = 365.0 * 24.0 * 3600.0
         rate_per_second = annual_rate / seconds_per_year
 
-        for node in self.network.nodes:
-            if node.is_coordinator:
-                continue
-            failure_time = self.rng.exponential(1.0 / rate_per_second)
-            if failure_time < self.simulation_duration_seconds:
-                self.event_queue.push(
-                    SimEvent(
-                        type="node_failure",
-                        time=failure_time,
-                        node_id=node.id,
-                        cluster_id=node.cluster_id,
-                    )
-                )
+        # One vectorised draw yields the same stream as per-node scalar draws.
+        candidates = np.flatnonzero(~self.network.store.is_coordinator)
+        self._failure_pending = ~self.network.store.is_coordinator
+        if self.config.random_streams == "per_process":
+            # Draw for every node, so a node's failure and repair times do
+            # not depend on which nodes the topology made coordinators
+            n_nodes = len(self.network.store)
+            failure_times = self._failure_rng.exponential(
+                1.0 / rate_per_second, size=n_nodes
+            )[candidates]
+            self._repair_days = self._failure_rng.integers(1, 8, size=n_nodes)
+        else:
+            failure_times = self._failure_rng.exponential(
+                1.0 / rate_per_second, size=candidates.size
+            )
+        self._push_failure_events(candidates, failure_times)
+
+    def _push_failure_events(
+        self, nodes: NDArray[np.int64], failure_times: NDArray[np.float64]
+    ) -> None:
+        """Queue the failures of *nodes* that fall within the run."""
+        due = failure_times < self.simulation_duration_seconds
+        for idx, failure_time in zip(
+            nodes[due].tolist(), failure_times[due].tolist()
+        ):
+            self.event_queue.push(self._node_event("node_failure", failure_time, idx))
+
+    def _reschedule_failure_events(self) -> None:
+        """Redraw the pending failures from the current time (see :meth:`fork`).
+
+        Failure times are exponential, so a node that has not failed by now
+        fails after a fresh draw at the (possibly new) rate, and the new
+        horizon decides which of those fall within the run.
+        """
+        self.event_queue.discard("node_failure")
+        rate_per_second = self.config.node_failure_rate_per_year / (365.0 * 24.0 * 3600.0)
+        nodes = np.flatnonzero(self._failure_pending)
+        failure_times = self._advanced_to + self._failure_rng.exponential(
+            1.0 / rate_per_second, size=nodes.size
+        )
+        self._push_failure_events(nodes, failure_times)
 
     # -- event loop --------------------------------------------------------
     def run(self) -> SwarmCoordinationRunResult:
-        """Execute the full simulation and return the result."""
-        events_processed = 0
-        # Default max_events accounts for:
-        # - sampled_nodes state_sync events per cycle
-        # - Each state_sync generates ~routes_per_event message_receive events
-        # - Additional handoff, failure, gossip events
-        # Cycles per day = 86400 / T_c = 8640 (at T_c=10s).
-        if self.config.max_events is not None:
-            max_events = self.config.max_events
-        else:
-            sampled_nodes = max(1, int(self.config.node_count * self._sync_sample_rate))
-            cycles_per_day = 86400.0 / 10.0  # T_c = 10s
-            # Estimate routes per event: hierarchical/centralized=1, sectorized=10, mesh=5
-            if self.config.coordination_topology == "sectorized_mesh":
-                events_per_sync = 1 + _SECTORIZED_MESH_MAX_GOSSIP  # state_sync + message_receives
-            elif self.config.coordination_topology == "mesh":
-                events_per_sync = 6  # gossip_round + ~5 exchanges
-            else:
-                events_per_sync = 3  # state_sync + ~2 message_receives
-            max_events = int(sampled_nodes * cycles_per_day * self.config.simulation_days * events_per_sync * 1.5)
+        """Execute the (rest of the) simulation and return the result.
+
+        With ``checkpoint_interval_days`` set, a checkpoint is written to
+        ``checkpoint_path`` every interval of simulated time.  Calling
+        :meth:`run` on a simulator restored by :meth:`load_checkpoint`
+        finishes the run with a result identical to an uninterrupted one.
+        """
+        interval_days = self.config.checkpoint_interval_days
+        if interval_days is not None:
+            if interval_days <= 0 or self.config.checkpoint_path is None:
+                raise ValueError(
+                    "checkpoint_interval_days must be positive and needs checkpoint_path"
+                )
+            interval = interval_days * SECONDS_PER_DAY
+            while not self._finished:
+                next_stop = (math.floor(self._advanced_to / interval) + 1) * interval
+                if next_stop >= self.simulation_duration_seconds:
+                    break
+                self.advance(next_stop)
+                self.save_checkpoint(self.config.checkpoint_path)
+        self.advance(self.simulation_duration_seconds)
+
+        # Final power update for remaining time
+        remaining_power = self.simulation_duration_seconds - self._last_power_time
+        if remaining_power > 0:
+            self._update_power_consumption(remaining_power)
+            self._last_power_time = self.simulation_duration_seconds
+
+        return self._generate_result()
+
+    def advance(self, until_seconds: float) -> bool:
+        """Process every event due at or before *until_seconds*.
+
+        Returns ``True`` once the run is complete (queue exhausted, end of
+        the simulated window, or ``max_events`` reached).  Advancing in
+        several steps processes exactly the same events as one call, so a
+        simulator can be checkpointed or forked between steps.
+        """
+        if self._finished:
+            return True
+        max_events = self._max_events()
+        events_processed = self.events_processed
         # Batch power updates: only update when >=60s have elapsed
-        last_power_time: float = 0.0
+        last_power_time = self._last_power_time
         power_update_interval = 60.0
         # AoI sampling at periodic intervals
-        last_aoi_sample_time: float = 0.0
+        last_aoi_sample_time = self._last_aoi_sample_time
         # Gilbert-Elliott state transitions (once per sync interval)
-        last_ge_transition_time: float = 0.0
-
-        while not self.event_queue.is_empty() and events_processed < max_events:
-            event = self.event_queue.pop()
-            if event is None:
+        last_ge_transition_time = self._last_ge_transition_time
+
+        queue = self.event_queue
+        dispatch = self._dispatch
+        profile = self._profile
+        update_power = self._update_power_consumption
+        sample_aoi = self._sample_aoi
+        update_ge = self._update_ge_link_states
+        if profile is not None:
+            wall_start = perf_counter()
+            update_power = self._timed("power_update", update_power)
+            sample_aoi = self._timed("aoi_sample", sample_aoi)
+            update_ge = self._timed("ge_transition", update_ge)
+        finished = True
+        while (
+            not queue.is_empty()
+            and events_processed + self._batched_events < max_events
+        ):
+            entry = queue.pop_entry()
+            if entry is None:
                 break
+            event = entry[4]
             if event.time > self.simulation_duration_seconds:
                 break
+            if event.time > until_seconds:
+                queue.push_entry(entry)
+                finished = False
+                break
 
             # Batch power updates at intervals instead of every event
             if event.time - last_power_time >= power_update_interval:
                 elapsed = event.time - last_power_time
-                self._update_power_consumption(elapsed)
+                update_power(elapsed)
                 last_power_time = event.time
 
             # Periodic AoI sampling
             if event.time - last_aoi_sample_time >= self._aoi_sample_interval:
-                self._sample_aoi(event.time)
+                sample_aoi(event.time)
                 last_aoi_sample_time = event.time
 
             # Gilbert-Elliott link state transitions (once per sync interval)
             if (
                 self.config.link_model == "gilbert_elliott"
+                and not self._cycle_batched
                 and event.time - last_ge_transition_time >= self._sync_interval
             ):
-                self._update_ge_link_states()
+                update_ge()
                 last_ge_transition_time = event.time
 
+            if (
+                profile is not None
+                and event.time - self._last_queue_sample_time >= self._aoi_sample_interval
+            ):
+                profile.queue_times.append(event.time)
+                profile.queue_sizes.append(queue.size())
+                self._last_queue_sample_time = event.time
+
             self.current_time = event.time
-            self._process_event(event)
+            dispatch[entry[2]](event)
             events_processed += 1
+        self.events_processed = events_processed
+        self._last_power_time = last_power_time
+        self._last_aoi_sample_time = last_aoi_sample_time
+        self._last_ge_transition_time = last_ge_transition_time
+        self._advanced_to = max(self._advanced_to, until_seconds)
+        self._finished = finished
+        if profile is not None:
+            profile.wall_seconds += perf_counter() - wall_start
+        return finished
+
+    def _max_events(self) -> int:
+        """Event budget of the run (``config.max_events`` or an estimate)."""
+        # Default max_events accounts for:
+        # - sampled_nodes state_sync events per cycle
+        # - Each state_sync generates ~routes_per_event message_receive events
+        # - Additional handoff, failure, gossip events
+        # Cycles per day = 86400 / T_c = 8640 (at T_c=10s).
+        if self.config.max_events is not None:
+            return self.config.max_events
+        sampled_nodes = max(1, int(self.config.node_count * self._sync_sample_rate))
+        cycles_per_day = 86400.0 / 10.0  # T_c = 10s
+        # Estimate routes per event: hierarchical/centralized=1, sectorized=10, mesh=5
+        if self.config.coordination_topology == "sectorized_mesh":
+            events_per_sync = 1 + _SECTORIZED_MESH_MAX_GOSSIP  # state_sync + message_receives
+        elif self.config.coordination_topology == "mesh":
+            events_per_sync = 6  # gossip_round + ~5 exchanges
+        else:
+            events_per_sync = 3  # state_sync + ~2 message_receives
+        return int(sampled_nodes * cycles_per_day * self.config.simulation_days * events_per_sync * 1.5)
 
-        # Final power update for remaining time
-        remaining_power = self.simulation_duration_seconds - last_power_time
-        if remaining_power > 0:
-            self._update_power_consumption(remaining_power)
+    # -- checkpoints and forks ---------------------------------------------
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_dispatch"]  # bound methods; rebuilt on load
+        return state
 
-        return self._generate_result()
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._dispatch = self._build_dispatch()
+
+    def save_checkpoint(self, path: str | os.PathLike[str]) -> None:
+        """Write the full simulator state to *path*.
+
+        The pickle holds the event queue, both RNG states, the node store and
+        every counter.  The file is replaced atomically, so a crash while
+        writing leaves the previous checkpoint intact.
+        """
+        tmp_path = f"{os.fspath(path)}.tmp"
+        with open(tmp_path, "wb") as fh:
+            pickle.dump(
+                {"version": _CHECKPOINT_VERSION, "simulator": self},
+                fh,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load_checkpoint(cls, path: str | os.PathLike[str]) -> "SwarmCoordinationSimulator":
+        """Restore a simulator written by :meth:`save_checkpoint`."""
+        with open(path, "rb") as fh:
+            payload = pickle.load(fh)
+        if (
+            not isinstance(payload, dict)
+            or payload.get("version") != _CHECKPOINT_VERSION
+            or not isinstance(payload.get("simulator"), cls)
+        ):
+            raise ValueError(f"{os.fspath(path)!r} is not a swarm simulator checkpoint")
+        return payload["simulator"]
+
+    def fork(self, **changes: Any) -> "SwarmCoordinationSimulator":
+        """Return an independent copy of this simulator with *changes* applied.
+
+        Intended for warm starts: :meth:`advance` a shared burn-in once, then
+        fork one branch per what-if configuration and :meth:`run` each.  The
+        branch continues from the current state and RNG positions; fields
+        that shaped the initial network or event schedule (see
+        ``_FORK_FIXED_FIELDS``) cannot change.  Changing the failure rate or
+        the run length redraws the failures still pending from the current
+        time.
+        """
+        if self._finished:
+            raise ValueError("cannot fork a finished run")
+        fixed = sorted(set(changes) & set(_FORK_FIXED_FIELDS))
+        if fixed:
+            raise ValueError(f"cannot change {', '.join(fixed)} when forking")
+        branch = copy.deepcopy(self)
+        branch.config = replace(self.config, **changes)
+        branch._derive_config_parameters()
+        if (
+            branch.config.node_failure_rate_per_year != self.config.node_failure_rate_per_year
+            or branch.config.simulation_days != self.config.simulation_days
+        ):
+            branch._reschedule_failure_events()
+        if branch.config.profile != self.config.profile:
+            branch._profile = RunProfile() if branch.config.profile else None
+            branch._dispatch = branch._build_dispatch()
+        rates = (branch.config.base_power_w, branch.config.coordinator_power_w)
+        if rates != (self.config.base_power_w, self.config.coordinator_power_w):
+            # Settle the burn-in at the old rates before switching
+            branch.network.store.settle_all()
+            branch.network.store.start_energy_accounting(*rates)
+        return branch
 
     def _process_event(self, event: SimEvent) -> None:
-        handlers = {
-            "state_sync": self._handle_state_sync,
-            "message_send": self._handle_message_send,
-            "message_receive": self._handle_message_receive,
-            "coordinator_handoff": self._handle_coordinator_handoff,
-            "node_failure": self._handle_node_failure,
-            "node_recovery": self._handle_node_recovery,
-            "gossip_round": self._handle_gossip_round,
-            "collision_warning": self._handle_collision_warning,
-        }
-        handler = handlers.get(event.type)
-        if handler:
-            handler(event)
+        self._dispatch[EVENT_CODES[event.type]](event)
 
     # -- Gilbert-Elliott link model ----------------------------------------
     def _update_ge_link_states(self) -> None:
-        """Transition Gilbert-Elliott link states for all active nodes.
+        """Transition Gilbert-Elliott link states for all nodes.
 
         Called once per sync interval (T_c).  Each node's link independently
         transitions between good (True) and bad (False) states according to
-        Markov transition probabilities.
+        Markov transition probabilities, as one vectorised step.  The
+        uniforms are the next draws of the stdlib stream, in node order (see
+        :func:`_stdlib_uniforms`), so the chain is identical to stepping the
+        nodes one by one.
         """
-        p_gb = self.config.ge_p_good_to_bad
-        p_bg = self.config.ge_p_bad_to_good
-        for node_id in self._ge_link_states:
-            if self._ge_link_states[node_id]:  # good state
-                if self._stdlib_rng.random() < p_gb:
-                    self._ge_link_states[node_id] = False
-            else:  # bad state
-                if self._stdlib_rng.random() < p_bg:
-                    self._ge_link_states[node_id] = True
+        if self._ge_mt is None:
+            self._ge_mt = np.random.MT19937(0)
+        u = _stdlib_uniforms(self._ge_random, self._ge_good.size, self._ge_mt)
+        self._ge_good = np.where(
+            self._ge_good,
+            u >= self.config.ge_p_good_to_bad,
+            u < self.config.ge_p_bad_to_good,
+        )
 
-    def _link_delivers(self, sender_id: str) -> bool:
-        """Return True if the message is successfully delivered.
+    def _link_delivers(self, sender: int) -> bool:
+        """Return True if the message from node *sender* is delivered.
 
         Uses the configured link model (Bernoulli or Gilbert-Elliott).
         """
         if self.config.link_model == "gilbert_elliott":
-            in_good = self._ge_link_states.get(sender_id, True)
-            p_loss = self.config.ge_p_loss_good if in_good else self.config.ge_p_loss_bad
-            return self._stdlib_rng.random() >= p_loss
+            if self._ge_good[sender]:
+                return self._link_random.random() >= self.config.ge_p_loss_good
+            return self._link_random.random() >= self.config.ge_p_loss_bad
         # Bernoulli i.i.d.
         if self.config.link_availability >= 1.0:
             return True
-        return self._stdlib_rng.random() <= self.config.link_availability
+        return self._link_random.random() <= self.config.link_availability
+
+    def _coordinator_interval_byte_cap(self) -> float:
+        """Return the per-coordinator ingress byte budget for one sync interval.
+
+        The cap is scaled by the sample rate: the DES only simulates a
+        fraction of members, but the coordinator would receive from ALL
+        members in the real fleet.  Scaling the cap down is equivalent to
+        scaling the observed bytes up.
+        """
+        max_bytes = (
+            (self.config.coordinator_link_capacity_kbps * 1_000 / 8)
+            * self._sync_interval
+        )
+        if self.config.coordinator_scheduling == "tdma":
+            # TDMA: deterministic slots, guard time reduces effective
+            # capacity but eliminates burstiness.  No drops if total
+            # offered load fits within (1 - guard) * capacity.
+            max_bytes *= 1.0 - self.config.guard_time_fraction
+        # Random phase: full capacity available but burstiness causes drops
+        # at lower utilizations.
+        return max_bytes * self._sync_sample_rate
 
     # -- event handlers ----------------------------------------------------
     def _handle_state_sync(self, event: SimEvent) -> None:
-        node = self._find_node(event.node_id)
-        if node is None or node.status == "failed":
+        store = self.network.store
+        idx = self._event_node_index(event)
+        if idx < 0 or store.status[idx] == STATUS_FAILED:
             return
+        is_coordinator = store.is_coordinator
+        node_is_coordinator = bool(is_coordinator[idx])
 
         # --- Exception-based telemetry filtering (hierarchical only) ---
         # When enabled, only nodes whose state changed beyond threshold report.
@@ -1892,64 +4363,38 @@ class SwarmCoordinationSimulator:
         if (
             self.config.enable_exception_telemetry
             and self.config.coordination_topology == "hierarchical"
-            and not node.is_coordinator
+            and not node_is_coordinator
         ):
             self._exception_expected_msgs += 1
-            if self._stdlib_rng.random() > self.config.exception_threshold:
+            if self._exception_random.random() > self.config.exception_threshold:
                 # Node is stable -- skip reporting this cycle
-                node.last_update_time = self.current_time
-                self._reschedule_state_sync(node, self.current_time)
+                store.last_update_time[idx] = self.current_time
+                self._reschedule_state_sync(idx, self.current_time)
                 return
             self._exception_actual_msgs += 1
 
-        routes = get_message_routing(
-            self.config.coordination_topology, self.network, event.node_id
-        )
         ephemeris_delivered = False
-        for sender_id, receiver_id in routes:
-            # Determine message type and size based on sender/receiver roles
-            msg_type = self._classify_message_type(sender_id, receiver_id)
-            msg_size = MESSAGE_SIZES.get(msg_type, MESSAGE_SIZES["ephemeris"])
+        sender = idx
+        for receiver, code in self._routes(idx):
+            # Message type and size by sender/receiver roles (see _routes)
+            msg_type = MESSAGE_CLASSES[code]
+            msg_size = MESSAGE_SIZES[msg_type]
+            receiver_is_coordinator = bool(is_coordinator[receiver])
 
             # --- Per-cycle coordinator ingress tracking (distributional) ---
-            recv_node = self._find_node(receiver_id)
-            if recv_node and recv_node.is_coordinator:
+            if receiver_is_coordinator:
                 self._coordinator_ingress_this_cycle += msg_size
 
             # --- Coordinator bandwidth cap ---
             if self.config.coordinator_link_capacity_kbps > 0:
                 # Check if receiver is a coordinator -- inbound traffic
-                receiver_node = self._find_node(receiver_id)
-                if receiver_node and receiver_node.is_coordinator:
-                    coord_id = receiver_id
-                    bytes_so_far = self._coordinator_bytes_this_interval.get(coord_id, 0.0)
-                    # Scale cap by sample_rate: the DES only simulates a fraction
-                    # of members, but the coordinator would receive from ALL members
-                    # in the real fleet.  Scaling the cap down is equivalent to
-                    # scaling the observed bytes up.
-                    if self.config.coordinator_scheduling == "tdma":
-                        # TDMA: deterministic slots, guard time reduces effective
-                        # capacity but eliminates burstiness.  No drops if total
-                        # offered load fits within (1 - guard) * capacity.
-                        gamma = 1.0 - self.config.guard_time_fraction
-                        max_bytes = (
-                            (self.config.coordinator_link_capacity_kbps * 1_000 / 8)
-                            * self._sync_interval
-                            * gamma
-                            * self._sync_sample_rate
-                        )
-                    else:
-                        # Random phase: full capacity available but burstiness
-                        # causes drops at lower utilizations.
-                        max_bytes = (
-                            (self.config.coordinator_link_capacity_kbps * 1_000 / 8)
-                            * self._sync_interval
-                            * self._sync_sample_rate
-                        )
+                if receiver_is_coordinator:
+                    bytes_so_far = self._coordinator_bytes_this_interval.get(receiver, 0.0)
+                    max_bytes = self._coordinator_interval_byte_cap()
                     if bytes_so_far + msg_size > max_bytes:
                         self._coordinator_drops += 1
                         continue
-                    self._coordinator_bytes_this_interval[coord_id] = bytes_so_far + msg_size
+                    self._coordinator_bytes_this_interval[receiver] = bytes_so_far + msg_size
 
             # --- Link availability filter with retransmission ---
             # Supports both Bernoulli and Gilbert-Elliott link models via
@@ -1967,7 +4412,7 @@ class SwarmCoordinationSimulator:
                 or self.config.link_availability < 1.0
             )
             if needs_loss_check:
-                if not self._link_delivers(sender_id):
+                if not self._link_delivers(sender):
                     delivered = False
                     # Attempt retransmissions
                     for _attempt in range(self.config.max_retransmissions):
@@ -1976,41 +4421,34 @@ class SwarmCoordinationSimulator:
                         self._total_bytes_attempted += msg_size
                         if is_protocol:
                             self._protocol_bytes_attempted += msg_size
-                        if self._link_delivers(sender_id):
+                        if self._link_delivers(sender):
                             delivered = True
                             retries_used = _attempt + 1
                             break
                     if not delivered:
                         self._link_lost_msgs += 1
                         if self.config.coordination_topology == "hierarchical":
-                            receiver_node = self._find_node(receiver_id)
-                            sender_node = self._find_node(sender_id)
-                            if (receiver_node and receiver_node.is_coordinator) or (
-                                sender_node and sender_node.is_coordinator
-                            ):
+                            if receiver_is_coordinator or is_coordinator[sender]:
                                 self._coordinator_unavailability_events += 1
                         # Cross-cycle tracking: increment loss streak for
                         # member→coordinator ephemeris messages
                         if msg_type == "ephemeris":
-                            streak = self._member_loss_streak.get(sender_id, 0)
-                            self._member_loss_streak[sender_id] = streak + 1
+                            self._member_loss_streak[sender] += 1
                         continue
 
             # --- Airtime enforcement ---
             # When enabled, check whether this message would push the
             # coordinator's cumulative ingress airtime beyond T_c.
             if self.config.enforce_airtime and msg_type == "ephemeris":
-                receiver_node_at = self._find_node(receiver_id)
-                if receiver_node_at and receiver_node_at.is_coordinator:
-                    coord_id_at = receiver_id
-                    airtime_so_far = self._coordinator_airtime_this_cycle.get(coord_id_at, 0.0)
+                if receiver_is_coordinator:
+                    airtime_so_far = self._coordinator_airtime_this_cycle.get(receiver, 0.0)
                     slot_ms = self.config.airtime_slot_duration_ms
                     T_c_ms = self._sync_interval * 1000
                     self._airtime_attempted += 1
                     if airtime_so_far + slot_ms > T_c_ms:
                         self._airtime_deadline_misses += 1
                         continue  # drop: airtime budget exceeded
-                    self._coordinator_airtime_this_cycle[coord_id_at] = airtime_so_far + slot_ms
+                    self._coordinator_airtime_this_cycle[receiver] = airtime_so_far + slot_ms
                     self._airtime_delivered += 1
 
             # --- Overhead accounting (unconditional) ---
@@ -2030,31 +4468,28 @@ class SwarmCoordinationSimulator:
                 self._heartbeat_bytes_sent += msg_size
             elif msg_type == "gossip":
                 self._gossip_bytes_sent += msg_size
-            sender = self._find_node(sender_id)
-            if sender:
-                sender.messages_sent += 1
-            self._classify_tier_message(sender_id, receiver_id)
+            store.messages_sent[sender] += 1
+            self._classify_tier_message(msg_type)
 
             # --- Track ephemeris delivery for companion heartbeat ---
             if msg_type == "ephemeris":
                 ephemeris_delivered = True
                 # Cross-cycle tracking: record recovery if member had
                 # consecutive failed cycles, then reset streak
-                streak = self._member_loss_streak.get(sender_id, 0)
+                streak = int(self._member_loss_streak[sender])
                 if streak > 0:
-                    self._recovery_streaks.append(streak)
-                    self._member_loss_streak[sender_id] = 0
+                    self._recovery_streaks.add(streak)
+                    self._member_loss_streak[sender] = 0
 
             # --- AoI tracking: record successful delivery to coordinator ---
-            if msg_type == "ephemeris":
-                receiver_node = self._find_node(receiver_id)
-                if receiver_node and receiver_node.is_coordinator:
-                    if receiver_id not in self._coordinator_last_update:
-                        self._coordinator_last_update[receiver_id] = {}
-                    self._coordinator_last_update[receiver_id][sender_id] = self.current_time
+            if msg_type == "ephemeris" and receiver_is_coordinator:
+                self._record_aoi_update(receiver, sender, self.current_time)
 
             # --- Queue for latency tracking ---
-            msg = create_message(sender_id, receiver_id, msg_type, self.current_time)
+            msg = create_message(
+                store.ids[sender], store.ids[receiver], msg_type, self.current_time,
+                receiver,
+            )
             msg.size_bytes = msg_size
             if self.message_queue.enqueue(msg):
                 base_delay_ms = calculate_propagation_delay(
@@ -2072,8 +4507,9 @@ class SwarmCoordinationSimulator:
                     SimEvent(
                         type="message_receive",
                         time=self.current_time + delay_s,
-                        node_id=receiver_id,
+                        node_id=msg.receiver_id,
                         data={"messageId": msg.id},
+                        node_idx=receiver,
                     )
                 )
         # --- Protocol extras: batch-accounted command dissemination ---
@@ -2085,11 +4521,10 @@ class SwarmCoordinationSimulator:
         #   stress:       one unique 512 B command per member per cycle
         #   nominal:      no per-member commands (cluster summary only)
         #   event_driven: commands to p_event fraction of members per cycle
-        if node.is_coordinator and self.config.coordination_topology in (
+        if node_is_coordinator and self.config.coordination_topology in (
             "hierarchical", "sectorized_mesh"
         ):
-            cluster = self._find_cluster(node.cluster_id)
-            if cluster and self.config.workload_profile != "nominal":
+            if self.config.workload_profile != "nominal":
                 # Campaign duty factor: determine if commands are active this cycle.
                 if self.config.campaign_mode == "on_off":
                     # ON/OFF Markov: transition state, then use current state
@@ -2106,11 +4541,8 @@ class SwarmCoordinationSimulator:
                 cmd_size = MESSAGE_SIZES["coordination_command"]
                 n_members = 0
                 if duty_active:
-                    for mid in cluster.node_ids:
-                        if mid != node.id:
-                            m = self._find_node(mid)
-                            if m is not None and m.status != "failed":
-                                n_members += 1
+                    # Live members of this coordinator's cluster, excluding itself
+                    n_members = int(store.live_per_cluster[store.cluster_idx[idx]]) - 1
                 # Event-driven: only a fraction of members need commands
                 if self.config.workload_profile == "event_driven":
                     n_event = 0
@@ -2145,7 +4577,7 @@ class SwarmCoordinationSimulator:
                 ):
                     n_reporting = 0
                     for _ in range(n_members):
-                        if self._stdlib_rng.random() <= self.config.exception_threshold:
+                        if self._exception_random.random() <= self.config.exception_threshold:
                             n_reporting += 1
                     n_members = n_reporting
                 # Apply link loss per-command (unified model)
@@ -2160,7 +4592,7 @@ class SwarmCoordinationSimulator:
                 if needs_loss:
                     n_delivered = 0
                     for _ in range(n_members):
-                        if self._link_delivers(node.id):
+                        if self._link_delivers(idx):
                             n_delivered += 1
                         else:
                             # Retransmission attempts
@@ -2169,7 +4601,7 @@ class SwarmCoordinationSimulator:
                                 # Count retransmission bytes as offered
                                 self._total_bytes_attempted += cmd_size
                                 self._protocol_bytes_attempted += cmd_size
-                                if self._link_delivers(node.id):
+                                if self._link_delivers(idx):
                                     n_delivered += 1
                                     break
                 else:
@@ -2184,7 +4616,7 @@ class SwarmCoordinationSimulator:
         # --- Hierarchical-only protocol extras: heartbeat + collision alert ---
         if self.config.coordination_topology == "hierarchical":
             # Heartbeat/ACK (64 B): regular node → coordinator, same link as ephemeris
-            if not node.is_coordinator and ephemeris_delivered:
+            if not node_is_coordinator and ephemeris_delivered:
                 hb_size = MESSAGE_SIZES["coordination_heartbeat"]
                 self._total_bytes_sent += hb_size
                 self._protocol_bytes_sent += hb_size
@@ -2204,13 +4636,12 @@ class SwarmCoordinationSimulator:
                 self.total_messages_sent += 1
                 self._tier_breakdown.intra_cluster_msgs += 1
 
-        node.last_update_time = self.current_time
+        store.last_update_time[idx] = self.current_time
         # Reset per-coordinator byte counters periodically
         if self.current_time - self._coordinator_interval_start >= self._sync_interval:
             self._coordinator_bytes_this_interval.clear()
             # Record per-cycle coordinator ingress for distributional analysis
-            self._coordinator_ingress_per_cycle.append(self._coordinator_ingress_this_cycle)
-            self._coordinator_ingress_this_cycle = 0
+            self._close_ingress_cycle()
             # Record airtime utilization for this cycle before resetting
             if self.config.enforce_airtime and self._coordinator_airtime_this_cycle:
                 T_c_ms = self._sync_interval * 1000
@@ -2219,42 +4650,535 @@ class SwarmCoordinationSimulator:
                 self._coordinator_airtime_this_cycle.clear()
             self._coordinator_interval_start = self.current_time
         # Lazy reschedule: queue the next state_sync for this node
-        self._reschedule_state_sync(node, self.current_time)
+        self._reschedule_state_sync(idx, self.current_time)
+
+    # -- cycle-batched state sync -------------------------------------------
+    def _handle_sync_cycle(self, event: SimEvent) -> None:
+        """Process one T_c cycle of hierarchical state syncs as arrays.
+
+        Array counterpart of :meth:`_handle_state_sync` for
+        ``execution_mode="cycle_batched"``.  Every sampled node fires at
+        ``event.time + phase`` exactly as in the per-event path, so routing,
+        coordinator caps, loss/retransmission, airtime, per-class byte
+        counters, AoI and command dissemination are evaluated for the whole
+        cycle at once, in phase order.  Messages that clear the link are
+        still queued (and received) individually for latency tracking.
+        """
+        cycle = int(event.data["cycle"]) if event.data else 0
+        store = self.network.store
+        nodes = self._batch_nodes
+        phase = self._batch_phase
+
+        # A node found failed when its sync comes due drops out of the
+        # rotation for good, mirroring the per-event path (no reschedule).
+        alive = store.status[nodes] != STATUS_FAILED
+        if not alive.all():
+            nodes = self._batch_nodes = nodes[alive]
+            phase = self._batch_phase = phase[alive]
+        times = event.time + phase
+        due = times < self.simulation_duration_seconds
+        sync_nodes = nodes[due]
+        sync_times = times[due]
+        if sync_nodes.size == 0:
+            return
+        self._batched_events += sync_nodes.size - 1
+        node_is_coordinator = store.is_coordinator[sync_nodes]
+
+        # --- Exception-based telemetry filtering ---
+        reporting = np.ones(sync_nodes.size, dtype=bool)
+        if self.config.enable_exception_telemetry:
+            members = ~node_is_coordinator
+            stable = members & (
+                self._batch_exception_rng.random(sync_nodes.size) > self.config.exception_threshold
+            )
+            n_members = int(np.count_nonzero(members))
+            self._exception_expected_msgs += n_members
+            self._exception_actual_msgs += n_members - int(np.count_nonzero(stable))
+            reporting = ~stable
+
+        self._batch_route_messages(sync_nodes[reporting], sync_times[reporting], cycle)
+        coordinators = sync_nodes[node_is_coordinator]
+        if coordinators.size and self.config.workload_profile != "nominal":
+            self._batch_command_dissemination(coordinators, cycle)
+
+        # Collision alert (128 B): Bernoulli per reporting sync, p = 10^-4/s * T_c
+        n_alerts = int(self._batch_rng.binomial(
+            int(np.count_nonzero(reporting)), 1e-4 * self._sync_interval
+        ))
+        if n_alerts:
+            alert_bytes = n_alerts * MESSAGE_SIZES["collision_alert"]
+            self._total_bytes_sent += alert_bytes
+            self._protocol_bytes_sent += alert_bytes
+            self._alert_bytes_sent += alert_bytes
+            self._total_bytes_attempted += alert_bytes
+            self._protocol_bytes_attempted += alert_bytes
+            self.total_messages_sent += n_alerts
+            self._tier_breakdown.intra_cluster_msgs += n_alerts
+
+        store.last_update_time[sync_nodes] = sync_times
+        # Close the cycle: per-coordinator counters reset every T_c
+        self._close_ingress_cycle()
+
+        next_time = event.time + self._sync_interval
+        if next_time < self.simulation_duration_seconds:
+            self.event_queue.push(
+                SimEvent(
+                    type="sync_cycle",
+                    time=next_time,
+                    node_id=event.node_id,
+                    data={"cycle": cycle + 1},
+                )
+            )
+
+    def _batch_route_messages(
+        self,
+        sources: NDArray[np.int64],
+        send_times: NDArray[np.float64],
+        cycle: int,
+    ) -> None:
+        """Send the upward reports of *sources* (phase-ordered) for one cycle.
+
+        Vectorised :func:`_hierarchical_routing` plus the per-route pipeline
+        of :meth:`_handle_state_sync`: members report ephemeris to their
+        cluster coordinator, cluster coordinators a cluster summary to their
+        regional coordinator, and regional coordinators a region summary to
+        the central coordinator.
+        """
+        network = self.network
+        store = network.store
+        central = network.central_idx
+        cidx = store.cluster_idx[sources]
+        coordinator = network.cluster_coordinator[cidx].astype(np.int64)
+        regional = network.cluster_regional[cidx].astype(np.int64)
+        is_cluster_coordinator = sources == coordinator
+        to_regional = is_cluster_coordinator & (regional >= 0) & (regional != sources)
+        to_central = is_cluster_coordinator & ~to_regional & (sources != central)
+        receivers = np.where(to_regional, regional, np.where(to_central, central, coordinator))
+        routed = ~is_cluster_coordinator | to_regional | to_central
+        senders = sources[routed]
+        receivers = receivers[routed]
+        times = send_times[routed]
+        regional = regional[routed]
+        if senders.size == 0:
+            return
+
+        # Classification as in _classify_message_type / _classify_tier_message
+        role = network.role_tier[senders]
+        sender_is_coordinator = store.is_coordinator[senders]
+        receiver_is_coordinator = store.is_coordinator[receivers]
+        cluster_summary = (role == ROLE_CLUSTER_COORDINATOR) & (receivers == regional)
+        region_summary = (role == ROLE_REGIONAL_COORDINATOR) & (receivers == central)
+        ephemeris = ~(cluster_summary | region_summary)
+        sizes = np.where(
+            cluster_summary,
+            MESSAGE_SIZES["cluster_summary"],
+            np.where(region_summary, MESSAGE_SIZES["region_summary"], MESSAGE_SIZES["ephemeris"]),
+        ).astype(np.int64)
+
+        # --- Per-cycle coordinator ingress tracking (distributional) ---
+        self._coordinator_ingress_this_cycle += int(sizes[receiver_is_coordinator].sum())
+
+        # --- Coordinator bandwidth cap: first-come budget per receiver ---
+        sent = np.ones(senders.size, dtype=bool)
+        if self.config.coordinator_link_capacity_kbps > 0:
+            capped = np.flatnonzero(receiver_is_coordinator)
+            capped = capped[np.argsort(receivers[capped], kind="stable")]
+            dropped = capped[~_first_come_admission(
+                receivers[capped], sizes[capped], self._coordinator_interval_byte_cap()
+            )]
+            self._coordinator_drops += dropped.size
+            sent[dropped] = False
+
+        # --- Link availability filter with retransmission ---
+        retries = np.zeros(senders.size, dtype=np.int64)
+        delivered = sent.copy()
+        if self._needs_loss_check():
+            attempt = np.flatnonzero(sent)
+            p_ok = self._batch_delivery_probability(senders[attempt], cycle)
+            delivered[attempt], retries[attempt] = self._batch_attempts(p_ok)
+        attempts = np.where(sent, retries + 1, 0)
+        attempted_bytes = attempts * sizes
+        self._link_attempted_msgs += int(attempts.sum())
+        self._retransmission_count += int(retries[sent].sum())
+        self._total_bytes_attempted += int(attempted_bytes.sum())
+        self._protocol_bytes_attempted += int(attempted_bytes[~ephemeris].sum())
+        lost = sent & ~delivered
+        if lost.any():
+            self._link_lost_msgs += int(np.count_nonzero(lost))
+            self._coordinator_unavailability_events += int(np.count_nonzero(
+                lost & (receiver_is_coordinator | sender_is_coordinator)
+            ))
+            # Cross-cycle tracking: each sender reports once per cycle
+            self._member_loss_streak[senders[lost & ephemeris]] += 1
+
+        # --- Airtime enforcement: first floor(T_c / slot) reports per coordinator ---
+        if self.config.enforce_airtime:
+            timed = np.flatnonzero(delivered & ephemeris & receiver_is_coordinator)
+            timed = timed[np.argsort(receivers[timed], kind="stable")]
+            slot_ms = self.config.airtime_slot_duration_ms
+            T_c_ms = self._sync_interval * 1000
+            rank = _running_total_by_key(
+                receivers[timed], np.ones(timed.size, dtype=np.int64)
+            )
+            missed = rank * slot_ms > T_c_ms
+            self._airtime_attempted += timed.size
+            self._airtime_deadline_misses += int(np.count_nonzero(missed))
+            self._airtime_delivered += timed.size - int(np.count_nonzero(missed))
+            delivered[timed[missed]] = False
+            _, per_coordinator = np.unique(receivers[timed[~missed]], return_counts=True)
+            self._airtime_per_cycle.extend((per_coordinator * slot_ms / T_c_ms).tolist())
+
+        # --- Overhead accounting for delivered messages ---
+        ok = np.flatnonzero(delivered)
+        if ok.size == 0:
+            return
+        ok_sizes = sizes[ok]
+        ok_ephemeris = ephemeris[ok]
+        ephemeris_bytes = int(ok_sizes[ok_ephemeris].sum())
+        summary_bytes = int(ok_sizes.sum()) - ephemeris_bytes
+        self.total_messages_sent += ok.size
+        self._total_bytes_sent += ephemeris_bytes + summary_bytes
+        self._protocol_bytes_sent += summary_bytes
+        self._ephemeris_bytes_sent += ephemeris_bytes
+        self._summary_bytes_sent += summary_bytes
+        np.add.at(store.messages_sent, senders[ok], 1)
+        n_central = int(np.count_nonzero(region_summary[ok]))
+        n_inter = int(np.count_nonzero(cluster_summary[ok]))
+        self._tier_breakdown.central_msgs += n_central
+        self._tier_breakdown.inter_cluster_msgs += n_inter
+        self._tier_breakdown.intra_cluster_msgs += ok.size - n_central - n_inter
+
+        # --- Ephemeris delivered: recovery streaks, heartbeat, AoI ---
+        reported = ok[ok_ephemeris]
+        reporters = senders[reported]
+        streaks = self._member_loss_streak[reporters]
+        recovered = streaks > 0
+        if recovered.any():
+            self._recovery_streaks.add_many(streaks[recovered])
+            self._member_loss_streak[reporters[recovered]] = 0
+        n_heartbeats = int(np.count_nonzero(~sender_is_coordinator[reported]))
+        hb_bytes = n_heartbeats * MESSAGE_SIZES["coordination_heartbeat"]
+        self._total_bytes_sent += hb_bytes
+        self._protocol_bytes_sent += hb_bytes
+        self._heartbeat_bytes_sent += hb_bytes
+        self._total_bytes_attempted += hb_bytes
+        self._protocol_bytes_attempted += hb_bytes
+        self.total_messages_sent += n_heartbeats
+        self._tier_breakdown.intra_cluster_msgs += n_heartbeats
+        heard = reported[receiver_is_coordinator[reported]]
+        self._record_aoi_updates(receivers[heard], senders[heard], times[heard])
+
+        # --- Queue for latency tracking ---
+        admitted = ok[: self.message_queue.admit(ok.size)]
+        if admitted.size:
+            self._batch_enqueue(
+                senders[admitted], receivers[admitted], sizes[admitted],
+                times[admitted], retries[admitted],
+            )
+
+    def _batch_command_dissemination(
+        self, coordinators: NDArray[np.int64], cycle: int
+    ) -> None:
+        """Account the commands sent by *coordinators* (phase-ordered) this cycle.
+
+        Array counterpart of the command block of :meth:`_handle_state_sync`:
+        per-member Bernoulli thinning becomes one binomial draw per
+        coordinator and per-command retransmissions one geometric draw per
+        command.
+        """
+        store = self.network.store
+        rng = self._batch_rng
+        cmd_size = MESSAGE_SIZES["coordination_command"]
+        active = self._batch_campaign_activity(coordinators.size)
+        n_members = np.where(
+            active, store.live_per_cluster[store.cluster_idx[coordinators]] - 1, 0
+        )
+        if self.config.workload_profile == "event_driven":
+            n_members = rng.binomial(n_members, self.config.event_command_probability)
+        if self.config.workload_profile == "distributed":
+            consensus_bytes = int(
+                self.config.distributed_consensus_rounds
+                * n_members.sum()
+                * self.config.distributed_vote_msg_bytes
+            )
+            self._distributed_consensus_bytes += consensus_bytes
+            self._total_bytes_sent += consensus_bytes
+            self._protocol_bytes_sent += consensus_bytes
+            self._total_bytes_attempted += consensus_bytes
+            self._protocol_bytes_attempted += consensus_bytes
+        if self.config.enable_exception_telemetry:
+            n_members = self._batch_exception_rng.binomial(
+                n_members, self.config.exception_threshold
+            )
+        n_commands = int(n_members.sum())
+        if n_commands == 0:
+            return
+        self._total_bytes_attempted += n_commands * cmd_size
+        self._protocol_bytes_attempted += n_commands * cmd_size
+        n_delivered = n_commands
+        if self._needs_loss_check():
+            p_ok = np.repeat(
+                self._batch_delivery_probability(coordinators, cycle), n_members
+            )
+            delivered, retries = self._batch_attempts(p_ok)
+            n_delivered = int(np.count_nonzero(delivered))
+            n_retries = int(retries.sum())
+            self._retransmission_count += n_retries
+            self._total_bytes_attempted += n_retries * cmd_size
+            self._protocol_bytes_attempted += n_retries * cmd_size
+        cmd_bytes = n_delivered * cmd_size
+        self._total_bytes_sent += cmd_bytes
+        self._protocol_bytes_sent += cmd_bytes
+        self._command_bytes_sent += cmd_bytes
+        self.total_messages_sent += n_commands
+        self._tier_breakdown.intra_cluster_msgs += n_commands
+
+    def _batch_campaign_activity(self, n_syncs: int) -> NDArray[np.bool_]:
+        """Return the campaign duty state seen by *n_syncs* coordinator syncs.
+
+        The ON/OFF chain steps once per coordinator sync, as in the
+        per-event path; it is advanced run by run with geometric sojourns
+        rather than one draw per step.
+        """
+        rng = self._batch_rng
+        if self.config.campaign_mode != "on_off":
+            return rng.random(n_syncs) <= self.config.campaign_duty_factor
+        active = np.empty(n_syncs, dtype=bool)
+        pos = 0
+        on = self._campaign_on
+        # Steps still spent in the current state (the run may continue from
+        # the previous cycle); later runs last at least one step.
+        first = True
+        while pos < n_syncs:
+            p_leave = self._campaign_p_on_to_off if on else self._campaign_p_off_to_on
+            if p_leave <= 0.0:
+                run = n_syncs - pos
+            else:
+                run = int(rng.geometric(p_leave)) - (1 if first else 0)
+            run = min(run, n_syncs - pos)
+            active[pos:pos + run] = on
+            pos += run
+            if pos < n_syncs:
+                on = not on
+                first = False
+        self._campaign_on = on
+        return active
+
+    def _needs_loss_check(self) -> bool:
+        return (
+            self.config.link_model == "gilbert_elliott"
+            or self.config.link_availability < 1.0
+        )
+
+    def _batch_delivery_probability(
+        self, senders: NDArray[np.int64], cycle: int
+    ) -> NDArray[np.float64]:
+        """Return each sender's per-attempt delivery probability in *cycle*.
+
+        Gilbert-Elliott states are stepped lazily: a node's chain is only
+        advanced when it transmits, by drawing its state after the elapsed
+        number of cycles from the closed-form n-step transition probability.
+        """
+        if self.config.link_model != "gilbert_elliott":
+            return np.full(senders.size, min(1.0, self.config.link_availability))
+        p_gb = self.config.ge_p_good_to_bad
+        p_bg = self.config.ge_p_bad_to_good
+        good = self._ge_good[senders]
+        steps = cycle - self._ge_cycle[senders]
+        stale = steps > 0
+        if stale.any() and p_gb + p_bg > 0:
+            pi_good = p_bg / (p_gb + p_bg)
+            decay = (1.0 - p_gb - p_bg) ** steps[stale]
+            p_good = np.where(good[stale], pi_good + (1.0 - pi_good) * decay, pi_good * (1.0 - decay))
+            good[stale] = self._batch_ge_rng.random(p_good.size) < p_good
+            self._ge_good[senders] = good
+        self._ge_cycle[senders] = cycle
+        return np.where(good, 1.0 - self.config.ge_p_loss_good, 1.0 - self.config.ge_p_loss_bad)
+
+    def _batch_attempts(
+        self, p_ok: NDArray[np.float64]
+    ) -> tuple[NDArray[np.bool_], NDArray[np.int64]]:
+        """Draw ``(delivered, retries)`` for messages with success odds *p_ok*.
+
+        The number of attempts to first success is geometric; a message is
+        delivered if that is within ``1 + max_retransmissions`` attempts, and
+        each failed attempt before success (or the cap) is one retry.
+        """
+        limit = self.config.max_retransmissions + 1
+        u = 1.0 - self._batch_link_rng.random(p_ok.size)  # (0, 1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            first_success = np.where(
+                p_ok > 0.0,
+                np.maximum(1.0, np.ceil(np.log(u) / np.log1p(-p_ok))),
+                np.inf,
+            )
+        delivered = first_success <= limit
+        retries = np.minimum(first_success, limit).astype(np.int64) - 1
+        return delivered, retries
+
+    def _record_aoi_updates(
+        self,
+        receivers: NDArray[np.int64],
+        senders: NDArray[np.int64],
+        times: NDArray[np.float64],
+    ) -> None:
+        """Array form of :meth:`_record_aoi_update`."""
+        cluster_idx = self.network.store.cluster_idx
+        same_cluster = cluster_idx[senders] == cluster_idx[receivers]
+        receivers = receivers[same_cluster]
+        new = receivers[~self._aoi_tracked[receivers]]
+        if new.size:
+            first, order = np.unique(new, return_index=True)
+            for coord in first[np.argsort(order)].tolist():
+                self._track_aoi(coord, int(cluster_idx[coord]))
+        self._aoi_last_update[senders[same_cluster]] = times[same_cluster]
+
+    def _batch_enqueue(
+        self,
+        senders: NDArray[np.int64],
+        receivers: NDArray[np.int64],
+        sizes: NDArray[np.int64],
+        times: NDArray[np.float64],
+        retries: NDArray[np.int64],
+    ) -> None:
+        """Queue admitted messages and schedule their ``message_receive`` events."""
+        store = self.network.store
+        base_delay_ms = calculate_propagation_delay(
+            self.config.coordination_topology,
+            self.config.node_count,
+            self.config.cluster_size,
+        )
+        serialization_ms = np.where(
+            sizes > MESSAGE_SIZES["ephemeris"],
+            (sizes * 8) / (self.config.bandwidth_per_node_kbps * 1_000) * 1_000,
+            0.0,
+        )
+        delay_s = (base_delay_ms + serialization_ms + retries * base_delay_ms) / 1_000.0
+        type_names = {size: name for name, size in MESSAGE_SIZES.items()
+                      if name in ("ephemeris", "cluster_summary", "region_summary")}
+        for sender, receiver, size, t, delay in zip(
+            senders.tolist(), receivers.tolist(), sizes.tolist(),
+            times.tolist(), delay_s.tolist(),
+        ):
+            msg = create_message(
+                store.ids[sender], store.ids[receiver], type_names[size], t, receiver
+            )
+            self.message_queue.enqueue(msg)
+            self.event_queue.push(
+                SimEvent(
+                    type="message_receive",
+                    time=t + delay,
+                    node_id=msg.receiver_id,
+                    data={"messageId": msg.id},
+                    node_idx=receiver,
+                )
+            )
 
     def _sample_aoi(self, current_time: float) -> None:
         """Sample Age-of-Information at all coordinators.
 
-        For each coordinator, compute AoI = current_time - last_update_time
-        for each cluster member. Nodes that have never reported have
-        AoI = current_time (since simulation start).
+        For each tracked coordinator (live or demoted) that has not failed,
+        AoI = current_time - last_update_time for every other member of its
+        cluster.  Nodes that have never reported have AoI = current_time
+        (since simulation start).  Samples keep entry order, members in index
+        order, and are folded into the sketch as one array.
         """
-        if not self._coordinator_last_update:
+        n = self._aoi_samples_used
+        if n == 0:
             return
-        for coord_id, member_updates in self._coordinator_last_update.items():
-            coord_node = self._find_node(coord_id)
-            if coord_node is None or coord_node.status == "failed":
-                continue
-            # Find the cluster this coordinator belongs to
-            cluster = None
-            if coord_node.cluster_id:
-                cluster = self.network.get_cluster(coord_node.cluster_id)
-            if cluster is None:
-                continue
-            # Compute AoI for each member in the cluster
-            for member_id in cluster.node_ids:
-                if member_id == coord_id:
-                    continue  # coordinator knows its own state
-                last_update = member_updates.get(member_id, 0.0)
-                aoi = current_time - last_update
-                self._aoi_samples.append(aoi)
+        k = self._aoi_entries
+        entry = self._aoi_sample_entry[:n]
+        entry_alive = self.network.store.status[self._aoi_entry_coord[:k]] != STATUS_FAILED
+        keep = entry_alive[entry]
+        if not keep.any():
+            return
+        live = self._aoi_entry_live[:k][entry[keep]]
+        last_update = np.where(
+            live,
+            self._aoi_last_update[self._aoi_sample_nodes[:n][keep]],
+            self._aoi_frozen[self._aoi_sample_frozen[:n][keep]],
+        )
+        self._aoi_stats.add_many(current_time - last_update)
+
+    def _close_ingress_cycle(self) -> None:
+        """Record this cycle's coordinator ingress and reset the counter."""
+        ingress = self._coordinator_ingress_this_cycle
+        self._coordinator_ingress_stats.add(ingress)
+        if self.config.stats_backend == "exact":
+            self._coordinator_ingress_per_cycle.append(ingress)
+        self._coordinator_ingress_this_cycle = 0
+
+    def _record_aoi_update(self, receiver: int, sender: int, time: float) -> None:
+        """Record that coordinator *receiver* heard from member *sender* at *time*."""
+        store = self.network.store
+        cidx = int(store.cluster_idx[receiver])
+        if store.cluster_idx[sender] != cidx:
+            return  # only the coordinator's own cluster is ever sampled
+        if not self._aoi_tracked[receiver]:
+            self._track_aoi(receiver, cidx)
+        self._aoi_last_update[sender] = time
+
+    def _track_aoi(self, coord: int, cidx: int) -> None:
+        """Start AoI bookkeeping for current coordinator *coord* of cluster *cidx*."""
+        members = self.network.cluster_members(cidx)
+        size = len(members)
+        e = self._aoi_entries
+        self._aoi_entries += 1
+        self._aoi_entry_coord = _grow(self._aoi_entry_coord, e + 1)
+        self._aoi_entry_live = _grow(self._aoi_entry_live, e + 1)
+        self._aoi_entry_offset = _grow(self._aoi_entry_offset, e + 1)
+        self._aoi_entry_coord[e] = coord
+        self._aoi_entry_live[e] = True
+        self._aoi_entry_offset[e] = self._aoi_frozen_used
+        self._aoi_entry_of[coord] = e
+        self._aoi_tracked[coord] = True
+        # Reserve the entry's frozen slot now so its sample rows are final
+        self._aoi_frozen = _grow(self._aoi_frozen, self._aoi_frozen_used + size)
+        nodes = np.arange(members.start, members.stop, dtype=np.int64)
+        frozen = self._aoi_frozen_used + np.arange(size, dtype=np.int64)
+        self._aoi_frozen_used += size
+        sampled = nodes != coord  # coordinator knows its own state
+        n = self._aoi_samples_used
+        m = int(np.count_nonzero(sampled))
+        self._aoi_sample_nodes = _grow(self._aoi_sample_nodes, n + m)
+        self._aoi_sample_frozen = _grow(self._aoi_sample_frozen, n + m)
+        self._aoi_sample_entry = _grow(self._aoi_sample_entry, n + m)
+        self._aoi_sample_nodes[n:n + m] = nodes[sampled]
+        self._aoi_sample_frozen[n:n + m] = frozen[sampled]
+        self._aoi_sample_entry[n:n + m] = e
+        self._aoi_samples_used = n + m
+
+    def _hand_over_aoi(self, cidx: int, old: int, new: int) -> None:
+        """Move the live AoI slice of cluster *cidx* from *old* to *new*.
+
+        The outgoing coordinator keeps a frozen copy of what it knew; the
+        incoming one resumes from its own earlier record, if any.
+        """
+        members = self.network.cluster_members(cidx)
+        live = self._aoi_last_update[members.start:members.stop]
+        size = len(members)
+        if self._aoi_tracked[old]:
+            e = int(self._aoi_entry_of[old])
+            off = int(self._aoi_entry_offset[e])
+            self._aoi_frozen[off:off + size] = live
+            self._aoi_entry_live[e] = False
+        if self._aoi_tracked[new]:
+            e = int(self._aoi_entry_of[new])
+            off = int(self._aoi_entry_offset[e])
+            if not self._aoi_entry_live[e]:
+                live[:] = self._aoi_frozen[off:off + size]
+                self._aoi_entry_live[e] = True
+        else:
+            live[:] = 0.0
 
     def _handle_message_send(self, event: SimEvent) -> None:
         # Sending is handled inline in state_sync
         pass
 
     def _handle_message_receive(self, event: SimEvent) -> None:
-        node = self._find_node(event.node_id)
-        if node is None or node.status == "failed":
+        store = self.network.store
+        idx = self._event_node_index(event)
+        if idx < 0 or store.status[idx] == STATUS_FAILED:
             return
 
         bandwidth_bps = self.config.bandwidth_per_node_kbps * 1_000
@@ -2263,60 +5187,126 @@ class SwarmCoordinationSimulator:
         )
         for msg in processed:
             self.total_messages_delivered += 1
-            if msg.receive_time is not None:
-                prop_ms = (msg.receive_time - msg.send_time) * 1_000
-                self.propagation_times.append(prop_ms)
-            receiver = self._find_node(msg.receiver_id)
-            if receiver:
-                receiver.messages_received += 1
-                receiver.last_update_time = self.current_time
+            store.messages_received[msg.receiver_idx] += 1
+            store.last_update_time[msg.receiver_idx] = self.current_time
 
     def _handle_coordinator_handoff(self, event: SimEvent) -> None:
-        cluster = self._find_cluster(event.cluster_id)
-        if cluster is None:
+        cidx = self._event_cluster_index(event)
+        if cidx < 0:
             return
+        cluster = self.network.clusters[cidx]
         if not needs_handoff(cluster, self.current_time, self.duty_cycle_seconds):
             return
-        result = perform_handoff(
-            cluster, self.network.nodes, self.current_time, self.rng
-        )
-        idx = next(
-            (i for i, c in enumerate(self.network.clusters) if c.id == cluster.id),
-            -1,
-        )
-        if idx >= 0:
-            self.network.clusters[idx] = result.cluster
-        self.network.nodes = result.nodes
+        self._perform_handoff(cidx)
         # Lazy reschedule next handoff for this cluster
-        self._reschedule_handoff(event.cluster_id, self.current_time)
+        self._reschedule_handoff(cidx, self.current_time)
 
-    def _handle_node_failure(self, event: SimEvent) -> None:
-        idx = self._find_node_index(event.node_id)
-        if idx < 0:
+    def _perform_handoff(self, cidx: int) -> None:
+        """Index-based equivalent of :func:`perform_handoff` for cluster *cidx*.
+
+        The successor comes from the cluster's candidate heap, so a handoff
+        costs O(log k) for a cluster of k members rather than O(N).
+        """
+        store = self.network.store
+        cluster = self.network.clusters[cidx]
+        current = int(self.network.cluster_coordinator[cidx])
+        cluster.last_handoff_time = self.current_time
+
+        # Least accumulated coordinator time wins (first index on ties)
+        new_coord = self._handoff_candidate(cidx, current)
+        if new_coord < 0:
+            cluster.failed_handoffs += 1
             return
-        node = self.network.nodes[idx]
-        if node.status == "failed":
+
+        # 1 % random handoff failure
+        if self.rng.random() < 0.01:
+            cluster.failed_handoffs += 1
             return
 
-        self.network.nodes[idx] = fail_node(node, self.current_time)
+        heap = self._handoff_heaps[cidx]
+        heapq.heappop(heap)
+        self.network.hand_over(cidx, new_coord)
+        self._push_handoff_candidate(current)
+        self._hand_over_aoi(cidx, current, new_coord)
+
+    def _handoff_candidate(self, cidx: int, current: int) -> int:
+        """Return the best handoff candidate of cluster *cidx*, or -1 if none.
+
+        Eligible candidates are operational members other than *current*.
+        Heap entries are invalidated lazily: a node that failed, became
+        coordinator or changed its coordinator time since it was pushed is
+        discarded when it reaches the top.  Every transition back to
+        operational pushes a fresh entry (see :meth:`_push_handoff_candidate`).
+        The winner is left on top of the heap.
+        """
+        store = self.network.store
+        heap = self._handoff_heaps[cidx]
+        if heap is None:
+            members = self.network.cluster_members(cidx)
+            heap = [
+                (float(store.coordinator_time_seconds[i]), i)
+                for i in members
+                if store.status[i] == STATUS_OPERATIONAL
+            ]
+            heapq.heapify(heap)
+            self._handoff_heaps[cidx] = heap
+        elif len(heap) > 2 * int(store.live_per_cluster[cidx]) + 16:
+            # Too many stale entries: rebuild from the valid ones
+            heap[:] = [
+                e for e in set(heap)
+                if store.status[e[1]] == STATUS_OPERATIONAL
+                and e[0] == store.coordinator_time_seconds[e[1]]
+            ]
+            heapq.heapify(heap)
+        status = store.status
+        coord_time = store.coordinator_time_seconds
+        while heap:
+            key, idx = heap[0]
+            if (
+                status[idx] == STATUS_OPERATIONAL
+                and idx != current
+                and key == coord_time[idx]
+            ):
+                return idx
+            heapq.heappop(heap)
+        return -1
+
+    def _push_handoff_candidate(self, idx: int) -> None:
+        """Enter node *idx*, now operational, in its cluster's candidate heap."""
+        store = self.network.store
+        heap = self._handoff_heaps[int(store.cluster_idx[idx])]
+        if heap is not None:
+            heapq.heappush(heap, (float(store.coordinator_time_seconds[idx]), idx))
 
-        if node.is_coordinator:
-            cluster = next(
-                (c for c in self.network.clusters if c.coordinator_id == node.id),
-                None,
-            )
-            if cluster:
+    def _handle_node_failure(self, event: SimEvent) -> None:
+        store = self.network.store
+        idx = self._event_node_index(event)
+        if idx < 0 or store.status[idx] == STATUS_FAILED:
+            return
+        self._failure_pending[idx] = False
+
+        was_coordinator = bool(store.is_coordinator[idx])
+        self.network.fail(idx, self.current_time)
+
+        if was_coordinator:
+            coordinated = int(self.network.coordinator_cluster[idx])
+            if coordinated >= 0:
                 self.event_queue.push(
                     SimEvent(
                         type="coordinator_handoff",
                         time=self.current_time + 1.0,
-                        node_id=node.id,
-                        cluster_id=cluster.id,
+                        node_id=store.ids[idx],
+                        cluster_id=self.network.clusters[coordinated].id,
+                        node_idx=idx,
+                        cluster_idx=coordinated,
                     )
                 )
 
         # Schedule recovery (MTTR 1--7 days)
-        mttr_seconds = (self.rng.integers(1, 8)) * SECONDS_PER_DAY
+        if self._repair_days is not None:
+            mttr_seconds = int(self._repair_days[idx]) * SECONDS_PER_DAY
+        else:
+            mttr_seconds = (self._failure_rng.integers(1, 8)) * SECONDS_PER_DAY
         if self.current_time + mttr_seconds < self.simulation_duration_seconds:
             self.event_queue.push(
                 SimEvent(
@@ -2324,53 +5314,40 @@ class SwarmCoordinationSimulator:
                     time=self.current_time + mttr_seconds,
                     node_id=event.node_id,
                     cluster_id=event.cluster_id,
+                    node_idx=idx,
+                    cluster_idx=event.cluster_idx,
                 )
             )
 
     def _handle_node_recovery(self, event: SimEvent) -> None:
-        idx = self._find_node_index(event.node_id)
-        if idx < 0:
+        store = self.network.store
+        idx = self._event_node_index(event)
+        if idx < 0 or store.status[idx] != STATUS_FAILED:
             return
-        node = self.network.nodes[idx]
-        if node.status != "failed":
-            return
-        self.network.nodes[idx] = SwarmNode(
-            id=node.id,
-            status="operational",
-            cluster_id=node.cluster_id,
-            is_coordinator=False,
-            coordinator_time_seconds=node.coordinator_time_seconds,
-            power_consumed_wh=node.power_consumed_wh,
-            messages_sent=node.messages_sent,
-            messages_received=node.messages_received,
-            last_update_time=node.last_update_time,
-            failure_time=None,
-        )
+        self.network.recover(idx)
+        self._push_handoff_candidate(idx)
 
     def _handle_gossip_round(self, event: SimEvent) -> None:
         if self.config.coordination_topology != "mesh":
             return
-        mesh_neighbors = self.network.mesh_neighbors or {}
-        n_nodes = len(self.network.nodes)
+        store = self.network.store
+        n_nodes = len(store)
         # Sample a fixed number of node indices directly
         n_sample = min(1_000, n_nodes)
-        indices = self.rng.choice(n_nodes, size=n_sample, replace=False)
+        indices = self._gossip_rng.choice(n_nodes, size=n_sample, replace=False)
         max_gossip_msgs = min(1_000, n_nodes)
         msgs_this_round = 0
 
         queue_has_space = not self.message_queue.is_full()
-        for idx in indices:
+        for idx in indices.tolist():
             if msgs_this_round >= max_gossip_msgs or not queue_has_space:
                 break
-            node = self.network.nodes[idx]
-            if node.status == "failed":
+            if store.status[idx] == STATUS_FAILED:
                 continue
-            neighbors = mesh_neighbors.get(node.id, [])
-            for nid in neighbors:
+            for neighbor in self.network.neighbors(idx).tolist():
                 if msgs_this_round >= max_gossip_msgs:
                     break
-                neighbor = self.network.get_node(nid)
-                if neighbor is None or neighbor.status == "failed":
+                if store.status[neighbor] == STATUS_FAILED:
                     continue
                 # --- Link availability filter (unified model) ---
                 self._link_attempted_msgs += 1
@@ -2381,16 +5358,19 @@ class SwarmCoordinationSimulator:
                     self.config.link_model == "gilbert_elliott"
                     or self.config.link_availability < 1.0
                 )
-                if needs_loss and not self._link_delivers(node.id):
+                if needs_loss and not self._link_delivers(idx):
                     self._link_lost_msgs += 1
                     continue
-                msg = create_message(node.id, nid, "gossip", self.current_time)
+                msg = create_message(
+                    store.ids[idx], store.ids[neighbor], "gossip", self.current_time,
+                    neighbor,
+                )
                 if self.message_queue.enqueue(msg):
                     self.total_messages_sent += 1
                     self._total_bytes_sent += msg.size_bytes
                     self._protocol_bytes_sent += msg.size_bytes
                     self._gossip_bytes_sent += msg.size_bytes
-                    node.messages_sent += 1
+                    store.messages_sent[idx] += 1
                     self._tier_breakdown.gossip_msgs += 1
                     msgs_this_round += 1
                 else:
@@ -2407,19 +5387,17 @@ class SwarmCoordinationSimulator:
 
     # -- power update ------------------------------------------------------
     def _update_power_consumption(self, elapsed_seconds: float) -> None:
+        """Credit *elapsed_seconds* at each node's current role (settled lazily)."""
         if elapsed_seconds <= 0:
             return
-        base_w = self.config.base_power_w
-        coord_w = self.config.coordinator_power_w
-        hours = elapsed_seconds / 3600.0
-        for node in self.network.nodes:
-            power = coord_w if node.is_coordinator else base_w
-            node.power_consumed_wh += power * hours
-            if node.is_coordinator:
-                node.coordinator_time_seconds += elapsed_seconds
+        self.network.store.accrue(elapsed_seconds)
 
     # -- result generation -------------------------------------------------
     def _generate_result(self) -> SwarmCoordinationRunResult:
+        profile = self._profile
+        if profile is not None:
+            profile.events = self.events_processed
+            profile.peak_rss_mb = _peak_rss_mb()
         queue_stats = self.message_queue.get_stats()
         prop_stats = self.message_queue.get_propagation_stats()
 
@@ -2442,25 +5420,33 @@ class SwarmCoordinationSimulator:
             self.config.bandwidth_per_node_kbps,
         )
 
+        store = self.network.store
+        store.settle_all()
         coord_availability = 100.0
         if self.config.coordination_topology == "hierarchical":
+            # Per-cluster coordinator time, summed in node order
+            coord_time = np.bincount(
+                store.cluster_idx,
+                weights=store.coordinator_time_seconds,
+                minlength=len(self.network.clusters),
+            )
             avails = [
-                calculate_coordinator_availability(
-                    c, self.network.nodes, self.simulation_duration_seconds
+                _coordinator_availability_percent(
+                    float(coord_time[ci]),
+                    c.failed_handoffs,
+                    self.simulation_duration_seconds,
                 )
-                for c in self.network.clusters
+                for ci, c in enumerate(self.network.clusters)
             ]
             if avails:
                 coord_availability = sum(avails) / len(avails)
 
-        power_var = calculate_power_variance(self.network.nodes)
+        power_var = _power_variance_percent(store.power_consumed_wh)
         total_failed = sum(c.failed_handoffs for c in self.network.clusters)
 
+        # Propagation times stream through the queue's running statistics
         avg_prop = prop_stats.avg_propagation_ms
         max_prop = prop_stats.max_propagation_ms
-        if self.propagation_times:
-            avg_prop = sum(self.propagation_times) / len(self.propagation_times)
-            max_prop = max(self.propagation_times)
         if avg_prop == 0.0:
             avg_prop = calculate_propagation_delay(
                 self.config.coordination_topology,
@@ -2484,15 +5470,11 @@ class SwarmCoordinationSimulator:
             link_loss_rate = 0.0
 
         # AoI statistics
-        aoi_mean = 0.0
-        aoi_p99 = 0.0
-        aoi_max = 0.0
-        aoi_count = len(self._aoi_samples)
-        if self._aoi_samples:
-            aoi_arr = np.array(self._aoi_samples)
-            aoi_mean = float(np.mean(aoi_arr))
-            aoi_p99 = float(np.percentile(aoi_arr, 99))
-            aoi_max = float(np.max(aoi_arr))
+        aoi = self._aoi_stats
+        aoi_count = aoi.count
+        aoi_mean = aoi.mean
+        aoi_p99 = aoi.percentile(99)
+        aoi_max = aoi.max if aoi_count else 0.0
 
         # AoI-to-ephemeris coupling: along-track position uncertainty
         # σ(t) = σ₀ + σ̇ · AoI
@@ -2500,19 +5482,15 @@ class SwarmCoordinationSimulator:
         aoi_p99_pos = self.config.aoi_sigma_0_m + self.config.aoi_sigma_dot_m_per_s * aoi_p99
 
         # Cross-cycle recovery statistics
-        cc_mean = 0.0
-        cc_p95 = 0.0
-        cc_count = len(self._recovery_streaks)
-        cc_max = 0
+        streaks = self._recovery_streaks
+        cc_count = streaks.count
+        cc_mean = streaks.mean
+        cc_p95 = streaks.percentile(95)
+        cc_max = int(streaks.max) if cc_count else 0
         cc_cdf: list[float] = []
-        if self._recovery_streaks:
-            cc_arr = np.array(self._recovery_streaks)
-            cc_mean = float(np.mean(cc_arr))
-            cc_p95 = float(np.percentile(cc_arr, 95))
-            cc_max = int(np.max(cc_arr))
+        if cc_count:
             # Cumulative recovery fraction at each cycle count [1..10]
-            for k in range(1, 11):
-                cc_cdf.append(float(np.mean(cc_arr <= k)))
+            cc_cdf = [streaks.cdf(k) for k in range(1, 11)]
 
         return SwarmCoordinationRunResult(
             run_id=0,
@@ -2532,7 +5510,7 @@ class SwarmCoordinationSimulator:
                 / max(1, self.config.node_count)
                 / max(1, self.config.simulation_days)
             ),
-            total_energy_kwh=calculate_total_energy(self.network.nodes),
+            total_energy_kwh=_total_energy_kwh(store.power_consumed_wh),
             coordinator_bandwidth_kbps=per_coordinator_bandwidth_kbps(
                 self.config.cluster_size, 10.0
             ),
@@ -2582,10 +5560,42 @@ class SwarmCoordinationSimulator:
             distributed_consensus_bytes=self._distributed_consensus_bytes,
             # Per-cycle coordinator ingress distribution
             coordinator_ingress_bytes_per_cycle=self._coordinator_ingress_per_cycle,
+            distributions={
+                "aoi_seconds": aoi,
+                "update_propagation_ms": self.message_queue.propagation,
+                "coordinator_ingress_bytes": self._coordinator_ingress_stats,
+                "recovery_streak_cycles": streaks,
+            },
+            profile=profile,
         )
 
     # -- helpers -----------------------------------------------------------
-    def _classify_message_type(self, sender_id: str, receiver_id: str) -> str:
+    def _routes(self, idx: int) -> Routes:
+        """Return the ``(receiver, message class code)`` routes of node *idx*.
+
+        Hierarchical and centralized routes and their classes only change
+        when a handoff, failure or recovery touches the sender's cluster
+        (see :attr:`NetworkStructure.cluster_epoch`), so they are cached per
+        node and rebuilt on the first use after such a change.
+        """
+        network = self.network
+        table = self._route_table
+        if table is not None:
+            epoch = int(network.cluster_epoch[network.store.cluster_idx[idx]])
+            cached = table[idx]
+            if cached is not None and cached[0] == epoch:
+                return cached[1]
+        routes = tuple(
+            (receiver, MESSAGE_CLASS_CODES[self._classify_message_type(sender, receiver)])
+            for sender, receiver in get_message_routing_indices(
+                self.config.coordination_topology, network, idx
+            )
+        )
+        if table is not None:
+            table[idx] = (epoch, routes)
+        return routes
+
+    def _classify_message_type(self, sender: int, receiver: int) -> str:
         """Return the message type key based on sender/receiver roles.
 
         This implements message-size heterogeneity: different tiers produce
@@ -2598,38 +5608,25 @@ class SwarmCoordinationSimulator:
             if self.config.coordination_topology == "sectorized_mesh":
                 # Status report to OWN sector coordinator = ephemeris (256 B);
                 # peer-to-peer (including cross-sector) = heartbeat (32 B)
-                sender = self._find_node(sender_id)
-                if sender and sender.cluster_id:
-                    cluster = self.network.get_cluster(sender.cluster_id)
-                    if cluster and receiver_id == cluster.coordinator_id:
-                        return "ephemeris"
+                cidx = self.network.store.cluster_idx[sender]
+                if receiver == self.network.cluster_coordinator[cidx]:
+                    return "ephemeris"
                 return "heartbeat"
             return "ephemeris"
 
-        sender = self._find_node(sender_id)
-        receiver = self._find_node(receiver_id)
-        if sender is None or receiver is None:
+        network = self.network
+        role = network.role_tier[sender]
+        if role == ROLE_MEMBER or sender == receiver:
             return "ephemeris"
-
-        # Check if this is a coordinator sending to regional coordinator
-        if sender.is_coordinator:
-            sender_cluster = self._find_cluster(sender.cluster_id)
-            if sender_cluster is not None:
-                regional_id = sender_cluster.regional_coordinator_id
-                if regional_id and receiver_id == regional_id and sender_id != receiver_id:
-                    return "cluster_summary"
-
-        # Check if this is a regional coordinator sending to central
-        if receiver_id == self.network.central_coordinator_id and sender_id != receiver_id:
-            sender_cluster = self._find_cluster(sender.cluster_id)
-            if sender_cluster and sender_cluster.regional_coordinator_id == sender_id:
-                return "region_summary"
-
-        # Default: node-to-coordinator ephemeris
-        return "ephemeris"
-
-    def _classify_tier_message(self, sender_id: str, receiver_id: str) -> None:
-        """Classify a message by tier and update the breakdown counters."""
+        # Regional coordinator sending to central
+        if role == ROLE_REGIONAL_COORDINATOR:
+            return "region_summary" if receiver == network.central_idx else "ephemeris"
+        # Cluster coordinator sending to its regional coordinator
+        regional = network.cluster_regional[network.store.cluster_idx[sender]]
+        return "cluster_summary" if receiver == regional else "ephemeris"
+
+    def _classify_tier_message(self, msg_type: str) -> None:
+        """Count a sent message of *msg_type* in its tier's breakdown counter."""
         if self.config.coordination_topology == "sectorized_mesh":
             self._tier_breakdown.gossip_msgs += 1
             return
@@ -2638,53 +5635,139 @@ class SwarmCoordinationSimulator:
             self._tier_breakdown.intra_cluster_msgs += 1
             return
 
-        sender = self._find_node(sender_id)
-        receiver = self._find_node(receiver_id)
-        if sender is None or receiver is None:
-            self._tier_breakdown.intra_cluster_msgs += 1
+        if msg_type == "region_summary":
+            # Regional coordinator to central -- central tier message
+            self._tier_breakdown.central_msgs += 1
+            return
+        if msg_type == "cluster_summary":
+            # Cluster coordinator to its regional coordinator (inter-cluster)
+            self._tier_breakdown.inter_cluster_msgs += 1
             return
-
-        # Check if receiver is the central coordinator
-        if receiver_id == self.network.central_coordinator_id and sender_id != receiver_id:
-            # Check if sender is a regional coordinator (i.e. it is a cluster
-            # coordinator that also serves as regional coordinator and is sending
-            # to central) -- treat as central tier message
-            sender_cluster = self._find_cluster(sender.cluster_id)
-            if sender_cluster and sender_cluster.regional_coordinator_id == sender_id:
-                self._tier_breakdown.central_msgs += 1
-                return
-
-        # Check if receiver is a regional coordinator (inter-cluster message)
-        sender_cluster = self._find_cluster(sender.cluster_id)
-        if sender_cluster is not None:
-            regional_id = sender_cluster.regional_coordinator_id
-            if regional_id and receiver_id == regional_id and sender_id != receiver_id:
-                # Sender is a cluster coordinator sending to regional coordinator
-                if sender.is_coordinator:
-                    self._tier_breakdown.inter_cluster_msgs += 1
-                    return
 
         # Default: intra-cluster message (member <-> coordinator)
         self._tier_breakdown.intra_cluster_msgs += 1
 
-    def _find_node(self, node_id: str) -> Optional[SwarmNode]:
-        return self.network.get_node(node_id)
-
-    def _find_node_index(self, node_id: str) -> int:
-        return self.network._node_map.get(node_id, -1)
+    def _event_node_index(self, event: SimEvent) -> int:
+        """Return the node index an event addresses (resolving IDs if unset)."""
+        if event.node_idx >= 0:
+            return event.node_idx
+        return self.network.index_of(event.node_id)
 
-    def _find_cluster(self, cluster_id: Optional[str]) -> Optional[Cluster]:
-        if cluster_id is None:
-            return None
-        return self.network.get_cluster(cluster_id)
+    def _event_cluster_index(self, event: SimEvent) -> int:
+        """Return the cluster index an event addresses (resolving IDs if unset)."""
+        if event.cluster_idx >= 0:
+            return event.cluster_idx
+        if event.cluster_id is None:
+            return -1
+        return self.network.cluster_index_of(event.cluster_id)
 
 
 # ---------------------------------------------------------------------------
 # CLI demo
 # ---------------------------------------------------------------------------
+def _benchmark_event_core(
+    config: SwarmCoordinationConfig, hours: float = 6.0, repeats: int = 3
+) -> None:
+    """Print events/s of the old and current event core on *config*'s traffic.
+
+    Records every push and pop the simulator makes over the first *hours*
+    simulated hours, then replays that trace, best of *repeats*, through
+    (a) the old core: a heap of event objects ordered by ``__lt__`` with a
+    handler dict rebuilt for every event, and (b) the current core: an
+    :class:`EventQueue` of ``(time, seq, code, ...)`` tuples dispatched
+    through a code-indexed table.  Handlers are no-ops, so only queue and
+    dispatch cost is measured; the trace is fixed by the config's seed.
+    """
+
+    class _OldEvent:
+        __slots__ = ("type", "time")
+
+        def __init__(self, event_type: str, time: float) -> None:
+            self.type = event_type
+            self.time = time
+
+        def __lt__(self, other: _OldEvent) -> bool:
+            return self.time < other.time
+
+    sim = SwarmCoordinationSimulator(replace(config, event_queue="heap", profile=False))
+    queue = sim.event_queue
+    initial = [(entry[4].type, entry[0]) for entry in sorted(queue._heap)]
+    trace: list[Optional[tuple[str, float]]] = []
+    push, pop_entry = queue.push, queue.pop_entry
+
+    def recording_push(event: SimEvent) -> None:
+        trace.append((event.type, event.time))
+        push(event)
+
+    def recording_pop_entry() -> Optional[EventEntry]:
+        trace.append(None)
+        return pop_entry()
+
+    queue.push = recording_push  # type: ignore[method-assign]
+    queue.pop_entry = recording_pop_entry  # type: ignore[method-assign]
+    sim.advance(hours * 3_600.0)
+    pops = trace.count(None)
+
+    def noop(event: Any) -> None:
+        pass
+
+    def run_old() -> float:
+        heap = [_OldEvent(t, time) for t, time in initial]
+        heapq.heapify(heap)
+        ops = [None if op is None else _OldEvent(*op) for op in trace]
+        t0 = perf_counter()
+        for op in ops:
+            if op is None:
+                event = heapq.heappop(heap)
+                handlers = {event_type: noop for event_type in EVENT_TYPES}
+                handlers[event.type](event)
+            else:
+                heapq.heappush(heap, op)
+        return perf_counter() - t0
+
+    def run_new() -> float:
+        eq = EventQueue()
+        for t, time in initial:
+            eq.push(SimEvent(type=t, time=time, node_id=""))  # type: ignore[arg-type]
+        ops = [
+            None if op is None else SimEvent(type=op[0], time=op[1], node_id="")  # type: ignore[arg-type]
+            for op in trace
+        ]
+        dispatch = [noop] * len(EVENT_TYPES)
+        t0 = perf_counter()
+        for op in ops:
+            if op is None:
+                entry = eq.pop_entry()
+                dispatch[entry[2]](entry[4])  # type: ignore[index]
+            else:
+                eq.push(op)
+        return perf_counter() - t0
+
+    print(f"\nEvent-core benchmark ({hours:g} simulated hours, {pops:,} events, "
+          f"best of {repeats}):")
+    for label, run_core in (("before", run_old), ("after", run_new)):
+        best = min(run_core() for _ in range(repeats))
+        print(f"  {label:<8}: {best:6.2f} s, {pops / best:,.0f} events/s")
+
+
 if __name__ == "__main__":
+    import argparse
     import time
 
+    parser = argparse.ArgumentParser(description="Swarm coordination single-run demo")
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Time each event handler and periodic phase and print the profile",
+    )
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="Replay the demo's event traffic through the old and current "
+             "event core and print events/s",
+    )
+    args = parser.parse_args()
+
     print("=" * 72)
     print("Swarm Coordination Model -- single-run demo")
     print("=" * 72)
@@ -2700,6 +5783,7 @@ if __name__ == "__main__":
         base_power_w=5.0,
         simulation_days=30,
         seed=42,
+        profile=args.profile,
     )
 
     print(f"\nConfig: {cfg.node_count} nodes, {cfg.coordination_topology} topology, "
@@ -2723,3 +5807,21 @@ if __name__ == "__main__":
     print(f"  Total messages delivered: {result.total_messages_delivered:,}")
     print(f"  Avg msgs/node/day      : {result.avg_messages_per_node_per_day:.2f}")
     print(f"  Total energy           : {result.total_energy_kwh:.2f} kWh")
+    print(f"  Events processed       : {sim.events_processed:,} "
+          f"({sim.events_processed / elapsed:,.0f} events/s)")
+    if result.profile is not None:
+        print("\nProfile:")
+        print(result.profile.format_table())
+
+    print("\nEvent queue comparison (7-day run):")
+    for queue_kind in ("heap", "calendar"):
+        qcfg = replace(cfg, simulation_days=7, event_queue=queue_kind, profile=False)
+        t0 = time.perf_counter()
+        qsim = SwarmCoordinationSimulator(qcfg)
+        qsim.run()
+        q_elapsed = time.perf_counter() - t0
+        print(f"  {queue_kind:<8}: {q_elapsed:6.2f} s, "
+              f"{qsim.events_processed / q_elapsed:,.0f} events/s")
+
+    if args.benchmark:
+        _benchmark_event_core(cfg)
@@ -1,27 +1,49 @@
 """Unit tests for swarm_mc -- Monte Carlo engine for swarm coordination."""
 
 import math
+import os
+from dataclasses import replace
 
 import numpy as np
 import pytest
 
 from swarm_mc import (
+    PAIRED_METRICS,
+    ResultCache,
     ScalingAnalysisResult,
     Stats,
     SwarmCoordinationOutput,
     SwarmCoordinationResult,
+    SweepTable,
     TopologyComparisonResult,
     aggregate_results,
+    WORKERS_ENV_VAR,
     calculate_stats,
+    compute_prcc_sensitivity,
+    config_digest,
     confidence_interval,
+    default_workers,
     find_optimal_config,
     generate_scaling_configs,
+    load_packed_results,
+    model_fingerprint,
+    pack_run_result,
+    relative_half_width,
+    run_scaling_analysis,
     run_swarm_coordination_mc,
+    run_sweep,
     run_topology_comparison,
+    sample_configs,
+    save_packed_results,
+    surrogate_validation_grid,
+    sweep_grid,
+    unpack_run_result,
+    validate_analytic_surrogate,
 )
 from swarm_model import (
     SwarmCoordinationConfig,
     SwarmCoordinationRunResult,
+    SwarmCoordinationSimulator,
 )
 
 
@@ -187,6 +209,412 @@ class TestRunSwarmCoordinationMC:
         assert r.bottleneck_threshold_nodes >= 0
 
 
+# ===== TestParallelMC =====
+
+
+class TestParallelMC:
+    """Test process-pool execution of MC ensembles."""
+
+    def _cfg(self):
+        return SwarmCoordinationConfig(
+            node_count=100,
+            coordination_topology="hierarchical",
+            cluster_size=25,
+            simulation_days=5, sync_sample_rate=0.1,
+            seed=42,
+        )
+
+    def test_parallel_matches_serial(self):
+        serial = run_swarm_coordination_mc(self._cfg(), runs=4, workers=1)
+        parallel = run_swarm_coordination_mc(self._cfg(), runs=4, workers=2)
+        assert repr(parallel.result) == repr(serial.result)
+
+    def test_parallel_progress_streams_every_run(self):
+        calls = []
+        run_swarm_coordination_mc(
+            self._cfg(), runs=4, workers=2,
+            on_progress=lambda cur, total, pct: calls.append((cur, total, pct)),
+        )
+        assert [c[0] for c in calls] == [1, 2, 3, 4]
+        assert calls[-1] == (4, 4, 100.0)
+
+    def test_topology_comparison_shares_pool(self):
+        topologies = ["centralized", "hierarchical"]
+        serial = run_topology_comparison(
+            self._cfg(), topologies=topologies, runs_per=2, workers=1
+        )
+        calls = []
+        parallel = run_topology_comparison(
+            self._cfg(), topologies=topologies, runs_per=2, workers=2,
+            on_progress=lambda cur, total, pct, topo: calls.append((cur, topo)),
+        )
+        assert [repr(r) for r in parallel.results] == [repr(r) for r in serial.results]
+        assert [c[0] for c in calls] == [1, 2, 3, 4]
+        assert {c[1] for c in calls} == set(topologies)
+
+    def test_warm_start_matches_cold_start(self):
+        cold = run_swarm_coordination_mc(self._cfg(), runs=3, workers=1)
+        for workers in (1, 2):
+            warm = run_swarm_coordination_mc(
+                self._cfg(), runs=3, workers=workers, warm_start=True
+            )
+            assert repr(warm.result) == repr(cold.result)
+
+    def test_fixed_topology_mesh(self):
+        cfg = replace(self._cfg(), coordination_topology="mesh", simulation_days=1)
+        serial = run_swarm_coordination_mc(cfg, runs=2, workers=1, fixed_topology=True)
+        parallel = run_swarm_coordination_mc(cfg, runs=2, workers=2, fixed_topology=True)
+        assert repr(parallel.result) == repr(serial.result)
+
+    def test_analytic_fidelity(self):
+        cfg = replace(self._cfg(), fidelity="analytic")
+        output = run_swarm_coordination_mc(cfg, runs=3, warm_start=True)
+        assert output.result.communication_overhead_percent > 0
+        assert output.result.communication_overhead_std_dev == pytest.approx(0.0, abs=1e-9)
+
+    def test_fluid_fidelity(self):
+        cfg = replace(self._cfg(), fidelity="fluid", coordination_topology="hierarchical")
+        output = run_swarm_coordination_mc(cfg, runs=3, workers=2)
+        assert output.result.communication_overhead_percent > 0
+        assert output.result.communication_overhead_std_dev > 0
+        serial = run_swarm_coordination_mc(cfg, runs=3, workers=1)
+        assert repr(serial.result) == repr(output.result)
+
+    def test_default_workers_from_env(self, monkeypatch):
+        monkeypatch.delenv(WORKERS_ENV_VAR, raising=False)
+        assert default_workers() == 1
+        monkeypatch.setenv(WORKERS_ENV_VAR, "3")
+        assert default_workers() == 3
+        monkeypatch.setenv(WORKERS_ENV_VAR, "0")
+        assert default_workers() >= 1
+
+
+# ===== TestSequentialMC =====
+
+
+class TestSequentialMC:
+    """Test adaptive replica counts with sequential stopping."""
+
+    def _cfg(self):
+        return SwarmCoordinationConfig(
+            node_count=100,
+            coordination_topology="hierarchical",
+            cluster_size=25,
+            simulation_days=2, sync_sample_rate=0.1,
+            seed=42,
+        )
+
+    def test_relative_half_width(self):
+        assert relative_half_width([5.0]) == math.inf
+        assert relative_half_width([2.0, 2.0]) == 0.0
+        assert relative_half_width([-1.0, 1.0]) == math.inf
+        lo, hi = confidence_interval([1.0, 3.0])
+        assert relative_half_width([1.0, 3.0]) == pytest.approx((hi - lo) / 4)
+
+    def test_stops_once_targets_met(self):
+        cfg = replace(self._cfg(), fidelity="analytic")
+        output = run_swarm_coordination_mc(
+            cfg, runs=50, precision={"communication_overhead_percent": 0.01},
+            batch_size=2,
+        )
+        assert output.runs == 2
+        assert output.converged
+        assert output.achieved_precision == {"communication_overhead_percent": 0.0}
+
+    def test_budget_caps_runs(self):
+        output = run_swarm_coordination_mc(
+            self._cfg(), runs=4, workers=2,
+            precision={"communication_overhead_percent": 0.0}, batch_size=3,
+        )
+        assert output.runs == 4
+        assert not output.converged
+        assert output.achieved_precision["communication_overhead_percent"] > 0
+
+    def test_matches_fixed_ensemble(self):
+        fixed = run_swarm_coordination_mc(self._cfg(), runs=4, workers=1)
+        calls = []
+        sequential = run_swarm_coordination_mc(
+            self._cfg(), runs=4, workers=1,
+            precision={"communication_overhead_percent": 0.0}, batch_size=2,
+            on_progress=lambda cur, total, pct: calls.append(cur),
+        )
+        assert repr(sequential.result) == repr(fixed.result)
+        assert calls == [1, 2, 3, 4]
+
+    def test_topology_comparison_per_topology(self):
+        result = run_topology_comparison(
+            self._cfg(), topologies=["centralized", "hierarchical"], runs_per=4,
+            workers=1, precision={"message_drop_rate": 0.05}, batch_size=2,
+        )
+        assert result.runs == [2, 2]
+        assert [p["message_drop_rate"] for p in result.achieved_precision] == [0.0, 0.0]
+
+    def test_unknown_metric_rejected(self):
+        with pytest.raises(ValueError, match="no_such_metric"):
+            run_swarm_coordination_mc(
+                self._cfg(), runs=2, precision={"no_such_metric": 0.1}
+            )
+
+
+# ===== TestSweep =====
+
+
+class TestSweep:
+    """Test the declarative parameter-sweep engine."""
+
+    def _cfg(self):
+        return SwarmCoordinationConfig(
+            node_count=100,
+            coordination_topology="hierarchical",
+            cluster_size=25,
+            simulation_days=2, sync_sample_rate=0.1,
+            seed=42,
+        )
+
+    def test_grid_product_and_seeds(self):
+        configs = sweep_grid(
+            self._cfg(), {"cluster_size": [10, 25], "link_availability": [0.9, 1.0]},
+            seeds=[1, 2],
+        )
+        assert len(configs) == 8
+        assert [(c.cluster_size, c.link_availability, c.seed) for c in configs[:3]] == [
+            (10, 0.9, 1), (10, 0.9, 2), (10, 1.0, 1),
+        ]
+        assert sweep_grid(self._cfg())[0] == self._cfg()
+
+    def test_grid_rejects_unknown_field(self):
+        with pytest.raises(ValueError, match="no_such_field"):
+            sweep_grid(self._cfg(), {"no_such_field": [1]})
+
+    def test_deduplicates_jobs(self):
+        calls = []
+        configs = sweep_grid(self._cfg(), seeds=[42, 43])
+        table = run_sweep(
+            configs + [replace(c) for c in configs], workers=1,
+            on_progress=lambda cur, total, pct: calls.append(total),
+        )
+        assert len(table) == 2
+        assert calls == [2, 2]
+        # Rows already in the table are not rerun
+        calls.clear()
+        run_sweep(configs, workers=1, table=table, on_progress=lambda *a: calls.append(a))
+        assert calls == []
+
+    def test_lossless_request_reruns_histogram_rows(self):
+        table = run_sweep([self._cfg()], workers=1)
+        assert table.get(self._cfg()).encoding == "histogram"
+        run_sweep([self._cfg()], workers=1, table=table, encoding="lossless")
+        assert len(table) == 1
+        assert table.get(self._cfg()).encoding == "lossless"
+        assert table.run_result(self._cfg()).coordinator_ingress_bytes_per_cycle
+        # A lossless row also serves later histogram requests
+        calls = []
+        run_sweep([self._cfg()], workers=1, table=table, on_progress=lambda *a: calls.append(a))
+        assert calls == []
+
+    def test_longest_first(self):
+        short = self._cfg()
+        long = replace(short, simulation_days=4)
+        table = run_sweep([short, long], workers=1)
+        assert table.configs == [long, short]
+
+    def test_matches_mc_runner(self):
+        table = run_sweep(sweep_grid(self._cfg(), seeds=range(42, 45)), workers=2)
+        mc = run_swarm_coordination_mc(self._cfg(), runs=3, workers=1)
+        assert repr(table.ensemble(self._cfg(), 3)) == repr(mc.result)
+        single = SwarmCoordinationSimulator(self._cfg()).run()
+        assert table.run_result(self._cfg()).communication_overhead_percent == (
+            single.communication_overhead_percent
+        )
+
+    def test_rows_are_tidy(self):
+        configs = sweep_grid(self._cfg(), {"cluster_size": [10, 25]}, seeds=[1])
+        table = SweepTable()
+        run_sweep(configs, workers=1, table=table)
+        rows = table.rows()
+        assert {(r["cluster_size"], r["seed"]) for r in rows} == {(10, 1), (25, 1)}
+        assert "node_count" not in rows[0]
+        assert rows[0]["communication_overhead_percent"] > 0
+        with pytest.raises(KeyError):
+            table.get(replace(self._cfg(), seed=99))
+
+
+# ===== TestResultCache =====
+
+
+class TestResultCache:
+    """Test the content-addressed on-disk run cache."""
+
+    def _cfg(self, **overrides):
+        return replace(SwarmCoordinationConfig(
+            node_count=100,
+            coordination_topology="hierarchical",
+            cluster_size=25,
+            simulation_days=2, sync_sample_rate=0.1,
+            seed=42,
+        ), **overrides)
+
+    def test_digest_is_stable_and_field_sensitive(self):
+        assert config_digest(self._cfg()) == config_digest(self._cfg())
+        assert config_digest(self._cfg()) != config_digest(self._cfg(seed=43))
+        assert config_digest(self._cfg()) != config_digest(self._cfg(), "lossless")
+        # Checkpointing does not change the result, so not the key either
+        assert config_digest(self._cfg()) == config_digest(
+            self._cfg(checkpoint_interval_days=1.0)
+        )
+        assert len(model_fingerprint()) == 64
+
+    def test_round_trip(self, tmp_path):
+        cache = ResultCache(str(tmp_path))
+        packed = pack_run_result(SwarmCoordinationSimulator(self._cfg()).run())
+        assert cache.get(self._cfg()) is None
+        cache.put(self._cfg(), packed)
+        hit = cache.get(self._cfg())
+        assert np.array_equal(hit.scalars, packed.scalars)
+        assert cache.get(self._cfg(seed=43)) is None
+        assert cache.get(self._cfg(), "lossless") is None
+        assert (cache.hits, cache.misses) == (1, 3)
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        cache = ResultCache(str(tmp_path))
+        cache.put(self._cfg(), pack_run_result(SwarmCoordinationSimulator(self._cfg()).run()))
+        path = cache._path(self._cfg(), "histogram")
+        with open(path, "wb") as f:
+            f.write(b"truncated")
+        assert cache.get(self._cfg()) is None
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = ResultCache(str(tmp_path))
+        packed = pack_run_result(SwarmCoordinationSimulator(self._cfg()).run())
+        configs = [self._cfg(seed=s) for s in range(3)]
+        for i, cfg in enumerate(configs):
+            cache.put(cfg, packed)
+            os.utime(cache._path(cfg, "histogram"), (i, i))
+        os.utime(cache._path(configs[0], "histogram"), (10, 10))  # most recent use
+        cache.max_bytes = cache.size_bytes() * 2 // 3 + 1
+        assert cache.evict() == 1
+        assert cache.get(configs[1]) is None
+        assert cache.get(configs[0]) is not None
+        assert cache.get(configs[2]) is not None
+
+    def test_prune_drops_other_model_versions(self, tmp_path):
+        cache = ResultCache(str(tmp_path))
+        packed = pack_run_result(SwarmCoordinationSimulator(self._cfg()).run())
+        cache.put(self._cfg(), packed)
+        stale = ResultCache(str(tmp_path))
+        stale.version = "0" * 16
+        stale.put(self._cfg(), packed)
+        assert cache.prune() == 1
+        assert stale.get(self._cfg()) is None
+        assert cache.get(self._cfg()) is not None
+
+    def test_leaves_foreign_files_alone(self, tmp_path):
+        cache = ResultCache(str(tmp_path), max_bytes=0)
+        cache.put(self._cfg(), pack_run_result(SwarmCoordinationSimulator(self._cfg()).run()))
+        foreign = [
+            tmp_path / "notes.txt",
+            tmp_path / "other-tool" / "data.npz",
+            tmp_path / ("0" * 16) / "readme.md",
+            tmp_path / cache.version / "scratch.npz",
+        ]
+        for path in foreign:
+            path.parent.mkdir(exist_ok=True)
+            path.write_bytes(b"x" * 4096)
+        assert cache.prune() == 0
+        assert cache.evict() == 1
+        assert cache.get(self._cfg()) is None
+        assert all(path.exists() for path in foreign)
+
+    def test_sweep_reads_and_fills_cache(self, tmp_path):
+        cache = ResultCache(str(tmp_path))
+        configs = sweep_grid(self._cfg(), seeds=[42, 43])
+        calls = []
+        first = run_sweep(configs, workers=1, cache=cache)
+        second = run_sweep(
+            configs, workers=1, cache=cache, on_progress=lambda *a: calls.append(a)
+        )
+        assert calls == []
+        assert cache.hits == 2
+        for cfg in configs:
+            assert repr(second.run_result(cfg)) == repr(first.run_result(cfg))
+
+
+# ===== TestPackedRunResult =====
+
+
+class TestPackedRunResult:
+    """Test the compact run-result encoding."""
+
+    @pytest.fixture
+    def run_result(self):
+        cfg = SwarmCoordinationConfig(
+            node_count=100,
+            coordination_topology="hierarchical",
+            cluster_size=25,
+            simulation_days=2, sync_sample_rate=0.1,
+            link_model="gilbert_elliott",
+            seed=42,
+        )
+        return SwarmCoordinationSimulator(cfg).run()
+
+    def test_lossless_round_trip(self, run_result):
+        packed = pack_run_result(run_result)
+        assert isinstance(packed.series["coordinator_ingress_bytes_per_cycle"], np.ndarray)
+        assert unpack_run_result(packed, run_result.config) == run_result
+
+    def test_histogram_counts_every_sample(self, run_result):
+        packed = pack_run_result(run_result, encoding="histogram")
+        counts = packed.histograms["coordinator_ingress_bytes_per_cycle"]
+        assert counts.sum() == len(run_result.coordinator_ingress_bytes_per_cycle)
+        assert "coordinator_ingress_bytes_per_cycle" not in packed.series
+        unpacked = unpack_run_result(packed)
+        assert unpacked.coordinator_ingress_bytes_per_cycle == []
+        assert unpacked.total_bytes_sent == run_result.total_bytes_sent
+
+    def test_save_load_round_trip(self, run_result, tmp_path):
+        path = str(tmp_path / "runs.npz")
+        packed = [
+            pack_run_result(run_result),
+            pack_run_result(run_result, encoding="histogram"),
+        ]
+        save_packed_results(path, packed)
+        loaded = load_packed_results(path)
+        assert len(loaded) == 2
+        assert unpack_run_result(loaded[0], run_result.config) == run_result
+        np.testing.assert_array_equal(
+            loaded[1].histograms["coordinator_ingress_bytes_per_cycle"],
+            packed[1].histograms["coordinator_ingress_bytes_per_cycle"],
+        )
+
+    def test_sketches_survive_save_load(self, run_result, tmp_path):
+        path = str(tmp_path / "runs.npz")
+        save_packed_results(path, [pack_run_result(run_result, encoding="histogram")])
+        loaded = load_packed_results(path)[0].sketches
+        original = run_result.distributions
+        assert set(loaded) == set(original)
+        aoi = loaded["aoi_seconds"]
+        assert aoi.kind == "log_histogram"
+        assert aoi.count == original["aoi_seconds"].count
+        assert aoi.percentile(99) == pytest.approx(
+            original["aoi_seconds"].percentile(99), rel=0.01
+        )
+
+    def test_aggregate_pools_distributions(self, run_result):
+        runs = [run_result, run_result]
+        agg = aggregate_results([pack_run_result(r, encoding="histogram") for r in runs])
+        aoi = agg.distributions["aoi_seconds"]
+        assert aoi.count == 2 * run_result.distributions["aoi_seconds"].count
+        assert agg.aoi_p99_seconds == pytest.approx(run_result.aoi_p99_seconds, rel=0.01)
+        # Per-run sketches are left untouched by the merge
+        assert run_result.distributions["aoi_seconds"].count * 2 == aoi.count
+
+    def test_aggregate_accepts_packed(self, run_result):
+        other = SwarmCoordinationRunResult(communication_overhead_percent=3.0)
+        full = aggregate_results([run_result, other])
+        packed = aggregate_results([pack_run_result(run_result), pack_run_result(other)])
+        assert packed == full
+
+
 # ===== TestRunTopologyComparison =====
 
 
@@ -245,6 +673,33 @@ class TestRunTopologyComparison:
         assert len(result.configs) == 2
         assert len(result.results) == 2
 
+    def test_paired_differences(self):
+        cfg = SwarmCoordinationConfig(
+            node_count=100,
+            coordination_topology="hierarchical",
+            cluster_size=25,
+            simulation_days=5, sync_sample_rate=0.1,
+            seed=42, random_streams="per_process",
+        )
+        result = run_topology_comparison(
+            cfg, topologies=["centralized", "hierarchical"], runs_per=3
+        )
+        best = result.optimal_config_index
+        other = 1 - best
+        assert len(result.paired_differences) == len(PAIRED_METRICS)
+        for d in result.paired_differences:
+            assert d.baseline == result.configs[best].coordination_topology
+            assert d.other == result.configs[other].coordination_topology
+            assert d.runs == 3
+            assert d.ci_lower <= d.mean <= d.ci_upper
+        overhead = result.paired_differences[
+            PAIRED_METRICS.index("communication_overhead_percent")
+        ]
+        assert overhead.mean == pytest.approx(
+            result.results[other].communication_overhead_percent
+            - result.results[best].communication_overhead_percent
+        )
+
 
 # ===== TestGenerateScalingConfigs =====
 
@@ -285,6 +740,24 @@ class TestGenerateScalingConfigs:
             assert c.node_failure_rate_per_year == 0.05
 
 
+# ===== TestRunScalingAnalysis =====
+
+
+class TestRunScalingAnalysis:
+    """Test run_scaling_analysis."""
+
+    @pytest.mark.parametrize("topology", ["mesh", "centralized", "sectorized_mesh"])
+    def test_fluid_needs_hierarchical(self, topology):
+        cfg = SwarmCoordinationConfig(coordination_topology=topology, seed=42)
+        calls = []
+        with pytest.raises(ValueError, match="hierarchical"):
+            run_scaling_analysis(
+                cfg, runs_per_size=1, fluid_from_nodes=100_000,
+                on_progress=lambda *a: calls.append(a),
+            )
+        assert calls == []
+
+
 # ===== TestFindOptimalConfig =====
 
 
@@ -403,3 +876,77 @@ class TestAggregateResults:
         agg = aggregate_results(runs)
         lo, hi = agg.confidence_interval_95
         assert lo <= agg.communication_overhead_percent <= hi
+
+
+# ===== TestSurrogateValidation =====
+
+
+class TestSurrogateValidation:
+    """Test the analytic-vs-DES validation harness."""
+
+    def test_grid_covers_topologies_and_sizes(self):
+        grid = surrogate_validation_grid(node_counts=(1_000, 4_000))
+        assert len(grid) == 8
+        assert {c.coordination_topology for c in grid} == {
+            "centralized", "hierarchical", "mesh", "sectorized_mesh",
+        }
+        assert all(c.simulation_days == 1 for c in grid)
+
+    def test_reports_errors_per_metric(self):
+        cfg = SwarmCoordinationConfig(
+            node_count=100, cluster_size=25, simulation_days=1, seed=1,
+            fidelity="analytic",
+        )
+        (row,) = validate_analytic_surrogate([cfg], runs=1)
+        assert row.config.fidelity == "des"
+        assert row.relative_error["communication_overhead_percent"] < 0.02
+        assert set(row.des) == set(row.analytic) == set(row.relative_error)
+
+
+# ===== TestPRCCSensitivity =====
+
+
+class TestPRCCSensitivity:
+    """Test the stratified sampler and the parallel PRCC analysis."""
+
+    def _cfg(self):
+        return SwarmCoordinationConfig(
+            node_count=1_000, cluster_size=50, simulation_days=1, seed=7,
+            fidelity="analytic",
+        )
+
+    def test_lhs_is_stratified(self):
+        ranges = {"node_count": (1_000, 1_999), "coordinator_duty_cycle_hours": (1.0, 11.0)}
+        configs, values = sample_configs(self._cfg(), ranges, 10)
+        # One sample per tenth of each range
+        assert sorted((values["node_count"] - 1_000) // 100) == list(range(10))
+        assert sorted(np.floor(values["coordinator_duty_cycle_hours"] - 1.0)) == list(range(10))
+        assert all(isinstance(c.node_count, int) for c in configs)
+        assert [c.seed for c in configs] == list(range(7, 17))
+
+    @pytest.mark.parametrize("design", ["sobol", "halton"])
+    def test_low_discrepancy_designs(self, design):
+        configs, values = sample_configs(self._cfg(), {"cluster_size": (20, 40)}, 16, design)
+        assert len(configs) == 16
+        assert values["cluster_size"].min() >= 20 and values["cluster_size"].max() <= 40
+
+    def test_rejects_unknown_and_non_numeric_fields(self):
+        with pytest.raises(ValueError, match="unknown"):
+            sample_configs(self._cfg(), {"bogus": (0, 1)}, 4)
+        with pytest.raises(ValueError, match="numeric"):
+            sample_configs(self._cfg(), {"coordination_topology": (0, 1)}, 4)
+
+    def test_prcc_over_all_outputs(self):
+        results = compute_prcc_sensitivity(self._cfg(), runs=24, workers=1)
+        assert len(results) == 3 * 4
+        by_name = {r.name: r for r in results}
+        assert {name.split(" vs ")[1] for name in by_name} == {
+            "overhead", "power_variance", "aoi_p99", "drop_rate",
+        }
+        # Larger clusters hold a smaller share of coordinators: lower variance
+        assert by_name["cluster_size vs power_variance"].prcc < 0
+
+    def test_parallel_matches_serial(self):
+        serial = compute_prcc_sensitivity(self._cfg(), runs=12, workers=1)
+        parallel = compute_prcc_sensitivity(self._cfg(), runs=12, workers=2)
+        assert repr(parallel) == repr(serial)
@@ -1,32 +1,52 @@
 """Unit tests for swarm_model -- swarm coordination simulation model logic."""
 
 import math
+import random
+import time
+from dataclasses import replace
 
 import numpy as np
 import pytest
 
 from swarm_model import (
     CENTRAL_DISTANCE_KM,
+    EVENT_TYPES,
     HANDOFF_STATE_SIZE_BYTES,
     HANDOFF_TIMEOUT_SECONDS,
     HANDOFF_VERIFICATION_ROUNDS,
     INTER_NODE_DISTANCE_KM,
+    MESSAGE_CLASS_CODES,
     MESSAGE_SIZES,
+    PROFILE_PHASES,
     REGIONAL_DISTANCE_KM,
+    ROLE_CLUSTER_COORDINATOR,
+    ROLE_MEMBER,
+    ROLE_REGIONAL_COORDINATOR,
     SECONDS_PER_DAY,
     SPEED_OF_LIGHT_KM_S,
+    STATUS_FAILED,
+    STATUS_OPERATIONAL,
+    CalendarEventQueue,
     Cluster,
     EventQueue,
+    ExactSamples,
+    FluidSwarmSimulator,
     HandoffResult,
+    LogHistogram,
     Message,
     MessageQueue,
     NetworkStructure,
+    NodeStore,
     PropagationStats,
     SimEvent,
     SwarmCoordinationConfig,
     SwarmCoordinationRunResult,
     SwarmCoordinationSimulator,
     SwarmNode,
+    _first_come_admission,
+    _sample_mesh_neighbors,
+    _stdlib_uniforms,
+    analytic_run_result,
     calculate_bandwidth_requirement,
     calculate_communication_overhead,
     calculate_handoff_time,
@@ -42,9 +62,11 @@ from swarm_model import (
     fail_node,
     get_hop_count,
     get_message_routing,
+    get_message_routing_indices,
     get_operational_nodes,
     initialize_network,
     light_time_delay,
+    make_sketch,
     needs_handoff,
     perform_handoff,
     update_node_power,
@@ -281,6 +303,124 @@ class TestPerformHandoff:
             assert result.new_coordinator_id == "c-0-node-3"
 
 
+# ===== TestHandoffCandidateIndex =====
+
+
+class TestHandoffCandidateIndex:
+    """Test the simulator's per-cluster handoff candidate heaps."""
+
+    @staticmethod
+    def _brute_force(sim, cidx, current):
+        store = sim.network.store
+        members = sim.network.cluster_members(cidx)
+        eligible = store.status[members.start:members.stop] == STATUS_OPERATIONAL
+        if current in members:
+            eligible[current - members.start] = False
+        if not eligible.any():
+            return -1
+        coord_time = store.coordinator_time_seconds[members.start:members.stop]
+        return members.start + int(np.argmin(np.where(eligible, coord_time, np.inf)))
+
+    def test_matches_full_scan_under_churn(self):
+        cfg = SwarmCoordinationConfig(
+            node_count=120, coordination_topology="hierarchical",
+            cluster_size=12, simulation_days=1, seed=3,
+        )
+        sim = SwarmCoordinationSimulator(cfg)
+        store = sim.network.store
+        rng = np.random.default_rng(0)
+        n_clusters = len(sim.network.clusters)
+        for step in range(3_000):
+            sim.current_time = float(step)
+            op = rng.random()
+            idx = int(rng.integers(len(store)))
+            if op < 0.3:
+                sim._handle_node_failure(
+                    SimEvent(type="node_failure", time=sim.current_time,
+                             node_id=store.ids[idx], node_idx=idx))
+            elif op < 0.6:
+                sim._handle_node_recovery(
+                    SimEvent(type="node_recovery", time=sim.current_time,
+                             node_id=store.ids[idx], node_idx=idx))
+            elif op < 0.7:
+                sim._update_power_consumption(float(rng.integers(1, 100)))
+            else:
+                sim._perform_handoff(int(rng.integers(n_clusters)))
+            cidx = int(rng.integers(n_clusters))
+            current = int(sim.network.cluster_coordinator[cidx])
+            assert sim._handoff_candidate(cidx, current) == self._brute_force(
+                sim, cidx, current
+            )
+
+    def test_no_candidates_when_cluster_failed(self):
+        cfg = SwarmCoordinationConfig(
+            node_count=20, coordination_topology="hierarchical",
+            cluster_size=10, simulation_days=1, seed=1,
+        )
+        sim = SwarmCoordinationSimulator(cfg)
+        members = sim.network.cluster_members(0)
+        for idx in members:
+            sim.network.store.fail(idx, 0.0)
+        before = sim.network.clusters[0].failed_handoffs
+        sim._perform_handoff(0)
+        assert sim.network.clusters[0].failed_handoffs == before + 1
+
+
+# ===== TestRouteTable =====
+
+
+class TestRouteTable:
+    """Test the simulator's cached per-node route tables."""
+
+    @staticmethod
+    def _fresh(sim, idx):
+        return tuple(
+            (r, MESSAGE_CLASS_CODES[sim._classify_message_type(s, r)])
+            for s, r in get_message_routing_indices(
+                sim.config.coordination_topology, sim.network, idx
+            )
+        )
+
+    @pytest.mark.parametrize("topology", ["hierarchical", "centralized"])
+    def test_cache_matches_fresh_routes_under_churn(self, topology):
+        cfg = SwarmCoordinationConfig(
+            node_count=300, coordination_topology=topology,
+            cluster_size=10, simulation_days=1, seed=5,
+        )
+        sim = SwarmCoordinationSimulator(cfg)
+        store = sim.network.store
+        rng = np.random.default_rng(0)
+        n_clusters = len(sim.network.clusters)
+        for step in range(2_000):
+            sim.current_time = float(step)
+            op = rng.random()
+            idx = int(rng.integers(len(store)))
+            if op < 0.1:
+                sim._handle_node_failure(
+                    SimEvent(type="node_failure", time=sim.current_time,
+                             node_id=store.ids[idx], node_idx=idx))
+            elif op < 0.2:
+                sim._handle_node_recovery(
+                    SimEvent(type="node_recovery", time=sim.current_time,
+                             node_id=store.ids[idx], node_idx=idx))
+            elif op < 0.3:
+                sim._perform_handoff(int(rng.integers(n_clusters)))
+            for probe in (idx, int(sim.network.cluster_coordinator[0]), 0):
+                assert sim._routes(probe) == self._fresh(sim, probe)
+
+    def test_routes_are_reused_between_changes(self):
+        cfg = SwarmCoordinationConfig(
+            node_count=100, coordination_topology="hierarchical",
+            cluster_size=10, simulation_days=1, seed=5,
+        )
+        sim = SwarmCoordinationSimulator(cfg)
+        first = sim._routes(15)
+        assert sim._routes(15) is first
+        assert first == ((10, MESSAGE_CLASS_CODES["ephemeris"]),)
+        sim.network.hand_over(1, 12)
+        assert sim._routes(15) == ((12, MESSAGE_CLASS_CODES["ephemeris"]),)
+
+
 # ===== TestFailNode =====
 
 
@@ -527,6 +667,111 @@ class TestMessageQueue:
         assert stats.message_count == 0
         assert stats.avg_propagation_ms == 0.0
 
+    def test_dequeue_orders_by_send_time(self):
+        mq = MessageQueue(max_queue_size=100)
+        for t, rid in [(2.0, "c"), (0.5, "a"), (2.0, "d"), (1.0, "b")]:
+            mq.enqueue(create_message("s", rid, "ephemeris", t))
+        order = [mq.dequeue(3.0).receiver_id for _ in range(4)]
+        # Earliest send time first; equal send times keep arrival order
+        assert order == ["a", "b", "c", "d"]
+        assert mq.dequeue(3.0) is None
+
+    def test_streaming_propagation_stats(self):
+        mq = MessageQueue(max_queue_size=5_000)
+        delays_ms = np.linspace(1.0, 200.0, 2_000)
+        for d in delays_ms:
+            mq.enqueue(create_message("a", "b", "ephemeris", 0.0))
+            mq.dequeue(d / 1_000)
+        stats = mq.get_propagation_stats()
+        assert stats.message_count == 2_000
+        assert stats.avg_propagation_ms == pytest.approx(delays_ms.mean())
+        assert stats.max_propagation_ms == pytest.approx(200.0)
+        exact_p95 = np.sort(delays_ms)[int(2_000 * 0.95)]
+        assert stats.p95_propagation_ms == pytest.approx(exact_p95, rel=0.01)
+
+    def test_admit_counts_overflow_as_dropped(self):
+        mq = MessageQueue(max_queue_size=3)
+        mq.enqueue(create_message("a", "b", "ephemeris", 0.0))
+        assert mq.admit(5) == 2
+        assert mq.get_stats()["dropped"] == 3
+        assert mq.admit(1) == 1  # admitting reserves nothing by itself
+
+    def test_future_messages_wait(self):
+        mq = MessageQueue()
+        mq.enqueue(create_message("a", "b", "ephemeris", 5.0))
+        assert mq.process_messages(1.0, 1e6, 1.0) == []
+        assert len(mq.process_messages(5.0, 1e6, 1.0)) == 1
+
+
+# ===== TestQuantileSketch =====
+
+
+class TestQuantileSketch:
+    """Test the streaming-statistics backends."""
+
+    def _samples(self):
+        return np.random.default_rng(0).lognormal(mean=3.0, sigma=1.0, size=5_000)
+
+    def test_exact_matches_numpy(self):
+        data = self._samples()
+        sketch = ExactSamples()
+        for v in data[:100]:
+            sketch.add(float(v))
+        sketch.add_many(data[100:])
+        assert sketch.count == len(data)
+        assert sketch.mean == pytest.approx(np.mean(data))
+        assert sketch.percentile(99) == np.percentile(data, 99)
+        assert sketch.cdf(20.0) == np.mean(data <= 20.0)
+
+    def test_log_histogram_quantile_error_bounded(self):
+        data = self._samples()
+        hist = LogHistogram(resolution=1e-3)
+        hist.add_many(data)
+        assert hist.max == data.max()
+        assert hist.mean == pytest.approx(np.mean(data))
+        ordered = np.sort(data)
+        for q in (50, 95, 99):
+            nearest_rank = ordered[int(len(data) * q / 100)]
+            assert hist.percentile(q) == pytest.approx(nearest_rank, rel=0.01)
+
+    def test_log_histogram_memory_bounded(self):
+        hist = LogHistogram(resolution=1.0)
+        hist.add_many(np.tile(np.arange(1.0, 1_001.0), 200))
+        assert hist.count == 200_000
+        assert len(hist.bins) < 700
+
+    def test_merge_equals_single_stream(self):
+        data = self._samples()
+        whole, left, right = (LogHistogram(resolution=1e-3) for _ in range(3))
+        whole.add_many(data)
+        left.add_many(data[:2_000])
+        right.add_many(data[2_000:])
+        left.merge(right)
+        assert left.bins == whole.bins
+        assert left.percentile(95) == whole.percentile(95)
+
+    def test_merge_rejects_mismatched_bins(self):
+        with pytest.raises(TypeError):
+            LogHistogram(resolution=1.0).merge(LogHistogram(resolution=1e-3))
+
+    def test_scalar_and_vector_add_agree(self):
+        data = self._samples()
+        a, b = LogHistogram(), LogHistogram()
+        for v in data:
+            a.add(float(v))
+        b.add_many(data)
+        assert a.bins == b.bins
+
+    def test_empty(self):
+        for backend in ("exact", "log_histogram"):
+            sketch = make_sketch(backend)
+            assert sketch.percentile(99) == 0.0
+            assert sketch.mean == 0.0
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            make_sketch("tdigest")
+
 
 # ===== TestEstimateBottleneckThreshold =====
 
@@ -604,6 +849,48 @@ class TestInitializeNetwork:
             net = initialize_network(cfg, rng)
             assert len(net.nodes) == 200
 
+    def test_fork_shares_layout_not_state(self):
+        cfg = SwarmCoordinationConfig(node_count=50, coordination_topology="mesh", seed=1)
+        net = initialize_network(cfg, np.random.default_rng(1))
+        branch = net.fork()
+        assert branch.mesh_indices is net.mesh_indices
+        assert branch.store.ids is net.store.ids
+        branch.store.fail(3, 10.0)
+        branch.cluster_coordinator[0] = 7
+        assert net.store.status[3] == STATUS_OPERATIONAL
+        assert net.cluster_coordinator[0] != 7
+
+    def test_reverse_indexes_follow_handoff_failure_recovery(self):
+        cfg = SwarmCoordinationConfig(
+            node_count=2_500, coordination_topology="hierarchical",
+            cluster_size=100, seed=42,
+        )
+        net = initialize_network(cfg, np.random.default_rng(42))
+        # Cluster 3 is coordinated by node 300; node 0 is the regional (and
+        # central) coordinator of clusters 0-9, node 1000 of clusters 10-19
+        assert net.coordinator_cluster[300] == 3
+        assert net.coordinator_cluster[301] == -1
+        assert net.role_tier[300] == ROLE_CLUSTER_COORDINATOR
+        assert net.role_tier[301] == ROLE_MEMBER
+        assert net.role_tier[1000] == ROLE_REGIONAL_COORDINATOR
+
+        net.hand_over(3, 305)
+        assert net.clusters[3].coordinator_id == net.store.ids[305]
+        assert (net.coordinator_cluster[300], net.coordinator_cluster[305]) == (-1, 3)
+        assert net.role_tier[300] == ROLE_MEMBER
+        assert net.role_tier[305] == ROLE_CLUSTER_COORDINATOR
+
+        # A failed coordinator keeps its cluster assignment until handed over
+        net.fail(305, 10.0)
+        assert net.role_tier[305] == ROLE_MEMBER
+        assert net.coordinator_cluster[305] == 3
+        net.recover(305)
+        assert net.store.status[305] == STATUS_OPERATIONAL
+
+        # Regional coordinators keep their tier through a handoff
+        net.hand_over(10, 1001)
+        assert net.role_tier[1000] == ROLE_REGIONAL_COORDINATOR
+
 
 # ===== TestGetMessageRouting =====
 
@@ -709,6 +996,71 @@ class TestEventQueue:
         assert peeked.time == 10.0
         assert eq.size() == 1  # peek does not remove
 
+    def test_equal_times_pop_in_push_order(self):
+        eq = EventQueue()
+        for i in range(5):
+            eq.push(SimEvent(type="state_sync", time=3.0, node_id=f"n-{i}"))
+        assert [eq.pop().node_id for _ in range(5)] == [f"n-{i}" for i in range(5)]
+
+    def test_pop_entry_carries_event_code(self):
+        eq = EventQueue()
+        eq.push(SimEvent(type="node_failure", time=1.0, node_id="n-0"))
+        when, _seq, code, _node, event = eq.pop_entry()
+        assert when == 1.0
+        assert EVENT_TYPES[code] == "node_failure"
+        assert event.node_id == "n-0"
+
+    def test_calendar_queue_matches_heap_order(self):
+        rng = np.random.default_rng(7)
+        heap, cal = EventQueue(), CalendarEventQueue(bucket_width=10.0 / 64, n_buckets=32)
+        now = 0.0
+        popped_heap, popped_cal = [], []
+        for step in range(2_000):
+            if rng.random() < 0.6 or heap.is_empty():
+                # Mostly near-future events, some far beyond one calendar year
+                delay = rng.exponential(1.0) if rng.random() < 0.9 else rng.uniform(50, 500)
+                ev = SimEvent(type="state_sync", time=now + round(delay, 1),
+                              node_id=f"n-{step}")
+                heap.push(ev)
+                cal.push(ev)
+            else:
+                a, b = heap.pop(), cal.pop()
+                now = a.time
+                popped_heap.append(a.node_id)
+                popped_cal.append(b.node_id)
+            assert heap.size() == cal.size()
+        while not heap.is_empty():
+            popped_heap.append(heap.pop().node_id)
+            popped_cal.append(cal.pop().node_id)
+        assert cal.is_empty()
+        assert popped_cal == popped_heap
+
+    @pytest.mark.parametrize("queue", [
+        EventQueue, lambda: CalendarEventQueue(bucket_width=1.0, n_buckets=4),
+    ])
+    def test_discard_removes_one_event_type(self, queue):
+        eq = queue()
+        for i in range(10):
+            eq.push(SimEvent(type="state_sync" if i % 2 else "node_failure",
+                             time=float(i), node_id=f"n-{i}"))
+        eq.discard("node_failure")
+        assert eq.size() == 5
+        assert [eq.pop().node_id for _ in range(5)] == [f"n-{i}" for i in (1, 3, 5, 7, 9)]
+        assert eq.is_empty()
+
+    def test_calendar_queue_run_matches_heap(self):
+        base = dict(node_count=200, coordination_topology="hierarchical",
+                    cluster_size=25, simulation_days=2, sync_sample_rate=0.1,
+                    node_failure_rate_per_year=5.0, seed=11)
+        heap_sim = SwarmCoordinationSimulator(SwarmCoordinationConfig(**base))
+        cal_sim = SwarmCoordinationSimulator(
+            SwarmCoordinationConfig(**base, event_queue="calendar"))
+        heap_result, cal_result = heap_sim.run(), cal_sim.run()
+        assert cal_sim.events_processed == heap_sim.events_processed > 0
+        assert cal_result.total_messages_sent == heap_result.total_messages_sent
+        assert cal_result.failed_handoffs == heap_result.failed_handoffs
+        assert cal_result.avg_update_propagation_ms == heap_result.avg_update_propagation_ms
+
 
 # ===== TestSwarmCoordinationSimulator =====
 
@@ -1135,6 +1487,45 @@ class TestCrossCycleRecovery:
         assert cdf[9] > 0.99
 
 
+# ===== TestGilbertElliottStep =====
+
+
+class TestGilbertElliottStep:
+    """Test the vectorised Gilbert-Elliott link-state step."""
+
+    def test_stdlib_uniforms_match_stream(self):
+        rng = random.Random(7)
+        ref = random.Random(7)
+        u = _stdlib_uniforms(rng, 1_500, np.random.MT19937(0))
+        assert u.tolist() == [ref.random() for _ in range(1_500)]
+        # The stdlib generator continues exactly where the block ended
+        assert rng.random() == ref.random()
+
+    def test_step_matches_per_node_chain(self):
+        cfg = SwarmCoordinationConfig(
+            node_count=500,
+            coordination_topology="hierarchical",
+            cluster_size=50,
+            simulation_days=1,
+            seed=3,
+            link_model="gilbert_elliott",
+            ge_p_good_to_bad=0.2,
+        )
+        sim = SwarmCoordinationSimulator(cfg)
+        ref = random.Random()
+        ref.setstate(sim._stdlib_rng.getstate())
+        states = [True] * 500
+        for _ in range(5):
+            sim._update_ge_link_states()
+            for idx in range(500):
+                if states[idx]:
+                    states[idx] = not ref.random() < cfg.ge_p_good_to_bad
+                else:
+                    states[idx] = ref.random() < cfg.ge_p_bad_to_good
+            assert sim._ge_good.tolist() == states
+        assert not all(states)
+
+
 # ===== TestAirtimeEnforcement =====
 
 
@@ -1389,6 +1780,35 @@ class TestCoordinatorIngressTracking:
             max_val = float(np.max(nonzero))
             assert max_val > median_val * 0.5, "Expected spread in ingress distribution"
 
+    def test_log_histogram_backend_matches_exact(self):
+        """Bounded-memory sketches report the same distributions within bin error."""
+        kwargs = dict(
+            node_count=200,
+            coordination_topology="hierarchical",
+            cluster_size=50,
+            simulation_days=2, sync_sample_rate=0.2,
+            seed=42,
+            link_model="gilbert_elliott",
+            max_retransmissions=1,
+        )
+        exact = SwarmCoordinationSimulator(SwarmCoordinationConfig(**kwargs)).run()
+        hist = SwarmCoordinationSimulator(
+            SwarmCoordinationConfig(stats_backend="log_histogram", **kwargs)
+        ).run()
+        assert hist.coordinator_ingress_bytes_per_cycle == []
+        assert hist.aoi_samples == exact.aoi_samples
+        assert hist.aoi_mean_seconds == pytest.approx(exact.aoi_mean_seconds)
+        assert hist.aoi_max_seconds == exact.aoi_max_seconds
+        assert hist.aoi_p99_seconds == pytest.approx(exact.aoi_p99_seconds, rel=0.01)
+        assert hist.cross_cycle_recovery_rate_by_cycle == pytest.approx(
+            exact.cross_cycle_recovery_rate_by_cycle
+        )
+        ingress = hist.distributions["coordinator_ingress_bytes"]
+        assert ingress.count == len(exact.coordinator_ingress_bytes_per_cycle)
+        assert ingress.percentile(99) == pytest.approx(
+            np.percentile(exact.coordinator_ingress_bytes_per_cycle, 99), rel=0.01
+        )
+
 
 class TestOnOffCampaignModel:
     """Verify ON/OFF Markov campaign model."""
@@ -1434,3 +1854,692 @@ class TestOnOffCampaignModel:
         assert onoff_std > bern_std * 0.5, (
             f"Expected ON/OFF variance ({onoff_std:.0f}) >= 50% of Bernoulli ({bern_std:.0f})"
         )
+
+
+# ===== TestNodeStore =====
+
+
+class TestNodeStore:
+    """Verify the columnar node store behind NetworkStructure."""
+
+    def test_store_matches_node_views(self):
+        cfg = SwarmCoordinationConfig(
+            node_count=230, coordination_topology="hierarchical",
+            cluster_size=50, seed=42,
+        )
+        net = initialize_network(cfg, np.random.default_rng(42))
+        store = net.store
+        assert len(store) == 230
+        for i, node in enumerate(net.nodes):
+            assert store.ids[i] == node.id
+            assert bool(store.is_coordinator[i]) == node.is_coordinator
+            assert net.clusters[store.cluster_idx[i]].id == node.cluster_id
+
+    def test_cluster_ranges_are_contiguous(self):
+        for topo in ["centralized", "hierarchical", "sectorized_mesh"]:
+            cfg = SwarmCoordinationConfig(
+                node_count=230, coordination_topology=topo,
+                cluster_size=50, seed=42,
+            )
+            net = initialize_network(cfg, np.random.default_rng(42))
+            for ci, cluster in enumerate(net.clusters):
+                members = [net.store.ids[i] for i in net.cluster_members(ci)]
+                assert members == cluster.node_ids
+                coord = int(net.cluster_coordinator[ci])
+                assert net.store.ids[coord] == cluster.coordinator_id
+
+    def test_fail_and_recover(self):
+        store = NodeStore(["a", "b"], [0, 0], ["c0"])
+        store.set_coordinator(0)
+        store.fail(0, 12.5)
+        node = store.view(0)
+        assert node.status == "failed"
+        assert not node.is_coordinator
+        assert node.failure_time == 12.5
+        store.recover(0)
+        assert store.view(0).status == "operational"
+        assert store.view(0).failure_time is None
+        assert store.index_of("b") == 1
+        assert store.index_of("missing") == -1
+
+    def test_live_per_cluster_tracks_failures(self):
+        store = NodeStore(["a", "b", "c"], [0, 0, 1], ["c0", "c1"])
+        store.fail(1, 1.0)
+        store.fail(2, 2.0)
+        assert store.live_per_cluster.tolist() == [1, 0]
+        store.set_operational(1)  # handoff revives a failed coordinator
+        store.recover(2)
+        assert store.live_per_cluster.tolist() == [2, 1]
+
+    def test_simulator_updates_store_in_place(self):
+        cfg = SwarmCoordinationConfig(
+            node_count=100, coordination_topology="hierarchical",
+            cluster_size=25, simulation_days=1, seed=42,
+            coordinator_duty_cycle_hours=6,
+        )
+        sim = SwarmCoordinationSimulator(cfg)
+        result = sim.run()
+        store = sim.network.store
+        assert result.total_energy_kwh == pytest.approx(
+            store.power_consumed_wh.sum() / 1_000.0
+        )
+        # Exactly one coordinator per cluster after handoffs
+        assert int(store.is_coordinator.sum()) == len(sim.network.clusters)
+        for ci in range(len(sim.network.clusters)):
+            coord = int(sim.network.cluster_coordinator[ci])
+            assert store.is_coordinator[coord]
+
+    def test_deliveries_credit_the_receiver(self):
+        cfg = SwarmCoordinationConfig(
+            node_count=100, coordination_topology="hierarchical",
+            cluster_size=25, simulation_days=1, seed=42,
+            bandwidth_per_node_kbps=1_000.0,
+        )
+        sim = SwarmCoordinationSimulator(cfg)
+        result = sim.run()
+        store = sim.network.store
+        assert result.total_messages_delivered > 0
+        assert int(store.messages_received.sum()) == result.total_messages_delivered
+        # Ephemeris reports are addressed to coordinators
+        assert store.messages_received[store.is_coordinator].sum() > 0
+
+    def test_lazy_energy_matches_eager_sweeps(self):
+        n = 20
+        store = NodeStore([f"n{i}" for i in range(n)], [0] * n, ["c0"])
+        store.start_energy_accounting(5.0, 18.0)
+        power = np.zeros(n)
+        coord_time = np.zeros(n)
+        rng = np.random.default_rng(4)
+        for _ in range(500):
+            elapsed = float(rng.uniform(60.0, 600.0))
+            # Eager reference: charge every node at its current role
+            power += np.where(store.is_coordinator, 18.0, 5.0) * elapsed / 3600.0
+            coord_time[store.is_coordinator] += elapsed
+            store.accrue(elapsed)
+            idx = int(rng.integers(n))
+            op = rng.integers(4)
+            if op == 0:
+                store.set_coordinator(idx)
+            elif op == 1:
+                store.set_operational(idx)
+            elif op == 2:
+                store.fail(idx, 0.0)
+            elif store.status[idx] == STATUS_FAILED:
+                store.recover(idx)
+        assert store.view(3).power_consumed_wh == pytest.approx(power[3], rel=1e-12)
+        store.settle_all()
+        np.testing.assert_allclose(store.power_consumed_wh, power, rtol=1e-12)
+        np.testing.assert_allclose(store.coordinator_time_seconds, coord_time, rtol=1e-12)
+
+
+# ===== TestMeshNeighborSampling =====
+
+
+class TestMeshNeighborSampling:
+    """Verify the vectorised CSR mesh neighbour builder."""
+
+    def test_csr_layout(self):
+        cfg = SwarmCoordinationConfig(
+            node_count=500, coordination_topology="mesh", seed=42
+        )
+        net = initialize_network(cfg, np.random.default_rng(42))
+        assert net.mesh_indices.dtype == np.int32
+        assert len(net.mesh_indptr) == 501
+        assert list(net.neighbors(3)) == [
+            net.index_of(nid) for nid in net.mesh_neighbors[net.store.ids[3]]
+        ]
+
+    def test_neighbors_distinct_and_exclude_self(self):
+        peers = _sample_mesh_neighbors(50, 5, np.random.default_rng(1))
+        assert peers.shape == (50, 5)
+        for i, row in enumerate(peers):
+            assert i not in row
+            assert len(set(row.tolist())) == 5
+
+    def test_uniform_peer_distribution(self):
+        """Every other node is equally likely to be picked as a peer."""
+        rng = np.random.default_rng(7)
+        counts = np.zeros(10)
+        for _ in range(400):
+            peers = _sample_mesh_neighbors(10, 3, rng)
+            counts += np.bincount(peers[0], minlength=10)
+        assert counts[0] == 0
+        # 1200 draws over 9 peers -> expected ~133 each
+        assert counts[1:].min() > 90 and counts[1:].max() < 180
+
+    def test_large_mesh_builds(self):
+        cfg = SwarmCoordinationConfig(
+            node_count=200_000, coordination_topology="mesh", seed=42
+        )
+        net = initialize_network(cfg, np.random.default_rng(42))
+        assert len(net.mesh_indices) == 200_000 * 5
+
+
+# ===== TestSectorizedMesh =====
+
+
+class TestSectorizedMesh:
+    """Verify the implicit sectorized-mesh adjacency and routing."""
+
+    def _net(self, node_count=23, sector_size=5):
+        cfg = SwarmCoordinationConfig(
+            node_count=node_count, coordination_topology="sectorized_mesh",
+            sector_size=sector_size, seed=42,
+        )
+        return initialize_network(cfg, np.random.default_rng(42))
+
+    def test_neighbors_from_sector_ranges(self):
+        net = self._net()
+        assert net.mesh_indices is None
+        # Sectors [0,5) [5,10) ... [20,23)
+        assert list(net.neighbors(0)) == [1, 2, 3, 4, 5]
+        assert list(net.neighbors(7)) == [5, 6, 8, 9, 4, 10]
+        assert list(net.neighbors(21)) == [20, 22, 19]
+        assert net.neighbors(7).dtype == np.int32
+        assert len(net.mesh_neighbors) == 23
+
+    def test_routing_skips_coordinator_and_failed(self):
+        net = self._net(node_count=60, sector_size=20)
+        net.store.fail(22, 0.0)
+        routes = get_message_routing_indices("sectorized_mesh", net, 21)
+        # Coordinator 20 first, then the first 10 live peers in row order
+        assert routes[0] == (21, 20)
+        assert [r for _, r in routes[1:]] == [23, 24, 25, 26, 27, 28, 29, 30, 31, 32]
+
+    def test_million_node_network_is_linear(self):
+        net = self._net(node_count=1_000_000, sector_size=0)
+        assert len(net.clusters) == 1_000
+        assert len(net.neighbors(123_456)) == 999 + 2
+
+
+# ===== TestCycleBatched =====
+
+
+def _batched_pair(**kwargs):
+    """Run a config in event and cycle-batched mode over a few seeds."""
+    results = {}
+    for mode in ("event", "cycle_batched"):
+        results[mode] = [
+            SwarmCoordinationSimulator(
+                SwarmCoordinationConfig(seed=seed, execution_mode=mode, **kwargs)
+            ).run()
+            for seed in range(2)
+        ]
+    return results
+
+
+class TestCycleBatched:
+    """Verify the cycle-batched hierarchical execution mode."""
+
+    def test_default_is_event(self):
+        assert SwarmCoordinationConfig().execution_mode == "event"
+
+    def test_deterministic(self):
+        cfg = SwarmCoordinationConfig(
+            node_count=200, cluster_size=25, simulation_days=1,
+            link_availability=0.8, execution_mode="cycle_batched", seed=5,
+        )
+        r1 = SwarmCoordinationSimulator(cfg).run()
+        r2 = SwarmCoordinationSimulator(cfg).run()
+        assert r1.total_bytes_sent == r2.total_bytes_sent
+        assert r1.retransmission_count == r2.retransmission_count
+        assert r1.aoi_mean_seconds == r2.aoi_mean_seconds
+
+    def test_ignored_outside_hierarchical(self):
+        kwargs = dict(
+            node_count=100, coordination_topology="sectorized_mesh",
+            simulation_days=1, sync_sample_rate=0.2, seed=3,
+        )
+        r_event = SwarmCoordinationSimulator(SwarmCoordinationConfig(**kwargs)).run()
+        r_batch = SwarmCoordinationSimulator(
+            SwarmCoordinationConfig(execution_mode="cycle_batched", **kwargs)
+        ).run()
+        assert r_batch.total_bytes_sent == r_event.total_bytes_sent
+
+    def test_matches_event_mode_with_loss_and_cap(self):
+        runs = _batched_pair(
+            node_count=150, cluster_size=25, simulation_days=1,
+            sync_sample_rate=0.3, link_availability=0.8, max_retransmissions=1,
+            coordinator_link_capacity_kbps=0.5,
+        )
+        for field in (
+            "communication_overhead_percent",
+            "total_bytes_sent",
+            "ephemeris_bytes_sent",
+            "command_bytes_sent",
+            "retransmission_count",
+            "coordinator_drops",
+        ):
+            event = np.mean([getattr(r, field) for r in runs["event"]])
+            batch = np.mean([getattr(r, field) for r in runs["cycle_batched"]])
+            assert batch == pytest.approx(event, rel=0.02), field
+        loss_event = np.mean([r.message_loss_rate for r in runs["event"]])
+        loss_batch = np.mean([r.message_loss_rate for r in runs["cycle_batched"]])
+        assert loss_batch == pytest.approx(loss_event, abs=0.005)
+
+    def test_matches_event_mode_gilbert_elliott(self):
+        runs = _batched_pair(
+            node_count=150, cluster_size=25, simulation_days=1,
+            sync_sample_rate=0.3, link_model="gilbert_elliott",
+            max_retransmissions=2,
+        )
+        for field in ("message_loss_rate", "cross_cycle_recovery_mean"):
+            event = np.mean([getattr(r, field) for r in runs["event"]])
+            batch = np.mean([getattr(r, field) for r in runs["cycle_batched"]])
+            assert batch == pytest.approx(event, rel=0.1), field
+        aoi_event = np.mean([r.aoi_mean_seconds for r in runs["event"]])
+        aoi_batch = np.mean([r.aoi_mean_seconds for r in runs["cycle_batched"]])
+        assert aoi_batch == pytest.approx(aoi_event, rel=0.05)
+
+    def test_first_come_admission(self):
+        keys = np.array([0, 0, 0, 0, 1, 1])
+        sizes = np.array([256, 512, 256, 1024, 1024, 256])
+        admitted = _first_come_admission(keys, sizes, 600.0)
+        # Key 0: 256 fits, 512 refused, 256 squeezes in; key 1: only 256
+        assert admitted.tolist() == [True, False, True, False, False, True]
+
+
+# ===== TestAgeOfInformation =====
+
+
+class TestAgeOfInformation:
+    """Test the vectorised AoI bookkeeping and sampling."""
+
+    def _sim(self):
+        cfg = SwarmCoordinationConfig(
+            node_count=8,
+            coordination_topology="hierarchical",
+            cluster_size=4,
+            simulation_days=1,
+            seed=42,
+        )
+        return SwarmCoordinationSimulator(cfg)
+
+    def _sample(self, sim, t):
+        sim._aoi_stats = ExactSamples()
+        sim._sample_aoi(t)
+        return sim._aoi_stats.samples().tolist()
+
+    def test_samples_every_other_member(self):
+        sim = self._sim()
+        sim._record_aoi_update(0, 1, 10.0)
+        sim._record_aoi_update(0, 2, 20.0)
+        # Member 3 never reported: its AoI is the full elapsed time
+        assert self._sample(sim, 100.0) == [90.0, 80.0, 100.0]
+
+    def test_other_cluster_updates_ignored(self):
+        sim = self._sim()
+        sim._record_aoi_update(0, 5, 10.0)
+        assert self._sample(sim, 100.0) == []
+
+    def test_handoff_freezes_outgoing_coordinator(self):
+        sim = self._sim()
+        sim._record_aoi_update(0, 1, 10.0)
+        sim._record_aoi_update(0, 2, 20.0)
+        sim._hand_over_aoi(0, 0, 1)
+        sim._record_aoi_update(1, 3, 50.0)
+        sim._record_aoi_update(1, 2, 60.0)
+        # Coordinator 0 keeps what it knew; coordinator 1 starts from scratch
+        assert self._sample(sim, 100.0) == [90.0, 80.0, 100.0, 100.0, 40.0, 50.0]
+
+    def test_handoff_back_restores_record(self):
+        sim = self._sim()
+        sim._record_aoi_update(0, 1, 10.0)
+        sim._hand_over_aoi(0, 0, 1)
+        sim._record_aoi_update(1, 2, 60.0)
+        sim._hand_over_aoi(0, 1, 0)
+        sim._record_aoi_update(0, 3, 70.0)
+        assert self._sample(sim, 100.0) == [90.0, 100.0, 30.0, 100.0, 40.0, 100.0]
+
+    def test_failed_coordinators_skipped(self):
+        sim = self._sim()
+        sim._record_aoi_update(0, 1, 10.0)
+        sim._record_aoi_update(4, 5, 30.0)
+        sim.network.store.fail(0, 50.0)
+        assert self._sample(sim, 100.0) == [70.0, 100.0, 100.0]
+
+
+# ===== TestCheckpoint =====
+
+
+def _failure_schedule(sim):
+    """Return ``{node_idx: failure_time}`` for the scheduled node failures."""
+    return {
+        entry[3]: entry[0]
+        for entry in sim.event_queue._heap
+        if entry[4].type == "node_failure"
+    }
+
+
+def _checkpoint_config(**kwargs):
+    params = dict(
+        node_count=60, cluster_size=15, simulation_days=1,
+        sync_sample_rate=0.2, link_availability=0.9,
+        node_failure_rate_per_year=5.0, seed=11,
+    )
+    params.update(kwargs)
+    return SwarmCoordinationConfig(**params)
+
+
+class TestCheckpoint:
+    """Test checkpoint/resume and warm-start forking of the simulator."""
+
+    def test_stepwise_advance_matches_single_run(self):
+        reference = SwarmCoordinationSimulator(_checkpoint_config()).run()
+        sim = SwarmCoordinationSimulator(_checkpoint_config())
+        for hours in (3, 7, 15):
+            assert not sim.advance(hours * 3600.0)
+        assert sim.run() == reference
+
+    def test_resume_is_bit_identical(self, tmp_path):
+        reference = SwarmCoordinationSimulator(_checkpoint_config()).run()
+        path = tmp_path / "sim.ckpt"
+        sim = SwarmCoordinationSimulator(_checkpoint_config())
+        sim.advance(0.5 * SECONDS_PER_DAY)
+        sim.save_checkpoint(path)
+        restored = SwarmCoordinationSimulator.load_checkpoint(path)
+        assert restored.run() == reference
+
+    def test_periodic_checkpoints(self, tmp_path):
+        path = tmp_path / "sim.ckpt"
+        cfg = _checkpoint_config(
+            checkpoint_interval_days=0.25, checkpoint_path=str(path),
+        )
+        result = SwarmCoordinationSimulator(cfg).run()
+        # The last checkpoint is taken at 0.75 days and finishes the same way
+        restored = SwarmCoordinationSimulator.load_checkpoint(path)
+        assert restored._advanced_to == pytest.approx(0.75 * SECONDS_PER_DAY)
+        assert restored.run() == result
+
+    def test_checkpoint_interval_needs_path(self):
+        cfg = _checkpoint_config(checkpoint_interval_days=1.0)
+        with pytest.raises(ValueError):
+            SwarmCoordinationSimulator(cfg).run()
+
+    def test_load_rejects_foreign_pickle(self, tmp_path):
+        import pickle
+
+        path = tmp_path / "other.pkl"
+        path.write_bytes(pickle.dumps({"version": 0}))
+        with pytest.raises(ValueError):
+            SwarmCoordinationSimulator.load_checkpoint(path)
+
+    def test_fork_leaves_parent_untouched(self):
+        reference = SwarmCoordinationSimulator(_checkpoint_config()).run()
+        sim = SwarmCoordinationSimulator(_checkpoint_config())
+        sim.advance(0.5 * SECONDS_PER_DAY)
+        same = sim.fork()
+        branch = sim.fork(link_availability=0.5)
+        assert same.run() == reference
+        assert branch.run().message_loss_rate > reference.message_loss_rate
+        assert sim.run() == reference
+
+    def test_fork_redraws_pending_failures(self):
+        sim = SwarmCoordinationSimulator(_checkpoint_config())
+        sim.advance(3600.0)
+        same = sim.fork()
+        faster = sim.fork(node_failure_rate_per_year=500.0)
+        assert len(_failure_schedule(faster)) > len(_failure_schedule(same))
+        assert min(_failure_schedule(faster).values()) >= 3600.0
+        assert faster.run().total_messages_sent < same.run().total_messages_sent
+
+    def test_fork_extends_failures_over_new_horizon(self):
+        sim = SwarmCoordinationSimulator(_checkpoint_config(node_failure_rate_per_year=200.0))
+        sim.advance(3600.0)
+        longer = sim.fork(simulation_days=3)
+        assert max(_failure_schedule(longer).values()) > SECONDS_PER_DAY
+        assert max(_failure_schedule(sim).values()) < SECONDS_PER_DAY
+
+    def test_fork_rejects_structural_changes(self):
+        sim = SwarmCoordinationSimulator(_checkpoint_config())
+        with pytest.raises(ValueError, match="node_count"):
+            sim.fork(node_count=500)
+
+
+# ===== TestRunProfile =====
+
+
+class TestRunProfile:
+    """Test the opt-in per-handler run profile."""
+
+    def test_off_by_default(self):
+        result = SwarmCoordinationSimulator(_checkpoint_config()).run()
+        assert result.profile is None
+
+    def test_profile_does_not_change_result(self):
+        reference = SwarmCoordinationSimulator(_checkpoint_config()).run()
+        sim = SwarmCoordinationSimulator(_checkpoint_config(profile=True))
+        result = sim.run()
+        assert replace(result, config=reference.config) == reference
+        profile = result.profile
+        assert profile.events == sim.events_processed
+        handled = sum(profile.counts[t] for t in EVENT_TYPES)
+        assert handled == sim.events_processed
+        assert profile.counts["state_sync"] > 0
+        assert set(profile.seconds) <= set(EVENT_TYPES) | set(PROFILE_PHASES)
+        assert profile.counts["power_update"] > 0
+        assert profile.wall_seconds >= sum(profile.seconds.values()) > 0
+        assert profile.events_per_second > 0
+        assert len(profile.queue_sizes) == len(profile.queue_times) > 0
+        assert "state_sync" in profile.format_table()
+
+    def test_profile_survives_checkpoint(self, tmp_path):
+        path = tmp_path / "sim.ckpt"
+        sim = SwarmCoordinationSimulator(_checkpoint_config(profile=True))
+        sim.advance(0.5 * SECONDS_PER_DAY)
+        sim.save_checkpoint(path)
+        restored = SwarmCoordinationSimulator.load_checkpoint(path)
+        result = restored.run()
+        assert sum(result.profile.counts.values()) >= restored.events_processed
+
+    def test_fork_can_switch_profiling_on(self):
+        sim = SwarmCoordinationSimulator(_checkpoint_config())
+        sim.advance(0.5 * SECONDS_PER_DAY)
+        branch = sim.fork(profile=True)
+        result = branch.run()
+        handled = sum(result.profile.counts[t] for t in EVENT_TYPES)
+        assert 0 < handled < branch.events_processed
+
+
+# ===== TestAnalyticSurrogate =====
+
+
+class TestAnalyticSurrogate:
+    """Compare the closed-form surrogate with the DES it approximates."""
+
+    def _compare(self, fields, rel=0.02, **kwargs):
+        cfg = SwarmCoordinationConfig(
+            node_count=200, cluster_size=25, simulation_days=1, seed=3, **kwargs
+        )
+        des = SwarmCoordinationSimulator(cfg).run()
+        surrogate = analytic_run_result(cfg)
+        for name in fields:
+            assert getattr(surrogate, name) == pytest.approx(
+                getattr(des, name), rel=rel, abs=1e-9
+            ), name
+
+    def test_hierarchical_stress_matches_des(self):
+        self._compare((
+            "communication_overhead_percent",
+            "coordinator_availability_percent",
+            "message_drop_rate",
+            "power_variance_percent",
+            "total_energy_kwh",
+        ))
+
+    def test_link_loss_with_retransmission(self):
+        self._compare(
+            ("communication_overhead_percent", "message_loss_rate"),
+            rel=0.05, link_availability=0.8, max_retransmissions=1,
+        )
+
+    def test_centralized_has_no_protocol_overhead(self):
+        result = analytic_run_result(
+            SwarmCoordinationConfig(node_count=500, coordination_topology="centralized")
+        )
+        assert result.communication_overhead_percent == 0.0
+        assert result.coordinator_availability_percent == 100.0
+
+    def test_nominal_workload_drops_commands(self):
+        stress = analytic_run_result(SwarmCoordinationConfig())
+        nominal = analytic_run_result(SwarmCoordinationConfig(workload_profile="nominal"))
+        assert nominal.communication_overhead_percent < stress.communication_overhead_percent / 5
+
+    def test_handoff_failures_reduce_availability(self):
+        result = analytic_run_result(
+            SwarmCoordinationConfig(simulation_days=30, coordinator_duty_cycle_hours=1)
+        )
+        assert result.failed_handoffs > 0
+        assert result.coordinator_availability_percent < 100.0
+
+
+# ===== TestRandomStreams =====
+
+
+class TestRandomStreams:
+    """Test per-process RNG streams (common random numbers)."""
+
+    def _cfg(self, **overrides):
+        params = dict(
+            node_count=60,
+            coordination_topology="hierarchical",
+            cluster_size=15,
+            simulation_days=1,
+            node_failure_rate_per_year=200.0,
+            sync_sample_rate=0.1,
+            seed=3,
+            random_streams="per_process",
+        )
+        params.update(overrides)
+        return SwarmCoordinationConfig(**params)
+
+    def test_failures_common_across_topologies(self):
+        hier = _failure_schedule(SwarmCoordinationSimulator(self._cfg()))
+        central = _failure_schedule(
+            SwarmCoordinationSimulator(self._cfg(coordination_topology="centralized"))
+        )
+        common = hier.keys() & central.keys()
+        assert len(common) > 10
+        assert all(hier[i] == central[i] for i in common)
+
+    def test_shared_streams_shift_with_topology(self):
+        hier = _failure_schedule(SwarmCoordinationSimulator(self._cfg(random_streams="shared")))
+        central = _failure_schedule(SwarmCoordinationSimulator(
+            self._cfg(random_streams="shared", coordination_topology="centralized")
+        ))
+        common = hier.keys() & central.keys()
+        assert any(hier[i] != central[i] for i in common)
+
+    def test_repair_times_drawn_per_node(self):
+        sim = SwarmCoordinationSimulator(self._cfg())
+        assert sim._repair_days.shape == (60,)
+        assert sim._repair_days.min() >= 1 and sim._repair_days.max() <= 7
+        assert SwarmCoordinationSimulator(self._cfg(random_streams="shared"))._repair_days is None
+
+    def test_per_process_runs_reproducible(self):
+        cfg = self._cfg(link_availability=0.9, enable_exception_telemetry=True)
+        assert SwarmCoordinationSimulator(cfg).run() == SwarmCoordinationSimulator(cfg).run()
+
+    def test_streams_fixed_on_fork(self):
+        sim = SwarmCoordinationSimulator(self._cfg())
+        sim.advance(3600.0)
+        with pytest.raises(ValueError, match="random_streams"):
+            sim.fork(random_streams="shared")
+
+
+# ===== TestFluidSwarmSimulator =====
+
+
+class TestFluidSwarmSimulator:
+    """Compare the time-stepped fluid engine with the DES it approximates."""
+
+    def _cfg(self, **overrides):
+        params = dict(
+            node_count=100, cluster_size=20, simulation_days=1, seed=3,
+            link_model="gilbert_elliott",
+        )
+        params.update(overrides)
+        return SwarmCoordinationConfig(**params)
+
+    def test_matches_des(self):
+        cfg = self._cfg()
+        des = SwarmCoordinationSimulator(cfg).run()
+        fluid = FluidSwarmSimulator(cfg).run()
+        for name, rel in (
+            ("communication_overhead_percent", 0.02),
+            ("message_loss_rate", 0.05),
+            ("power_variance_percent", 0.01),
+            ("total_energy_kwh", 0.01),
+            ("total_messages_sent", 0.01),
+            ("aoi_mean_seconds", 0.1),
+            ("cross_cycle_recovery_mean", 0.05),
+            ("message_drop_rate", 0.01),
+        ):
+            assert getattr(fluid, name) == pytest.approx(getattr(des, name), rel=rel), name
+
+    def test_reproducible_per_seed(self):
+        cfg = self._cfg(node_failure_rate_per_year=50.0, coordinator_duty_cycle_hours=6)
+        a = FluidSwarmSimulator(cfg).run()
+        b = FluidSwarmSimulator(cfg).run()
+        c = FluidSwarmSimulator(replace(cfg, seed=4)).run()
+        assert a.total_bytes_sent == b.total_bytes_sent
+        assert a.aoi_p99_seconds == b.aoi_p99_seconds
+        assert a.total_bytes_sent != c.total_bytes_sent
+
+    def test_failures_and_handoffs(self):
+        cfg = self._cfg(
+            node_failure_rate_per_year=200.0, coordinator_duty_cycle_hours=2,
+            simulation_days=2,
+        )
+        sim = FluidSwarmSimulator(cfg)
+        result = sim.run()
+        assert not sim.alive.all()
+        assert 0 < result.coordinator_availability_percent <= 100.0
+        # Coordinator duty is spread across more than the initial heads
+        assert np.count_nonzero(sim.coordinator_time_seconds) > sim.cluster_coordinator.size
+
+    def test_one_percent_of_handoffs_fail(self):
+        cfg = self._cfg(
+            node_count=20_000, cluster_size=20, coordinator_duty_cycle_hours=1,
+        )
+        result = FluidSwarmSimulator(cfg).run()
+        # 1,000 clusters hand off at 1 h, 2 h, ..., 23 h
+        handoffs = 1_000 * 23
+        expected = 0.01 * handoffs
+        assert abs(result.failed_handoffs - expected) < 5 * math.sqrt(expected * 0.99)
+
+    def test_byte_cap_drops(self):
+        result = FluidSwarmSimulator(self._cfg(coordinator_link_capacity_kbps=4.0)).run()
+        assert result.coordinator_drops > 0
+        assert result.total_bytes_attempted > result.total_bytes_sent
+
+    def test_distributions_are_log_histograms(self):
+        result = FluidSwarmSimulator(self._cfg()).run()
+        assert isinstance(result.distributions["aoi_seconds"], LogHistogram)
+        assert result.aoi_samples == result.distributions["aoi_seconds"].count > 0
+        assert result.cross_cycle_recovery_count > 0
+
+    def test_cost_independent_of_node_count(self):
+        def seconds_per_step(sim):
+            sim._apply_events(0.0)
+            sim._step()
+            best = math.inf
+            for _ in range(5):
+                t0 = time.perf_counter()
+                for _ in range(20):
+                    sim._step()
+                best = min(best, (time.perf_counter() - t0) / 20)
+            return best
+
+        # Same 1,000 clusters, 100x the nodes
+        small = FluidSwarmSimulator(self._cfg(node_count=10_000, cluster_size=10))
+        large = FluidSwarmSimulator(self._cfg(node_count=1_000_000, cluster_size=1_000))
+        assert large._aoi.live().sum() == pytest.approx(1_000_000 - 1_000)
+        small_cost = seconds_per_step(small)
+        large_cost = seconds_per_step(large)
+        assert large.total_messages_sent > 100 * small.total_messages_sent * 0.9
+        assert large_cost < 5 * small_cost
+
+    def test_rejects_other_topologies(self):
+        with pytest.raises(ValueError, match="hierarchical"):
+            FluidSwarmSimulator(self._cfg(coordination_topology="mesh"))